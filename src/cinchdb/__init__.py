@@ -1,6 +1,7 @@
 """CinchDB - A Git-like SQLite database management system."""
 
 from cinchdb.core.database import connect, connect_api
+from cinchdb.core.async_database import connect_async
 from cinchdb.plugins.manager import PluginManager
 
 try:
@@ -17,4 +18,4 @@ except Exception:
 # Global plugin manager
 plugin_manager = PluginManager()
 
-__all__ = ["connect", "connect_api", "plugin_manager"]
+__all__ = ["connect", "connect_api", "connect_async", "plugin_manager"]
@@ -1,6 +1,7 @@
 """Data manipulation commands for CinchDB CLI."""
 
 import typer
+from pathlib import Path
 from typing import Optional
 from rich.console import Console
 
@@ -337,6 +338,419 @@ def bulk_delete(
         raise typer.Exit(1)
 
 
+@app.command()
+def select(
+    table_name: str = typer.Argument(..., help="Name of table to read"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter conditions (e.g., 'status=active' or 'age__gt=65')"),
+    limit: int = typer.Option(50, "--limit", "-l", help="Records per page"),
+    order_by: str = typer.Option("id", "--order-by", "-o", help="Sort column, prefixed with '-' for descending"),
+    after: Optional[str] = typer.Option(None, "--after", "-a", help="Continuation token printed by the previous page"),
+    tenant: Optional[str] = typer.Option("main", "--tenant", "-t", help="Tenant name"),
+    format: str = typer.Option("table", "--format", "-f", help="Output format: table or json"),
+):
+    """Page through a table using keyset pagination.
+
+    Each page prints a continuation token; pass it to --after to fetch the
+    next page. Deep pages are as fast as the first.
+
+    Examples:
+        cinch data select users --limit 20
+        cinch data select users --order-by -created_at --after <token>
+        cinch data select orders --where "status=open" -f json
+    """
+    from rich.table import Table as RichTable
+    from cinchdb.core.database import CinchDB
+
+    config, config_data = get_config_with_data()
+
+    filters = {}
+    if where:
+        try:
+            filters = _parse_conditions(where)
+        except ValueError as e:
+            console.print(f"[red]❌ Invalid conditions format: {e}[/red]")
+            raise typer.Exit(1)
+
+    try:
+        db = CinchDB(config_data.active_database, tenant=tenant, project_dir=config.project_dir)
+        page = db.select_page(table_name, limit=limit, order_by=order_by, cursor=after, **filters)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+
+    if format == "json":
+        console.print_json(data={"records": page.records, "next_cursor": page.next_cursor})
+        return
+
+    if not page.records:
+        console.print("[yellow]No results[/yellow]")
+        return
+
+    columns = list(page.records[0].keys())
+    table = RichTable(title=f"{table_name} ({len(page.records)} rows)")
+    for col in columns:
+        table.add_column(col, style="cyan")
+    for row in page.records:
+        table.add_row(*[str(row[col]) if row[col] is not None else "NULL" for col in columns])
+    console.print(table)
+
+    if page.has_more:
+        console.print(f"[blue]ℹ️  Next page: --after {page.next_cursor}[/blue]")
+
+
+@app.command(name="import")
+def import_file(
+    table_name: str = typer.Argument(..., help="Name of table to import into"),
+    file: Path = typer.Argument(..., help="CSV or JSON Lines file (optionally .gz)"),
+    format: Optional[str] = typer.Option(None, "--format", "-f", help="File format: csv or jsonl (default: from extension)"),
+    tenant: Optional[str] = typer.Option("main", "--tenant", "-t", help="Tenant name"),
+    batch_size: int = typer.Option(1000, "--batch-size", "-b", help="Records per transaction"),
+    tenant_column: Optional[str] = typer.Option(None, "--tenant-column", help="Route each row to the tenant named in this column"),
+    create_tenants: bool = typer.Option(False, "--create-tenants", help="Create tenants named in --tenant-column that don't exist"),
+    skip_unknown: bool = typer.Option(False, "--skip-unknown", help="Drop columns that aren't in the table instead of failing"),
+):
+    """Import records from a CSV or JSON Lines file.
+
+    The file is streamed and inserted in batches of --batch-size records,
+    each committed in its own transaction. Values are converted to the
+    column types of the table schema.
+
+    Examples:
+        cinch data import users users.csv
+        cinch data import events events.jsonl.gz --batch-size 5000
+        cinch data import orders orders.csv --tenant-column customer --create-tenants
+    """
+    import time
+    from cinchdb.core.database import CinchDB
+
+    config, config_data = get_config_with_data()
+
+    if not file.exists():
+        console.print(f"[red]❌ File not found: {file}[/red]")
+        raise typer.Exit(1)
+
+    file_format = format or _infer_file_format(file)
+    if file_format not in ("csv", "jsonl"):
+        console.print("[red]❌ Format must be 'csv' or 'jsonl'[/red]")
+        raise typer.Exit(1)
+
+    if batch_size <= 0:
+        console.print("[red]❌ Batch size must be positive[/red]")
+        raise typer.Exit(1)
+
+    stats = {"inserted": 0}
+    started = time.perf_counter()
+
+    try:
+        db = CinchDB(config_data.active_database, tenant=tenant, project_dir=config.project_dir)
+        column_types = {col.name: col.type for col in db.get_table(table_name).columns}
+
+        console.print(f"[yellow]📥 Importing {file.name} into '{table_name}'...[/yellow]")
+
+        records = (
+            _coerce_record(record, column_types, skip_unknown, exclude=tenant_column)
+            for record in _read_records(file, file_format)
+        )
+
+        if tenant_column:
+            tenant_counts = _import_fan_out(
+                db, table_name, records, tenant_column, batch_size, create_tenants, stats
+            )
+        else:
+            def on_chunk(chunk_stats):
+                stats["inserted"] = chunk_stats["inserted"]
+
+            db.insert_stream(table_name, records, chunk_size=batch_size, progress=on_chunk)
+            tenant_counts = {tenant: stats["inserted"]}
+
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        if stats["inserted"]:
+            console.print(f"[yellow]   {stats['inserted']} record(s) were committed before the error[/yellow]")
+        raise typer.Exit(1)
+
+    elapsed = time.perf_counter() - started
+    rate = stats["inserted"] / elapsed if elapsed else 0.0
+    console.print(
+        f"[green]✅ Imported {stats['inserted']} record(s) into '{table_name}' "
+        f"in {elapsed:.2f}s ({rate:,.0f} rows/sec)[/green]"
+    )
+    if tenant_column:
+        for name, count in sorted(tenant_counts.items()):
+            console.print(f"[cyan]   {name}: {count}[/cyan]")
+
+
+def _import_fan_out(db, table_name, records, tenant_column, batch_size, create_tenants, stats) -> dict:
+    """Insert records into the tenant named by tenant_column, one batch per tenant at a time."""
+    from cinchdb.core.database import CinchDB
+
+    existing = {t.name for t in db.list_tenants()}
+    tenant_dbs = {}
+    buffers = {}
+    counts = {}
+
+    def flush(name):
+        rows = buffers.pop(name, None)
+        if rows:
+            tenant_dbs[name].insert_stream(table_name, rows, chunk_size=batch_size)
+            counts[name] = counts.get(name, 0) + len(rows)
+            stats["inserted"] += len(rows)
+
+    for row_number, (name, record) in enumerate(records, start=1):
+        if not name:
+            raise ValueError(f"Row {row_number}: missing value for tenant column '{tenant_column}'")
+        name = str(name)
+        if name not in tenant_dbs:
+            if name not in existing:
+                if not create_tenants:
+                    raise ValueError(f"Tenant '{name}' does not exist (use --create-tenants to create it)")
+                db.create_tenant(name)
+                existing.add(name)
+            tenant_dbs[name] = CinchDB(db.database, branch=db.branch, tenant=name, project_dir=db.project_dir)
+        buffer = buffers.setdefault(name, [])
+        buffer.append(record)
+        if len(buffer) >= batch_size:
+            flush(name)
+
+    for name in list(buffers):
+        flush(name)
+    return counts
+
+
+def _infer_file_format(path: Path) -> Optional[str]:
+    """Infer the import/export format from a file name, ignoring a .gz suffix."""
+    suffixes = [s.lower() for s in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    if not suffixes:
+        return None
+    return {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}.get(suffixes[-1])
+
+
+def _read_records(path: Path, file_format: str):
+    """Yield one dictionary per CSV row or JSON line without reading the whole file."""
+    import csv
+    import gzip
+    import json
+
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: invalid JSON ({e})")
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number}: expected a JSON object")
+            yield record
+
+
+_TRUE_STRINGS = {"true", "t", "yes", "y", "1"}
+_FALSE_STRINGS = {"false", "f", "no", "n", "0"}
+
+
+def _coerce_record(record: dict, column_types: dict, skip_unknown: bool = False, exclude: Optional[str] = None):
+    """Convert a record's values to the table's column types.
+
+    When exclude names a column (the tenant column), it is removed from the
+    record and a (value, record) tuple is returned instead.
+    """
+    excluded = record.pop(exclude, None) if exclude else None
+    result = {}
+    for key, value in record.items():
+        if key not in column_types:
+            if skip_unknown:
+                continue
+            raise ValueError(f"Column '{key}' does not exist in table (use --skip-unknown to ignore it)")
+        result[key] = _coerce_value(value, column_types[key], key)
+    return (excluded, result) if exclude else result
+
+
+def _coerce_value(value, column_type: str, column: str):
+    """Convert a single value (usually a CSV string) to a column type."""
+    if not isinstance(value, str):
+        return value
+    if column_type == "TEXT":
+        return value
+    if value == "":
+        return None
+
+    try:
+        if column_type == "INTEGER":
+            try:
+                return int(value)
+            except ValueError:
+                number = float(value)
+                if not number.is_integer():
+                    raise
+                return int(number)
+        if column_type == "REAL":
+            return float(value)
+        if column_type == "NUMERIC":
+            try:
+                return int(value)
+            except ValueError:
+                return float(value)
+        if column_type == "BOOLEAN":
+            lowered = value.strip().lower()
+            if lowered in _TRUE_STRINGS:
+                return True
+            if lowered in _FALSE_STRINGS:
+                return False
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid {column_type} value for column '{column}': {value!r}")
+
+    return value
+
+
+@app.command()
+def export(
+    source: str = typer.Argument(..., help="Table name or SELECT query to export"),
+    out: Optional[Path] = typer.Option(None, "--out", "-o", help="Output file (default: stdout); a directory with --tenants"),
+    format: Optional[str] = typer.Option(None, "--format", "-f", help="Output format: csv or jsonl (default: from --out extension, else csv)"),
+    tenant: Optional[str] = typer.Option("main", "--tenant", "-t", help="Tenant name"),
+    tenants: Optional[str] = typer.Option(None, "--tenants", help="'all' or comma-separated tenant names, one file per tenant"),
+    gzip_output: bool = typer.Option(False, "--gzip", "-z", help="Compress output with gzip (implied by a .gz --out)"),
+    batch_size: int = typer.Option(1000, "--batch-size", "-b", help="Rows fetched per round trip"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Tenants exported in parallel"),
+):
+    """Export a table or query result to CSV or JSON Lines.
+
+    Rows are streamed from SQLite and written as they are read, so memory
+    use stays constant regardless of result size.
+
+    Examples:
+        cinch data export users --out users.csv
+        cinch data export "SELECT id, email FROM users WHERE active = 1" -f jsonl > active.jsonl
+        cinch data export events --out events.jsonl.gz
+        cinch data export users --tenants all --out exports/ --gzip
+    """
+    import re
+    import sys
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from cinchdb.core.database import CinchDB
+
+    config, config_data = get_config_with_data()
+
+    if len(source.split()) > 1:
+        sql = source
+    elif re.match(r"^\w+$", source):
+        sql = f"SELECT * FROM {source}"
+    else:
+        console.print(f"[red]❌ Invalid table name: {source}[/red]")
+        raise typer.Exit(1)
+
+    if out is not None and out.suffix.lower() == ".gz":
+        gzip_output = True
+    file_format = format or (_infer_file_format(out) if out is not None and not tenants else None) or "csv"
+    if file_format not in ("csv", "jsonl"):
+        console.print("[red]❌ Format must be 'csv' or 'jsonl'[/red]")
+        raise typer.Exit(1)
+
+    if batch_size <= 0:
+        console.print("[red]❌ Batch size must be positive[/red]")
+        raise typer.Exit(1)
+
+    def export_one(tenant_name: str, path: Optional[Path]) -> int:
+        db = CinchDB(config_data.active_database, tenant=tenant_name, project_dir=config.project_dir)
+        rows = db.query_iter(sql, batch_size=batch_size)
+        if path is None:
+            if gzip_output:
+                import gzip
+                import io
+                with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") as gz:
+                    with io.TextIOWrapper(gz, encoding="utf-8", newline="") as f:
+                        return _write_rows(rows, f, file_format)
+            return _write_rows(rows, sys.stdout, file_format)
+        with _open_output(path, gzip_output) as f:
+            return _write_rows(rows, f, file_format)
+
+    started = time.perf_counter()
+
+    if not tenants:
+        try:
+            count = export_one(tenant, out)
+        except Exception as e:
+            console.print(f"[red]❌ Export failed: {e}[/red]")
+            raise typer.Exit(1)
+        if out is not None:
+            elapsed = time.perf_counter() - started
+            console.print(f"[green]✅ Exported {count} row(s) to {out} in {elapsed:.2f}s[/green]")
+        return
+
+    if out is None:
+        console.print("[red]❌ --out must be a directory when exporting multiple tenants[/red]")
+        raise typer.Exit(1)
+
+    if tenants == "all":
+        db = CinchDB(config_data.active_database, project_dir=config.project_dir)
+        tenant_names = [t.name for t in db.list_tenants()]
+    else:
+        tenant_names = [name.strip() for name in tenants.split(",") if name.strip()]
+
+    out.mkdir(parents=True, exist_ok=True)
+    extension = file_format + (".gz" if gzip_output else "")
+
+    console.print(f"[yellow]📤 Exporting {len(tenant_names)} tenant(s) to {out}/...[/yellow]")
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            name: executor.submit(export_one, name, out / f"{name}.{extension}")
+            for name in tenant_names
+        }
+        for name, future in futures.items():
+            try:
+                console.print(f"[cyan]   {name}: {future.result()} row(s)[/cyan]")
+            except Exception as e:
+                failed = True
+                console.print(f"[red]❌ {name}: {e}[/red]")
+
+    if failed:
+        raise typer.Exit(1)
+
+    elapsed = time.perf_counter() - started
+    console.print(f"[green]✅ Exported {len(tenant_names)} tenant(s) in {elapsed:.2f}s[/green]")
+
+
+def _open_output(path: Path, compress: bool):
+    """Open an output file for text writing, gzip-compressed if requested."""
+    import gzip
+
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _write_rows(rows, f, file_format: str) -> int:
+    """Write rows to an open text file as they arrive; returns the row count."""
+    import csv
+    import json
+
+    count = 0
+    if file_format == "csv":
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            f.write(json.dumps(row, default=str) + "\n")
+            count += 1
+    return count
+
+
 def _parse_conditions(conditions_str: str) -> dict:
     """Parse condition string into filter dictionary."""
     filters = {}
@@ -97,6 +97,48 @@ def init(
         raise typer.Exit(1)
 
 
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    port: int = typer.Option(8000, "--port", "-p", help="Port to listen on"),
+    api_key: Optional[str] = typer.Option(
+        None, "--api-key", envvar="CINCHDB_API_KEY", help="Key clients must send in X-API-Key"
+    ),
+    workers: int = typer.Option(16, "--workers", "-w", help="Worker threads handling requests"),
+    group_commit: bool = typer.Option(
+        True, "--group-commit/--no-group-commit", help="Commit concurrent writes to a tenant together"
+    ),
+    project_dir: Optional[Path] = typer.Option(
+        None, "--project-dir", help="Project directory (default: search from current directory)"
+    ),
+):
+    """Serve the project over HTTP for remote connections."""
+    from cinchdb.core.path_utils import get_project_root
+    from cinchdb.core.writer import WriterOptions
+    from cinchdb.server import CinchServer
+
+    try:
+        project_path = project_dir or get_project_root(Path.cwd())
+    except FileNotFoundError:
+        typer.secho("❌ No .cinchdb directory found. Run 'cinch init' first.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    server = CinchServer(
+        project_path, host=host, port=port, api_key=api_key, workers=workers,
+        writer_options=WriterOptions() if group_commit else None,
+    )
+    typer.secho(f"✅ Serving {project_path} on {server.url}", fg=typer.colors.GREEN)
+    if api_key is None:
+        typer.secho("   No API key set: every request is accepted", fg=typer.colors.YELLOW)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
 @app.command()
 def version():
     """Show CinchDB version."""
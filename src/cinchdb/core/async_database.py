@@ -0,0 +1,445 @@
+"""Asyncio interface to CinchDB."""
+
+import asyncio
+import functools
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from cinchdb.core.database import CinchDB, _RemoteCall
+from cinchdb.core.path_utils import get_project_root
+
+if TYPE_CHECKING:
+    from cinchdb.core.batch import AsyncBatch
+    from cinchdb.core.http import HTTPOptions
+    from cinchdb.core.writer import WriterOptions
+    from cinchdb.managers.kv import KVOptions
+    from cinchdb.models import Tenant
+
+
+class _TenantExecutor:
+    """Single-thread workers with each tenant pinned to one of them.
+
+    Calls for the same tenant run one at a time and in submission order on
+    the same thread, so they never contend for that tenant's write lock;
+    different tenants spread across the workers and run in parallel.
+    """
+
+    def __init__(self, max_workers: int):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"cinchdb-async-{i}")
+            for i in range(max_workers)
+        ]
+
+    def submit(self, key: str, fn: Callable[[], Any]) -> Future:
+        worker = self._workers[zlib.crc32(key.encode()) % len(self._workers)]
+        return worker.submit(fn)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for worker in self._workers:
+            worker.shutdown(wait=wait, cancel_futures=True)
+
+
+class _Shared:
+    """Executor, backpressure slots and HTTP client shared by for_tenant() handles."""
+
+    def __init__(self, max_workers: int, max_pending: int, headers: Dict[str, str]):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.executor = _TenantExecutor(max_workers)
+        self.slots = asyncio.Semaphore(max_pending)
+        self.headers = headers
+        self.client = None
+
+
+class AsyncCinchDB:
+    """Asyncio counterpart of CinchDB.
+
+    Local connections run each call of the synchronous API on a bounded
+    pool of worker threads. Every tenant is pinned to one worker, so its
+    calls run in order without racing each other for the write lock.
+    Remote connections send query(), insert(), update() and delete() with
+    an httpx.AsyncClient; other remote calls run on the workers.
+
+    At most max_pending calls are in flight at once; further calls wait
+    for a slot, which pushes back on producers instead of queueing without
+    bound. Cancelling a call that is still queued removes it; a call that
+    is already running on a worker finishes, and its result is discarded.
+
+    Examples:
+        async with AsyncCinchDB("mydb", project_dir="/path/to/project") as db:
+            await db.insert("users", {"name": "Alice"})
+            users = await db.query("SELECT * FROM users")
+            await db.kv.set("session:1", {"user": "Alice"}, ttl=3600)
+
+            other = db.for_tenant("acme")
+            await other.query("SELECT COUNT(*) AS n FROM users")
+    """
+
+    def __init__(
+        self,
+        database: str,
+        branch: str = "main",
+        tenant: str = "main",
+        project_dir: Optional[Path] = None,
+        api_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        encryption_manager=None,
+        encryption_key: Optional[str] = None,
+        kv_options: Optional["KVOptions"] = None,
+        writer_options: Optional["WriterOptions"] = None,
+        http_options: Optional["HTTPOptions"] = None,
+        max_workers: int = 4,
+        max_pending: int = 64,
+    ):
+        """Initialize an async connection.
+
+        Args:
+            database: Database name
+            branch: Branch name (default: main)
+            tenant: Tenant name (default: main)
+            project_dir: Path to project directory for local connection
+            api_url: Base URL for remote API connection
+            api_key: API key for remote connection
+            encryption_manager: EncryptionManager instance for encrypted connections
+            encryption_key: Encryption key for encrypted tenant databases
+            kv_options: KV store tuning such as compression (local only)
+            writer_options: Group-commit writes through a per-tenant writer
+                thread (local only)
+            http_options: Connection pool, compression and retry settings
+                (remote only)
+            max_workers: Worker threads running synchronous calls
+            max_pending: Calls allowed in flight before new calls wait
+
+        Raises:
+            ValueError: If neither local nor remote connection params provided
+        """
+        self._db = CinchDB(
+            database=database, branch=branch, tenant=tenant, project_dir=project_dir,
+            api_url=api_url, api_key=api_key, encryption_manager=encryption_manager,
+            encryption_key=encryption_key, kv_options=kv_options, writer_options=writer_options,
+            http_options=http_options,
+        )
+        headers = {} if self._db.is_local else {"X-API-Key": api_key, "Content-Type": "application/json"}
+        self._shared = _Shared(max_workers, max_pending, headers)
+        self._owner = True
+
+    @property
+    def database(self) -> str:
+        return self._db.database
+
+    @property
+    def branch(self) -> str:
+        return self._db.branch
+
+    @property
+    def tenant(self) -> str:
+        return self._db.tenant
+
+    @property
+    def is_local(self) -> bool:
+        return self._db.is_local
+
+    @property
+    def sync(self) -> CinchDB:
+        """The synchronous CinchDB this instance delegates to."""
+        return self._db
+
+    @property
+    def client(self):
+        """Get or create the async HTTP client for remote connections."""
+        if not self.is_local and self._shared.client is None:
+            import httpx
+            self._shared.client = httpx.AsyncClient(
+                headers=self._shared.headers, **self._db.http_options.client_kwargs()
+            )
+        return self._shared.client
+
+    def for_tenant(self, tenant: str) -> "AsyncCinchDB":
+        """Return a handle for another tenant sharing this instance's workers.
+
+        Args:
+            tenant: Tenant name
+
+        Returns:
+            AsyncCinchDB for the same database and branch
+        """
+        db = self._db
+        other = AsyncCinchDB.__new__(AsyncCinchDB)
+        other._db = CinchDB(
+            database=db.database, branch=db.branch, tenant=tenant, project_dir=db.project_dir,
+            api_url=db.api_url, api_key=db.api_key, encryption_manager=db.encryption_manager,
+            encryption_key=db.encryption_key, kv_options=db.kv_options, writer_options=db.writer_options,
+            http_options=db.http_options,
+        )
+        other._shared = self._shared
+        other._owner = False
+        return other
+
+    async def run_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func(db, *args, **kwargs) with the synchronous CinchDB on this tenant's worker.
+
+        Use this for calls without an async counterpart, e.g.
+        ``await db.run_sync(lambda db: db.list_tables())``.
+        """
+        return await self._run(func, self._db, *args, **kwargs)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on this tenant's worker once a slot is free."""
+        slots = self._shared.slots
+        await slots.acquire()
+        try:
+            future = self._shared.executor.submit(
+                f"{self.database}/{self.branch}/{self.tenant}",
+                functools.partial(func, *args, **kwargs),
+            )
+        except BaseException:
+            slots.release()
+            raise
+
+        # Hold the slot until the worker is done, even if the caller is cancelled
+        loop = asyncio.get_running_loop()
+
+        def release(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def _send(self, call: _RemoteCall) -> Any:
+        """Make a remote API request without blocking the event loop.
+
+        Failed requests are retried as in CinchDB._make_request.
+        """
+        import httpx
+        from cinchdb.core.http import retry_delay
+
+        options = self._db.http_options
+        url, kwargs = self._db._prepare_request(call.endpoint, dict(call.kwargs))
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self._shared.slots:
+                    response = await self.client.request(call.method, url, **kwargs)
+            except httpx.TransportError as e:
+                delay = retry_delay(options, call.method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = retry_delay(options, call.method, attempt, response=response)
+                if delay is None:
+                    return call.decode(self._db._parse_response(response))
+            await asyncio.sleep(delay)
+
+    # Data operations
+
+    async def query(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        skip_validation: bool = False,
+        mask_columns: Optional[List[str]] = None,
+        row_format: str = "dict",
+    ) -> List[Dict[str, Any]] | List[Tuple[Any, ...]]:
+        """Execute a SQL query (see CinchDB.query)."""
+        if self.is_local:
+            return await self._run(self._db.query, sql, params, skip_validation, mask_columns, row_format)
+
+        if row_format not in ("dict", "tuple"):
+            raise ValueError("row_format must be 'dict' or 'tuple'")
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+        return await self._send(self._db._query_call(sql, params, mask_columns, row_format))
+
+    async def insert(self, table: str, *data: Dict[str, Any]) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Insert one or more records into a table (see CinchDB.insert)."""
+        if self.is_local:
+            return await self._run(self._db.insert, table, *data)
+
+        if not data:
+            raise ValueError("At least one record must be provided")
+        return await self._send(self._db._insert_call(table, data))
+
+    async def update(self, table: str, *updates: Dict[str, Any]) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Update one or more records by ID (see CinchDB.update)."""
+        if self.is_local:
+            return await self._run(self._db.update, table, *updates)
+
+        if not updates:
+            raise ValueError("At least one update record must be provided")
+        for i, update_data in enumerate(updates):
+            if 'id' not in update_data:
+                raise ValueError(f"Update record {i} missing required 'id' field")
+        return await self._send(self._db._update_call(table, updates))
+
+    async def delete(self, table: str, *ids: str) -> int:
+        """Delete one or more records by ID (see CinchDB.delete)."""
+        if self.is_local:
+            return await self._run(self._db.delete, table, *ids)
+
+        if not ids:
+            raise ValueError("At least one ID must be provided")
+        return await self._send(self._db._delete_call(table, ids))
+
+    def batch(self) -> "AsyncBatch":
+        """Collect data calls and run them together (see CinchDB.batch).
+
+        Examples:
+            async with db.batch() as batch:
+                alice = batch.insert("users", {"name": "Alice"})
+            alice.value["id"]
+        """
+        from cinchdb.core.batch import AsyncBatch
+        return AsyncBatch(self)
+
+    async def upsert(self, table: str, *records: Dict[str, Any], **kwargs) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Insert or update records on conflict (see CinchDB.upsert)."""
+        return await self._run(self._db.upsert, table, *records, **kwargs)
+
+    async def delete_where(self, table: str, operator: str = "AND", **filters) -> int:
+        """Delete records matching filters (see CinchDB.delete_where)."""
+        return await self._run(self._db.delete_where, table, operator, **filters)
+
+    async def update_where(self, table: str, data: Dict[str, Any], operator: str = "AND", **filters) -> int:
+        """Update records matching filters (see CinchDB.update_where)."""
+        return await self._run(self._db.update_where, table, data, operator, **filters)
+
+    async def select(self, model_class, **kwargs) -> List[Any]:
+        """Select rows from a table or model (see CinchDB.select)."""
+        return await self._run(self._db.select, model_class, **kwargs)
+
+    async def aggregate(self, source, **kwargs) -> List[Dict[str, Any]]:
+        """Compute aggregates over a table (see CinchDB.aggregate)."""
+        return await self._run(self._db.aggregate, source, **kwargs)
+
+    @property
+    def kv(self) -> "AsyncKV":
+        """Async key-value store for this tenant (local only)."""
+        if not self.is_local:
+            raise RuntimeError("KV store is not available for remote connections yet")
+        return AsyncKV(self)
+
+    # Tenant operations
+
+    async def list_tenants(self, include_system: bool = False) -> List["Tenant"]:
+        """List tenants in the branch (see CinchDB.list_tenants)."""
+        return await self._run(self._db.list_tenants, include_system)
+
+    async def create_tenant(self, name: str, **kwargs) -> "Tenant":
+        """Create a tenant (see CinchDB.create_tenant)."""
+        return await self._run(self._db.create_tenant, name, **kwargs)
+
+    async def delete_tenant(self, name: str) -> None:
+        """Delete a tenant and all its data (see CinchDB.delete_tenant)."""
+        await self._run(self._db.delete_tenant, name)
+
+    async def copy_tenant(self, source: str, target: str) -> "Tenant":
+        """Copy a tenant and its data (see CinchDB.copy_tenant)."""
+        return await self._run(self._db.copy_tenant, source, target)
+
+    async def rename_tenant(self, old_name: str, new_name: str) -> None:
+        """Rename a tenant (see CinchDB.rename_tenant)."""
+        await self._run(self._db.rename_tenant, old_name, new_name)
+
+    async def query_tenants(self, sql: str, **kwargs) -> Any:
+        """Run a SELECT on many tenants in parallel (see CinchDB.query_tenants)."""
+        return await self._run(self._db.query_tenants, sql, **kwargs)
+
+    # Lifecycle
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and stop the workers (queued calls are cancelled)."""
+        if not self._owner:
+            return
+        if self._shared.client is not None:
+            await self._shared.client.aclose()
+            self._shared.client = None
+        await asyncio.get_running_loop().run_in_executor(None, self._shared.executor.shutdown)
+        self._db.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+
+class AsyncKV:
+    """Async proxy for KVManager; each method runs on the tenant's worker.
+
+    Every public KVManager method is available as a coroutine with the same
+    arguments, e.g. ``await db.kv.get("key")``.
+    """
+
+    def __init__(self, db: AsyncCinchDB):
+        self._db = db
+
+    def __getattr__(self, name: str):
+        from cinchdb.managers.kv import KVManager
+
+        method = getattr(KVManager, name, None)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(f"'AsyncKV' object has no attribute '{name}'")
+
+        async def call(*args, **kwargs):
+            return await self._db._run(lambda: getattr(self._db.sync.kv, name)(*args, **kwargs))
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+
+def connect_async(
+    database: str,
+    branch: str = "main",
+    tenant: str = "main",
+    project_dir: Optional[Path] = None,
+    encryption_key: Optional[str] = None,
+    kv_options: Optional["KVOptions"] = None,
+    writer_options: Optional["WriterOptions"] = None,
+    max_workers: int = 4,
+    max_pending: int = 64,
+) -> AsyncCinchDB:
+    """Connect to a local CinchDB database for use from asyncio code.
+
+    Args:
+        database: Database name
+        branch: Branch name (default: main)
+        tenant: Tenant name (default: main)
+        project_dir: Path to project directory (optional, will search for .cinchdb)
+        encryption_key: Encryption key for encrypted tenant databases
+        kv_options: KV store tuning such as compression
+        writer_options: Group-commit writes through a per-tenant writer thread
+        max_workers: Worker threads running database calls
+        max_pending: Calls allowed in flight before new calls wait
+
+    Returns:
+        AsyncCinchDB connection instance
+
+    Examples:
+        db = connect_async("mydb")
+        rows = await db.query("SELECT * FROM users")
+        await db.aclose()
+    """
+    if project_dir is None:
+        try:
+            project_dir = get_project_root(Path.cwd())
+        except FileNotFoundError:
+            raise ValueError("No .cinchdb directory found. Run 'cinchdb init' first.")
+
+    return AsyncCinchDB(
+        database=database, branch=branch, tenant=tenant, project_dir=project_dir,
+        encryption_key=encryption_key, kv_options=kv_options, writer_options=writer_options,
+        max_workers=max_workers, max_pending=max_pending,
+    )
@@ -0,0 +1,245 @@
+"""Batched operations that are sent to a remote API in one request."""
+
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from cinchdb.utils.sql_validator import validate_query_safe
+
+if TYPE_CHECKING:
+    from cinchdb.core.async_database import AsyncCinchDB
+    from cinchdb.core.database import CinchDB, _RemoteCall
+
+
+class BatchResult:
+    """Result of one operation in a batch, available once the batch has run."""
+
+    __slots__ = ("_done", "_value", "_error")
+
+    def __init__(self):
+        self._done = False
+        self._value = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the operation has run."""
+        return self._done
+
+    @property
+    def value(self) -> Any:
+        """The operation's return value.
+
+        Raises:
+            RuntimeError: If the batch hasn't run up to this operation
+            Exception: The error the operation failed with
+        """
+        if self._error is not None:
+            raise self._error
+        if not self._done:
+            raise RuntimeError("Batch operation has not run yet")
+        return self._value
+
+    def _set(self, value: Any) -> None:
+        self._value = value
+        self._done = True
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._done = True
+
+
+class Batch:
+    """Operations collected by CinchDB.batch() and run together.
+
+    Remote connections send the whole batch as a single POST /batch
+    request; local connections run the operations directly. Either way
+    operations run in the order they were added and stop at the first
+    failure, whose error is raised. The batch is not a transaction:
+    operations that ran before the failure stay applied.
+
+    Examples:
+        with db.batch() as batch:
+            user = batch.insert("users", {"name": "Alice"})
+            batch.update("users", {"id": "123", "status": "active"})
+            count = batch.query("SELECT COUNT(*) AS n FROM users")
+
+        print(user.value["id"], count.value[0]["n"])
+    """
+
+    def __init__(self, db: "CinchDB"):
+        self._db = db
+        self._operations: List[tuple] = []
+        self._results: Optional[List[Any]] = None
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def _add(self, run: Callable[[], Any], call: Callable[[], "_RemoteCall"]) -> BatchResult:
+        if self._results is not None or self._error is not None:
+            raise RuntimeError("Batch has already been executed")
+        result = BatchResult()
+        self._operations.append((run, call, result))
+        return result
+
+    def query(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        skip_validation: bool = False,
+        mask_columns: Optional[List[str]] = None,
+        row_format: str = "dict",
+    ) -> BatchResult:
+        """Add a SELECT query (see CinchDB.query)."""
+        if row_format not in ("dict", "tuple"):
+            raise ValueError("row_format must be 'dict' or 'tuple'")
+        if not skip_validation:
+            validate_query_safe(sql)
+
+        db = self._db
+        return self._add(
+            lambda: db.query(sql, params, skip_validation=True, mask_columns=mask_columns, row_format=row_format),
+            lambda: db._query_call(sql, params, mask_columns, row_format),
+        )
+
+    def insert(self, table: str, *data: Dict[str, Any]) -> BatchResult:
+        """Add an insert of one or more records (see CinchDB.insert)."""
+        if not data:
+            raise ValueError("At least one record must be provided")
+
+        db = self._db
+        return self._add(lambda: db.insert(table, *data), lambda: db._insert_call(table, data))
+
+    def update(self, table: str, *updates: Dict[str, Any]) -> BatchResult:
+        """Add an update of one or more records by ID (see CinchDB.update)."""
+        if not updates:
+            raise ValueError("At least one update record must be provided")
+        for i, update_data in enumerate(updates):
+            if 'id' not in update_data:
+                raise ValueError(f"Update record {i} missing required 'id' field")
+
+        db = self._db
+        return self._add(lambda: db.update(table, *updates), lambda: db._update_call(table, updates))
+
+    def delete(self, table: str, *ids: str) -> BatchResult:
+        """Add a delete of one or more records by ID (see CinchDB.delete)."""
+        if not ids:
+            raise ValueError("At least one ID must be provided")
+
+        db = self._db
+        return self._add(lambda: db.delete(table, *ids), lambda: db._delete_call(table, ids))
+
+    @property
+    def results(self) -> List[Any]:
+        """Return values of the operations, in order, once executed."""
+        if self._results is None:
+            raise RuntimeError("Batch has not been executed")
+        return self._results
+
+    def execute(self) -> List[Any]:
+        """Run the batched operations.
+
+        Returns:
+            Each operation's return value, in the order they were added
+
+        Raises:
+            Exception: The error of the first operation that failed
+        """
+        if self._error is not None:
+            raise self._error
+        if self._results is None:
+            if not self._operations:
+                self._results = []
+            elif self._db.is_local:
+                self._run_local()
+            else:
+                self._db._send(self._remote_call())
+        return self._results
+
+    def _run_local(self) -> None:
+        for run, _, result in self._operations:
+            try:
+                result._set(run())
+            except Exception as e:
+                result._fail(e)
+                self._error = e
+                raise
+        self._results = [result.value for _, _, result in self._operations]
+
+    def _remote_call(self) -> "_RemoteCall":
+        """Describe the POST /batch request for the collected operations."""
+        from cinchdb.core.database import _RemoteCall
+
+        calls = [call() for _, call, _ in self._operations]
+        operations = []
+        for call in calls:
+            operation = {"method": call.method, "path": call.endpoint}
+            if call.kwargs.get("params"):
+                operation["params"] = call.kwargs["params"]
+            if "json" in call.kwargs:
+                operation["body"] = call.kwargs["json"]
+            operations.append(operation)
+
+        def decode(response: Dict[str, Any]) -> List[Any]:
+            for call, (_, _, result), outcome in zip(calls, self._operations, response.get("results", [])):
+                status = outcome.get("status", 200)
+                body = outcome.get("body")
+                if status >= 400:
+                    detail = body.get("detail", "Unknown error") if isinstance(body, dict) else "Unknown error"
+                    error = Exception(f"API Error ({status}): {detail}")
+                    result._fail(error)
+                    self._error = error
+                    raise error
+                result._set(call.decode(body))
+
+            missing = [result for _, _, result in self._operations if not result.done]
+            if missing:
+                raise Exception(f"API Error: batch response is missing {len(missing)} result(s)")
+            self._results = [result.value for _, _, result in self._operations]
+            return self._results
+
+        return _RemoteCall("POST", "/batch", {"json": {"operations": operations}}, decode)
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Operations are discarded if the block raised
+        if exc_type is None:
+            self.execute()
+
+
+class AsyncBatch(Batch):
+    """Batch returned by AsyncCinchDB.batch(), run with ``async with``.
+
+    Examples:
+        async with db.batch() as batch:
+            user = batch.insert("users", {"name": "Alice"})
+        print(user.value["id"])
+    """
+
+    def __init__(self, db: "AsyncCinchDB"):
+        super().__init__(db.sync)
+        self._async_db = db
+
+    async def execute(self) -> List[Any]:
+        """Run the batched operations (see Batch.execute)."""
+        if self._error is not None:
+            raise self._error
+        if self._results is None:
+            if not self._operations:
+                self._results = []
+            elif self._db.is_local:
+                await self._async_db._run(self._run_local)
+            else:
+                await self._async_db._send(self._remote_call())
+        return self._results
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncCinchDB.batch()")
+
+    async def __aenter__(self) -> "AsyncBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.execute()
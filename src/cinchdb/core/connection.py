@@ -2,8 +2,10 @@
 
 import os
 import sqlite3
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterator, List, Any, Tuple
 from contextlib import contextmanager
 from datetime import datetime
 
@@ -29,7 +31,8 @@ sqlite3.register_converter("DATETIME", convert_datetime)
 class DatabaseConnection:
     """Manages a SQLite database connection with WAL mode."""
 
-    def __init__(self, path: Path, tenant_id: Optional[str] = None, encryption_manager=None, encryption_key: Optional[str] = None):
+    def __init__(self, path: Path, tenant_id: Optional[str] = None, encryption_manager=None, encryption_key: Optional[str] = None,
+                 pragmas: Optional[Dict[str, Any]] = None, read_only: bool = False):
         """Initialize database connection.
 
         Args:
@@ -37,16 +40,32 @@ class DatabaseConnection:
             tenant_id: Tenant ID for per-tenant encryption
             encryption_manager: EncryptionManager instance for encrypted connections
             encryption_key: Encryption key for encrypted databases
+            pragmas: Extra PRAGMA settings applied after the defaults (page_size
+                is applied first and only affects newly created files)
+            read_only: Open the file with a mode=ro URI and PRAGMA query_only,
+                skipping the WAL and write setup. The file must already exist.
+
+        Raises:
+            sqlite3.OperationalError: If read_only is set and the file doesn't exist
         """
         self.path = Path(path)
         self.tenant_id = tenant_id
         self.encryption_manager = encryption_manager
         self.encryption_key = encryption_key
+        self.read_only = read_only
+        self.pragmas = dict(pragmas or {})
+        for name in self.pragmas:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid PRAGMA name: {name}")
         self._conn: Optional[sqlite3.Connection] = None
         self._connect()
 
     def _connect(self) -> None:
         """Establish database connection and configure WAL mode."""
+        if self.read_only:
+            self._connect_read_only()
+            return
+
         # Ensure directory exists
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -78,9 +97,15 @@ class DatabaseConnection:
 
         # CRITICAL: Configure WAL mode for ALL connection types - fail if any of these fail
         try:
+            # Page size can only be chosen before WAL mode creates the file
+            if "page_size" in self.pragmas:
+                self._conn.execute(f"PRAGMA page_size = {int(self.pragmas['page_size'])}")
             self._conn.execute("PRAGMA journal_mode = WAL")
             self._conn.execute("PRAGMA synchronous = NORMAL")
             self._conn.execute("PRAGMA wal_autocheckpoint = 0")
+            for name, value in self.pragmas.items():
+                if name != "page_size":
+                    self._conn.execute(f"PRAGMA {name} = {value}")
         except sqlite3.OperationalError as e:
             self._conn.close()
             raise
@@ -94,6 +119,51 @@ class DatabaseConnection:
             self._conn.close()
             raise
 
+    def _connect_read_only(self) -> None:
+        """Open a query-only connection without the write-oriented setup.
+
+        The journal mode is stored in the file, so readers of a WAL database
+        still read from the WAL without running PRAGMA journal_mode or
+        committing. Unencrypted connections may be handed between threads
+        (one at a time) by ReaderPool. Readers never create the file.
+        """
+        if not self.path.exists():
+            raise sqlite3.OperationalError(f"Database file {self.path} does not exist")
+
+        if self.encryption_manager:
+            self._conn = self.encryption_manager.get_connection(self.path, tenant_id=self.tenant_id)
+        elif self.encryption_key:
+            # Keyed files can't be opened through a mode=ro URI reliably; query_only still applies
+            self._conn = sqlite3.connect(
+                str(self.path),
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            )
+            try:
+                self._conn.execute(f"PRAGMA key = '{self.encryption_key}'")
+            except sqlite3.OperationalError as e:
+                self._conn.close()
+                raise ValueError(
+                    "SQLCipher is required for encryption but not available. "
+                    "Please install pysqlcipher3 or sqlite3 with SQLCipher support."
+                ) from e
+        else:
+            self._conn = sqlite3.connect(
+                f"{self.path.absolute().as_uri()}?mode=ro",
+                uri=True,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                check_same_thread=False,
+            )
+
+        try:
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA query_only = ON")
+            for name, value in self.pragmas.items():
+                if name != "page_size":
+                    self._conn.execute(f"PRAGMA {name} = {value}")
+        except sqlite3.OperationalError:
+            self._conn.close()
+            raise
+
     def execute(self, sql: str, params: Optional[tuple] = None) -> sqlite3.Cursor:
         """Execute a SQL statement.
 
@@ -215,3 +285,136 @@ class ConnectionPool:
         for conn in self._connections.values():
             conn.close()
         self._connections.clear()
+
+
+def file_identity(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return what identifies the file currently at path (None if missing).
+
+    Device, inode and ctime change when a tenant file is deleted and
+    recreated or replaced, so long-lived connections compare identities to
+    notice they point at a file that is no longer there.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_ctime_ns)
+
+
+class ReaderPool:
+    """Idle read-only connections kept for reuse, per database file.
+
+    Readers never take write locks, so in WAL mode they run concurrently
+    with each other and with the single writer. Each connection is used by
+    one caller at a time and returned afterwards; up to max_idle_per_file
+    connections are kept per file and max_files files are tracked, least
+    recently used first out.
+
+    A pooled connection is only reused while the path still refers to the
+    same file (device, inode and ctime), so deleted or replaced tenant files
+    are never read through a stale handle. Encrypted connections are not
+    pooled.
+    """
+
+    def __init__(self, max_idle_per_file: int = 4, max_files: int = 64):
+        """Initialize an empty pool.
+
+        Args:
+            max_idle_per_file: Idle connections kept per database file
+            max_files: Database files with idle connections kept at once
+        """
+        self.max_idle_per_file = max_idle_per_file
+        self.max_files = max_files
+        self._idle: "OrderedDict[Tuple[str, Optional[str]], List[Tuple[Tuple[int, int, int], DatabaseConnection]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, path: Path, tenant_id: Optional[str] = None, encryption_manager=None) -> Iterator[DatabaseConnection]:
+        """Borrow a read-only connection to path.
+
+        Args:
+            path: Database file path
+            tenant_id: Tenant ID for per-tenant encryption
+            encryption_manager: EncryptionManager instance for encrypted connections
+
+        Yields:
+            Read-only DatabaseConnection, returned to the pool on exit
+        """
+        if encryption_manager is not None:
+            with DatabaseConnection(path, tenant_id=tenant_id, encryption_manager=encryption_manager, read_only=True) as conn:
+                yield conn
+            return
+
+        key = (str(path), tenant_id)
+        identity = file_identity(path)
+        conn = self._take(key, identity)
+        if conn is None:
+            conn = DatabaseConnection(path, tenant_id=tenant_id, read_only=True)
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        else:
+            self._release(key, identity, conn)
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, OrderedDict()
+        for connections in idle.values():
+            for _, conn in connections:
+                conn.close()
+
+    def _take(self, key, identity) -> Optional[DatabaseConnection]:
+        """Pop an idle connection for key, dropping ones for a replaced file."""
+        stale = []
+        conn = None
+        with self._lock:
+            connections = self._idle.get(key)
+            while connections:
+                conn_identity, candidate = connections.pop()
+                if identity is not None and conn_identity == identity:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+            if connections is not None and not connections:
+                del self._idle[key]
+        for candidate in stale:
+            candidate.close()
+        return conn
+
+    def _release(self, key, identity, conn: DatabaseConnection) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        if identity is None or conn._conn is None or conn._conn.in_transaction:
+            conn.close()
+            return
+
+        evicted: List[DatabaseConnection] = []
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(connections) < self.max_idle_per_file:
+                connections.append((identity, conn))
+                conn = None
+            while len(self._idle) > self.max_files:
+                _, dropped = self._idle.popitem(last=False)
+                evicted.extend(dropped_conn for _, dropped_conn in dropped)
+        if conn is not None:
+            conn.close()
+        for dropped_conn in evicted:
+            dropped_conn.close()
+
+
+_reader_pool: Optional[ReaderPool] = None
+_reader_pool_lock = threading.Lock()
+
+
+def get_reader_pool() -> ReaderPool:
+    """Return the process-wide pool of read-only connections."""
+    global _reader_pool
+    if _reader_pool is None:
+        with _reader_pool_lock:
+            if _reader_pool is None:
+                _reader_pool = ReaderPool()
+    return _reader_pool
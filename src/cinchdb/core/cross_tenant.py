@@ -0,0 +1,116 @@
+"""Cross-tenant queries over ATTACHed tenant databases.
+
+Tenant files are attached read-only to one scratch in-memory connection.
+Every table the query reads is replaced by a temporary ``UNION ALL`` over
+the attached copies with a synthetic ``tenant`` column, so the user's
+SELECT runs unchanged and SQLite does the grouping in a single statement.
+
+SQLite caps the number of attached databases (10 by default). Up to that
+many tenants are queried through temp views; beyond it, tenants are
+attached in batches and their rows copied into temp tables first, which
+keeps every aggregate exact at the cost of holding the rows in memory.
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# SQLITE_MAX_ATTACHED default, used when the limit can't be queried
+DEFAULT_ATTACH_LIMIT = 10
+
+TENANT_COLUMN = "tenant"
+
+
+def attach_limit(conn: sqlite3.Connection) -> int:
+    """Return how many databases can be attached to a connection."""
+    if hasattr(conn, "getlimit"):  # Python 3.11+
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+    return DEFAULT_ATTACH_LIMIT
+
+
+def referenced_tables(sql: str, table_names: Sequence[str]) -> List[str]:
+    """Return the tables from table_names whose names appear in sql."""
+    words = {word.lower() for word in re.findall(r"[A-Za-z_][A-Za-z0-9_]*", sql)}
+    return [name for name in table_names if name.lower() in words]
+
+
+def query_attached(
+    paths: Dict[str, Path],
+    tables: Dict[str, List[str]],
+    sql: str,
+    params: Optional[List[Any]] = None,
+    batch_size: Optional[int] = None,
+) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """Run a SELECT over the union of several tenant databases.
+
+    Args:
+        paths: Tenant name to database file
+        tables: Tables the query reads, mapped to their column names
+        sql: SELECT query; each table gains a "tenant" column
+        params: Query parameters (optional)
+        batch_size: Tenants attached at once (default: SQLite's attach limit)
+
+    Returns:
+        Tuple of (column names, rows as tuples)
+
+    Raises:
+        ValueError: If a table already has a column named "tenant"
+    """
+    for table, columns in tables.items():
+        if TENANT_COLUMN in columns:
+            raise ValueError(
+                f"Table '{table}' has a '{TENANT_COLUMN}' column, which clashes with the synthetic tenant column"
+            )
+
+    conn = sqlite3.connect("file::memory:", uri=True)
+    try:
+        limit = min(batch_size or attach_limit(conn), attach_limit(conn))
+        if limit <= 0:
+            raise ValueError("batch_size must be positive")
+
+        tenants = list(paths.items())
+        if len(tenants) <= limit:
+            aliases = _attach(conn, tenants)
+            for table in tables:
+                conn.execute(f"CREATE TEMP VIEW {table} AS {_union(table, aliases)}")
+        else:
+            for start in range(0, len(tenants), limit):
+                aliases = _attach(conn, tenants[start:start + limit])
+                for table in tables:
+                    if start == 0:
+                        conn.execute(f"CREATE TEMP TABLE {table} AS {_union(table, aliases)}")
+                    else:
+                        conn.execute(f"INSERT INTO temp.{table} {_union(table, aliases)}")
+                conn.commit()
+                for alias in aliases.values():
+                    conn.execute(f"DETACH DATABASE {alias}")
+
+        cursor = conn.execute(sql, params or [])
+        columns = tuple(desc[0] for desc in cursor.description)
+        return columns, cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def _attach(conn: sqlite3.Connection, tenants: List[Tuple[str, Path]]) -> Dict[str, str]:
+    """Attach tenant files read-only and return tenant name -> schema alias."""
+    aliases = {}
+    for i, (tenant, path) in enumerate(tenants):
+        alias = f"t{i}"
+        conn.execute(f"ATTACH DATABASE ? AS {alias}", (f"{Path(path).absolute().as_uri()}?mode=ro",))
+        aliases[tenant] = alias
+    return aliases
+
+
+def _union(table: str, aliases: Dict[str, str]) -> str:
+    """Build the UNION ALL of one table across attached tenants."""
+    return " UNION ALL ".join(
+        f"SELECT {_quote_literal(tenant)} AS {TENANT_COLUMN}, * FROM {alias}.{table}"
+        for tenant, alias in aliases.items()
+    )
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as an SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
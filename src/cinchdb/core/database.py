@@ -1,16 +1,20 @@
 """Unified database connection interface for CinchDB."""
 
 import os
+import time
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from cinchdb.models import Column, Change, Index
 from cinchdb.core.path_utils import get_project_root
 from cinchdb.utils import validate_query_safe
+from cinchdb.utils.pagination import Page
 from cinchdb.infrastructure.metadata_connection_pool import get_metadata_db
 from cinchdb.managers.base import ConnectionContext
 
 if TYPE_CHECKING:
+    from cinchdb.core.batch import Batch
     from cinchdb.managers.table import TableManager
     from cinchdb.managers.column import ColumnManager
     from cinchdb.managers.query import QueryManager
@@ -21,7 +25,10 @@ if TYPE_CHECKING:
     from cinchdb.managers.codegen import CodegenManager
     from cinchdb.managers.merge_manager import MergeManager
     from cinchdb.managers.index import IndexManager
-    from cinchdb.managers.kv import KVManager
+    from cinchdb.core.http import HTTPOptions
+    from cinchdb.core.writer import WriterOptions
+    from cinchdb.managers.kv import KVManager, KVOptions
+    from cinchdb.core.prepared import PreparedQuery
 
 
 class CinchDB:
@@ -67,6 +74,9 @@ class CinchDB:
         api_key: Optional[str] = None,
         encryption_manager=None,
         encryption_key: Optional[str] = None,
+        kv_options: Optional["KVOptions"] = None,
+        writer_options: Optional["WriterOptions"] = None,
+        http_options: Optional["HTTPOptions"] = None,
     ):
         """Initialize CinchDB connection.
 
@@ -79,6 +89,11 @@ class CinchDB:
             api_key: API key for remote connection
             encryption_manager: EncryptionManager instance for encrypted connections
             encryption_key: Encryption key for encrypted tenant databases
+            kv_options: KV store tuning such as compression (local only)
+            writer_options: Group-commit writes through a per-tenant writer
+                thread (local only, None writes directly)
+            http_options: Connection pool, compression and retry settings
+                (remote only, defaults to HTTPOptions())
 
         Raises:
             ValueError: If neither local nor remote connection params provided
@@ -88,7 +103,10 @@ class CinchDB:
         self.tenant = tenant
         self.encryption_manager = encryption_manager
         self.encryption_key = encryption_key
-        
+        self.kv_options = kv_options
+        self.writer_options = writer_options
+        self.http_options = http_options
+
         # Determine connection type
         if project_dir is not None:
             # Local connection
@@ -103,7 +121,9 @@ class CinchDB:
                 database=database,
                 branch=branch,
                 tenant=tenant,
-                encryption_manager=encryption_manager
+                encryption_manager=encryption_manager,
+                kv_options=kv_options,
+                writer_options=writer_options,
             )
 
             # Auto-materialize lazy database if needed
@@ -115,6 +135,8 @@ class CinchDB:
             self.api_key = api_key
             self.is_local = False
             self._session = None
+            from cinchdb.core.http import HTTPOptions
+            self.http_options = http_options or HTTPOptions()
             self._context = None  # Remote doesn't use ConnectionContext yet
         else:
             raise ValueError(
@@ -155,18 +177,16 @@ class CinchDB:
 
     @property
     def session(self):
-        """Get or create HTTP session for remote connections."""
+        """Get or create the pooled HTTP client for remote connections.
+
+        Connections are kept alive and reused across requests, up to the
+        limits in http_options.
+        """
         if not self.is_local and self._session is None:
-            try:
-                import requests
-            except ImportError:
-                raise ImportError(
-                    "The 'requests' package is required for remote connections. "
-                    "Install it with: pip install requests"
-                )
-            self._session = requests.Session()
-            self._session.headers.update(
-                {"X-API-Key": self.api_key, "Content-Type": "application/json"}
+            import httpx
+            self._session = httpx.Client(
+                headers={"X-API-Key": self.api_key, "Content-Type": "application/json"},
+                **self.http_options.client_kwargs(),
             )
         return self._session
 
@@ -187,6 +207,14 @@ class CinchDB:
         if "/data" in endpoint:
             return True
 
+        # Aggregates read tenant data (tables/{table}/aggregate)
+        if endpoint.endswith("/aggregate"):
+            return True
+
+        # Batches carry data operations for one tenant
+        if endpoint == "/batch":
+            return True
+
         # Tenant management operations need tenant
         if endpoint.startswith("/tenants"):
             return True
@@ -208,6 +236,30 @@ class CinchDB:
         Raises:
             Exception: If request fails
         """
+        import httpx
+        from cinchdb.core.http import retry_delay
+
+        url, kwargs = self._prepare_request(endpoint, kwargs)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                delay = retry_delay(self.http_options, method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = retry_delay(self.http_options, method, attempt, response=response)
+                if delay is None:
+                    return self._parse_response(response)
+            time.sleep(delay)
+
+    def _prepare_request(self, endpoint: str, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Return the URL and request arguments with the default query parameters.
+
+        JSON bodies above http_options.compress_min_bytes are gzipped.
+        """
         if self.is_local:
             raise RuntimeError("Cannot make API requests on local connection")
 
@@ -223,14 +275,71 @@ class CinchDB:
 
         kwargs["params"] = params
 
-        response = self.session.request(method, url, **kwargs)
+        from cinchdb.core.http import compress_body
+        return url, compress_body(kwargs, self.http_options)
 
+    @staticmethod
+    def _parse_response(response) -> Any:
+        """Return the JSON body of an API response, raising on error statuses."""
         if response.status_code >= 400:
             error_detail = response.json().get("detail", "Unknown error")
             raise Exception(f"API Error ({response.status_code}): {error_detail}")
 
         return response.json()
 
+    def _send(self, call: "_RemoteCall") -> Any:
+        """Make the API request described by call and decode its response."""
+        return call.decode(self._make_request(call.method, call.endpoint, **call.kwargs))
+
+    def _query_call(
+        self, sql: str, params: Optional[List[Any]], mask_columns: Optional[List[str]], row_format: str
+    ) -> "_RemoteCall":
+        """Describe a remote query() request."""
+        data = {"sql": sql}
+        if params:
+            data["params"] = params
+
+        def decode(result: Dict[str, Any]) -> List[Any]:
+            results = result.get("data", [])
+
+            # Apply column masking if requested
+            _mask_rows(results, mask_columns)
+
+            if row_format == "tuple":
+                return [tuple(row.values()) for row in results]
+            return results
+
+        return _RemoteCall("POST", "/query", {"json": data}, decode)
+
+    def _insert_call(self, table: str, data: Sequence[Dict[str, Any]]) -> "_RemoteCall":
+        """Describe a remote insert() request."""
+        if len(data) == 1:
+            # Single record - use existing endpoint
+            return _RemoteCall("POST", f"/tables/{table}/data", {"json": {"data": data[0]}})
+        # Multiple records - use bulk endpoint
+        return _RemoteCall("POST", f"/tables/{table}/data/bulk", {"json": {"records": list(data)}})
+
+    def _update_call(self, table: str, updates: Sequence[Dict[str, Any]]) -> "_RemoteCall":
+        """Describe a remote update() request."""
+        if len(updates) == 1:
+            # Single record - use existing endpoint
+            update_data = updates[0].copy()
+            record_id = update_data.pop('id')
+            return _RemoteCall("PUT", f"/tables/{table}/data/{record_id}", {"json": {"data": update_data}})
+        # Multiple records - use bulk endpoint
+        return _RemoteCall("PUT", f"/tables/{table}/data/bulk", {"json": {"updates": list(updates)}})
+
+    def _delete_call(self, table: str, ids: Sequence[str]) -> "_RemoteCall":
+        """Describe a remote delete() request."""
+        if len(ids) == 1:
+            # Single record - use existing endpoint
+            return _RemoteCall("DELETE", f"/tables/{table}/data/{ids[0]}", {}, lambda result: 1)
+        # Multiple records - use bulk endpoint
+        return _RemoteCall(
+            "DELETE", f"/tables/{table}/data/bulk", {"json": {"ids": list(ids)}},
+            lambda result: result.get("deleted_count", len(ids)),
+        )
+
     @property
     def kv(self) -> "KVManager":
         """Key-Value store for fast unstructured data storage.
@@ -272,7 +381,8 @@ class CinchDB:
         params: Optional[List[Any]] = None,
         skip_validation: bool = False,
         mask_columns: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
+        row_format: str = "dict",
+    ) -> List[Dict[str, Any]] | List[Tuple[Any, ...]]:
         """Execute a SQL query.
 
         Args:
@@ -280,100 +390,436 @@ class CinchDB:
             params: Query parameters (optional)
             skip_validation: Skip SQL validation (default: False)
             mask_columns: List of column names to mask in results (optional)
+            row_format: "dict" (default) or "tuple" for plain value tuples in
+                column order, which skips building a dict per row
 
         Returns:
-            List of result rows as dictionaries
+            List of result rows as dictionaries (or tuples)
 
         Raises:
             SQLValidationError: If the query contains restricted operations
         """
+        if row_format not in ("dict", "tuple"):
+            raise ValueError("row_format must be 'dict' or 'tuple'")
+
         # Validate query unless explicitly skipped
         if not skip_validation:
             from cinchdb.utils.sql_validator import validate_query_safe
             validate_query_safe(sql)
 
         if self.is_local:
-            # Execute SELECT query directly
-            from cinchdb.core.connection import DatabaseConnection
+            # Execute SELECT query directly on a pooled read-only connection
+            from cinchdb.core.connection import get_reader_pool
+            from cinchdb.utils.row_decoder import compile_row_decoder, bool_columns_of
 
             # Ensure this is a SELECT query
             if not sql.strip().upper().startswith("SELECT"):
                 raise ValueError("query() can only be used with SELECT queries. Use insert(), update(), delete() for data modifications.")
 
+            # Lazy tenants have no rows; simple reads are answered from the schema
+            tenants = self._context.tenants
+            results = tenants.empty_read_result(self.tenant, sql)
+            if results is not None:
+                _mask_rows(results, mask_columns)
+                if row_format == "tuple":
+                    return [tuple(row.values()) for row in results]
+                return results
+
             # Get appropriate database path
-            db_path = self._context.tenants.get_tenant_db_path_for_operation(
+            db_path = tenants.get_tenant_db_path_for_operation(
                 self.tenant, is_write=False
             )
 
-            with DatabaseConnection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+            with get_reader_pool().connection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
                 cursor = conn.execute(sql, params)
-                rows = cursor.fetchall()
-                results = [dict(row) for row in rows]
-
-                # Try to get table name from query to apply boolean conversion
-                # This is a simple extraction - works for basic SELECT FROM table queries
-                from_match = None
-                sql_upper = sql.upper()
-                if "FROM" in sql_upper:
-                    from_idx = sql_upper.index("FROM")
-                    after_from = sql[from_idx + 4:].strip()
-                    # Extract table name (stops at space, comma, or WHERE)
-                    import re
-                    table_match = re.match(r'(\w+)', after_from)
-                    if table_match:
-                        table_name = table_match.group(1)
-                        try:
-                            # Get column types for boolean conversion
-                            # IMPORTANT: For lazy tenants, we need to get schema from the db_path we're actually using (__empty__),
-                            # not from the tenant's path (which might not exist yet or be empty)
-                            # Create a temporary TableManager with the actual db_path to avoid creating empty tenant databases
-                            from cinchdb.managers.table import TableManager
-                            temp_table_mgr = TableManager.__new__(TableManager)
-                            temp_table_mgr.db_path = db_path  # Use the actual path from get_tenant_db_path_for_operation
-                            temp_table_mgr.project_root = self.project_dir
-                            temp_table_mgr.database = self.database
-                            temp_table_mgr.branch = self.branch
-                            temp_table_mgr.tenant = self.tenant
-                            temp_table_mgr.encryption_manager = self.encryption_manager
-
-                            table = temp_table_mgr.get_table(table_name)
-                            column_types = {col.name: col.type for col in table.columns}
-
-                            # Convert BOOLEAN values from storage
-                            from cinchdb.utils.type_utils import convert_value_from_storage
-                            for row in results:
-                                for col_name, value in row.items():
-                                    if col_name in column_types:
-                                        row[col_name] = convert_value_from_storage(column_types[col_name], value)
-                        except:
-                            # If we can't get table schema, proceed without conversion
-                            pass
+
+                # Decode rows with a compiled decoder that converts only BOOLEAN
+                # columns when the table can be identified
+                column_types = self._query_column_types(sql, db_path)
+                if column_types or row_format == "tuple":
+                    columns = tuple(desc[0] for desc in cursor.description)
+                    decode = compile_row_decoder(columns, bool_columns_of(column_types), row_format)
+                    cursor.row_factory = None
+                    results = list(map(decode, cursor.fetchall()))
+                else:
+                    results = [dict(row) for row in cursor.fetchall()]
 
                 # Apply column masking if requested
                 if mask_columns and results:
-                    for row in results:
-                        for col in mask_columns:
-                            if col in row and row[col] is not None:
-                                row[col] = "***REDACTED***"
+                    if row_format == "tuple":
+                        masked = [i for i, col in enumerate(columns) if col in mask_columns]
+                        results = [
+                            tuple("***REDACTED***" if i in masked and value is not None else value
+                                  for i, value in enumerate(row))
+                            for row in results
+                        ]
+                    else:
+                        _mask_rows(results, mask_columns)
 
                 return results
         else:
             # Remote query
-            data = {"sql": sql}
-            if params:
-                data["params"] = params
-            result = self._make_request("POST", "/query", json=data)
-            results = result.get("data", [])
+            return self._send(self._query_call(sql, params, mask_columns, row_format))
 
-            # Apply column masking if requested
-            if mask_columns and results:
-                for row in results:
-                    for col in mask_columns:
-                        if col in row and row[col] is not None:
-                            row[col] = "***REDACTED***"
+    def query_iter(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        batch_size: int = 1000,
+        skip_validation: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Execute a SELECT query and yield rows as they are read.
+
+        Rows are fetched with fetchmany, so memory use stays constant no
+        matter how large the result is. The connection stays open until the
+        iterator is exhausted or closed.
+
+        Args:
+            sql: SQL query to execute
+            params: Query parameters (optional)
+            batch_size: Rows fetched from SQLite per round trip (default: 1000)
+            skip_validation: Skip SQL validation (default: False)
+
+        Yields:
+            Result rows as dictionaries
+
+        Examples:
+            for row in db.query_iter("SELECT * FROM events"):
+                process(row)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+
+        if not self.is_local:
+            # Remote results arrive as one response
+            yield from self.query(sql, params, skip_validation=True)
+            return
+
+        from cinchdb.core.connection import get_reader_pool
+        from cinchdb.utils.row_decoder import compile_row_decoder, bool_columns_of
+
+        if not sql.strip().upper().startswith("SELECT"):
+            raise ValueError("query_iter() can only be used with SELECT queries.")
+
+        tenants = self._context.tenants
+        results = tenants.empty_read_result(self.tenant, sql)
+        if results is not None:
+            yield from results
+            return
+
+        db_path = tenants.get_tenant_db_path_for_operation(
+            self.tenant, is_write=False
+        )
+        column_types = self._query_column_types(sql, db_path)
+
+        with get_reader_pool().connection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+            cursor = conn.execute(sql, params)
+            columns = tuple(desc[0] for desc in cursor.description)
+            decode = compile_row_decoder(columns, bool_columns_of(column_types))
+            cursor.row_factory = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from map(decode, rows)
+
+    def prepare(self, sql: str, row_format: str = "dict", skip_validation: bool = False) -> "PreparedQuery":
+        """Prepare a SELECT query for repeated execution.
+
+        Validation, table detection and decoder setup happen once; each
+        run() only executes the statement on a connection kept open between
+        runs.
+
+        Args:
+            sql: SELECT query with ? placeholders
+            row_format: "dict" (default) or "tuple"
+            skip_validation: Skip SQL validation (default: False)
+
+        Returns:
+            PreparedQuery handle with run() and iter()
 
+        Examples:
+            get_user = db.prepare("SELECT * FROM users WHERE id = ?")
+            user = get_user.run([user_id])
+            get_user.close()
+        """
+        from cinchdb.core.prepared import PreparedQuery
+        return PreparedQuery(self, sql, row_format=row_format, skip_validation=skip_validation)
+
+    def query_columns(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        batch_size: int = 10000,
+        skip_validation: bool = False,
+        use_numpy: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Execute a SELECT query and return the result column by column.
+
+        Rows are read in fetchmany batches and each batch is transposed
+        straight into typed arrays, without building a dict per row. Column
+        types come from the table schema, or from the first non-NULL value
+        for expressions such as aggregates.
+
+        Args:
+            sql: SQL query to execute
+            params: Query parameters (optional)
+            batch_size: Rows fetched from SQLite per round trip (default: 10000)
+            skip_validation: Skip SQL validation (default: False)
+            use_numpy: Force NumPy on or off (default: use it if installed)
+
+        Returns:
+            Dictionary of column name to NumPy array, or to array.array
+            (INTEGER/REAL/BOOLEAN) or list (other types) without NumPy
+
+        Examples:
+            cols = db.query_columns("SELECT price, quantity FROM orders")
+            revenue = (cols["price"] * cols["quantity"]).sum()
+        """
+        from cinchdb.utils.columnar import columns_from_batches
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+
+        if not self.is_local:
+            rows = self.query(sql, params, skip_validation=True)
+            columns = tuple(rows[0]) if rows else ()
+            return columns_from_batches(
+                columns, [[tuple(row.values()) for row in rows]], use_numpy=use_numpy
+            )
+
+        from cinchdb.core.connection import get_reader_pool
+
+        if not sql.strip().upper().startswith("SELECT"):
+            raise ValueError("query_columns() can only be used with SELECT queries.")
+
+        db_path = self._context.tenants.get_tenant_db_path_for_operation(
+            self.tenant, is_write=False
+        )
+        column_types = self._query_column_types(sql, db_path)
+
+        with get_reader_pool().connection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+            cursor = conn.execute(sql, params)
+            cursor.row_factory = None
+            columns = tuple(desc[0] for desc in cursor.description)
+            batches = iter(lambda: cursor.fetchmany(batch_size), [])
+            return columns_from_batches(columns, batches, column_types, use_numpy)
+
+    def query_tenants(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        tenants: Sequence[str] | str = "all",
+        max_workers: int = 8,
+        reducer: Optional[Callable[[Any, str, List[Dict[str, Any]]], Any]] = None,
+        initial: Any = None,
+        skip_validation: bool = False,
+    ):
+        """Run the same SELECT against many tenants in parallel.
+
+        The query is validated once, then executed on a thread pool with one
+        connection per tenant. Lazy tenants are skipped because they can only
+        return the empty template's results.
+
+        Args:
+            sql: SELECT query to run in every tenant
+            params: Query parameters (optional)
+            tenants: "all" (default), a tenant name or a list of tenant names
+            max_workers: Tenants queried concurrently (default: 8)
+            reducer: Optional function(accumulator, tenant, rows) -> accumulator
+                used to merge results instead of streaming them
+            initial: Starting accumulator for reducer
+            skip_validation: Skip SQL validation (default: False)
+
+        Returns:
+            Without reducer, an iterator of (tenant, rows) pairs in completion
+            order; with reducer, the final accumulator
+
+        Raises:
+            ValueError: If the query is not a SELECT or a tenant doesn't exist
+
+        Examples:
+            for tenant, rows in db.query_tenants("SELECT COUNT(*) AS n FROM users"):
+                print(tenant, rows[0]["n"])
+
+            total = db.query_tenants(
+                "SELECT COUNT(*) AS n FROM users",
+                reducer=lambda acc, tenant, rows: acc + rows[0]["n"],
+                initial=0,
+            )
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+
+        if not self.is_local:
+            raise NotImplementedError("Remote multi-tenant queries not implemented")
+
+        if not sql.strip().upper().startswith("SELECT"):
+            raise ValueError("query_tenants() can only be used with SELECT queries.")
+
+        if isinstance(tenants, str):
+            tenant_names = None if tenants == "all" else [tenants]
+        else:
+            tenant_names = list(tenants)
+        paths = self._context.tenants.get_materialized_tenant_paths(tenant_names)
+
+        # Tenants share the branch schema, so column types are looked up once
+        column_types = self._query_column_types(sql, next(iter(paths.values()))) if paths else {}
+        results = self._iter_tenant_queries(sql, params, paths, column_types, max_workers)
+
+        if reducer is None:
             return results
 
+        accumulator = initial
+        for tenant, rows in results:
+            accumulator = reducer(accumulator, tenant, rows)
+        return accumulator
+
+    def _iter_tenant_queries(
+        self,
+        sql: str,
+        params: Optional[List[Any]],
+        paths: Dict[str, Path],
+        column_types: Dict[str, str],
+        max_workers: int,
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Yield (tenant, rows) as each tenant's query finishes."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from cinchdb.core.connection import get_reader_pool
+        from cinchdb.utils.row_decoder import compile_row_decoder, bool_columns_of
+
+        bool_columns = bool_columns_of(column_types)
+
+        def run(tenant: str, db_path: Path) -> List[Dict[str, Any]]:
+            with get_reader_pool().connection(db_path, tenant_id=tenant, encryption_manager=self.encryption_manager) as conn:
+                cursor = conn.execute(sql, params)
+                columns = tuple(desc[0] for desc in cursor.description)
+                decode = compile_row_decoder(columns, bool_columns)
+                cursor.row_factory = None
+                return list(map(decode, cursor.fetchall()))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {executor.submit(run, tenant, path): tenant for tenant, path in paths.items()}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Stop queued tenants if the caller stops iterating or a query fails
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def query_across_tenants(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        tenants: Sequence[str] | str = "all",
+        batch_size: Optional[int] = None,
+        skip_validation: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Run one SELECT over the combined rows of many tenants.
+
+        Tenant databases are ATTACHed read-only to a scratch connection and
+        each table in the query becomes a UNION ALL across tenants with an
+        extra "tenant" column, so grouping and aggregation happen in SQLite
+        in a single pass instead of one connection per tenant.
+
+        Args:
+            sql: SELECT query; tables gain a "tenant" column
+            params: Query parameters (optional)
+            tenants: "all" (default), a tenant name or a list of tenant names
+            batch_size: Tenants attached at once (default: SQLite's attach
+                limit). Above it, rows are copied into temp tables in batches.
+            skip_validation: Skip SQL validation (default: False)
+
+        Returns:
+            List of result rows as dictionaries
+
+        Raises:
+            ValueError: If the query is not a SELECT or a tenant doesn't exist
+
+        Examples:
+            db.query_across_tenants(
+                "SELECT tenant, COUNT(*) AS orders, SUM(total) AS revenue "
+                "FROM orders GROUP BY tenant ORDER BY revenue DESC"
+            )
+        """
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+
+        if not self.is_local:
+            raise NotImplementedError("Remote multi-tenant queries not implemented")
+        if self.encryption_manager is not None:
+            raise NotImplementedError("query_across_tenants() does not support encrypted tenants; use query_tenants()")
+
+        if not sql.strip().upper().startswith("SELECT"):
+            raise ValueError("query_across_tenants() can only be used with SELECT queries.")
+
+        from cinchdb.core.cross_tenant import query_attached, referenced_tables
+        from cinchdb.utils.row_decoder import compile_row_decoder, bool_columns_of
+
+        if isinstance(tenants, str):
+            tenant_names = None if tenants == "all" else [tenants]
+        else:
+            tenant_names = list(tenants)
+        paths = self._context.tenants.get_materialized_tenant_paths(tenant_names)
+        if not paths:
+            # Lazy tenants have no rows; aggregates still return their row
+            paths = {"__empty__": self._context.tenants.get_empty_tenant_path()}
+
+        schema = {table.name: table for table in self._context.tables.list_tables()}
+        tables = {
+            name: [column.name for column in schema[name].columns]
+            for name in referenced_tables(sql, list(schema))
+        }
+
+        columns, rows = query_attached(paths, tables, sql, params, batch_size)
+        column_types = self._query_column_types(sql, next(iter(paths.values())))
+        decode = compile_row_decoder(columns, bool_columns_of(column_types))
+        return list(map(decode, rows))
+
+    def _query_column_types(self, sql: str, db_path: Path) -> Dict[str, str]:
+        """Return column types of the table a simple SELECT reads from.
+
+        This is a simple extraction - works for basic SELECT FROM table queries.
+        Returns an empty dict if the table can't be identified.
+        """
+        sql_upper = sql.upper()
+        if "FROM" not in sql_upper:
+            return {}
+        from_idx = sql_upper.index("FROM")
+        after_from = sql[from_idx + 4:].strip()
+        # Extract table name (stops at space, comma, or WHERE)
+        import re
+        table_match = re.match(r'(\w+)', after_from)
+        if not table_match:
+            return {}
+        table_name = table_match.group(1)
+        try:
+            # IMPORTANT: For lazy tenants, we need to get schema from the db_path we're actually using (__empty__),
+            # not from the tenant's path (which might not exist yet or be empty)
+            # Point the TableManager at the actual db_path to avoid creating empty tenant databases
+            from cinchdb.managers.table import TableManager
+            temp_table_mgr = TableManager(self._context)
+            temp_table_mgr.db_path = db_path  # Use the actual path from get_tenant_db_path_for_operation
+
+            table = temp_table_mgr.get_table(table_name)
+            return {col.name: col.type for col in table.columns}
+        except:
+            # If we can't get table schema, proceed without conversion
+            return {}
+
     def create_table(self, name: str, columns: List[Column], indexes: Optional[List["Index"]] = None) -> "Table":
         """Create a new table.
 
@@ -464,18 +910,122 @@ class CinchDB:
             return self._context.data.bulk_create_from_dict(table, list(data))
         else:
             # Remote insert
-            if len(data) == 1:
-                # Single record - use existing endpoint
-                result = self._make_request(
-                    "POST", f"/tables/{table}/data", json={"data": data[0]}
-                )
-                return result
-            else:
-                # Multiple records - use bulk endpoint
-                result = self._make_request(
-                    "POST", f"/tables/{table}/data/bulk", json={"records": list(data)}
-                )
-                return result
+            return self._send(self._insert_call(table, data))
+
+    def insert_stream(
+        self,
+        table: str,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000,
+        single_transaction: bool = False,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Insert records from an iterable or generator in chunks.
+
+        Only one chunk is held in memory at a time, so this suits loads far
+        larger than RAM.
+
+        Args:
+            table: Table name
+            records: Iterable of record dictionaries
+            chunk_size: Records per batch (default: 1000)
+            single_transaction: Commit once at the end instead of per chunk
+                (local connections only)
+            progress: Called after each chunk with a stats dict
+
+        Returns:
+            Stats dict with inserted, chunks, elapsed and rows_per_sec
+
+        Examples:
+            def rows():
+                for line in open("events.jsonl"):
+                    yield json.loads(line)
+
+            stats = db.insert_stream("events", rows(), chunk_size=5000,
+                                     progress=lambda s: print(s["inserted"]))
+        """
+        if self.is_local:
+            return self._context.data.insert_stream(
+                table, records, chunk_size=chunk_size,
+                single_transaction=single_transaction, progress=progress,
+            )
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if single_transaction:
+            raise NotImplementedError("single_transaction is not supported for remote connections")
+
+        # Remote: send each chunk to the bulk endpoint as it is read
+        stats = {"inserted": 0, "chunks": 0, "elapsed": 0.0, "rows_per_sec": 0.0}
+        started = time.perf_counter()
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            self._make_request("POST", f"/tables/{table}/data/bulk", json={"records": chunk})
+            stats["inserted"] += len(chunk)
+            stats["chunks"] += 1
+            stats["elapsed"] = time.perf_counter() - started
+            stats["rows_per_sec"] = stats["inserted"] / stats["elapsed"] if stats["elapsed"] else 0.0
+            if progress:
+                progress(dict(stats))
+        stats["elapsed"] = time.perf_counter() - started
+        stats["rows_per_sec"] = stats["inserted"] / stats["elapsed"] if stats["elapsed"] else 0.0
+        return stats
+
+    def upsert(
+        self,
+        table: str,
+        *records: Dict[str, Any],
+        conflict: Sequence[str] = ("id",),
+        update_columns: Optional[List[str]] = None,
+    ) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Insert records or update the rows they conflict with.
+
+        Args:
+            table: Table name
+            *records: One or more record data dictionaries
+            conflict: Columns of the primary key or a unique index that identify
+                an existing row (default: ("id",))
+            update_columns: Columns to overwrite on conflict (default: every
+                supplied column except the conflict columns; [] keeps existing
+                rows unchanged)
+
+        Returns:
+            Single record dict if one record given, list of dicts if multiple.
+            Existing rows keep their created_at, so it is not included.
+
+        Examples:
+            # Idempotent ingest keyed on id
+            db.upsert("users", {"id": "123", "name": "John"})
+
+            # Keyed on a unique column, only refreshing some fields
+            db.upsert("users",
+                {"email": "john@example.com", "name": "John", "plan": "pro"},
+                {"email": "jane@example.com", "name": "Jane", "plan": "free"},
+                conflict=("email",),
+                update_columns=["plan"],
+            )
+        """
+        if not records:
+            raise ValueError("At least one record must be provided")
+
+        if self.is_local:
+            results = self._context.data.upsert_from_dict(
+                table, list(records), conflict=tuple(conflict), update_columns=update_columns
+            )
+            return results[0] if len(records) == 1 else results
+        else:
+            result = self._make_request(
+                "POST", f"/tables/{table}/data/upsert",
+                json={
+                    "records": list(records),
+                    "conflict": list(conflict),
+                    "update_columns": update_columns,
+                },
+            )
+            return result
 
     def update(self, table: str, *updates: Dict[str, Any]) -> Dict[str, Any] | List[Dict[str, Any]]:
         """Update one or more records in a table.
@@ -485,7 +1035,9 @@ class CinchDB:
             *updates: One or more update dictionaries, each must contain 'id' field
 
         Returns:
-            Single record dict if one record updated, list of dicts if multiple
+            Single record dict if one record updated, list of dicts if multiple.
+            Multiple updates run in one transaction; records that don't exist
+            appear in the list as {"id": ..., "error": ...}
 
         Examples:
             # Single update
@@ -520,34 +1072,11 @@ class CinchDB:
                 record_id = update_data.pop('id')
                 return self._context.data.update_by_id(table, record_id, update_data)
 
-            # Multiple records - batch update
-            results = []
-            for update_data in updates:
-                update_copy = update_data.copy()
-                record_id = update_copy.pop('id')
-                try:
-                    result = self._context.data.update_by_id(table, record_id, update_copy)
-                    results.append(result)
-                except ValueError as e:
-                    # Record not found - include error in results
-                    results.append({"id": record_id, "error": str(e)})
-            return results
+            # Multiple records - one transaction; missing records are reported inline
+            return self._context.data.bulk_update_by_id(table, list(updates))
         else:
             # Remote update
-            if len(updates) == 1:
-                # Single record - use existing endpoint
-                update_data = updates[0].copy()
-                record_id = update_data.pop('id')
-                result = self._make_request(
-                    "PUT", f"/tables/{table}/data/{record_id}", json={"data": update_data}
-                )
-                return result
-            else:
-                # Multiple records - use bulk endpoint
-                result = self._make_request(
-                    "PUT", f"/tables/{table}/data/bulk", json={"updates": list(updates)}
-                )
-                return result
+            return self._send(self._update_call(table, updates))
 
     def delete(self, table: str, *ids: str) -> int:
         """Delete one or more records from a table.
@@ -579,25 +1108,33 @@ class CinchDB:
                 success = self._context.data.delete_by_id(table, ids[0])
                 return 1 if success else 0
 
-            # Multiple records - batch delete
-            deleted_count = 0
-            for record_id in ids:
-                success = self._context.data.delete_by_id(table, record_id)
-                if success:
-                    deleted_count += 1
-            return deleted_count
+            # Multiple records - batch delete in one transaction
+            outcomes = self._context.data.bulk_delete_by_id(table, list(ids))
+            return sum(outcomes.values())
         else:
             # Remote delete
-            if len(ids) == 1:
-                # Single record - use existing endpoint
-                self._make_request("DELETE", f"/tables/{table}/data/{ids[0]}")
-                return 1
-            else:
-                # Multiple records - use bulk endpoint
-                result = self._make_request(
-                    "DELETE", f"/tables/{table}/data/bulk", json={"ids": list(ids)}
-                )
-                return result.get("deleted_count", len(ids))
+            return self._send(self._delete_call(table, ids))
+
+    def batch(self) -> "Batch":
+        """Collect query(), insert(), update() and delete() calls and run them together.
+
+        Remote connections send the batch in a single request instead of one
+        round trip per call. Operations run in order and stop at the first
+        failure; they are not rolled back as a unit.
+
+        Returns:
+            Batch whose methods return BatchResult placeholders
+
+        Examples:
+            with db.batch() as batch:
+                alice = batch.insert("users", {"name": "Alice"})
+                total = batch.query("SELECT COUNT(*) AS n FROM users")
+
+            alice.value["id"]
+            total.value[0]["n"]
+        """
+        from cinchdb.core.batch import Batch
+        return Batch(self)
 
     def delete_where(self, table: str, operator: str = "AND", **filters) -> int:
         """Delete records from a table based on filter criteria.
@@ -1383,13 +1920,25 @@ class CinchDB:
 
     # Data convenience methods
 
-    def select(self, model_class, limit: Optional[int] = None, offset: Optional[int] = None, **filters):
+    def select(
+        self,
+        model_class,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after: Any = None,
+        columns: Optional[List[str]] = None,
+        **filters,
+    ):
         """Select records using a Pydantic model class.
 
         Args:
             model_class: Pydantic model class representing the table
             limit: Maximum number of records
             offset: Number of records to skip
+            order_by: Column to sort by, prefixed with "-" for descending
+            after: Sort key of the last record already seen (keyset pagination)
+            columns: Only fetch these columns; rows are returned as dictionaries
             **filters: Column filters (supports operators like column__gte, column__like)
 
         Returns:
@@ -1411,12 +1960,113 @@ class CinchDB:
 
             # With filters
             active_users = db.select(User, active=True, limit=10)
+
+            # Next 10 users by id, continuing after the last one seen
+            more = db.select(User, limit=10, after=active_users[-1].id)
         """
         if self.is_local:
-            return self._context.data.select(model_class, limit=limit, offset=offset, **filters)
+            return self._context.data.select(
+                model_class, limit=limit, offset=offset, order_by=order_by, after=after,
+                columns=columns, **filters
+            )
         else:
             raise NotImplementedError("Remote model-based select not implemented")
 
+    def select_page(
+        self,
+        source,
+        limit: int = 100,
+        order_by: str = "id",
+        cursor: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **filters,
+    ) -> Page:
+        """Select one page of records using keyset pagination.
+
+        Args:
+            source: Pydantic model class or table name
+            limit: Maximum number of records per page (default: 100)
+            order_by: Column to sort by, prefixed with "-" for descending
+            cursor: next_cursor from the previous page (None for the first page)
+            columns: Only return these columns (records are then dictionaries)
+            **filters: Column filters (supports operators like column__gte, column__like)
+
+        Returns:
+            Page with records (model instances, or dictionaries for a table
+            name or column list) and next_cursor, which is None on the last page
+
+        Examples:
+            # Page through users, newest first
+            page = db.select_page("users", limit=50, order_by="-created_at")
+            while page.has_more:
+                page = db.select_page("users", limit=50, order_by="-created_at",
+                                      cursor=page.next_cursor)
+        """
+        if self.is_local:
+            return self._context.data.select_page(
+                source, limit=limit, order_by=order_by, cursor=cursor, columns=columns, **filters
+            )
+
+        from cinchdb.managers.data import DataManager
+
+        table = source if isinstance(source, str) else DataManager._get_table_name(source)
+        params = {"limit": limit, "order_by": order_by, **filters}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if columns is not None:
+            params["columns"] = ",".join(columns)
+        result = self._make_request("GET", f"/tables/{table}/data", params=params)
+
+        records = result.get("records", [])
+        if not isinstance(source, str) and columns is None:
+            records = [source(**record) for record in records]
+        return Page(records=records, next_cursor=result.get("next_cursor"))
+
+    def aggregate(
+        self,
+        source,
+        group_by=None,
+        sum=None,
+        avg=None,
+        min=None,
+        max=None,
+        **filters,
+    ) -> List[Dict[str, Any]]:
+        """Compute COUNT/SUM/AVG/MIN/MAX in the database instead of fetching rows.
+
+        Args:
+            source: Table name or Pydantic model class
+            group_by: Column or list of columns to group by
+            sum: Column or list of columns to total
+            avg: Column or list of columns to average
+            min: Column or list of columns to take the minimum of
+            max: Column or list of columns to take the maximum of
+            **filters: Column filters (supports operators like column__gte, column__like)
+
+        Returns:
+            List of result rows with the group_by columns, "count" and
+            "<function>_<column>" keys such as "sum_total"
+
+        Examples:
+            # Revenue per status for the last month
+            db.aggregate("orders", group_by="status", sum="total",
+                         created_at__gte="2024-01-01")
+        """
+        if self.is_local:
+            return self._context.data.aggregate(
+                source, group_by=group_by, sum=sum, avg=avg, min=min, max=max, **filters
+            )
+
+        from cinchdb.managers.data import DataManager
+
+        table = source if isinstance(source, str) else DataManager._get_table_name(source)
+        params = dict(filters)
+        for name, value in (("group_by", group_by), ("sum", sum), ("avg", avg), ("min", min), ("max", max)):
+            if value is not None:
+                params[name] = value if isinstance(value, str) else ",".join(value)
+        result = self._make_request("GET", f"/tables/{table}/aggregate", params=params)
+        return result.get("data", [])
+
     def find_by_id(self, model_class, record_id: str):
         """Find a single record by ID using a Pydantic model class.
 
@@ -1604,12 +2254,33 @@ class CinchDB:
         self.close()
 
 
+class _RemoteCall(NamedTuple):
+    """An API request and how to turn its response into the method's result."""
+
+    method: str
+    endpoint: str
+    kwargs: Dict[str, Any]
+    decode: Callable[[Any], Any] = lambda result: result
+
+
+def _mask_rows(rows: List[Dict[str, Any]], mask_columns: Optional[List[str]]) -> None:
+    """Redact non-NULL values of mask_columns in dictionary rows, in place."""
+    if not mask_columns:
+        return
+    for row in rows:
+        for col in mask_columns:
+            if col in row and row[col] is not None:
+                row[col] = "***REDACTED***"
+
+
 def connect(
     database: str,
     branch: str = "main",
     tenant: str = "main",
     project_dir: Optional[Path] = None,
     encryption_key: Optional[str] = None,
+    kv_options: Optional["KVOptions"] = None,
+    writer_options: Optional["WriterOptions"] = None,
 ) -> CinchDB:
     """Connect to a local CinchDB database.
 
@@ -1619,6 +2290,8 @@ def connect(
         tenant: Tenant name (default: main)
         project_dir: Path to project directory (optional, will search for .cinchdb)
         encryption_key: Encryption key for encrypted tenant databases
+        kv_options: KV store tuning such as compression
+        writer_options: Group-commit writes through a per-tenant writer thread
 
     Returns:
         CinchDB connection instance
@@ -1644,7 +2317,8 @@ def connect(
 
     return CinchDB(
         database=database, branch=branch, tenant=tenant, project_dir=project_dir,
-        encryption_key=encryption_key
+        encryption_key=encryption_key, kv_options=kv_options,
+        writer_options=writer_options,
     )
 
 
@@ -1654,6 +2328,7 @@ def connect_api(
     database: str,
     branch: str = "main",
     tenant: str = "main",
+    http_options: Optional["HTTPOptions"] = None,
 ) -> CinchDB:
     """Connect to a remote CinchDB API.
 
@@ -1663,6 +2338,7 @@ def connect_api(
         database: Database name
         branch: Branch name (default: main)
         tenant: Tenant name (default: main)
+        http_options: Connection pool, compression and retry settings
 
     Returns:
         CinchDB connection instance for remote API
@@ -1673,6 +2349,7 @@ def connect_api(
         tenant=tenant,
         api_url=api_url,
         api_key=api_key,
+        http_options=http_options,
     )
 
 
@@ -0,0 +1,118 @@
+"""HTTP client settings shared by the sync and async remote clients."""
+
+import gzip
+import json
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+# Methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class HTTPOptions:
+    """Connection pooling, compression and retry settings for remote mode.
+
+    Attributes:
+        max_connections: Most open connections to the API host
+        max_keepalive_connections: Idle connections kept alive for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        http2: Negotiate HTTP/2 (requires ``pip install httpx[http2]``)
+        timeout: Seconds to wait for a connection or response
+        compress_min_bytes: Gzip JSON request bodies at least this large
+            (None never compresses). Responses are always requested with
+            ``Accept-Encoding: gzip`` and decoded transparently.
+        retries: Extra attempts for failed idempotent requests (GET, PUT,
+            DELETE); any request is retried if the connection couldn't be
+            opened, since it was never sent
+        backoff_factor: Seconds before the first retry, doubled each time
+        backoff_max: Longest wait between retries
+        retry_statuses: Response codes that trigger a retry
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    timeout: float = 30.0
+    compress_min_bytes: Optional[int] = 16384
+    retries: int = 3
+    backoff_factor: float = 0.1
+    backoff_max: float = 5.0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """Arguments for httpx.Client / httpx.AsyncClient."""
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+            "timeout": self.timeout,
+        }
+
+
+def compress_body(kwargs: Dict[str, Any], options: HTTPOptions) -> Dict[str, Any]:
+    """Replace a large json= body with a gzipped one.
+
+    Args:
+        kwargs: Request arguments; returned unchanged if the body is small
+        options: HTTP settings with the compression threshold
+
+    Returns:
+        Request arguments to send
+    """
+    if options.compress_min_bytes is None or kwargs.get("json") is None:
+        return kwargs
+
+    body = json.dumps(kwargs["json"]).encode()
+    if len(body) < options.compress_min_bytes:
+        return kwargs
+
+    kwargs = {key: value for key, value in kwargs.items() if key != "json"}
+    kwargs["content"] = gzip.compress(body, compresslevel=5)
+    kwargs["headers"] = {
+        **kwargs.get("headers", {}),
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
+    return kwargs
+
+
+def retry_delay(
+    options: HTTPOptions,
+    method: str,
+    attempt: int,
+    response: Optional[httpx.Response] = None,
+    error: Optional[Exception] = None,
+) -> Optional[float]:
+    """Return how long to wait before retrying a request, or None to give up.
+
+    Args:
+        options: HTTP settings with the retry policy
+        method: HTTP method of the request
+        attempt: Attempts made so far, starting at 1
+        response: Response received, if any
+        error: Transport error raised instead of a response, if any
+    """
+    if attempt > options.retries:
+        return None
+
+    if error is not None:
+        # A request that never connected can be resent whatever its method
+        if not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)) and method.upper() not in IDEMPOTENT_METHODS:
+            return None
+    elif response is None or response.status_code not in options.retry_statuses or method.upper() not in IDEMPOTENT_METHODS:
+        return None
+
+    delay = min(options.backoff_max, options.backoff_factor * 2 ** (attempt - 1))
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(options.backoff_max, float(retry_after))
+    # Jitter so clients that failed together don't retry together
+    return delay * (0.5 + random.random() / 2)
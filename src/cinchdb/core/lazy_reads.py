@@ -0,0 +1,327 @@
+"""Answer simple reads on lazy tenants without opening a database file.
+
+A lazy tenant has no database of its own: reads go to the ``__empty__``
+template, which holds the schema and no rows. For a single-table SELECT
+the answer is known in advance: no rows, or, for aggregates without
+GROUP BY, one row where COUNT is 0, TOTAL is 0.0 and the other aggregates
+are NULL. Such queries are answered from the branch schema snapshot in
+the metadata database. Anything the planner can't reason about (joins,
+subqueries, compound selects, expressions, unknown identifiers) yields
+None, and the caller falls back to querying ``__empty__``.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Aggregate functions and their value over zero rows
+_EMPTY_AGGREGATES = {
+    "COUNT": 0,
+    "TOTAL": 0.0,
+    "SUM": None,
+    "AVG": None,
+    "MIN": None,
+    "MAX": None,
+    "GROUP_CONCAT": None,
+}
+
+# Clauses that may follow the table in a supported query
+_CLAUSE_KEYWORDS = {"WHERE", "GROUP", "HAVING", "ORDER", "LIMIT"}
+
+# Words allowed after FROM that are not column references
+_EXPRESSION_KEYWORDS = _CLAUSE_KEYWORDS | {
+    "AND", "OR", "NOT", "IS", "NULL", "IN", "LIKE", "GLOB", "BETWEEN", "ESCAPE",
+    "BY", "ASC", "DESC", "NULLS", "FIRST", "LAST", "COLLATE", "NOCASE", "BINARY",
+    "RTRIM", "CASE", "WHEN", "THEN", "ELSE", "END", "TRUE", "FALSE", "OFFSET",
+    "CAST", "AS", "TEXT", "INTEGER", "REAL", "NUMERIC", "BLOB",
+}
+
+# Words that end a table reference or projection item instead of aliasing it
+_RESERVED = _EXPRESSION_KEYWORDS | {
+    "FROM", "JOIN", "LEFT", "RIGHT", "FULL", "INNER", "OUTER", "CROSS", "NATURAL",
+    "ON", "USING", "UNION", "INTERSECT", "EXCEPT", "INDEXED", "DISTINCT", "ALL",
+    "SELECT", "WITH", "WINDOW", "EXISTS", "VALUES",
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<space>\s+|--[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<qident>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+    | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+    | (?P<punct>[(),.;*])
+    | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class _Token:
+    kind: str
+    text: str
+    start: int
+    end: int
+
+    @property
+    def upper(self) -> str:
+        return self.text.upper() if self.kind == "word" else self.text
+
+
+@dataclass(frozen=True)
+class EmptyResultPlan:
+    """What a query returns when its table is empty.
+
+    Attributes:
+        table: Table read by the query
+        columns: Column names the query references, checked against the schema
+        row: None for zero rows, else (name, value, is_column) for each
+            result column of the single row; is_column marks unaliased
+            column references, which SQLite names after the declared column
+    """
+
+    table: str
+    columns: Tuple[str, ...]
+    row: Optional[Tuple[Tuple[str, Any, bool], ...]]
+
+
+def empty_result(sql: str, schema) -> Optional[List[Dict[str, Any]]]:
+    """Return the result of a SELECT over an empty tenant, if it can be known.
+
+    Args:
+        sql: SELECT query
+        schema: SchemaSnapshot of the tenant's branch
+
+    Returns:
+        List of result rows, or None if the query must run against a database
+    """
+    plan = plan_empty_result(sql)
+    if plan is None or schema is None:
+        return None
+
+    tables = {name.lower(): name for name in schema.list_tables()}
+    table = tables.get(plan.table.lower())
+    if table is None:
+        # Unknown table or a view; let SQLite decide
+        return None
+
+    declared = {column.name.lower(): column.name for column in schema.get_table_schema(table)}
+    if any(column.lower() not in declared for column in plan.columns):
+        return None
+
+    if plan.row is None:
+        return []
+    return [
+        {(declared[name.lower()] if is_column else name): value for name, value, is_column in plan.row}
+    ]
+
+
+@lru_cache(maxsize=256)
+def plan_empty_result(sql: str) -> Optional[EmptyResultPlan]:
+    """Work out what a SELECT returns when its table is empty (cached by text).
+
+    Returns:
+        EmptyResultPlan, or None if the query is not simple enough
+    """
+    tokens = [
+        _Token(match.lastgroup, match.group(), match.start(), match.end())
+        for match in _TOKEN_RE.finditer(sql)
+        if match.lastgroup != "space"
+    ]
+    while tokens and tokens[-1].text == ";":
+        tokens.pop()
+    if len(tokens) < 4 or tokens[0].upper != "SELECT":
+        return None
+
+    # Top-level FROM followed by a single unqualified table
+    from_index = _find_from(tokens)
+    if from_index is None or from_index + 1 >= len(tokens):
+        return None
+    table_token = tokens[from_index + 1]
+    if table_token.kind != "word" or table_token.upper in _RESERVED:
+        return None
+    table = table_token.text
+
+    rest = tokens[from_index + 2:]
+    alias = None
+    if rest and rest[0].upper == "AS":
+        rest = rest[1:]
+        if not rest or rest[0].kind != "word":
+            return None
+    if rest and rest[0].kind == "word" and rest[0].upper not in _RESERVED:
+        alias = rest[0].text
+        rest = rest[1:]
+    if rest and rest[0].upper not in _CLAUSE_KEYWORDS:
+        return None
+
+    columns: List[str] = []
+    qualifiers = {table.lower(), (alias or table).lower()}
+    if not _collect_references(rest, qualifiers, columns):
+        return None
+    top_level = {token.upper for token in _top_level(rest) if token.kind == "word"}
+
+    projection = tokens[1:from_index]
+    if projection and projection[0].upper in ("DISTINCT", "ALL"):
+        projection = projection[1:]
+    items = _split_items(projection)
+    if not items:
+        return None
+
+    row: List[Tuple[str, Any, bool]] = []
+    has_aggregate = False
+    has_star = False
+    for expression, item_alias in items:
+        if len(expression) == 1 and expression[0].text == "*":
+            has_star = True
+            continue
+        if len(expression) == 1 and expression[0].kind == "word":
+            columns.append(expression[0].text)
+            row.append((item_alias or expression[0].text, None, item_alias is None))
+            continue
+        aggregate = _parse_aggregate(expression)
+        if aggregate is None:
+            return None
+        function, argument = aggregate
+        if argument is not None:
+            columns.append(argument)
+        has_aggregate = True
+        # SQLite names an unaliased expression after its exact source text
+        name = item_alias or sql[expression[0].start:expression[-1].end]
+        row.append((name, _EMPTY_AGGREGATES[function], False))
+
+    if "GROUP" in top_level or not has_aggregate:
+        return EmptyResultPlan(table, tuple(columns), None)
+    if has_star or top_level & {"HAVING", "LIMIT", "OFFSET"}:
+        return None
+    return EmptyResultPlan(table, tuple(columns), tuple(row))
+
+
+def _find_from(tokens: List[_Token]) -> Optional[int]:
+    """Return the index of the top-level FROM; None for compound selects."""
+    from_index = None
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token.text == "(":
+            depth += 1
+        elif token.text == ")":
+            depth -= 1
+        elif depth == 0 and token.kind == "word":
+            keyword = token.upper
+            if keyword in ("UNION", "INTERSECT", "EXCEPT", "WITH", "WINDOW"):
+                return None
+            if keyword == "FROM" and from_index is None:
+                from_index = i
+        elif token.text == ";":
+            return None
+    return from_index
+
+
+def _top_level(tokens: List[_Token]) -> List[_Token]:
+    """Return the tokens outside any parentheses."""
+    result = []
+    depth = 0
+    for token in tokens:
+        if token.text == "(":
+            depth += 1
+        elif token.text == ")":
+            depth -= 1
+        elif depth == 0:
+            result.append(token)
+    return result
+
+
+def _collect_references(tokens: List[_Token], qualifiers, columns: List[str]) -> bool:
+    """Collect column references from the clauses after FROM.
+
+    Returns False if a word is neither a keyword, a function call, a bind
+    parameter, a qualifier of the table nor a plain identifier.
+    """
+    for i, token in enumerate(tokens):
+        if token.kind == "qident":
+            return False
+        if token.kind != "word":
+            continue
+        previous = tokens[i - 1] if i else None
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+        if previous is not None and previous.kind == "other" and previous.text in ":@$":
+            continue  # named parameter
+        if following is not None and following.text == "(":
+            if token.upper in ("SELECT", "EXISTS") or token.upper in _RESERVED - {"IN"}:
+                return False
+            continue  # function call
+        if following is not None and following.text == ".":
+            if token.text.lower() not in qualifiers:
+                return False
+            continue
+        if token.upper in _EXPRESSION_KEYWORDS:
+            continue
+        if token.upper in _RESERVED:
+            return False
+        columns.append(token.text)
+    return True
+
+
+def _split_items(projection: List[_Token]) -> List[Tuple[List[_Token], Optional[str]]]:
+    """Split a projection into (expression tokens, alias) items."""
+    items: List[List[_Token]] = []
+    current: List[_Token] = []
+    depth = 0
+    for token in projection:
+        if token.text == "(":
+            depth += 1
+        elif token.text == ")":
+            depth -= 1
+        if token.text == "," and depth == 0:
+            items.append(current)
+            current = []
+        else:
+            current.append(token)
+    items.append(current)
+
+    result = []
+    for tokens in items:
+        alias = None
+        if len(tokens) >= 3 and tokens[-2].upper == "AS":
+            alias = _identifier(tokens[-1])
+            tokens = tokens[:-2]
+        elif len(tokens) >= 2 and tokens[-1].kind in ("word", "qident", "string") and tokens[-2].text != ".":
+            alias = _identifier(tokens[-1])
+            tokens = tokens[:-1]
+        if not tokens or alias == "":
+            return []
+        result.append((tokens, alias))
+    return result
+
+
+def _parse_aggregate(expression: List[_Token]) -> Optional[Tuple[str, Optional[str]]]:
+    """Match FUNC(*), FUNC(col) or FUNC(DISTINCT col); return (FUNC, col)."""
+    if len(expression) < 3 or expression[0].kind != "word":
+        return None
+    if expression[1].text != "(" or expression[-1].text != ")":
+        return None
+    function = expression[0].upper
+    if function not in _EMPTY_AGGREGATES:
+        return None
+    inner = expression[2:-1]
+    if function == "COUNT" and len(inner) == 1 and inner[0].text == "*":
+        return function, None
+    if inner and inner[0].upper == "DISTINCT":
+        inner = inner[1:]
+    if len(inner) == 1 and inner[0].kind == "word" and inner[0].upper not in _RESERVED:
+        return function, inner[0].text
+    return None
+
+
+def _identifier(token: _Token) -> str:
+    """Return an alias token's name, or "" if it can't be an alias."""
+    if token.kind == "word":
+        return "" if token.upper in _RESERVED else token.text
+    if token.kind == "qident":
+        if token.text[0] == "[":
+            return token.text[1:-1]
+        quote = token.text[0]
+        return token.text[1:-1].replace(quote * 2, quote)
+    if token.kind == "string":
+        return token.text[1:-1].replace("''", "'")
+    return ""
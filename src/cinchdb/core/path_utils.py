@@ -248,6 +248,18 @@ def get_tenant_db_path_in_context(context_root: Path, tenant: str) -> Path:
     return context_root / shard / f"{tenant}.db"
 
 
+def get_tenant_kv_db_path(tenant_db_path: Path) -> Path:
+    """Get the dedicated KV store file that sits beside a tenant database.
+
+    Args:
+        tenant_db_path: Path to the tenant database ({shard}/{tenant}.db)
+
+    Returns:
+        Path to the tenant's KV file ({shard}/{tenant}.kv.db)
+    """
+    return tenant_db_path.with_name(f"{tenant_db_path.stem}.kv.db")
+
+
 
 
 def ensure_context_directory(project_root: Path, database: str, branch: str) -> Path:
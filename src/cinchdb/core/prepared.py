@@ -0,0 +1,193 @@
+"""Prepared query handles for repeated SELECT execution."""
+
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from cinchdb.core.connection import DatabaseConnection
+from cinchdb.utils.row_decoder import RowDecoder, bool_columns_of, compile_row_decoder
+
+if TYPE_CHECKING:
+    from cinchdb.core.database import CinchDB
+
+
+class PreparedQuery:
+    """A SELECT query validated and analysed once for repeated execution.
+
+    Created by CinchDB.prepare(). SQL validation, the SELECT check and the
+    tenant path lookup happen up front. Each run() executes on a read-only
+    connection kept open per thread, and the table schema and row decoder
+    are only rebuilt when SQLite's schema_version changes.
+
+    Lazy tenants are re-resolved on every run until they are materialized,
+    so reads switch to the tenant's own file as soon as it exists. Until
+    then, simple reads are answered from the schema without opening a file.
+    """
+
+    def __init__(
+        self,
+        db: "CinchDB",
+        sql: str,
+        row_format: str = "dict",
+        skip_validation: bool = False,
+    ):
+        """Validate and prepare a query.
+
+        Args:
+            db: CinchDB instance to run against
+            sql: SELECT query with ? placeholders
+            row_format: "dict" or "tuple"
+            skip_validation: Skip SQL validation
+
+        Raises:
+            ValueError: If the query is not a SELECT or row_format is unknown
+            SQLValidationError: If the query contains restricted operations
+        """
+        if row_format not in ("dict", "tuple"):
+            raise ValueError("row_format must be 'dict' or 'tuple'")
+
+        if not skip_validation:
+            from cinchdb.utils.sql_validator import validate_query_safe
+            validate_query_safe(sql)
+
+        if not sql.strip().upper().startswith("SELECT"):
+            raise ValueError("prepare() can only be used with SELECT queries.")
+
+        self.db = db
+        self.sql = sql
+        self.row_format = row_format
+        self._local = threading.local()
+        self._connections: List[DatabaseConnection] = []
+        self._decoders: Dict[Tuple[str, int], RowDecoder] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(self, params: Optional[List[Any]] = None) -> List[Any]:
+        """Execute the query and return all rows.
+
+        Args:
+            params: Query parameters (optional)
+
+        Returns:
+            List of rows as dictionaries (or tuples)
+        """
+        if not self.db.is_local:
+            return self.db.query(self.sql, params, skip_validation=True, row_format=self.row_format)
+
+        results = self._empty_read_result()
+        if results is not None:
+            return results
+
+        conn, pinned = self._acquire()
+        try:
+            cursor, decode = self._execute(conn, params)
+            return list(map(decode, cursor.fetchall()))
+        finally:
+            if not pinned:
+                conn.close()
+
+    def iter(self, params: Optional[List[Any]] = None, batch_size: int = 1000) -> Iterator[Any]:
+        """Execute the query and yield rows in fetchmany batches.
+
+        Args:
+            params: Query parameters (optional)
+            batch_size: Rows fetched per round trip (default: 1000)
+
+        Yields:
+            Rows as dictionaries (or tuples)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        if not self.db.is_local:
+            yield from self.run(params)
+            return
+
+        results = self._empty_read_result()
+        if results is not None:
+            yield from results
+            return
+
+        conn, pinned = self._acquire()
+        try:
+            cursor, decode = self._execute(conn, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from map(decode, rows)
+        finally:
+            if not pinned:
+                conn.close()
+
+    def close(self) -> None:
+        """Close the connections opened for this query."""
+        self._closed = True
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Opened by another thread; released when that thread's reference goes away
+                pass
+        self._local = threading.local()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _empty_read_result(self) -> Optional[List[Any]]:
+        """Answer the query from the schema while the tenant is lazy."""
+        if self._closed:
+            raise ValueError("Prepared query is closed")
+        if getattr(self._local, "conn", None) is not None:
+            # Connections are only kept for materialized tenants
+            return None
+
+        results = self.db._context.tenants.empty_read_result(self.db.tenant, self.sql)
+        if results is not None and self.row_format == "tuple":
+            return [tuple(row.values()) for row in results]
+        return results
+
+    def _acquire(self) -> Tuple[DatabaseConnection, bool]:
+        """Return this thread's connection and whether it is kept between runs."""
+        if self._closed:
+            raise ValueError("Prepared query is closed")
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn, True
+
+        tenants = self.db._context.tenants
+        lazy = tenants.is_tenant_lazy(self.db.tenant)
+        db_path = tenants.get_tenant_db_path_for_operation(self.db.tenant, is_write=False)
+        conn = DatabaseConnection(
+            db_path, tenant_id=self.db.tenant, encryption_manager=self.db.encryption_manager, read_only=True
+        )
+        if lazy:
+            return conn, False
+
+        with self._lock:
+            self._connections.append(conn)
+        self._local.conn = conn
+        return conn, True
+
+    def _execute(self, conn: DatabaseConnection, params: Optional[List[Any]]) -> Tuple[sqlite3.Cursor, RowDecoder]:
+        """Run the statement and return the cursor with its row decoder."""
+        schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        key = (str(conn.path), schema_version)
+
+        cursor = conn.execute(self.sql, params)
+        decode = self._decoders.get(key)
+        if decode is None:
+            column_types = self.db._query_column_types(self.sql, conn.path)
+            columns = tuple(desc[0] for desc in cursor.description)
+            decode = compile_row_decoder(columns, bool_columns_of(column_types), self.row_format)
+            self._decoders[key] = decode
+        cursor.row_factory = None
+        return cursor, decode
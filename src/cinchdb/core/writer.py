@@ -0,0 +1,332 @@
+"""Per-tenant writer threads that group-commit queued write operations.
+
+Without a writer, every write opens its own connection and transaction,
+and concurrent writers to one tenant race for SQLite's write lock until
+the busy timeout runs out. A TenantWriter instead owns the tenant's write
+connection on a single thread: callers submit operations and get futures
+back, and operations that queue up while a commit is running are applied
+together in one transaction, so the file is synced once per batch instead
+of once per write.
+
+Each operation runs inside its own savepoint, so a failing operation is
+rolled back on its own and the rest of the batch still commits. Futures
+resolve only after the batch has committed; if the commit itself fails,
+every operation in the batch gets the error.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cinchdb.core.connection import DatabaseConnection, file_identity
+
+
+@dataclass
+class WriterOptions:
+    """Tuning options for per-tenant writer threads.
+
+    Attributes:
+        max_batch: Most operations committed in one transaction
+        max_delay: Seconds the writer keeps collecting operations once more
+            than one is queued (a lone operation is committed immediately)
+        idle_timeout: Seconds without writes before the writer thread exits
+            and closes its connection
+    """
+    max_batch: int = 256
+    max_delay: float = 0.002
+    idle_timeout: float = 5.0
+
+    def __post_init__(self):
+        if self.max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if self.max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if self.idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive")
+
+
+class _BatchConnection:
+    """DatabaseConnection stand-in handed to operations inside a batch.
+
+    commit() is a no-op because the writer commits the whole batch, and
+    rollback() only undoes the current operation.
+    """
+
+    def __init__(self, conn: DatabaseConnection):
+        self._conn = conn
+        self.path = conn.path
+
+    def execute(self, sql: str, params: Optional[Any] = None):
+        return self._conn.execute(sql, params)
+
+    def executemany(self, sql: str, params: List[Any]):
+        return self._conn.executemany(sql, params)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self._conn.execute("ROLLBACK TO operation")
+
+
+class TenantWriter:
+    """A thread that owns one tenant file's write connection.
+
+    Created through submit_write(), which keeps one writer per file and
+    tenant. The writer exits after WriterOptions.idle_timeout seconds
+    without work; submit() then returns None and a new writer is started.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        tenant_id: Optional[str] = None,
+        encryption_manager=None,
+        pragmas: Optional[Dict[str, Any]] = None,
+        options: Optional[WriterOptions] = None,
+        on_exit: Optional[Callable[["TenantWriter"], None]] = None,
+    ):
+        """Start a writer thread for path.
+
+        Args:
+            path: Database file the writer commits to
+            tenant_id: Tenant ID for per-tenant encryption
+            encryption_manager: EncryptionManager instance for encrypted connections
+            pragmas: Extra PRAGMA settings for the write connection
+            options: Batching and idle settings (default: WriterOptions())
+            on_exit: Called from the writer thread once it has stopped
+        """
+        self.path = Path(path)
+        self.tenant_id = tenant_id
+        self.encryption_manager = encryption_manager
+        self.pragmas = pragmas
+        self.options = options or WriterOptions()
+        self._on_exit = on_exit
+        self._queue: "queue.SimpleQueue[Optional[Tuple[Callable, Future]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._conn: Optional[DatabaseConnection] = None
+        self._identity = None
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"cinchdb-writer-{self.path.stem}",
+        )
+        self._thread.start()
+
+    def submit(self, operation: Callable[[DatabaseConnection], Any]) -> Optional[Future]:
+        """Queue an operation to run in the writer's next batch.
+
+        The operation receives the write connection and must not begin,
+        commit or roll back transactions with SQL statements; conn.commit()
+        is a no-op and conn.rollback() undoes only this operation.
+
+        Args:
+            operation: Callable run on the writer thread with the connection
+
+        Returns:
+            Future resolving to the operation's return value once its batch
+            has committed, or None if the writer has stopped
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            future: Future = Future()
+            self._queue.put((operation, future))
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting operations; queued ones are still committed.
+
+        Args:
+            wait: Block until the writer thread has finished
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    try:
+                        conn = self._connection()
+                    except Exception as e:
+                        for _, future in batch:
+                            if future.set_running_or_notify_cancel():
+                                future.set_exception(e)
+                    else:
+                        self._commit(conn, batch)
+                if stop:
+                    break
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+            if self._on_exit:
+                self._on_exit(self)
+
+    def _next_batch(self) -> Tuple[List[Tuple[Callable, Future]], bool]:
+        """Wait for work and collect a batch; return it and whether to stop."""
+        try:
+            item = self._queue.get(timeout=self.options.idle_timeout)
+        except queue.Empty:
+            with self._lock:
+                # submit() enqueues under the lock, so nothing can slip in now
+                if self._queue.empty():
+                    self._closed = True
+                    return [], True
+            return [], False
+        if item is None:
+            return [], True
+
+        batch = [item]
+        # Take whatever queued up during the previous commit
+        while len(batch) < self.options.max_batch:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+
+        # Concurrent writers are active: linger briefly to fill the batch
+        if len(batch) > 1 and self.options.max_delay:
+            deadline = time.monotonic() + self.options.max_delay
+            while len(batch) < self.options.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    return batch, True
+                batch.append(item)
+        return batch, False
+
+    def _connection(self) -> DatabaseConnection:
+        """Return the write connection, reopening it if the file was replaced."""
+        if self._conn is not None:
+            if self._identity is not None and file_identity(self.path) == self._identity:
+                return self._conn
+            self._conn.close()
+            self._conn = None
+        self._conn = DatabaseConnection(
+            self.path, tenant_id=self.tenant_id,
+            encryption_manager=self.encryption_manager, pragmas=self.pragmas,
+        )
+        self._identity = file_identity(self.path)
+        return self._conn
+
+    def _commit(self, conn: DatabaseConnection, batch: List[Tuple[Callable, Future]]) -> None:
+        """Run a batch in one transaction and resolve its futures."""
+        batch = [(operation, future) for operation, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        outcomes: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        batch_conn = _BatchConnection(conn)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                conn.execute("SAVEPOINT operation")
+                try:
+                    result = operation(batch_conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO operation")
+                    conn.execute("RELEASE operation")
+                    outcomes.append((future, None, e))
+                else:
+                    conn.execute("RELEASE operation")
+                    outcomes.append((future, result, None))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+
+_writers: Dict[Tuple[str, Optional[str]], TenantWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _discard_writer(writer: TenantWriter) -> None:
+    key = (str(writer.path), writer.tenant_id)
+    with _writers_lock:
+        if _writers.get(key) is writer:
+            del _writers[key]
+
+
+def submit_write(
+    path: Path,
+    operation: Callable[[DatabaseConnection], Any],
+    tenant_id: Optional[str] = None,
+    encryption_manager=None,
+    options: Optional[WriterOptions] = None,
+    pragmas: Optional[Dict[str, Any]] = None,
+) -> Future:
+    """Queue a write operation on the writer for path, starting one if needed.
+
+    The options and pragmas only apply when a new writer is started; a
+    running writer keeps the settings it was started with.
+
+    Args:
+        path: Database file to write to
+        operation: Callable run on the writer thread (see TenantWriter.submit)
+        tenant_id: Tenant ID for per-tenant encryption
+        encryption_manager: EncryptionManager instance for encrypted connections
+        options: Batching and idle settings for a new writer
+        pragmas: Extra PRAGMA settings for a new writer's connection
+
+    Returns:
+        Future resolving to the operation's return value after commit
+    """
+    key = (str(path), tenant_id)
+    while True:
+        with _writers_lock:
+            writer = _writers.get(key)
+            if writer is None:
+                writer = TenantWriter(
+                    path, tenant_id=tenant_id, encryption_manager=encryption_manager,
+                    pragmas=pragmas, options=options, on_exit=_discard_writer,
+                )
+                _writers[key] = writer
+        future = writer.submit(operation)
+        if future is not None:
+            return future
+        # The writer went idle and stopped between lookup and submit
+        _discard_writer(writer)
+
+
+def close_writer(path: Path, tenant_id: Optional[str] = None) -> None:
+    """Stop the writer for path after its queued operations have committed."""
+    with _writers_lock:
+        writer = _writers.pop((str(path), tenant_id), None)
+    if writer:
+        writer.close()
+
+
+@atexit.register
+def close_writers() -> None:
+    """Commit queued operations and stop every writer (also runs at exit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
@@ -1,9 +1,10 @@
 """SQLite-based metadata storage for lazy resource tracking."""
 
 import sqlite3
+import threading
 import uuid
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import json
 
 
@@ -14,28 +15,61 @@ class MetadataDB:
         """Initialize metadata database for a project."""
         self.db_path = project_path / ".cinchdb" / "metadata.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
         self._connect()
         self._create_tables()
-    
-    def _connect(self):
-        """Connect to the SQLite database."""
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """This thread's connection, opened on first use in each thread.
+
+        A sqlite3 connection can't run statements from several threads at
+        once, so every thread gets its own; in WAL mode they read
+        concurrently while one writes.
+        """
+        try:
+            return self._local.conn
+        except AttributeError:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            return self._connect()
+
+    @conn.setter
+    def conn(self, value: Optional[sqlite3.Connection]) -> None:
+        self._local.conn = value
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the SQLite database from the current thread."""
         # Check if this is a new database
         is_new_db = not self.db_path.exists()
         
-        self.conn = sqlite3.connect(
+        conn = sqlite3.connect(
             str(self.db_path),
-            check_same_thread=False,  # Allow multi-threaded access
+            check_same_thread=False,  # close() may run on another thread
             timeout=30.0
         )
-        self.conn.row_factory = sqlite3.Row
+        conn.row_factory = sqlite3.Row
         
         # For new databases, set small page size before creating any tables
         if is_new_db:
-            self.conn.execute("PRAGMA page_size = 1024")  # 1KB pages for metadata DB
+            conn.execute("PRAGMA page_size = 1024")  # 1KB pages for metadata DB
         
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        self.conn.execute("PRAGMA journal_mode = WAL")  # Better concurrency
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")  # Better concurrency
+
+        # Close connections left behind by threads that have exited
+        with self._connections_lock:
+            finished = [c for thread, c in self._connections if not thread.is_alive()]
+            self._connections = [(thread, c) for thread, c in self._connections if thread.is_alive()]
+            self._connections.append((threading.current_thread(), conn))
+        for old in finished:
+            old.close()
+
+        self._local.conn = conn
+        return conn
     
     
     def _create_tables(self):
@@ -681,6 +715,36 @@ class MetadataDB:
             return SchemaSnapshot.from_dict(data)
         return None
 
+    def get_current_table_schema(self, branch_id: str) -> Optional["SchemaSnapshot"]:
+        """Get the branch schema snapshot if it reflects the current tables.
+
+        Some table and column changes (drops, renames, merged changes) are
+        recorded without a snapshot, which leaves the latest one stale. View
+        and index changes don't affect tables and are skipped.
+
+        Args:
+            branch_id: Branch ID to get schema for
+
+        Returns:
+            SchemaSnapshot object, or None if the latest applied table or
+            column change carries no snapshot
+        """
+        from cinchdb.models import SchemaSnapshot
+
+        cursor = self.conn.execute("""
+            SELECT c.schema_snapshot, bc.applied
+            FROM branch_changes bc
+            JOIN changes c ON bc.change_id = c.id
+            WHERE bc.branch_id = ?
+              AND c.type NOT IN ('create_view', 'drop_view', 'update_view', 'create_index', 'drop_index')
+            ORDER BY bc.applied_order DESC
+            LIMIT 1
+        """, (branch_id,))
+        row = cursor.fetchone()
+        if row and row['applied'] and row['schema_snapshot']:
+            return SchemaSnapshot.from_dict(json.loads(row['schema_snapshot']))
+        return None
+
     def get_next_change_order(self, branch_name: str = None, branch_id: str = None) -> int:
         """Get the next available order number for a branch."""
         if branch_id:
@@ -791,9 +855,15 @@ class MetadataDB:
                 """, (target_branch_name, source_branch_name, source_branch_name))
 
     def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close the database connections of all threads."""
+        self._closed = True
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for _, conn in connections:
+            conn.close()
+        current = getattr(self._local, "conn", None)
+        if current is not None:
+            current.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -1,9 +1,13 @@
 """Base manager class and shared context for all CinchDB managers."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from cinchdb.core.writer import WriterOptions
+    from cinchdb.managers.kv import KVOptions
+
 
 @dataclass
 class ConnectionContext:
@@ -18,12 +22,17 @@ class ConnectionContext:
         branch: Branch name
         tenant: Tenant name (default: main)
         encryption_manager: Optional encryption manager for encrypted tenants
+        kv_options: Optional KV store tuning (defaults to KVOptions())
+        writer_options: Route data and KV writes through a per-tenant writer
+            thread that group-commits them (None writes directly)
     """
     project_root: Path
     database: str
     branch: str
     tenant: str = "main"
     encryption_manager: Optional[object] = None
+    kv_options: Optional["KVOptions"] = None
+    writer_options: Optional["WriterOptions"] = None
 
     def __post_init__(self):
         """Ensure project_root is a Path object."""
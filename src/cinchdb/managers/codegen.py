@@ -215,12 +215,13 @@ class CodegenManager(BaseManager):
         content = [
             f'"""Generated model for {table.name} table."""',
             "",
-            "from typing import Optional, List, ClassVar, Union",
+            "from typing import Optional, List, ClassVar, Union, Any",
             "from datetime import datetime",
             "from pathlib import Path",
             "from pydantic import BaseModel, Field, ConfigDict",
             "",
             "from cinchdb.managers.data import DataManager",
+            "from cinchdb.utils.pagination import Page",
             "",
             "",
             f"class {class_name}(BaseModel):",
@@ -251,9 +252,14 @@ class CodegenManager(BaseManager):
                 "        return cls._data_manager",
                 "",
                 "    @classmethod",
-                f"    def select(cls, limit: Optional[int] = None, offset: Optional[int] = None, **filters) -> List['{class_name}']:",
-                '        """Select records with optional filtering."""',
-                "        return cls._get_data_manager().select(cls, limit=limit, offset=offset, **filters)",
+                f"    def select(cls, limit: Optional[int] = None, offset: Optional[int] = None, order_by: Optional[str] = None, after: Any = None, **filters) -> List['{class_name}']:",
+                '        """Select records with optional filtering and keyset pagination."""',
+                "        return cls._get_data_manager().select(cls, limit=limit, offset=offset, order_by=order_by, after=after, **filters)",
+                "",
+                "    @classmethod",
+                "    def select_page(cls, limit: int = 100, order_by: str = 'id', cursor: Optional[str] = None, **filters) -> Page:",
+                '        """Select one page of records; pass page.next_cursor to get the next one."""',
+                "        return cls._get_data_manager().select_page(cls, limit=limit, order_by=order_by, cursor=cursor, **filters)",
                 "",
                 "    @classmethod",
                 f"    def find_by_id(cls, record_id: str) -> Optional['{class_name}']:",
@@ -603,7 +609,7 @@ class CodegenManager(BaseManager):
             " * CinchDB TypeScript API Client",
             " */",
             "",
-            "import { QueryResult, CreateResult, UpdateResult, DeleteResult } from './types';",
+            "import { QueryResult, CreateResult, UpdateResult, DeleteResult, CursorPaginationParams, Page } from './types';",
             "",
             "export class CinchDBClient {",
             "  private baseUrl: string;",
@@ -641,7 +647,9 @@ class CodegenManager(BaseManager):
             "    table: string,",
             "    filters?: Record<string, any>,",
             "    limit?: number,",
-            "    offset?: number",
+            "    offset?: number,",
+            "    orderBy?: string,",
+            "    after?: string | number",
             "  ): Promise<T[]> {",
             "    const params = new URLSearchParams();",
             "    if (filters) {",
@@ -651,6 +659,8 @@ class CodegenManager(BaseManager):
             "    }",
             "    if (limit !== undefined) params.append('limit', String(limit));",
             "    if (offset !== undefined) params.append('offset', String(offset));",
+            "    if (orderBy !== undefined) params.append('order_by', orderBy);",
+            "    if (after !== undefined) params.append('after', String(after));",
             "",
             "    const response = await fetch(",
             "      `${this.baseUrl}/api/v1/tables/${table}/records?${params}`,",
@@ -669,6 +679,40 @@ class CodegenManager(BaseManager):
             "  }",
             "",
             "  /**",
+            "   * Select one page of records using keyset pagination",
+            "   */",
+            "  async selectPage<T = any>(",
+            "    table: string,",
+            "    options: CursorPaginationParams = {},",
+            "    filters?: Record<string, any>",
+            "  ): Promise<Page<T>> {",
+            "    const params = new URLSearchParams();",
+            "    if (filters) {",
+            "      Object.entries(filters).forEach(([key, value]) => {",
+            "        params.append(key, String(value));",
+            "      });",
+            "    }",
+            "    if (options.limit !== undefined) params.append('limit', String(options.limit));",
+            "    if (options.orderBy !== undefined) params.append('order_by', options.orderBy);",
+            "    if (options.cursor) params.append('cursor', options.cursor);",
+            "",
+            "    const response = await fetch(",
+            "      `${this.baseUrl}/api/v1/tables/${table}/records?${params}`,",
+            "      {",
+            "        method: 'GET',",
+            "        headers: this.headers,",
+            "      }",
+            "    );",
+            "",
+            "    if (!response.ok) {",
+            "      throw new Error(`Select failed: ${response.statusText}`);",
+            "    }",
+            "",
+            "    const result = await response.json();",
+            "    return { records: result.records, nextCursor: result.next_cursor ?? null };",
+            "  }",
+            "",
+            "  /**",
             "   * Create a new record",
             "   */",
             "  async create<T = any>(table: string, data: Partial<T>): Promise<CreateResult<T>> {",
@@ -794,6 +838,17 @@ class CodegenManager(BaseManager):
             "  offset?: number;",
             "}",
             "",
+            "export interface CursorPaginationParams {",
+            "  limit?: number;",
+            "  orderBy?: string;",
+            "  cursor?: string | null;",
+            "}",
+            "",
+            "export interface Page<T = any> {",
+            "  records: T[];",
+            "  nextCursor: string | null;",
+            "}",
+            "",
             "export interface FilterParams {",
             "  [key: string]: any;",
             "}",
@@ -1,17 +1,41 @@
 """Data management for CinchDB - handles CRUD operations on table data."""
 
+import time
 import uuid
-from typing import List, Dict, Any, Optional, Type, TypeVar
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple, Type, TypeVar, Union
 from datetime import datetime
 
 from pydantic import BaseModel
 
-from cinchdb.core.connection import DatabaseConnection
+from cinchdb.core.connection import DatabaseConnection, get_reader_pool
 from cinchdb.core.maintenance_utils import check_maintenance_mode
+from cinchdb.core.writer import submit_write
 from cinchdb.managers.base import BaseManager, ConnectionContext
+from cinchdb.utils.name_validator import VALID_TABLE_NAME_PATTERN
+from cinchdb.utils.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    order_clause,
+    parse_order_by,
+)
+from cinchdb.utils.row_decoder import compile_row_decoder
 from cinchdb.utils.type_utils import prepare_value_for_storage, convert_value_from_storage
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Lowest SQLITE_MAX_VARIABLE_NUMBER across SQLite builds; IN lists are chunked to it
+MAX_SQL_VARIABLES = 999
+
+
+def _chunked(items: List[Any], size: int = MAX_SQL_VARIABLES):
+    """Yield successive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class DataManager(BaseManager):
@@ -34,6 +58,9 @@ class DataManager(BaseManager):
         model_class: Type[T],
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after: Any = None,
+        columns: Optional[List[str]] = None,
         **filters,
     ) -> List[T]:
         """Select records from a table with optional filtering.
@@ -42,34 +69,260 @@ class DataManager(BaseManager):
             model_class: Pydantic model class representing the table
             limit: Maximum number of records to return
             offset: Number of records to skip
+            order_by: Column to sort by, prefixed with "-" for descending
+                (defaults to "id" when after is given)
+            after: Sort key of the last record already seen. Only rows past it
+                are returned, using the index instead of skipping rows like
+                offset does. Best suited to unique columns; use select_page to
+                page through non-unique ones.
+            columns: Only fetch these columns. Rows are then returned as
+                dictionaries, since they don't hold every model field.
             **filters: Column filters (exact match or special operators)
 
         Returns:
-            List of model instances
+            List of model instances (dictionaries when columns is given)
 
         Raises:
             ValueError: If table doesn't exist or filters are invalid
         """
         table_name = self._get_table_name(model_class)
+        if after is not None and order_by is None:
+            order_by = "id"
+
+        rows = self._select_rows(
+            table_name, filters, columns=columns, limit=limit, offset=offset,
+            order_by=order_by, after=after,
+        )
+        if columns is not None:
+            return self._decode_dict_rows(table_name, rows)
+        return [model_class(**row) for row in rows]
+
+    def select_page(
+        self,
+        source: Union[str, Type[T]],
+        limit: int = 100,
+        order_by: str = "id",
+        cursor: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **filters,
+    ) -> Page:
+        """Select one page of records using keyset pagination.
+
+        Each page continues from the position encoded in the previous page's
+        next_cursor, so deep pages cost the same as the first one.
+
+        Args:
+            source: Pydantic model class or table name
+            limit: Maximum number of records per page (default: 100)
+            order_by: Column to sort by, prefixed with "-" for descending.
+                Ties are broken by id.
+            cursor: next_cursor from the previous page (None for the first page)
+            columns: Only return these columns (records are then dictionaries)
+            **filters: Column filters (exact match or special operators)
+
+        Returns:
+            Page with model instances (or dictionaries for a table name or
+            column list) and the cursor for the next page
+
+        Raises:
+            ValueError: If limit is not positive or the cursor is invalid
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+
+        if isinstance(source, str):
+            table_name, model_class = source, None
+        else:
+            table_name, model_class = self._get_table_name(source), source
+
+        after = after_id = None
+        if cursor is not None:
+            after, after_id = decode_cursor(cursor, order_by)
+
+        # The cursor needs the sort key and id of the last row
+        sort_column, _ = parse_order_by(order_by)
+        fetch_columns = columns
+        if columns is not None:
+            fetch_columns = list(columns) + [c for c in (sort_column, "id") if c not in columns]
+
+        # Fetch one extra row to learn whether another page follows
+        rows = self._select_rows(
+            table_name, filters, columns=fetch_columns, limit=limit + 1, order_by=order_by,
+            after=after, after_id=after_id, after_given=cursor is not None,
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(order_by, rows[-1].get(sort_column), rows[-1].get("id"))
+
+        if columns is not None:
+            extra = set(fetch_columns) - set(columns)
+            rows = [{k: v for k, v in row.items() if k not in extra} for row in rows]
+        if model_class is None or columns is not None:
+            rows = self._decode_dict_rows(table_name, rows)
+        else:
+            rows = [model_class(**row) for row in rows]
+        return Page(records=rows, next_cursor=next_cursor)
+
+    def aggregate(
+        self,
+        source: Union[str, Type[BaseModel]],
+        group_by: Union[str, List[str], None] = None,
+        sum: Union[str, List[str], None] = None,
+        avg: Union[str, List[str], None] = None,
+        min: Union[str, List[str], None] = None,
+        max: Union[str, List[str], None] = None,
+        **filters,
+    ) -> List[Dict[str, Any]]:
+        """Compute aggregates in SQLite instead of fetching rows.
+
+        Each result row holds the group_by columns, "count" and one
+        "<function>_<column>" entry per requested aggregate, e.g. sum_amount.
+
+        Args:
+            source: Table name or Pydantic model class
+            group_by: Column(s) to group by (None for a single result row)
+            sum: Column(s) to total
+            avg: Column(s) to average
+            min: Column(s) to take the minimum of
+            max: Column(s) to take the maximum of
+            **filters: Column filters (exact match or special operators)
+
+        Returns:
+            List of result rows, ordered by the group_by columns
+
+        Raises:
+            ValueError: If a column name is invalid
 
+        Example:
+            aggregate("orders", group_by="status", sum="total", avg="total")
+            # [{"status": "open", "count": 3, "sum_total": 60.0, "avg_total": 20.0}, ...]
+        """
+        table_name = source if isinstance(source, str) else self._get_table_name(source)
+        groups = self._column_list(group_by)
+
+        expressions = list(groups) + ["COUNT(*) AS count"]
+        # MIN/MAX of a BOOLEAN column is still a 0/1 flag; SUM/AVG are numbers
+        bool_candidates = {column: column for column in groups}
+        for function, names in (("sum", sum), ("avg", avg), ("min", min), ("max", max)):
+            for column in self._column_list(names):
+                expressions.append(f"{function.upper()}({column}) AS {function}_{column}")
+                if function in ("min", "max"):
+                    bool_candidates[f"{function}_{column}"] = column
+
+        where_clause, params = self._build_where_clause(filters)
+        query = f"SELECT {', '.join(expressions)} FROM {table_name}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        if groups:
+            group_sql = ", ".join(groups)
+            query += f" GROUP BY {group_sql} ORDER BY {group_sql}"
+
+        with get_reader_pool().connection(self._read_path(), tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+            cursor = conn.execute(query, params)
+            columns = tuple(desc[0] for desc in cursor.description)
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+
+        bool_columns = self._bool_column_names(table_name)
+        decode = compile_row_decoder(columns, frozenset(
+            output for output, column in bool_candidates.items() if column in bool_columns
+        ))
+        return [decode(row) for row in rows]
+
+    def _select_rows(
+        self,
+        table_name: str,
+        filters: Dict[str, Any],
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        after: Any = None,
+        after_id: Optional[str] = None,
+        after_given: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Run a filtered, optionally keyset-paginated SELECT and return raw rows."""
         # Build WHERE clause from filters
         where_clause, params = self._build_where_clause(filters)
+        conditions = [where_clause] if where_clause else []
+
+        order_sql = None
+        if order_by is not None:
+            column, descending = parse_order_by(order_by)
+            order_sql = order_clause(column, descending)
+            if after is not None or after_given:
+                condition, keyset_params = keyset_condition(column, descending, after, after_id)
+                conditions.append(condition)
+                params.update(keyset_params)
 
         # Build query
-        query = f"SELECT * FROM {table_name}"
-        if where_clause:
-            query += f" WHERE {where_clause}"
+        projection = "*" if columns is None else ", ".join(self._column_list(columns))
+        query = f"SELECT {projection} FROM {table_name}"
+        if conditions:
+            query += " WHERE " + " AND ".join(f"({c})" for c in conditions)
+        if order_sql:
+            query += f" ORDER BY {order_sql}"
         if limit:
             query += f" LIMIT {limit}"
         if offset:
             query += f" OFFSET {offset}"
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with get_reader_pool().connection(self._read_path(), tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
             cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _column_list(columns: Union[str, List[str], None]) -> List[str]:
+        """Normalize a column argument to a list of validated column names.
+
+        Raises:
+            ValueError: If a name is not a valid column identifier
+        """
+        if columns is None:
+            return []
+        if isinstance(columns, str):
+            columns = [columns]
+        for column in columns:
+            if not isinstance(column, str) or not VALID_TABLE_NAME_PATTERN.match(column):
+                raise ValueError(f"Invalid column name: '{column}'")
+        return list(columns)
+
+    def _bool_column_names(self, table_name: str) -> set:
+        """Names of the table's BOOLEAN columns (empty if the schema can't be read)."""
+        try:
+            table = self.context.tables.get_table(table_name)
+        except (ValueError, FileNotFoundError):
+            return set()
+        return {col.name for col in table.columns if col.type == "BOOLEAN"}
+
+    def _decode_dict_rows(
+        self, table_name: str, rows: List[Dict[str, Any]], only: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Convert BOOLEAN columns of dictionary rows from their 0/1 storage form.
 
-            # Convert rows to model instances
-            return [model_class(**dict(row)) for row in rows]
+        Args:
+            table_name: Table the rows came from
+            rows: Rows to convert in place
+            only: Restrict conversion to these columns (e.g. group_by columns)
+        """
+        if not rows:
+            return rows
+        try:
+            table = self.context.tables.get_table(table_name)
+        except (ValueError, FileNotFoundError):
+            # If we can't get schema, return rows unconverted
+            return rows
+
+        bool_columns = [
+            col.name for col in table.columns
+            if col.type == "BOOLEAN" and col.name in rows[0] and (only is None or col.name in only)
+        ]
+        for row in rows:
+            for name in bool_columns:
+                row[name] = convert_value_from_storage("BOOLEAN", row[name])
+        return rows
 
     def find_by_id(self, model_class: Type[T], record_id: str) -> Optional[T]:
         """Find a single record by ID.
@@ -137,18 +390,15 @@ class DataManager(BaseManager):
             VALUES ({", ".join(placeholders)})
         """
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            try:
-                conn.execute(query, record_data)
-                conn.commit()
+        try:
+            self._write(lambda conn: conn.execute(query, record_data))
+        except Exception as e:
+            if "UNIQUE constraint failed" in str(e):
+                raise ValueError(f"Record with ID {record_data['id']} already exists")
+            raise
 
-                # Return the created record data
-                return record_data
-            except Exception as e:
-                conn.rollback()
-                if "UNIQUE constraint failed" in str(e):
-                    raise ValueError(f"Record with ID {record_data['id']} already exists")
-                raise
+        # Return the created record data
+        return record_data
 
     def bulk_create_from_dict(self, table_name: str, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Bulk create multiple records from dictionaries using executemany.
@@ -198,18 +448,227 @@ class DataManager(BaseManager):
             VALUES ({", ".join(placeholders)})
         """
 
+        try:
+            # Use executemany for bulk insert
+            self._write(lambda conn: conn.executemany(query, records))
+        except Exception as e:
+            if "UNIQUE constraint failed" in str(e):
+                raise ValueError(f"Duplicate ID found in bulk insert")
+            raise
+        return records
+
+    def upsert_from_dict(
+        self,
+        table_name: str,
+        data_list: List[Dict[str, Any]],
+        conflict: Tuple[str, ...] = ("id",),
+        update_columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Insert records, updating existing rows that hit a unique conflict.
+
+        Uses ``INSERT ... ON CONFLICT DO UPDATE`` with one executemany per
+        column signature, all in one transaction. Existing rows keep their
+        ``created_at``; ``updated_at`` is set on insert and on update.
+
+        Args:
+            table_name: Name of the table to upsert into
+            data_list: List of dictionaries containing record data
+            conflict: Columns of the primary key or unique index that identify
+                an existing row
+            update_columns: Columns to overwrite on conflict (default: every
+                supplied column except the conflict columns). An empty list
+                leaves existing rows untouched.
+
+        Returns:
+            List of the written records with IDs and updated_at. created_at is
+            omitted because it is only set for newly inserted rows. When the
+            conflict target is not "id", a generated ID only applies to rows
+            that were inserted.
+
+        Raises:
+            ValueError: If conflict is empty or a record lacks a conflict column
+            MaintenanceError: If branch is in maintenance mode
+        """
+        # Check maintenance mode
+        check_maintenance_mode(self.project_root, self.database, self.branch)
+
+        if not conflict:
+            raise ValueError("upsert requires at least one conflict column")
+
+        # Auto-materialize lazy tenant if needed
+        self._ensure_tenant_materialized()
+
+        if not data_list:
+            return []
+
+        try:
+            table = self.context.tables.get_table(table_name)
+            column_types = {col.name: col.type for col in table.columns}
+        except (ValueError, FileNotFoundError):
+            # If we can't get schema, proceed without conversion
+            column_types = {}
+
+        now = datetime.now()
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        records = []
+        for i, data in enumerate(data_list):
+            record_data = data.copy()
+
+            # Generate ID if not provided
+            if not record_data.get("id"):
+                record_data["id"] = str(uuid.uuid4())
+
+            missing = [col for col in conflict if col not in record_data]
+            if missing:
+                raise ValueError(f"Record {i} missing conflict column(s): {', '.join(missing)}")
+
+            record_data["updated_at"] = now
+            record_data.pop("created_at", None)
+            records.append(record_data)
+
+            row = {
+                col: prepare_value_for_storage(column_types[col], value) if col in column_types else value
+                for col, value in record_data.items()
+            }
+            row["created_at"] = now
+            groups.setdefault(tuple(row), []).append(row)
+
+        excluded = set(conflict) | {"id", "created_at", "updated_at"}
+        statements = []
+        for columns, rows in groups.items():
+            if update_columns is not None and not update_columns:
+                on_conflict = "DO NOTHING"
+            else:
+                if update_columns is None:
+                    to_update = [col for col in columns if col not in excluded]
+                else:
+                    # Only overwrite columns this group actually supplies
+                    to_update = [col for col in update_columns if col in columns and col not in excluded]
+                set_clause = ", ".join(f"{col} = excluded.{col}" for col in to_update + ["updated_at"])
+                on_conflict = f"DO UPDATE SET {set_clause}"
+
+            query = f"""
+                INSERT INTO {table_name} ({", ".join(columns)})
+                VALUES ({", ".join(f":{col}" for col in columns)})
+                ON CONFLICT ({", ".join(conflict)}) {on_conflict}
+            """
+            statements.append((query, rows))
+
+        def upsert(conn: DatabaseConnection) -> None:
+            for query, rows in statements:
+                conn.executemany(query, rows)
+
+        self._write(upsert)
+        return records
+
+    def insert_stream(
+        self,
+        table_name: str,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000,
+        single_transaction: bool = False,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Insert records from any iterable in fixed-size chunks.
+
+        Records are pulled from the iterable one chunk at a time, so
+        generators of any length can be loaded without holding them in
+        memory. The table schema is read once and only BOOLEAN columns are
+        converted.
+
+        Args:
+            table_name: Name of the table to insert into
+            records: Iterable of record dictionaries (e.g. a generator)
+            chunk_size: Number of records per executemany batch
+            single_transaction: Commit once at the end instead of after each
+                chunk, so a failure leaves nothing behind
+            progress: Called after every chunk with the running stats
+
+        Returns:
+            Stats dictionary with inserted, chunks, elapsed (seconds) and
+            rows_per_sec
+
+        Raises:
+            ValueError: If chunk_size is not positive or a record has a duplicate ID
+            MaintenanceError: If branch is in maintenance mode
+        """
+        # Check maintenance mode
+        check_maintenance_mode(self.project_root, self.database, self.branch)
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        # Auto-materialize lazy tenant if needed
+        self._ensure_tenant_materialized()
+
+        try:
+            table = self.context.tables.get_table(table_name)
+            bool_columns = {col.name for col in table.columns if col.type == "BOOLEAN"}
+        except (ValueError, FileNotFoundError):
+            # If we can't get schema, proceed without conversion
+            bool_columns = set()
+
+        stats = {"inserted": 0, "chunks": 0, "elapsed": 0.0, "rows_per_sec": 0.0}
+        started = time.perf_counter()
+        iterator = iter(records)
+
         with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+            if single_transaction:
+                conn.execute("BEGIN IMMEDIATE")
             try:
-                # Use executemany for bulk insert
-                conn.executemany(query, records)
-                conn.commit()
-                return records
+                while True:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+
+                    # Group rows by column signature so each group is one executemany.
+                    # Timestamps are formatted once per chunk instead of adapted per row.
+                    now = datetime.now().isoformat()
+                    groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+                    for data in chunk:
+                        columns = [col for col in data if col not in ("id", "created_at", "updated_at")]
+                        row = [data.get("id") or str(uuid.uuid4()), now, now]
+                        for col in columns:
+                            value = data[col]
+                            if col in bool_columns and value is not None:
+                                value = 1 if value else 0
+                            row.append(value)
+                        groups.setdefault(tuple(columns), []).append(tuple(row))
+
+                    if not single_transaction:
+                        conn.execute("BEGIN IMMEDIATE")
+                    for columns, rows in groups.items():
+                        all_columns = ("id", "created_at", "updated_at") + columns
+                        conn.executemany(
+                            f"INSERT INTO {table_name} ({', '.join(all_columns)}) "
+                            f"VALUES ({', '.join('?' * len(all_columns))})",
+                            rows,
+                        )
+                    if not single_transaction:
+                        conn.execute("COMMIT")
+
+                    stats["inserted"] += len(chunk)
+                    stats["chunks"] += 1
+                    stats["elapsed"] = time.perf_counter() - started
+                    stats["rows_per_sec"] = stats["inserted"] / stats["elapsed"] if stats["elapsed"] else 0.0
+                    if progress:
+                        progress(dict(stats))
+
+                if single_transaction:
+                    conn.execute("COMMIT")
             except Exception as e:
                 conn.rollback()
                 if "UNIQUE constraint failed" in str(e):
-                    raise ValueError(f"Duplicate ID found in bulk insert")
+                    committed = 0 if single_transaction else stats["inserted"]
+                    raise ValueError(
+                        f"Duplicate value in streamed insert ({e}); {committed} records committed"
+                    ) from e
                 raise
 
+        stats["elapsed"] = time.perf_counter() - started
+        stats["rows_per_sec"] = stats["inserted"] / stats["elapsed"] if stats["elapsed"] else 0.0
+        return stats
+
     def create(self, instance: T) -> T:
         """Create a new record from a model instance.
 
@@ -300,16 +759,10 @@ class DataManager(BaseManager):
 
         params = {**update_data, "id": data["id"]}
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            try:
-                conn.execute(query, params)
-                conn.commit()
+        self._write(lambda conn: conn.execute(query, params))
 
-                # Return updated instance
-                return type(instance)(**data)
-            except Exception:
-                conn.rollback()
-                raise
+        # Return updated instance
+        return type(instance)(**data)
 
     def delete(self, model_class: Type[T], **filters) -> int:
         """Delete records matching filters.
@@ -344,15 +797,7 @@ class DataManager(BaseManager):
 
         query = f"DELETE FROM {table_name} WHERE {where_clause}"
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            try:
-                cursor = conn.execute(query, params)
-                deleted_count = cursor.rowcount
-                conn.commit()
-                return deleted_count
-            except Exception:
-                conn.rollback()
-                raise
+        return self._write(lambda conn: conn.execute(query, params).rowcount)
 
     def delete_model_by_id(self, model_class: Type[T], record_id: str) -> bool:
         """Delete a single record by ID using model class.
@@ -390,37 +835,37 @@ class DataManager(BaseManager):
 
         table_name = self._get_table_name(type(instances[0]))
         created_instances = []
+        inserts = []
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            try:
-                for instance in instances:
-                    data = instance.model_dump()
+        for instance in instances:
+            data = instance.model_dump()
 
-                    # Generate ID if not provided
-                    if not data.get("id"):
-                        data["id"] = str(uuid.uuid4())
+            # Generate ID if not provided
+            if not data.get("id"):
+                data["id"] = str(uuid.uuid4())
 
-                    # Set timestamps
-                    now = datetime.now()
-                    data["created_at"] = now
-                    data["updated_at"] = now
+            # Set timestamps
+            now = datetime.now()
+            data["created_at"] = now
+            data["updated_at"] = now
 
-                    # Build INSERT query
-                    columns = list(data.keys())
-                    placeholders = [f":{col}" for col in columns]
-                    query = f"""
-                        INSERT INTO {table_name} ({", ".join(columns)}) 
-                        VALUES ({", ".join(placeholders)})
-                    """
+            # Build INSERT query
+            columns = list(data.keys())
+            placeholders = [f":{col}" for col in columns]
+            query = f"""
+                INSERT INTO {table_name} ({", ".join(columns)}) 
+                VALUES ({", ".join(placeholders)})
+            """
 
-                    conn.execute(query, data)
-                    created_instances.append(type(instance)(**data))
+            inserts.append((query, data))
+            created_instances.append(type(instance)(**data))
 
-                conn.commit()
-                return created_instances
-            except Exception:
-                conn.rollback()
-                raise
+        def insert_all(conn: DatabaseConnection) -> None:
+            for query, data in inserts:
+                conn.execute(query, data)
+
+        self._write(insert_all)
+        return created_instances
 
     def count(self, model_class: Type[T], **filters) -> int:
         """Count records with optional filtering.
@@ -441,12 +886,13 @@ class DataManager(BaseManager):
         if where_clause:
             query += f" WHERE {where_clause}"
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with get_reader_pool().connection(self._read_path(), tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
             cursor = conn.execute(query, params)
             result = cursor.fetchone()
             return result["count"] if result else 0
 
-    def _get_table_name(self, model_class: Type[BaseModel]) -> str:
+    @staticmethod
+    def _get_table_name(model_class: Type[BaseModel]) -> str:
         """Extract table name from model class.
 
         Args:
@@ -596,10 +1042,7 @@ class DataManager(BaseManager):
         
         sql = f"DELETE FROM {table} WHERE {where_clause}"
         
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            cursor = conn.execute(sql, params)
-            conn.commit()
-            return cursor.rowcount
+        return self._write(lambda conn: conn.execute(sql, params).rowcount)
 
     def update_where(self, table: str, data: Dict[str, Any], operator: str = "AND", **filters) -> int:
         """Update records in a table based on filter criteria.
@@ -664,10 +1107,7 @@ class DataManager(BaseManager):
         
         sql = f"UPDATE {table} SET {', '.join(set_clauses)} WHERE {where_clause}"
         
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            cursor = conn.execute(sql, all_params)
-            conn.commit()
-            return cursor.rowcount
+        return self._write(lambda conn: conn.execute(sql, all_params).rowcount)
 
     def update_by_id(self, table: str, record_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a single record by ID.
@@ -702,20 +1142,18 @@ class DataManager(BaseManager):
         sql = f"UPDATE {table} SET {set_clause} WHERE id = ?"
         params.append(record_id)
         
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            cursor = conn.execute(sql, params)
-            conn.commit()
-            
-            if cursor.rowcount == 0:
+        def update(conn: DatabaseConnection) -> Optional[Dict[str, Any]]:
+            if conn.execute(sql, params).rowcount == 0:
                 raise ValueError(f"No record found with id: {record_id}")
-            
-            # Return the updated record
-            result = conn.execute(f"SELECT * FROM {table} WHERE id = ?", [record_id])
-            row = result.fetchone()
-            if row:
-                return dict(row)
-            else:
-                raise ValueError(f"Record not found after update: {record_id}")
+
+            # Read the updated record back in the same transaction
+            row = conn.execute(f"SELECT * FROM {table} WHERE id = ?", [record_id]).fetchone()
+            return dict(row) if row else None
+
+        record = self._write(update)
+        if record is None:
+            raise ValueError(f"Record not found after update: {record_id}")
+        return record
     
     def delete_by_id(self, table: str, record_id: str) -> bool:
         """Delete a single record by ID using table name.
@@ -735,10 +1173,173 @@ class DataManager(BaseManager):
 
         sql = f"DELETE FROM {table} WHERE id = ?"
         
+        return self._write(lambda conn: conn.execute(sql, [record_id]).rowcount > 0)
+
+    def bulk_update_by_id(self, table: str, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update many records by ID in a single transaction.
+
+        Updates that set the same columns are applied together with one
+        executemany per column signature, so large batches cost one commit
+        instead of one per record.
+
+        Args:
+            table: Table name
+            updates: Update dictionaries, each containing 'id' and the columns to set
+
+        Returns:
+            One entry per update, in order: the updated record, or
+            {"id": ..., "error": ...} if the record was not found or the
+            update had no columns
+
+        Raises:
+            ValueError: If an update is missing its 'id' field
+            MaintenanceError: If branch is in maintenance mode
+        """
+        # Check maintenance mode
+        check_maintenance_mode(self.project_root, self.database, self.branch)
+
+        for i, update_data in enumerate(updates):
+            if "id" not in update_data:
+                raise ValueError(f"Update record {i} missing required 'id' field")
+
+        ids = [update_data["id"] for update_data in updates]
+        records: Dict[Any, Dict[str, Any]] = {}
+
+        # Records can't exist in a lazy tenant
+        if ids and self._is_tenant_materialized():
+            def update_all(conn: DatabaseConnection) -> Dict[Any, Dict[str, Any]]:
+                existing = set()
+                for chunk in _chunked(list(dict.fromkeys(ids))):
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = conn.execute(f"SELECT id FROM {table} WHERE id IN ({placeholders})", chunk)
+                    existing.update(row[0] for row in rows)
+
+                groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+                pending = set()
+                for update_data in updates:
+                    record_id = update_data["id"]
+                    if record_id not in existing or len(update_data) == 1:
+                        continue
+                    # Flush before touching a record twice so updates apply in order
+                    if record_id in pending:
+                        self._apply_update_groups(conn, table, groups)
+                        pending.clear()
+                    signature = tuple(sorted(col for col in update_data if col != "id"))
+                    groups.setdefault(signature, []).append(update_data)
+                    pending.add(record_id)
+                self._apply_update_groups(conn, table, groups)
+
+                updated = {}
+                for chunk in _chunked(list(existing)):
+                    placeholders = ", ".join("?" * len(chunk))
+                    for row in conn.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk):
+                        updated[row["id"]] = dict(row)
+                return updated
+
+            records = self._write(update_all)
+
+        results = []
+        for update_data in updates:
+            record_id = update_data["id"]
+            if len(update_data) == 1:
+                results.append({"id": record_id, "error": "No data provided for update"})
+            elif record_id in records:
+                results.append(records[record_id])
+            else:
+                results.append({"id": record_id, "error": f"No record found with id: {record_id}"})
+        return results
+
+    def _apply_update_groups(
+        self, conn: DatabaseConnection, table: str, groups: Dict[Tuple[str, ...], List[Dict[str, Any]]]
+    ) -> None:
+        """Run one executemany UPDATE per column signature and clear the groups."""
+        for columns, group in groups.items():
+            set_clause = ", ".join(f"{col} = :{col}" for col in columns)
+            conn.executemany(f"UPDATE {table} SET {set_clause} WHERE id = :id", group)
+        groups.clear()
+
+    def bulk_delete_by_id(self, table: str, record_ids: List[str]) -> Dict[str, bool]:
+        """Delete many records by ID in a single transaction.
+
+        IDs are deleted with chunked ``DELETE ... WHERE id IN (...)``
+        statements that stay under SQLite's bound-variable limit.
+
+        Args:
+            table: Table name
+            record_ids: Record IDs to delete
+
+        Returns:
+            Dictionary mapping each ID to True if it was deleted, False if not found
+
+        Raises:
+            MaintenanceError: If branch is in maintenance mode
+        """
+        # Check maintenance mode
+        check_maintenance_mode(self.project_root, self.database, self.branch)
+
+        outcomes = dict.fromkeys(record_ids, False)
+
+        # Nothing to delete in a lazy tenant
+        if not outcomes or not self._is_tenant_materialized():
+            return outcomes
+
+        def delete_all(conn: DatabaseConnection) -> List[Any]:
+            deleted = []
+            for chunk in _chunked(list(outcomes)):
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"DELETE FROM {table} WHERE id IN ({placeholders}) RETURNING id", chunk
+                ).fetchall()
+                deleted.extend(row[0] for row in rows)
+            return deleted
+
+        for record_id in self._write(delete_all):
+            outcomes[record_id] = True
+        return outcomes
+
+    def _write(self, operation: Callable[[DatabaseConnection], R]) -> R:
+        """Run a write operation in a transaction and return its result.
+
+        With writer options on the context, the operation is queued on the
+        tenant's writer thread and committed together with other queued
+        writes. Otherwise it runs in its own BEGIN IMMEDIATE transaction on
+        a new connection. Either way it is rolled back if it raises.
+
+        Args:
+            operation: Callable that executes statements on the connection
+                without committing
+
+        Returns:
+            The operation's return value, once committed
+        """
+        if self.context.writer_options is not None:
+            return submit_write(
+                self.db_path, operation, tenant_id=self.tenant,
+                encryption_manager=self.encryption_manager, options=self.context.writer_options,
+            ).result()
+
         with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            cursor = conn.execute(sql, [record_id])
-            conn.commit()
-            return cursor.rowcount > 0
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return result
+
+    def _read_path(self) -> Path:
+        """Database file to read from without creating or materializing it.
+
+        Lazy tenants have no file yet and are read through the empty
+        template tenant, which has the branch schema and no rows.
+
+        Raises:
+            ValueError: If the tenant doesn't exist
+        """
+        if self.db_path.exists():
+            return self.db_path
+        return self.context.tenants.get_tenant_db_path_for_operation(self.tenant, is_write=False)
 
     def _ensure_tenant_materialized(self) -> None:
         """Ensure the tenant is materialized before performing data operations.
@@ -1,12 +1,323 @@
 """Key-Value store manager for CinchDB - provides fast unstructured data storage with TTL support."""
 
+import atexit
 import json
+import math
+import os
 import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from cinchdb.managers.base import BaseManager, ConnectionContext
 from cinchdb.core.connection import DatabaseConnection
+from cinchdb.core.path_utils import get_tenant_kv_db_path
+from cinchdb.core.writer import submit_write
+
+R = TypeVar("R")
+
+
+def _number(num: float) -> Union[int, float]:
+    """Return a stored REAL as int when it holds a whole number."""
+    return int(num) if math.isfinite(num) and num == int(num) else num
+
+
+class WrongTypeError(ValueError):
+    """Raised when a KV operation targets a key holding another type of value."""
+
+
+# Names of the key types used in WrongTypeError messages
+_TYPE_NAMES = {
+    "value": "plain value",
+    "hash": "hash",
+    "list": "list",
+    "set": "set",
+    "zset": "sorted set",
+}
+
+
+class KVCodec:
+    """Compression codec for large KV values.
+
+    Subclass and pass to register_codec() to make a codec available by name.
+    The codec name is stored alongside each compressed value, so any registered
+    codec can decode values written with it.
+    """
+
+    name: str = ""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress raw bytes."""
+        raise NotImplementedError
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress bytes produced by compress()."""
+        raise NotImplementedError
+
+
+class ZlibCodec(KVCodec):
+    """zlib codec (default)."""
+
+    name = "zlib"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+_CODECS: Dict[str, KVCodec] = {ZlibCodec.name: ZlibCodec()}
+
+
+def register_codec(codec: KVCodec) -> None:
+    """Register a compression codec for use by KVManager.
+
+    Args:
+        codec: Codec instance with a unique, non-empty name
+
+    Raises:
+        ValueError: If the codec has no name
+    """
+    if not codec.name:
+        raise ValueError("Codec must have a name")
+    _CODECS[codec.name] = codec
+
+
+def get_codec(name: str) -> KVCodec:
+    """Look up a registered codec by name.
+
+    Raises:
+        ValueError: If no codec is registered under that name
+    """
+    codec = _CODECS.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown KV codec: {name}")
+    return codec
+
+
+@dataclass
+class KVOptions:
+    """Tuning options for the KV store.
+
+    Attributes:
+        compression_threshold: Compress text, JSON and blob values whose encoded
+            size is at least this many bytes (None disables compression)
+        compression_codec: Name of the registered codec used for new values
+        separate_file: Store each tenant's KV data in its own {tenant}.kv.db
+            file next to the tenant database, so KV writes don't contend with
+            relational writes for the same WAL
+        pragmas: PRAGMA settings for the separate KV file, e.g.
+            {"synchronous": "OFF", "page_size": 1024} for cache-class data
+            (ignored unless separate_file is set)
+        in_memory: Keep each tenant's KV data in an in-memory SQLite database
+            that is snapshotted to {tenant}.kv.db, trading durability of the
+            most recent writes for speed
+        snapshot_interval: Seconds between background snapshots of in-memory
+            stores (None snapshots only on shutdown or snapshot())
+    """
+    compression_threshold: Optional[int] = 4096
+    compression_codec: str = ZlibCodec.name
+    separate_file: bool = False
+    pragmas: Dict[str, Any] = field(default_factory=dict)
+    in_memory: bool = False
+    snapshot_interval: Optional[float] = 30.0
+
+
+class _MemoryStore:
+    """In-memory KV database for one tenant, snapshotted to a file."""
+
+    def __init__(self, path: Path, snapshot_interval: Optional[float]):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+
+        # Start from the last snapshot, if any
+        if path.exists():
+            source = sqlite3.connect(str(path))
+            try:
+                source.backup(self.conn)
+            finally:
+                source.close()
+        self._snapshot_changes = self.conn.total_changes
+
+        self._stop = threading.Event()
+        if snapshot_interval:
+            thread = threading.Thread(
+                target=self._run, args=(snapshot_interval,), daemon=True,
+                name=f"cinchdb-kv-snapshot-{path.stem}",
+            )
+            thread.start()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.snapshot()
+
+    def snapshot(self) -> bool:
+        """Write the store to disk if it changed since the last snapshot.
+
+        The snapshot is written to a temporary file and moved into place, so
+        the file on disk is always a complete copy.
+        """
+        with self.lock:
+            if self.conn.total_changes == self._snapshot_changes:
+                return False
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            target = sqlite3.connect(str(tmp_path))
+            try:
+                self.conn.backup(target)
+            finally:
+                target.close()
+
+            # Stale WAL files from file-backed mode must not be replayed
+            for suffix in ("-wal", "-shm"):
+                stale = Path(f"{self.path}{suffix}")
+                if stale.exists():
+                    stale.unlink()
+            os.replace(tmp_path, self.path)
+
+            self._snapshot_changes = self.conn.total_changes
+            return True
+
+    def close(self) -> None:
+        self._stop.set()
+        with self.lock:
+            self.conn.close()
+
+
+class _MemoryConnection:
+    """DatabaseConnection stand-in that serializes access to a _MemoryStore."""
+
+    def __init__(self, store: _MemoryStore):
+        self._store = store
+
+    def __enter__(self):
+        self._store.lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Match DatabaseConnection.close(): uncommitted work is discarded
+        try:
+            if self._store.conn.in_transaction:
+                self._store.conn.rollback()
+        finally:
+            self._store.lock.release()
+        return False
+
+    def execute(self, sql: str, params: Optional[Any] = None) -> sqlite3.Cursor:
+        if params:
+            return self._store.conn.execute(sql, params)
+        return self._store.conn.execute(sql)
+
+    def executemany(self, sql: str, params: List[tuple]) -> sqlite3.Cursor:
+        return self._store.conn.executemany(sql, params)
+
+    def commit(self) -> None:
+        self._store.conn.commit()
+
+    def rollback(self) -> None:
+        self._store.conn.rollback()
+
+
+_MEMORY_STORES: Dict[Path, _MemoryStore] = {}
+_MEMORY_STORES_LOCK = threading.Lock()
+
+
+def _get_memory_store(path: Path, options: KVOptions) -> _MemoryStore:
+    with _MEMORY_STORES_LOCK:
+        store = _MEMORY_STORES.get(path)
+        if store is None:
+            store = _MemoryStore(path, options.snapshot_interval)
+            _MEMORY_STORES[path] = store
+        return store
+
+
+def snapshot_memory_store(path: Path) -> bool:
+    """Snapshot the in-memory KV store backed by path, if one is open.
+
+    Returns:
+        True if a snapshot was written
+    """
+    store = _MEMORY_STORES.get(path)
+    return store.snapshot() if store else False
+
+
+def discard_memory_store(path: Path) -> None:
+    """Close the in-memory KV store backed by path without snapshotting it."""
+    with _MEMORY_STORES_LOCK:
+        store = _MEMORY_STORES.pop(path, None)
+    if store:
+        store.close()
+
+
+@atexit.register
+def snapshot_memory_stores() -> None:
+    """Snapshot every open in-memory KV store (also runs at interpreter exit)."""
+    for store in list(_MEMORY_STORES.values()):
+        store.snapshot()
+
+
+# Value columns of __kv, in insert order
+_VALUE_COLUMNS = ('value_text', 'value_number', 'value_bool', 'value_blob', 'value_json')
+
+_INSERT_SQL = """
+    INSERT INTO __kv (key, value_type, value_text, value_number, value_bool, value_blob,
+                      value_json, value_codec, value_size, expires_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, unixepoch())
+"""
+
+# Every value column is overwritten so a key can change type in place
+_UPSERT_SQL = _INSERT_SQL + """
+    ON CONFLICT(key) DO UPDATE SET
+        value_type = excluded.value_type,
+        value_text = excluded.value_text,
+        value_number = excluded.value_number,
+        value_bool = excluded.value_bool,
+        value_blob = excluded.value_blob,
+        value_json = excluded.value_json,
+        value_codec = excluded.value_codec,
+        value_size = excluded.value_size,
+        expires_at = excluded.expires_at,
+        updated_at = unixepoch()
+"""
+
+# A row whose TTL has passed is treated as absent by the counter upsert.
+_EXPIRED = "(__kv.expires_at IS NOT NULL AND __kv.expires_at <= :now)"
+_COUNTER_VALUE = (
+    f"CASE WHEN {_EXPIRED} THEN excluded.value_number "
+    "ELSE __kv.value_number + excluded.value_number END"
+)
+
+# Increment a counter and start its TTL only when the counter is (re)created,
+# so the window is fixed by the first hit. Non-numeric live values are left
+# untouched and produce no RETURNING row.
+_COUNTER_UPSERT_SQL = f"""
+    INSERT INTO __kv (key, value_type, value_number, value_size, expires_at, updated_at)
+    VALUES (:key, 'number', :amount, LENGTH(CAST(:amount AS TEXT)), :expires_at, unixepoch())
+    ON CONFLICT(key) DO UPDATE SET
+        value_type = 'number',
+        value_text = NULL,
+        value_bool = NULL,
+        value_blob = NULL,
+        value_json = NULL,
+        value_codec = NULL,
+        value_number = {_COUNTER_VALUE},
+        value_size = LENGTH(CAST({_COUNTER_VALUE} AS TEXT)),
+        expires_at = CASE WHEN {_EXPIRED} THEN excluded.expires_at
+                          ELSE COALESCE(__kv.expires_at, excluded.expires_at) END,
+        updated_at = unixepoch()
+    WHERE __kv.value_type = 'number' OR {_EXPIRED}
+    RETURNING value_number, expires_at
+"""
 
 
 class KVManager(BaseManager):
@@ -14,6 +325,9 @@ class KVManager(BaseManager):
 
     Provides fast unstructured data storage with TTL support and native type handling.
     Supports text, numbers, binary data, JSON objects, and null values.
+
+    Plain values, hashes, lists, sets and sorted sets share one key namespace.
+    An operation on a key that holds another type raises WrongTypeError.
     """
 
     def __init__(self, context: ConnectionContext):
@@ -23,6 +337,88 @@ class KVManager(BaseManager):
             context: ConnectionContext with all connection parameters
         """
         super().__init__(context)
+        self.options = context.kv_options or KVOptions()
+        self._dedicated = self.options.separate_file or self.options.in_memory
+        if self._dedicated:
+            self.kv_path = get_tenant_kv_db_path(self.db_path)
+        else:
+            self.kv_path = self.db_path
+
+        if self.options.in_memory and self.encryption_manager:
+            raise ValueError("In-memory KV mode does not support encrypted tenants")
+
+    def _connect(self) -> DatabaseConnection:
+        """Open a connection to the tenant's KV storage."""
+        if self.options.in_memory:
+            return _MemoryConnection(_get_memory_store(self.kv_path, self.options))
+        pragmas = self.options.pragmas if self.options.separate_file else None
+        return DatabaseConnection(
+            self.kv_path,
+            tenant_id=self.tenant,
+            encryption_manager=self.encryption_manager,
+            pragmas=pragmas,
+        )
+
+    def _write(self, operation: Callable[[DatabaseConnection], R], structures: bool = False) -> R:
+        """Run a KV write after ensuring the __kv table, and return its result.
+
+        With writer options on the context, the operation is queued on the
+        writer thread for the KV file and group-committed with other writes
+        (in-memory stores are always written directly). Otherwise it runs in
+        its own BEGIN IMMEDIATE transaction. Either way the operation
+        commits its own work with conn.commit().
+
+        Args:
+            operation: Callable run with the write connection
+            structures: Also ensure the hash, list, set and sorted set tables
+        """
+        def prepare(conn: DatabaseConnection) -> None:
+            self._ensure_kv_table(conn)
+            if structures:
+                self._ensure_structure_tables(conn)
+
+        def write(conn: DatabaseConnection) -> R:
+            prepare(conn)
+            return operation(conn)
+
+        writer_options = self.context.writer_options
+        if writer_options is not None and not self.options.in_memory:
+            return submit_write(
+                self.kv_path, write, tenant_id=self.tenant,
+                encryption_manager=self.encryption_manager, options=writer_options,
+                pragmas=self.options.pragmas if self.options.separate_file else None,
+            ).result()
+
+        with self._connect() as conn:
+            prepare(conn)
+            # Uncommitted work is rolled back when the connection closes
+            conn.execute("BEGIN IMMEDIATE")
+            return operation(conn)
+
+    def _kv_exists(self) -> bool:
+        """Check whether the tenant's KV storage exists yet."""
+        if self.options.in_memory and self.kv_path in _MEMORY_STORES:
+            return True
+        if self._dedicated:
+            return self.kv_path.exists()
+        return self._is_tenant_materialized()
+
+    def _ensure_kv_storage(self) -> None:
+        """Ensure the tenant's KV storage exists before a write.
+
+        A separate KV file (or in-memory store) only needs the tenant to be
+        registered; it is created on first write without materializing the
+        tenant database.
+        """
+        if not self._dedicated:
+            self._ensure_tenant_materialized()
+            return
+        if not self._kv_exists() and self.tenant != "main":
+            try:
+                self.context.tenants.create_tenant(self.tenant, lazy=True)
+            except ValueError:
+                # Tenant already exists
+                pass
 
     def _is_tenant_materialized(self) -> bool:
         """Check if the tenant is materialized (has actual database file)."""
@@ -47,11 +443,16 @@ class KVManager(BaseManager):
         """Ensure the __kv table exists with the multi-type schema."""
         # Check if table exists
         result = conn.execute("""
-            SELECT name FROM sqlite_master
+            SELECT sql FROM sqlite_master
             WHERE type='table' AND name='__kv'
         """).fetchone()
 
-        if not result:
+        if result:
+            # Tables created before compression support lack the codec column
+            if 'value_codec' not in result['sql']:
+                conn.execute("ALTER TABLE __kv ADD COLUMN value_codec TEXT")
+                conn.commit()
+        else:
             # Create the multi-type KV table
             conn.execute("""
                 CREATE TABLE __kv (
@@ -62,6 +463,7 @@ class KVManager(BaseManager):
                     value_bool BOOLEAN,
                     value_blob BLOB,
                     value_json TEXT,
+                    value_codec TEXT,
                     value_size INTEGER,
                     expires_at INTEGER,
                     created_at INTEGER DEFAULT (unixepoch()),
@@ -96,6 +498,123 @@ class KVManager(BaseManager):
 
             conn.commit()
 
+    def _ensure_structure_tables(self, conn: DatabaseConnection) -> None:
+        """Ensure the hash, list, set and sorted set tables exist.
+
+        Each structure gets its own table keyed by (key, element) so single-field
+        updates and range reads touch only the rows involved.
+        """
+        result = conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='__kv_hash'
+        """).fetchone()
+
+        if result:
+            return
+
+        element_type_check = (
+            "CHECK (value_type IN ('text', 'number', 'boolean', 'blob', 'json', 'null'))"
+        )
+
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS __kv_hash (
+                key TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value_type TEXT NOT NULL {element_type_check},
+                value,
+                PRIMARY KEY (key, field)
+            ) WITHOUT ROWID
+        """)
+
+        # Positions stay contiguous because elements are only pushed/popped at the ends
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS __kv_list (
+                key TEXT NOT NULL,
+                pos INTEGER NOT NULL,
+                value_type TEXT NOT NULL {element_type_check},
+                value,
+                PRIMARY KEY (key, pos)
+            ) WITHOUT ROWID
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS __kv_set (
+                key TEXT NOT NULL,
+                member TEXT NOT NULL,
+                PRIMARY KEY (key, member)
+            ) WITHOUT ROWID
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS __kv_zset (
+                key TEXT NOT NULL,
+                member TEXT NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (key, member)
+            ) WITHOUT ROWID
+        """)
+
+        # Index for score range scans
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS __kv_zset_score ON __kv_zset(key, score, member)
+        """)
+
+        conn.commit()
+
+    def _structure_tables_exist(self, conn: DatabaseConnection) -> bool:
+        """Check whether the data structure tables have been created."""
+        result = conn.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type='table' AND name='__kv_hash'
+        """).fetchone()
+        return result is not None
+
+    def _structure_type(self, conn: DatabaseConnection, key: str) -> Optional[str]:
+        """Get the data structure type stored under a key, if any."""
+        if not self._structure_tables_exist(conn):
+            return None
+        result = conn.execute("""
+            SELECT CASE
+                WHEN EXISTS (SELECT 1 FROM __kv_hash WHERE key = :key) THEN 'hash'
+                WHEN EXISTS (SELECT 1 FROM __kv_list WHERE key = :key) THEN 'list'
+                WHEN EXISTS (SELECT 1 FROM __kv_set WHERE key = :key) THEN 'set'
+                WHEN EXISTS (SELECT 1 FROM __kv_zset WHERE key = :key) THEN 'zset'
+            END
+        """, {"key": key}).fetchone()
+        return result[0]
+
+    def _value_exists(self, conn: DatabaseConnection, key: str) -> bool:
+        """Check whether a plain value is stored under a key and not expired."""
+        result = conn.execute("""
+            SELECT 1 FROM __kv
+            WHERE key = ?
+            AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
+        """, [key]).fetchone()
+        return result is not None
+
+    def _key_type(self, conn: DatabaseConnection, key: str) -> Optional[str]:
+        """Get the type stored under a key ('value', 'hash', 'list', 'set' or 'zset')."""
+        if self._value_exists(conn, key):
+            return "value"
+        return self._structure_type(conn, key)
+
+    def _check_type(self, conn: DatabaseConnection, key: str, expected: str) -> None:
+        """Ensure a key is missing or holds the expected type.
+
+        Raises:
+            WrongTypeError: If the key holds another type
+        """
+        if expected == "value":
+            actual = self._structure_type(conn, key)
+        else:
+            self._ensure_kv_table(conn)
+            actual = self._key_type(conn, key)
+
+        if actual is not None and actual != expected:
+            raise WrongTypeError(
+                f"WRONGTYPE Key '{key}' holds a {_TYPE_NAMES[actual]}, not a {_TYPE_NAMES[expected]}"
+            )
+
     def _glob_to_like(self, pattern: str) -> str:
         """Convert Redis glob pattern to SQL LIKE pattern.
 
@@ -182,23 +701,110 @@ class KVManager(BaseManager):
             except (TypeError, ValueError) as e:
                 raise ValueError(f"Value is not JSON serializable: {e}")
 
-    def _calculate_value_size(self, value: Any) -> int:
-        """Calculate size of value in bytes."""
-        if value is None:
-            return 0
-        elif isinstance(value, bytes):
-            return len(value)
-        elif isinstance(value, (int, float, bool)):
-            return len(str(value).encode('utf-8'))
-        elif isinstance(value, str):
-            return len(value.encode('utf-8'))
+    def _prepare_row(self, value: Any) -> Dict[str, Any]:
+        """Prepare the __kv value columns for a value.
+
+        The value is serialized once; the encoded length drives both size
+        accounting and the compression decision.
+
+        Returns:
+            Dict with value_type, every value column, value_codec and value_size
+        """
+        value_type, value_dict = self._detect_type_and_value(value)
+        row = dict.fromkeys(_VALUE_COLUMNS)
+        row.update(value_dict)
+        row['value_type'] = value_type
+        row['value_codec'] = None
+
+        if value_type in ('text', 'json', 'blob'):
+            column = f'value_{value_type}'
+            raw = row[column]
+            encoded = raw if isinstance(raw, bytes) else raw.encode('utf-8')
+            row['value_size'] = len(encoded)
+
+            threshold = self.options.compression_threshold
+            if threshold is not None and len(encoded) >= threshold:
+                codec = get_codec(self.options.compression_codec)
+                compressed = codec.compress(encoded)
+                # Keep the original when compression doesn't pay off
+                if len(compressed) < len(encoded):
+                    row[column] = compressed
+                    row['value_codec'] = codec.name
+        elif value_type == 'null':
+            row['value_size'] = 0
         else:
-            # JSON types
-            return len(json.dumps(value).encode('utf-8'))
+            row['value_size'] = len(str(value).encode('utf-8'))
+
+        return row
+
+    def _row_params(self, key: str, row: Dict[str, Any], expires_at: Optional[float]) -> list:
+        """Build parameters for _INSERT_SQL/_UPSERT_SQL from a prepared row."""
+        return [
+            key,
+            row['value_type'],
+            *(row[column] for column in _VALUE_COLUMNS),
+            row['value_codec'],
+            row['value_size'],
+            expires_at,
+        ]
+
+    def _decode_value(self, row: sqlite3.Row) -> Any:
+        """Convert a __kv row back to its original value, decompressing if needed."""
+        value_type = row['value_type']
+
+        if value_type == 'null':
+            return None
+        elif value_type == 'number':
+            num = row['value_number']
+            # Try to preserve int vs float
+            return _number(num)
+        elif value_type == 'boolean':
+            return bool(row['value_bool'])
+
+        raw = row[f'value_{value_type}']
+        if row['value_codec']:
+            raw = get_codec(row['value_codec']).decompress(raw)
+            if value_type != 'blob':
+                raw = raw.decode('utf-8')
+
+        if value_type == 'json':
+            return json.loads(raw)
+        return raw
+
+    def _encode_element(self, value: Any) -> tuple[str, Any]:
+        """Encode a hash value or list element for single-column storage.
+
+        Returns:
+            (value_type, stored_value)
+        """
+        value_type, value_dict = self._detect_type_and_value(value)
+        if value_type == 'boolean':
+            return value_type, 1 if value else 0
+        return value_type, next(iter(value_dict.values()), None)
+
+    def _decode_element(self, value_type: str, stored: Any) -> Any:
+        """Decode a value stored by _encode_element."""
+        if value_type == 'null':
+            return None
+        elif value_type == 'number':
+            return _number(stored)
+        elif value_type == 'boolean':
+            return bool(stored)
+        elif value_type == 'json':
+            return json.loads(stored)
+        return stored
+
+    def _validate_member(self, member: Any, kind: str = "Member") -> None:
+        """Validate a hash field or set member (non-empty string)."""
+        if not isinstance(member, str) or not member:
+            raise ValueError(f"{kind} must be a non-empty string")
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """Set a key-value pair with optional TTL.
 
+        Text, JSON and binary values at or above the configured compression
+        threshold are stored compressed and decompressed transparently on read.
+
         Args:
             key: Key to set
             value: Value to store (any type)
@@ -206,6 +812,7 @@ class KVManager(BaseManager):
 
         Raises:
             ValueError: If key is empty or invalid
+            WrongTypeError: If the key holds a hash, list, set or sorted set
         """
         self._validate_key(key)
 
@@ -215,126 +822,20 @@ class KVManager(BaseManager):
                 raise ValueError("TTL must be positive")
             expires_at = time.time() + ttl
 
-        # Detect type and prepare value
-        value_type, value_dict = self._detect_type_and_value(value)
-        value_size = self._calculate_value_size(value)
-
-        # Ensure tenant is materialized for write operation
-        self._ensure_tenant_materialized()
-
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
-
-            # Build the INSERT/UPDATE based on type
-            if value_type == 'null':
-                # NULL type: no value columns
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = NULL,
-                        value_number = NULL,
-                        value_bool = NULL,
-                        value_blob = NULL,
-                        value_json = NULL,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_size, expires_at])
-                conn.commit()
-
-            elif value_type == 'text':
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_text, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = excluded.value_text,
-                        value_number = NULL,
-                        value_bool = NULL,
-                        value_blob = NULL,
-                        value_json = NULL,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_dict['value_text'], value_size, expires_at])
-                conn.commit()
+        # Serialize, measure and (maybe) compress once
+        row = self._prepare_row(value)
 
-            elif value_type == 'number':
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_number, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = NULL,
-                        value_number = excluded.value_number,
-                        value_bool = NULL,
-                        value_blob = NULL,
-                        value_json = NULL,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_dict['value_number'], value_size, expires_at])
-                conn.commit()
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
 
-            elif value_type == 'blob':
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_blob, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = NULL,
-                        value_number = NULL,
-                        value_bool = NULL,
-                        value_blob = excluded.value_blob,
-                        value_json = NULL,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_dict['value_blob'], value_size, expires_at])
-                conn.commit()
+        params = self._row_params(key, row, expires_at)
 
-            elif value_type == 'boolean':
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_bool, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = NULL,
-                        value_number = NULL,
-                        value_bool = excluded.value_bool,
-                        value_blob = NULL,
-                        value_json = NULL,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_dict['value_bool'], value_size, expires_at])
-                conn.commit()
+        def upsert(conn: DatabaseConnection) -> None:
+            self._check_type(conn, key, "value")
+            conn.execute(_UPSERT_SQL, params)
+            conn.commit()
 
-            elif value_type == 'json':
-                sql = """
-                    INSERT INTO __kv (key, value_type, value_json, value_size, expires_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, unixepoch())
-                    ON CONFLICT(key) DO UPDATE SET
-                        value_type = excluded.value_type,
-                        value_text = NULL,
-                        value_number = NULL,
-                        value_bool = NULL,
-                        value_blob = NULL,
-                        value_json = excluded.value_json,
-                        value_size = excluded.value_size,
-                        expires_at = excluded.expires_at,
-                        updated_at = unixepoch()
-                """
-                conn.execute(sql, [key, value_type, value_dict['value_json'], value_size, expires_at])
-                conn.commit()
+        self._write(upsert)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value by key, automatically excluding expired entries.
@@ -344,48 +845,33 @@ class KVManager(BaseManager):
 
         Returns:
             Original value or None if key doesn't exist or is expired
+
+        Raises:
+            WrongTypeError: If the key holds a hash, list, set or sorted set
         """
         if not key or not isinstance(key, str):
             return None
 
         # If tenant is not materialized, key doesn't exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return None
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
             result = conn.execute("""
-                SELECT value_type, value_text, value_number, value_bool, value_blob, value_json
+                SELECT value_type, value_text, value_number, value_bool, value_blob, value_json, value_codec
                 FROM __kv
                 WHERE key = ?
                 AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
             """, [key]).fetchone()
 
             if not result:
+                self._check_type(conn, key, "value")
                 return None
 
-            value_type = result['value_type']
-
-            if value_type == 'null':
-                return None
-            elif value_type == 'text':
-                return result['value_text']
-            elif value_type == 'number':
-                num = result['value_number']
-                # Try to preserve int vs float
-                if num == int(num):
-                    return int(num)
-                return num
-            elif value_type == 'boolean':
-                return bool(result['value_bool'])
-            elif value_type == 'blob':
-                return result['value_blob']
-            elif value_type == 'json':
-                return json.loads(result['value_json'])
-
-            return None
+            return self._decode_value(result)
 
     def delete(self, *keys) -> int:
         """Delete one or more keys.
@@ -414,25 +900,34 @@ class KVManager(BaseManager):
             return 0
 
         # If tenant is not materialized, no keys to delete
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return 0
 
-        deleted_count = 0
-
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
+        def delete_keys(conn: DatabaseConnection) -> int:
+            structure_tables = []
+            if self._structure_tables_exist(conn):
+                structure_tables = ['__kv_hash', '__kv_list', '__kv_set', '__kv_zset']
 
+            deleted_count = 0
             for key in valid_keys:
                 result = conn.execute("DELETE FROM __kv WHERE key = ?", [key])
-                deleted_count += result.rowcount
+                removed = result.rowcount > 0
+
+                # Hashes, lists and sets share the key namespace
+                for table in structure_tables:
+                    result = conn.execute(f"DELETE FROM {table} WHERE key = ?", [key])
+                    removed = result.rowcount > 0 or removed
+
+                if removed:
+                    deleted_count += 1
 
             conn.commit()
+            return deleted_count
 
-        return deleted_count
+        return self._write(delete_keys)
 
     def exists(self, key: str) -> bool:
-        """Check if a key exists and is not expired.
+        """Check if a key of any type exists and is not expired.
 
         Args:
             key: Key to check
@@ -444,20 +939,14 @@ class KVManager(BaseManager):
             return False
 
         # If tenant is not materialized, key doesn't exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return False
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
-            result = conn.execute("""
-                SELECT 1 FROM __kv
-                WHERE key = ?
-                AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
-            """, [key]).fetchone()
-
-            return result is not None
+            return self._key_type(conn, key) is not None
 
     def setnx(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """Set key only if it doesn't exist (SET if Not eXists).
@@ -468,7 +957,7 @@ class KVManager(BaseManager):
             ttl: Optional TTL in seconds
 
         Returns:
-            True if key was set, False if key already existed
+            True if key was set, False if key already existed (with any type)
         """
         self._validate_key(key)
 
@@ -478,25 +967,15 @@ class KVManager(BaseManager):
                 raise ValueError("TTL must be positive")
             expires_at = time.time() + ttl
 
-        # Detect type and prepare value
-        value_type, value_dict = self._detect_type_and_value(value)
-        value_size = self._calculate_value_size(value)
-
-        # Ensure tenant is materialized for write operation
-        self._ensure_tenant_materialized()
+        # Serialize, measure and (maybe) compress once
+        row = self._prepare_row(value)
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
 
+        def set_if_missing(conn: DatabaseConnection) -> bool:
             # First, check if key exists and is not expired
-            existing = conn.execute("""
-                SELECT 1 FROM __kv
-                WHERE key = ?
-                AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
-            """, [key]).fetchone()
-
-            if existing:
+            if self._key_type(conn, key) is not None:
                 return False
 
             # Delete expired key if it exists
@@ -508,44 +987,7 @@ class KVManager(BaseManager):
             """, [key])
 
             try:
-                # Use type-specific INSERT (no ON CONFLICT)
-                if value_type == 'null':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_size, expires_at])
-                elif value_type == 'text':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_text, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_dict['value_text'], value_size, expires_at])
-                elif value_type == 'number':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_number, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_dict['value_number'], value_size, expires_at])
-                elif value_type == 'boolean':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_bool, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_dict['value_bool'], value_size, expires_at])
-                elif value_type == 'blob':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_blob, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_dict['value_blob'], value_size, expires_at])
-                elif value_type == 'json':
-                    sql = """
-                        INSERT INTO __kv (key, value_type, value_json, value_size, expires_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, unixepoch())
-                    """
-                    conn.execute(sql, [key, value_type, value_dict['value_json'], value_size, expires_at])
-
+                conn.execute(_INSERT_SQL, self._row_params(key, row, expires_at))
                 conn.commit()
                 return True
 
@@ -553,8 +995,23 @@ class KVManager(BaseManager):
                 # Key already exists
                 return False
 
+        return self._write(set_if_missing)
+
+    def _matching_keys_sql(self, conn: DatabaseConnection) -> str:
+        """SQL selecting distinct keys of every type that match :pattern."""
+        sql = """
+            SELECT key FROM __kv
+            WHERE key LIKE :pattern ESCAPE '\\'
+            AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
+        """
+        if self._structure_tables_exist(conn):
+            # UNION removes keys that appear in more than one table
+            for table in ('__kv_hash', '__kv_list', '__kv_set', '__kv_zset'):
+                sql += f"UNION SELECT key FROM {table} WHERE key LIKE :pattern ESCAPE '\\'\n"
+        return sql
+
     def keys(self, pattern: str = '*') -> List[str]:
-        """List keys matching a pattern.
+        """List keys of every type matching a pattern.
 
         Args:
             pattern: Redis-style glob pattern (default: '*' for all keys)
@@ -563,20 +1020,15 @@ class KVManager(BaseManager):
             List of matching keys (sorted)
         """
         # If tenant is not materialized, no keys exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return []
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
-            sql_pattern = self._glob_to_like(pattern)
-            results = conn.execute("""
-                SELECT key FROM __kv
-                WHERE key LIKE ? ESCAPE '\\'
-                AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
-                ORDER BY key
-            """, [sql_pattern]).fetchall()
+            sql = self._matching_keys_sql(conn) + "ORDER BY key"
+            results = conn.execute(sql, {"pattern": self._glob_to_like(pattern)}).fetchall()
 
             return [row['key'] for row in results]
 
@@ -587,16 +1039,17 @@ class KVManager(BaseManager):
             key: Key to check
 
         Returns:
-            TTL in seconds (can be fractional), None if no expiry set, -1 if key doesn't exist or is expired
+            TTL in seconds (can be fractional), None if no expiry set, -1 if key doesn't exist or is expired.
+            Hashes, lists, sets and sorted sets never expire, so their TTL is None.
         """
         if not key or not isinstance(key, str):
             return -1
 
         # If tenant is not materialized, key doesn't exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return -1
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
@@ -604,15 +1057,16 @@ class KVManager(BaseManager):
                 "SELECT expires_at FROM __kv WHERE key = ?", [key]
             ).fetchone()
 
-            if not result:
-                return -1
+            if result:
+                expires_at = result['expires_at']
+                if expires_at is None:
+                    return None
 
-            expires_at = result['expires_at']
-            if expires_at is None:
-                return None
+                ttl = expires_at - time.time()
+                if ttl > 0:
+                    return ttl
 
-            ttl = expires_at - time.time()
-            return ttl if ttl > 0 else -1
+            return None if self._structure_type(conn, key) else -1
 
     def expire(self, key: str, ttl: float) -> bool:
         """Set/update TTL for an existing key.
@@ -623,20 +1077,22 @@ class KVManager(BaseManager):
 
         Returns:
             True if key existed and TTL was set, False otherwise
+
+        Raises:
+            WrongTypeError: If the key holds a hash, list, set or sorted set,
+                which can't expire
         """
         if not key or not isinstance(key, str) or ttl <= 0:
             return False
 
         # If tenant is not materialized, key doesn't exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return False
 
         expires_at = time.time() + ttl
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
-
+        def set_expiry(conn: DatabaseConnection) -> bool:
+            self._check_type(conn, key, "value")
             result = conn.execute("""
                 UPDATE __kv
                 SET expires_at = ?, updated_at = unixepoch()
@@ -647,6 +1103,8 @@ class KVManager(BaseManager):
 
             return result.rowcount > 0
 
+        return self._write(set_expiry)
+
     def persist(self, key: str) -> bool:
         """Remove expiration from a key, making it permanent.
 
@@ -660,13 +1118,10 @@ class KVManager(BaseManager):
             return False
 
         # If tenant is not materialized, key doesn't exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return False
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
-
+        def clear_expiry(conn: DatabaseConnection) -> bool:
             result = conn.execute("""
                 UPDATE __kv
                 SET expires_at = NULL, updated_at = unixepoch()
@@ -678,6 +1133,8 @@ class KVManager(BaseManager):
 
             return result.rowcount > 0
 
+        return self._write(clear_expiry)
+
     def delete_expired(self) -> int:
         """Delete all expired keys from storage.
 
@@ -685,13 +1142,10 @@ class KVManager(BaseManager):
             Number of keys removed
         """
         # If tenant is not materialized, no keys to clean up
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             return 0
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
-
+        def delete_rows(conn: DatabaseConnection) -> int:
             result = conn.execute("""
                 DELETE FROM __kv
                 WHERE expires_at IS NOT NULL
@@ -700,6 +1154,22 @@ class KVManager(BaseManager):
             conn.commit()
             return result.rowcount
 
+        return self._write(delete_rows)
+
+    def snapshot(self) -> bool:
+        """Write the in-memory KV store to disk now.
+
+        Returns:
+            True if a snapshot was written, False if nothing changed since the
+            last one
+
+        Raises:
+            ValueError: If the KV store is not in in-memory mode
+        """
+        if not self.options.in_memory:
+            raise ValueError("snapshot() requires in-memory KV mode")
+        return snapshot_memory_store(self.kv_path)
+
     # Batch operations
 
     def mget(self, keys: List[str]) -> Dict[str, Any]:
@@ -723,55 +1193,27 @@ class KVManager(BaseManager):
                 raise ValueError(f"Invalid key: {key}")
 
         # If tenant is not materialized, no keys exist
-        if not self._is_tenant_materialized():
+        if not self._kv_exists():
             raise ValueError(f"Keys not found: {keys}")
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
-            # First, check that all keys exist (non-expired)
+            # Fetch all values in one query; missing keys are whatever didn't come back
             placeholders = ','.join(['?'] * len(keys))
-            existing = conn.execute(f"""
-                SELECT key FROM __kv
+            results = conn.execute(f"""
+                SELECT key, value_type, value_text, value_number, value_bool, value_blob, value_json, value_codec
+                FROM __kv
                 WHERE key IN ({placeholders})
                 AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
             """, keys).fetchall()
 
-            existing_keys = {row['key'] for row in existing}
-            missing_keys = set(keys) - existing_keys
-
+            missing_keys = set(keys) - {row['key'] for row in results}
             if missing_keys:
                 raise ValueError(f"Keys not found: {sorted(missing_keys)}")
 
-            # Now get all values in one query
-            results = conn.execute(f"""
-                SELECT key, value_type, value_text, value_number, value_bool, value_blob, value_json
-                FROM __kv
-                WHERE key IN ({placeholders})
-                AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
-            """, keys).fetchall()
-
-            result_dict = {}
-            for row in results:
-                key = row['key']
-                value_type = row['value_type']
-
-                if value_type == 'null':
-                    result_dict[key] = None
-                elif value_type == 'text':
-                    result_dict[key] = row['value_text']
-                elif value_type == 'number':
-                    num = row['value_number']
-                    result_dict[key] = int(num) if num == int(num) else num
-                elif value_type == 'boolean':
-                    result_dict[key] = bool(row['value_bool'])
-                elif value_type == 'blob':
-                    result_dict[key] = row['value_blob']
-                elif value_type == 'json':
-                    result_dict[key] = json.loads(row['value_json'])
-
-            return result_dict
+            return {row['key']: self._decode_value(row) for row in results}
 
     def mset(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
         """Set multiple key-value pairs atomically.
@@ -782,6 +1224,7 @@ class KVManager(BaseManager):
 
         Raises:
             ValueError: If items is empty or contains invalid keys/values
+            WrongTypeError: If a key holds a hash, list, set or sorted set
         """
         if not items:
             return
@@ -798,62 +1241,20 @@ class KVManager(BaseManager):
             if not key or not isinstance(key, str):
                 raise ValueError(f"Invalid key: {key}")
 
-            value_type, value_dict = self._detect_type_and_value(value)
-            value_size = self._calculate_value_size(value)
-            prepared_items.append((key, value_type, value_dict, value_size, expires_at))
+            row = self._prepare_row(value)
+            prepared_items.append(self._row_params(key, row, expires_at))
 
-        # Ensure tenant is materialized for write operation
-        self._ensure_tenant_materialized()
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
 
-        # Use transaction for atomicity
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
+        def set_all(conn: DatabaseConnection) -> None:
+            # One transaction for atomicity; a failure discards every item
+            for key in items:
+                self._check_type(conn, key, "value")
+            conn.executemany(_UPSERT_SQL, prepared_items)
+            conn.commit()
 
-            conn.execute("BEGIN TRANSACTION")
-            try:
-                for key, value_type, value_dict, value_size, exp_at in prepared_items:
-                    # Build dynamic SQL for each item
-                    columns = ['key', 'value_type', 'value_size', 'expires_at', 'updated_at']
-                    values = [key, value_type, value_size, exp_at, 'unixepoch()']
-
-                    for col, val in value_dict.items():
-                        columns.insert(2, col)
-                        values.insert(2, val)
-
-                    clear_columns = []
-                    for col in ['value_text', 'value_number', 'value_bool', 'value_blob', 'value_json']:
-                        if col not in value_dict:
-                            clear_columns.append(f"{col} = NULL")
-
-                    placeholders = ['?' if v != 'unixepoch()' else v for v in values]
-
-                    # Build UPDATE clause parts
-                    update_parts = ['value_type = excluded.value_type']
-                    if value_dict:
-                        update_parts.extend([f"{col} = excluded.{col}" for col in value_dict.keys()])
-                    if clear_columns:
-                        update_parts.extend(clear_columns)
-                    update_parts.extend([
-                        'value_size = excluded.value_size',
-                        'expires_at = excluded.expires_at',
-                        'updated_at = unixepoch()'
-                    ])
-
-                    sql = f"""
-                        INSERT INTO __kv ({', '.join(columns)})
-                        VALUES ({', '.join(placeholders)})
-                        ON CONFLICT(key) DO UPDATE SET
-                            {', '.join(update_parts)}
-                    """
-
-                    actual_values = [v for v in values if v != 'unixepoch()']
-                    conn.execute(sql, actual_values)
-
-                conn.execute("COMMIT")
-            except Exception:
-                conn.execute("ROLLBACK")
-                raise
+        self._write(set_all)
 
     # Atomic operations
 
@@ -876,13 +1277,10 @@ class KVManager(BaseManager):
         if not isinstance(amount, (int, float)):
             raise ValueError("Amount must be numeric")
 
-        # Ensure tenant is materialized for write operation
-        self._ensure_tenant_materialized()
-
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
 
+        def increment_value(conn: DatabaseConnection) -> Union[int, float]:
             # Try atomic increment on existing numeric key
             result = conn.execute("""
                 UPDATE __kv
@@ -898,7 +1296,7 @@ class KVManager(BaseManager):
             if result:
                 conn.commit()
                 num = result[0]
-                return int(num) if num == int(num) else num
+                return _number(num)
 
             # Check why it failed
             existing = conn.execute("""
@@ -909,6 +1307,7 @@ class KVManager(BaseManager):
 
             if existing:
                 raise ValueError(f"Cannot increment non-numeric value")
+            self._check_type(conn, key, "value")
 
             # Key doesn't exist - create as number
             value_size = len(str(amount).encode('utf-8'))
@@ -920,52 +1319,854 @@ class KVManager(BaseManager):
 
             return amount
 
-    # Statistics and introspection
-
-    def key_count(self, pattern: str = '*') -> int:
-        """Count keys matching a pattern.
+        return self._write(increment_value)
+
+    def _incr_counter(
+        self, conn: sqlite3.Connection, key: str, amount: Union[int, float],
+        expires_at: float, now: float
+    ) -> sqlite3.Row:
+        """Run the single-statement counter upsert and return the new row."""
+        self._check_type(conn, key, "value")
+        row = conn.execute(_COUNTER_UPSERT_SQL, {
+            "key": key,
+            "amount": amount,
+            "expires_at": expires_at,
+            "now": now,
+        }).fetchone()
+        if row is None:
+            raise ValueError("Cannot increment non-numeric value")
+        return row
+
+    def incr_with_ttl(
+        self, key: str, amount: Union[int, float] = 1, ttl: float = 60
+    ) -> Union[int, float]:
+        """Atomically increment a counter that expires ttl seconds after creation.
+
+        The TTL is set when the counter is created (or re-created after it
+        expired) and is not extended by later increments. An existing
+        counter without a TTL gains one. This is a single upsert, so
+        concurrent callers never lose increments.
 
         Args:
-            pattern: Redis-style glob pattern (default: '*' for all keys)
+            key: Counter key
+            amount: Amount to increment by (default: 1)
+            ttl: Lifetime of the counter in seconds
 
         Returns:
-            Number of matching keys
+            New value after increment
+
+        Raises:
+            ValueError: If key, amount or ttl is invalid, or the current value
+                is not numeric
         """
-        # If tenant is not materialized, no keys exist
-        if not self._is_tenant_materialized():
-            return 0
+        self._validate_key(key)
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
-            # Ensure the __kv table exists
-            self._ensure_kv_table(conn)
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise ValueError("Amount must be numeric")
+        if ttl <= 0:
+            raise ValueError("TTL must be positive")
 
-            sql_pattern = self._glob_to_like(pattern)
-            result = conn.execute("""
-                SELECT COUNT(*) as count FROM __kv
-                WHERE key LIKE ? ESCAPE '\\'
-                AND (expires_at IS NULL OR expires_at > ((julianday('now') - 2440587.5) * 86400.0))
-            """, [sql_pattern]).fetchone()
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
 
-            return result['count'] if result else 0
+        now = time.time()
 
-    def storage_size(self, *keys) -> Dict[str, int]:
-        """Get storage size in bytes for keys.
+        def increment_counter(conn: DatabaseConnection) -> sqlite3.Row:
+            row = self._incr_counter(conn, key, amount, now + ttl, now)
+            conn.commit()
+            return row
+
+        num = self._write(increment_counter)[0]
+        return _number(num)
+
+    def rate_limit(
+        self, key: str, limit: int, window: float, sliding: bool = False
+    ) -> Dict[str, Any]:
+        """Record a hit against a rate limit and report whether it is allowed.
+
+        Fixed windows count hits in a single counter that expires ``window``
+        seconds after the first hit. Sliding windows keep one counter per
+        aligned window (stored as ``{key}:{window_index}``) and weight the
+        previous window's count by how much of it still overlaps the
+        sliding window. Every hit is counted, including rejected ones.
 
         Args:
-            *keys: Specific keys to check. If none, returns total for all keys.
+            key: Rate limit key (e.g. ``"rate:user:123"``)
+            limit: Maximum hits allowed per window
+            window: Window length in seconds
+            sliding: Use the sliding-window estimate instead of a fixed window
 
         Returns:
-            Dict mapping keys to their sizes in bytes.
-            For non-existent keys, size is 0.
-            If no keys specified, returns {'total': total_bytes}.
+            Dictionary with ``allowed``, ``count`` (hits counted in the
+            window), ``remaining`` and ``reset_in`` (seconds)
+
+        Raises:
+            ValueError: If key, limit or window is invalid
         """
-        # If tenant is not materialized, no storage
-        if not self._is_tenant_materialized():
+        self._validate_key(key)
+
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+            raise ValueError("Limit must be a non-negative integer")
+        if window <= 0:
+            raise ValueError("Window must be positive")
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        now = time.time()
+
+        def record_hit(conn: DatabaseConnection) -> Tuple[float, float]:
+            if not sliding:
+                row = self._incr_counter(conn, key, 1, now + window, now)
+                conn.commit()
+                return int(row[0]), max(0.0, row[1] - now)
+
+            index = int(now // window)
+            window_start = index * window
+            # Keep each bucket until the following window has ended
+            row = self._incr_counter(
+                conn, f"{key}:{index}", 1, window_start + 2 * window, now
+            )
+            conn.commit()
+
+            previous = conn.execute("""
+                SELECT value_number FROM __kv
+                WHERE key = ?
+                AND value_type = 'number'
+                AND (expires_at IS NULL OR expires_at > ?)
+            """, [f"{key}:{index - 1}", now]).fetchone()
+
+            overlap = 1.0 - (now - window_start) / window
+            count = row[0] + (previous[0] * overlap if previous else 0)
+            return count, window_start + window - now
+
+        count, reset_in = self._write(record_hit)
+
+        return {
+            "allowed": count <= limit,
+            "count": count,
+            "remaining": max(0, int(limit - count)),
+            "reset_in": reset_in,
+        }
+
+    # Hashes
+
+    def hset(
+        self,
+        key: str,
+        field: Optional[str] = None,
+        value: Any = None,
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Set one or more fields in a hash.
+
+        Args:
+            key: Hash key
+            field: Field to set (optional when mapping is given)
+            value: Value for field (any type)
+            mapping: Dictionary of field-value pairs to set
+
+        Returns:
+            Number of fields that were newly added
+
+        Raises:
+            ValueError: If key or fields are invalid, or nothing to set
+            WrongTypeError: If the key holds another type
+        """
+        self._validate_key(key)
+
+        items = dict(mapping) if mapping else {}
+        if field is not None:
+            items[field] = value
+        if not items:
+            raise ValueError("hset requires a field and value or a mapping")
+
+        rows = []
+        for item_field, item_value in items.items():
+            self._validate_member(item_field, "Field")
+            value_type, stored = self._encode_element(item_value)
+            rows.append((key, item_field, value_type, stored))
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        def set_fields(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "hash")
+            fields = list(items.keys())
+            placeholders = ','.join(['?'] * len(fields))
+            existing = conn.execute(f"""
+                SELECT COUNT(*) FROM __kv_hash
+                WHERE key = ? AND field IN ({placeholders})
+            """, [key, *fields]).fetchone()[0]
+
+            conn.executemany("""
+                INSERT INTO __kv_hash (key, field, value_type, value)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key, field) DO UPDATE SET
+                    value_type = excluded.value_type,
+                    value = excluded.value
+            """, rows)
+            conn.commit()
+            return len(rows) - existing
+
+        return self._write(set_fields, structures=True)
+
+    def hget(self, key: str, field: str) -> Optional[Any]:
+        """Get the value of a hash field.
+
+        Args:
+            key: Hash key
+            field: Field to retrieve
+
+        Returns:
+            Field value or None if the hash or field doesn't exist
+        """
+        if not key or not isinstance(key, str):
+            return None
+
+        if not self._kv_exists():
+            return None
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            result = conn.execute("""
+                SELECT value_type, value FROM __kv_hash
+                WHERE key = ? AND field = ?
+            """, [key, field]).fetchone()
+
+            if not result:
+                self._check_type(conn, key, "hash")
+                return None
+            return self._decode_element(result['value_type'], result['value'])
+
+    def hgetall(self, key: str) -> Dict[str, Any]:
+        """Get all fields and values of a hash.
+
+        Args:
+            key: Hash key
+
+        Returns:
+            Dictionary of field-value pairs (empty if hash doesn't exist)
+        """
+        if not key or not isinstance(key, str):
+            return {}
+
+        if not self._kv_exists():
+            return {}
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            results = conn.execute("""
+                SELECT field, value_type, value FROM __kv_hash
+                WHERE key = ?
+                ORDER BY field
+            """, [key]).fetchall()
+
+            if not results:
+                self._check_type(conn, key, "hash")
+            return {
+                row['field']: self._decode_element(row['value_type'], row['value'])
+                for row in results
+            }
+
+    def hdel(self, key: str, *fields: str) -> int:
+        """Delete one or more fields from a hash.
+
+        Args:
+            key: Hash key
+            *fields: Fields to delete
+
+        Returns:
+            Number of fields that were removed
+        """
+        self._validate_key(key)
+        if not fields:
+            return 0
+
+        if not self._kv_exists():
+            return 0
+
+        def delete_fields(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "hash")
+            result = conn.executemany(
+                "DELETE FROM __kv_hash WHERE key = ? AND field = ?",
+                [(key, field) for field in fields],
+            )
+            conn.commit()
+            return result.rowcount
+
+        return self._write(delete_fields, structures=True)
+
+    def hincrby(self, key: str, field: str, amount: Union[int, float] = 1) -> Union[int, float]:
+        """Atomically increment a numeric hash field.
+
+        Missing fields are created with the increment amount.
+
+        Args:
+            key: Hash key
+            field: Field to increment
+            amount: Amount to increment by (default: 1)
+
+        Returns:
+            New value of the field
+
+        Raises:
+            ValueError: If key/field is invalid or the field is not numeric
+            WrongTypeError: If the key holds another type
+        """
+        self._validate_key(key)
+        self._validate_member(field, "Field")
+
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise ValueError("Amount must be numeric")
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        def increment_field(conn: DatabaseConnection) -> sqlite3.Row:
+            self._check_type(conn, key, "hash")
+            # Single upsert: the WHERE guard skips non-numeric fields, returning no row
+            result = conn.execute("""
+                INSERT INTO __kv_hash (key, field, value_type, value)
+                VALUES (?, ?, 'number', ?)
+                ON CONFLICT(key, field) DO UPDATE SET
+                    value = value + excluded.value
+                WHERE value_type = 'number'
+                RETURNING value
+            """, [key, field, float(amount)]).fetchone()
+            conn.commit()
+            return result
+
+        result = self._write(increment_field, structures=True)
+        if not result:
+            raise ValueError("Cannot increment non-numeric hash field")
+
+        num = result[0]
+        return _number(num)
+
+    # Lists
+
+    def _list_bounds(self, conn: DatabaseConnection, key: str) -> Optional[tuple[int, int]]:
+        """Get the (head, tail) positions of a list, or None if it is empty."""
+        # Separate MIN/MAX lookups so each is a single primary key seek
+        head = conn.execute(
+            "SELECT pos FROM __kv_list WHERE key = ? ORDER BY pos ASC LIMIT 1", [key]
+        ).fetchone()
+        if not head:
+            return None
+        tail = conn.execute(
+            "SELECT pos FROM __kv_list WHERE key = ? ORDER BY pos DESC LIMIT 1", [key]
+        ).fetchone()
+        return head[0], tail[0]
+
+    def _push(self, key: str, values: tuple, left: bool) -> int:
+        """Push values onto the head or tail of a list."""
+        self._validate_key(key)
+        if not values:
+            raise ValueError("At least one value must be provided")
+
+        encoded = [self._encode_element(value) for value in values]
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        def push(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "list")
+            head, tail = self._list_bounds(conn, key) or (0, -1)
+
+            if left:
+                rows = [
+                    (key, head - i - 1, value_type, stored)
+                    for i, (value_type, stored) in enumerate(encoded)
+                ]
+                head -= len(rows)
+            else:
+                rows = [
+                    (key, tail + i + 1, value_type, stored)
+                    for i, (value_type, stored) in enumerate(encoded)
+                ]
+                tail += len(rows)
+
+            conn.executemany("""
+                INSERT INTO __kv_list (key, pos, value_type, value)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+            return tail - head + 1
+
+        return self._write(push, structures=True)
+
+    def _pop(self, key: str, left: bool) -> Optional[Any]:
+        """Remove and return the head or tail element of a list."""
+        if not key or not isinstance(key, str):
+            return None
+
+        if not self._kv_exists():
+            return None
+
+        order = "ASC" if left else "DESC"
+
+        def pop(conn: DatabaseConnection) -> Optional[sqlite3.Row]:
+            self._check_type(conn, key, "list")
+            result = conn.execute(f"""
+                DELETE FROM __kv_list
+                WHERE key = ? AND pos = (
+                    SELECT pos FROM __kv_list WHERE key = ? ORDER BY pos {order} LIMIT 1
+                )
+                RETURNING value_type, value
+            """, [key, key]).fetchone()
+            conn.commit()
+            return result
+
+        result = self._write(pop, structures=True)
+        if not result:
+            return None
+        return self._decode_element(result['value_type'], result['value'])
+
+    def lpush(self, key: str, *values: Any) -> int:
+        """Prepend one or more values to a list.
+
+        Values are pushed one after another, so the last value ends up first.
+
+        Args:
+            key: List key
+            *values: Values to prepend (any type)
+
+        Returns:
+            Length of the list after the push
+        """
+        return self._push(key, values, left=True)
+
+    def rpush(self, key: str, *values: Any) -> int:
+        """Append one or more values to a list.
+
+        Args:
+            key: List key
+            *values: Values to append (any type)
+
+        Returns:
+            Length of the list after the push
+        """
+        return self._push(key, values, left=False)
+
+    def lpop(self, key: str) -> Optional[Any]:
+        """Remove and return the first element of a list.
+
+        Args:
+            key: List key
+
+        Returns:
+            The element, or None if the list is empty
+        """
+        return self._pop(key, left=True)
+
+    def rpop(self, key: str) -> Optional[Any]:
+        """Remove and return the last element of a list.
+
+        Args:
+            key: List key
+
+        Returns:
+            The element, or None if the list is empty
+        """
+        return self._pop(key, left=False)
+
+    def lrange(self, key: str, start: int = 0, stop: int = -1) -> List[Any]:
+        """Get a range of elements from a list.
+
+        Args:
+            key: List key
+            start: Start index (inclusive, negative counts from the end)
+            stop: Stop index (inclusive, negative counts from the end)
+
+        Returns:
+            List of elements in the range
+        """
+        if not key or not isinstance(key, str):
+            return []
+
+        if not self._kv_exists():
+            return []
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            bounds = self._list_bounds(conn, key)
+            if bounds is None:
+                self._check_type(conn, key, "list")
+                return []
+
+            head, tail = bounds
+            length = tail - head + 1
+
+            if start < 0:
+                start = max(length + start, 0)
+            if stop < 0:
+                stop = length + stop
+            stop = min(stop, length - 1)
+            if start > stop:
+                return []
+
+            results = conn.execute("""
+                SELECT value_type, value FROM __kv_list
+                WHERE key = ? AND pos BETWEEN ? AND ?
+                ORDER BY pos
+            """, [key, head + start, head + stop]).fetchall()
+
+            return [self._decode_element(row['value_type'], row['value']) for row in results]
+
+    def llen(self, key: str) -> int:
+        """Get the length of a list.
+
+        Args:
+            key: List key
+
+        Returns:
+            Number of elements (0 if the list doesn't exist)
+        """
+        if not key or not isinstance(key, str):
+            return 0
+
+        if not self._kv_exists():
+            return 0
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            bounds = self._list_bounds(conn, key)
+            if bounds is None:
+                self._check_type(conn, key, "list")
+                return 0
+            return bounds[1] - bounds[0] + 1
+
+    # Sets
+
+    def sadd(self, key: str, *members: str) -> int:
+        """Add one or more members to a set.
+
+        Args:
+            key: Set key
+            *members: String members to add
+
+        Returns:
+            Number of members that were newly added
+        """
+        self._validate_key(key)
+        if not members:
+            raise ValueError("At least one member must be provided")
+        for member in members:
+            self._validate_member(member)
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        def add_members(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "set")
+            result = conn.executemany(
+                "INSERT OR IGNORE INTO __kv_set (key, member) VALUES (?, ?)",
+                [(key, member) for member in members],
+            )
+            conn.commit()
+            return result.rowcount
+
+        return self._write(add_members, structures=True)
+
+    def srem(self, key: str, *members: str) -> int:
+        """Remove one or more members from a set.
+
+        Args:
+            key: Set key
+            *members: Members to remove
+
+        Returns:
+            Number of members that were removed
+        """
+        self._validate_key(key)
+        if not members:
+            return 0
+
+        if not self._kv_exists():
+            return 0
+
+        def remove_members(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "set")
+            result = conn.executemany(
+                "DELETE FROM __kv_set WHERE key = ? AND member = ?",
+                [(key, member) for member in members],
+            )
+            conn.commit()
+            return result.rowcount
+
+        return self._write(remove_members, structures=True)
+
+    def smembers(self, key: str) -> set:
+        """Get all members of a set.
+
+        Args:
+            key: Set key
+
+        Returns:
+            Set of members (empty if the set doesn't exist)
+        """
+        if not key or not isinstance(key, str):
+            return set()
+
+        if not self._kv_exists():
+            return set()
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            results = conn.execute(
+                "SELECT member FROM __kv_set WHERE key = ?", [key]
+            ).fetchall()
+
+            if not results:
+                self._check_type(conn, key, "set")
+            return {row['member'] for row in results}
+
+    def sismember(self, key: str, member: str) -> bool:
+        """Check if a member belongs to a set.
+
+        Args:
+            key: Set key
+            member: Member to check
+
+        Returns:
+            True if the member is in the set
+        """
+        if not key or not isinstance(key, str):
+            return False
+
+        if not self._kv_exists():
+            return False
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            result = conn.execute(
+                "SELECT 1 FROM __kv_set WHERE key = ? AND member = ?", [key, member]
+            ).fetchone()
+
+            if not result:
+                self._check_type(conn, key, "set")
+            return result is not None
+
+    # Sorted sets
+
+    def zadd(self, key: str, mapping: Dict[str, Union[int, float]]) -> int:
+        """Add members with scores to a sorted set, updating existing scores.
+
+        Args:
+            key: Sorted set key
+            mapping: Dictionary of member -> score
+
+        Returns:
+            Number of members that were newly added
+        """
+        self._validate_key(key)
+        if not mapping:
+            raise ValueError("At least one member must be provided")
+
+        rows = []
+        for member, score in mapping.items():
+            self._validate_member(member)
+            if isinstance(score, bool) or not isinstance(score, (int, float)):
+                raise ValueError("Score must be numeric")
+            rows.append((key, member, float(score)))
+
+        # Ensure KV storage exists for write operation
+        self._ensure_kv_storage()
+
+        def add_members(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "zset")
+            members = list(mapping.keys())
+            placeholders = ','.join(['?'] * len(members))
+            existing = conn.execute(f"""
+                SELECT COUNT(*) FROM __kv_zset
+                WHERE key = ? AND member IN ({placeholders})
+            """, [key, *members]).fetchone()[0]
+
+            conn.executemany("""
+                INSERT INTO __kv_zset (key, member, score)
+                VALUES (?, ?, ?)
+                ON CONFLICT(key, member) DO UPDATE SET score = excluded.score
+            """, rows)
+            conn.commit()
+            return len(rows) - existing
+
+        return self._write(add_members, structures=True)
+
+    def zrem(self, key: str, *members: str) -> int:
+        """Remove one or more members from a sorted set.
+
+        Args:
+            key: Sorted set key
+            *members: Members to remove
+
+        Returns:
+            Number of members that were removed
+        """
+        self._validate_key(key)
+        if not members:
+            return 0
+
+        if not self._kv_exists():
+            return 0
+
+        def remove_members(conn: DatabaseConnection) -> int:
+            self._check_type(conn, key, "zset")
+            result = conn.executemany(
+                "DELETE FROM __kv_zset WHERE key = ? AND member = ?",
+                [(key, member) for member in members],
+            )
+            conn.commit()
+            return result.rowcount
+
+        return self._write(remove_members, structures=True)
+
+    def zscore(self, key: str, member: str) -> Optional[float]:
+        """Get the score of a sorted set member.
+
+        Args:
+            key: Sorted set key
+            member: Member to look up
+
+        Returns:
+            Score, or None if the member doesn't exist
+        """
+        if not key or not isinstance(key, str):
+            return None
+
+        if not self._kv_exists():
+            return None
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            result = conn.execute(
+                "SELECT score FROM __kv_zset WHERE key = ? AND member = ?", [key, member]
+            ).fetchone()
+
+            if not result:
+                self._check_type(conn, key, "zset")
+                return None
+            return result['score']
+
+    def zrangebyscore(
+        self,
+        key: str,
+        min_score: float = float('-inf'),
+        max_score: float = float('inf'),
+        withscores: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Any]:
+        """Get sorted set members with scores in a range, ordered by score.
+
+        Args:
+            key: Sorted set key
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+            withscores: If True, return (member, score) tuples
+            limit: Maximum number of members to return
+            offset: Number of matching members to skip
+
+        Returns:
+            List of members, or (member, score) tuples if withscores=True
+        """
+        if not key or not isinstance(key, str):
+            return []
+
+        if not self._kv_exists():
+            return []
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            results = conn.execute("""
+                SELECT member, score FROM __kv_zset
+                WHERE key = ? AND score BETWEEN ? AND ?
+                ORDER BY score, member
+                LIMIT ? OFFSET ?
+            """, [key, min_score, max_score, -1 if limit is None else limit, offset]).fetchall()
+
+            if not results:
+                self._check_type(conn, key, "zset")
+            if withscores:
+                return [(row['member'], row['score']) for row in results]
+            return [row['member'] for row in results]
+
+    def zcard(self, key: str) -> int:
+        """Get the number of members in a sorted set.
+
+        Args:
+            key: Sorted set key
+
+        Returns:
+            Number of members (0 if the sorted set doesn't exist)
+        """
+        if not key or not isinstance(key, str):
+            return 0
+
+        if not self._kv_exists():
+            return 0
+
+        with self._connect() as conn:
+            self._ensure_structure_tables(conn)
+
+            result = conn.execute(
+                "SELECT COUNT(*) AS count FROM __kv_zset WHERE key = ?", [key]
+            ).fetchone()
+
+            if not result['count']:
+                self._check_type(conn, key, "zset")
+            return result['count']
+
+    # Statistics and introspection
+
+    def key_count(self, pattern: str = '*') -> int:
+        """Count keys of every type matching a pattern.
+
+        Args:
+            pattern: Redis-style glob pattern (default: '*' for all keys)
+
+        Returns:
+            Number of matching keys
+        """
+        # If tenant is not materialized, no keys exist
+        if not self._kv_exists():
+            return 0
+
+        with self._connect() as conn:
+            # Ensure the __kv table exists
+            self._ensure_kv_table(conn)
+
+            sql = f"SELECT COUNT(*) as count FROM ({self._matching_keys_sql(conn)})"
+            result = conn.execute(sql, {"pattern": self._glob_to_like(pattern)}).fetchone()
+
+            return result['count'] if result else 0
+
+    def storage_size(self, *keys) -> Dict[str, int]:
+        """Get storage size in bytes for keys.
+
+        Args:
+            *keys: Specific keys to check. If none, returns total for all keys.
+
+        Returns:
+            Dict mapping keys to their sizes in bytes.
+            For non-existent keys, size is 0.
+            If no keys specified, returns {'total': total_bytes}.
+        """
+        # If tenant is not materialized, no storage
+        if not self._kv_exists():
             if not keys:
                 return {'total': 0}
             return {key: 0 for key in keys}
 
-        with DatabaseConnection(self.db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with self._connect() as conn:
             # Ensure the __kv table exists
             self._ensure_kv_table(conn)
 
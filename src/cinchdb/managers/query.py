@@ -5,8 +5,9 @@ from typing import List, Optional, Type, TypeVar, Union
 from pydantic import BaseModel, ValidationError
 
 from cinchdb.managers.base import BaseManager, ConnectionContext
-from cinchdb.core.connection import DatabaseConnection
+from cinchdb.core.connection import get_reader_pool
 from cinchdb.utils import validate_query_safe
+from cinchdb.utils.row_decoder import compile_row_decoder, bool_fields_of
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -48,6 +49,7 @@ class QueryManager(BaseManager):
         model: Type[T],
         params: Optional[Union[tuple, dict]] = None,
         strict: bool = True,
+        validate: bool = True,
     ) -> List[T]:
         """Execute a SELECT query and return results as typed model instances.
 
@@ -56,6 +58,9 @@ class QueryManager(BaseManager):
             model: Pydantic model class to validate results against
             params: Optional query parameters
             strict: If True, raise on validation errors; if False, skip invalid rows
+            validate: If False, build instances with model_construct through a
+                compiled row decoder instead of validating every row. Only bool
+                fields are converted; use for trusted data on hot paths.
 
         Returns:
             List of model instances
@@ -82,8 +87,13 @@ class QueryManager(BaseManager):
             self.tenant, is_write=False
         )
 
-        with DatabaseConnection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
+        with get_reader_pool().connection(db_path, tenant_id=self.tenant, encryption_manager=self.encryption_manager) as conn:
             cursor = conn.execute(sql, params)
+            if not validate:
+                columns = tuple(desc[0] for desc in cursor.description)
+                decode = compile_row_decoder(columns, bool_fields_of(model), "model", model)
+                cursor.row_factory = None
+                return list(map(decode, cursor.fetchall()))
             raw_rows = cursor.fetchall()
             rows = [dict(row) for row in raw_rows]
 
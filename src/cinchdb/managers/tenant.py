@@ -7,7 +7,7 @@ import shutil
 import sqlite3
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 from cinchdb.models import Tenant
@@ -22,10 +22,12 @@ from cinchdb.core.path_utils import (
     ensure_context_directory,
     ensure_tenant_db_path,
     calculate_shard,
+    get_tenant_kv_db_path,
     invalidate_cache,
 )
 from cinchdb.core.connection import DatabaseConnection
 from cinchdb.core.maintenance_utils import check_maintenance_mode
+from cinchdb.managers.kv import discard_memory_store, snapshot_memory_store
 from cinchdb.utils.name_validator import validate_name
 from cinchdb.infrastructure.metadata_db import MetadataDB
 from cinchdb.infrastructure.metadata_connection_pool import get_metadata_db
@@ -374,6 +376,16 @@ class TenantManager(BaseManager):
                     wal_path.unlink()
                 if shm_path.exists():
                     shm_path.unlink()
+
+        # A dedicated KV file can exist whether or not the tenant is materialized
+        kv_path = get_tenant_kv_db_path(
+            get_tenant_db_path(self.project_root, self.database, self.branch, tenant_name)
+        )
+        discard_memory_store(kv_path)
+        for suffix in ("", "-wal", "-shm"):
+            kv_file = Path(f"{kv_path}{suffix}")
+            if kv_file.exists():
+                kv_file.unlink()
         
         # Invalidate cache for this tenant
         invalidate_cache(tenant=tenant_name)
@@ -485,6 +497,16 @@ class TenantManager(BaseManager):
 
         # Copy database file
         shutil.copy2(source_path, target_path)
+
+        # Copy the dedicated KV file (and any uncheckpointed WAL) if present
+        source_kv = get_tenant_kv_db_path(source_path)
+        snapshot_memory_store(source_kv)
+        if source_kv.exists():
+            target_kv = get_tenant_kv_db_path(target_path)
+            shutil.copy2(source_kv, target_kv)
+            source_kv_wal = Path(f"{source_kv}-wal")
+            if source_kv_wal.exists():
+                shutil.copy2(source_kv_wal, Path(f"{target_kv}-wal"))
         
         # Mark as materialized since we copied a physical file
         self.metadata_db.mark_tenant_materialized(tenant_id)
@@ -550,6 +572,17 @@ class TenantManager(BaseManager):
                 self.project_root, self.database, self.branch, new_name
             )
 
+        # KV files are moved regardless of materialization
+        context_root = get_context_root(self.project_root, self.database, self.branch)
+        old_kv = get_tenant_kv_db_path(context_root / tenant_info['shard'] / f"{old_name}.db")
+        snapshot_memory_store(old_kv)
+        discard_memory_store(old_kv)
+        new_kv = None
+        if old_kv.exists():
+            new_kv = get_tenant_kv_db_path(
+                ensure_tenant_db_path(self.project_root, self.database, self.branch, new_name)
+            )
+
         # Update metadata database
         new_shard = calculate_shard(new_name)
         with self.metadata_db.conn:
@@ -577,6 +610,12 @@ class TenantManager(BaseManager):
                 if old_shm.exists():
                     old_shm.rename(new_shm)
 
+        if new_kv:
+            for suffix in ("", "-wal", "-shm"):
+                old_file = Path(f"{old_kv}{suffix}")
+                if old_file.exists():
+                    old_file.rename(Path(f"{new_kv}{suffix}"))
+
     def get_tenant_size(self, tenant_name: str) -> dict:
         """Get storage size information for a tenant.
         
@@ -737,13 +776,15 @@ class TenantManager(BaseManager):
         if not self.branch_id:
             raise ValueError(f"Branch '{self.branch}' not found in metadata database")
             
+        lazy = False
         if tenant_name != self._empty_tenant_name:
             tenant_info = self.metadata_db.get_tenant(self.branch_id, tenant_name)
             if not tenant_info:
                 raise ValueError(f"Tenant '{tenant_name}' does not exist")
+            lazy = not tenant_info['materialized']
         
         # For lazy tenants
-        if self.is_tenant_lazy(tenant_name):
+        if lazy:
             if is_write:
                 # Materialize the tenant for writes
                 self.materialize_tenant(tenant_name)
@@ -756,6 +797,78 @@ class TenantManager(BaseManager):
             # For materialized tenants, use their actual database
             return self._get_sharded_tenant_db_path(tenant_name)
 
+    def empty_read_result(self, tenant_name: str, sql: str) -> Optional[List[Dict[str, Any]]]:
+        """Answer a simple SELECT on a lazy tenant without opening a database.
+
+        A lazy tenant has no rows, so single-table SELECTs (column lists,
+        COUNT and other aggregates) are answered from the branch schema
+        snapshot. See cinchdb.core.lazy_reads for what qualifies. If the
+        snapshot may be stale the query falls back to __empty__.
+
+        Args:
+            tenant_name: Name of the tenant
+            sql: SELECT query
+
+        Returns:
+            Result rows as dictionaries, or None if the tenant is materialized
+            or the query has to run against the __empty__ database
+        """
+        from cinchdb.core.lazy_reads import empty_result, plan_empty_result
+
+        # Check the (cached) plan first so other queries skip the metadata lookups
+        if plan_empty_result(sql) is None or not self.is_tenant_lazy(tenant_name):
+            return None
+        return empty_result(sql, self.metadata_db.get_current_table_schema(self.branch_id))
+
+    def get_materialized_tenant_paths(self, tenant_names: Optional[List[str]] = None) -> Dict[str, Path]:
+        """Map materialized tenants to their database files with one metadata query.
+
+        Lazy tenants are left out: until they are written to, reads only ever
+        see the empty template database.
+
+        Args:
+            tenant_names: Tenants to include (default: all user tenants)
+
+        Returns:
+            Dictionary of tenant name to database path, in tenant_names order
+            when given
+
+        Raises:
+            ValueError: If a requested tenant doesn't exist
+        """
+        # Ensure initialization
+        self._ensure_initialized()
+
+        if not self.branch_id:
+            raise ValueError(f"Branch '{self.branch}' not found in metadata database")
+
+        records = {
+            record["name"]: record
+            for record in self.metadata_db.list_tenants(self.branch_id)
+            if record["name"] != self._empty_tenant_name
+        }
+        if tenant_names is None:
+            tenant_names = list(records)
+        else:
+            missing = [name for name in tenant_names if name not in records]
+            if missing:
+                raise ValueError(f"Tenant '{missing[0]}' does not exist")
+
+        return {
+            name: self._get_sharded_tenant_db_path(name)
+            for name in tenant_names
+            if records[name]["materialized"]
+        }
+
+    def get_empty_tenant_path(self) -> Path:
+        """Get the __empty__ template database, creating it if needed.
+
+        Returns:
+            Path to a database with the branch schema and no rows
+        """
+        self._ensure_empty_tenant()
+        return self._get_sharded_tenant_db_path(self._empty_tenant_name)
+
     def get_tenant_connection(self, tenant_name: str, is_write: bool = False) -> DatabaseConnection:
         """Get a database connection for a tenant.
 
@@ -0,0 +1,613 @@
+"""HTTP API server for remote CinchDB connections (``cinch serve``).
+
+Implements the endpoints used by ``CinchDB(api_url=...)`` and the
+TypeScript SDK on top of a local project, using only the standard library.
+Requests are handled by a fixed pool of worker threads, and connections
+are cached per database/branch/tenant so reads go through the shared
+reader pool and writes can be group-committed by the tenant's writer.
+"""
+
+import gzip
+import hmac
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from pydantic import ValidationError
+
+from cinchdb.core.database import CinchDB
+from cinchdb.core.writer import WriterOptions
+from cinchdb.infrastructure.metadata_connection_pool import get_metadata_db
+from cinchdb.models import Column, Index
+from cinchdb.utils.name_validator import validate_name
+from cinchdb.utils.sql_validator import SQLValidationError
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that select the connection rather than filter rows
+CONTEXT_PARAMS = ("database", "branch", "tenant")
+PAGE_PARAMS = ("limit", "order_by", "cursor", "columns", "offset")
+AGGREGATE_PARAMS = ("group_by", "sum", "avg", "min", "max")
+
+# The TypeScript SDK prefixes every endpoint with this
+API_PREFIX = "/api/v1"
+
+# Responses at least this large are gzipped for clients that accept it
+COMPRESS_MIN_BYTES = 16384
+
+
+class APIError(Exception):
+    """Error returned to the client with an HTTP status code."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class ConnectionCache:
+    """Least recently used CinchDB connections keyed by database/branch/tenant."""
+
+    def __init__(self, project_dir: Path, writer_options: Optional[WriterOptions], max_size: int = 256):
+        self.project_dir = project_dir
+        self.writer_options = writer_options
+        self.max_size = max_size
+        self._connections: "OrderedDict[Tuple[str, str, str], CinchDB]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, database: str, branch: str, tenant: str) -> CinchDB:
+        key = (database, branch, tenant)
+        with self._lock:
+            db = self._connections.get(key)
+            if db is not None:
+                self._connections.move_to_end(key)
+                return db
+
+        self._check_exists(database, branch, tenant)
+        db = CinchDB(
+            database=database, branch=branch, tenant=tenant,
+            project_dir=self.project_dir, writer_options=self.writer_options,
+        )
+        with self._lock:
+            db = self._connections.setdefault(key, db)
+            self._connections.move_to_end(key)
+            while len(self._connections) > self.max_size:
+                self._connections.popitem(last=False)
+        return db
+
+    def _check_exists(self, database: str, branch: str, tenant: str) -> None:
+        """Raise a 404 unless the tenant is registered in the project metadata.
+
+        Connecting to unknown names would otherwise create their files.
+        """
+        metadata = get_metadata_db(self.project_dir)
+        if metadata.tenant_exists(database, branch, tenant):
+            return
+        database_info = metadata.get_database(database)
+        if database_info is None:
+            raise APIError(404, f"Database '{database}' not found")
+        if metadata.get_branch(database_info["id"], branch) is None:
+            raise APIError(404, f"Branch '{branch}' not found")
+        raise APIError(404, f"Tenant '{tenant}' not found")
+
+    def clear(self) -> None:
+        """Forget cached connections, e.g. after tenants were renamed or deleted."""
+        with self._lock:
+            self._connections.clear()
+
+
+Handler = Callable[["Request"], Any]
+
+
+class Request:
+    """A parsed API request."""
+
+    __slots__ = ("method", "path", "params", "body", "match", "api_v1", "columns", "_server")
+
+    def __init__(self, server: "CinchServer", method: str, path: str, params: Dict[str, str], body: Any, api_v1: bool = False):
+        self._server = server
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body if body is not None else {}
+        self.match: Optional[re.Match] = None
+        self.api_v1 = api_v1
+        self.columns: Optional[set] = None
+
+    def arg(self, name: str) -> str:
+        """Path segment captured by the route."""
+        return unquote(self.match.group(name))
+
+    def field(self, name: str, default: Any = ...) -> Any:
+        """Field of the JSON body."""
+        if not isinstance(self.body, dict):
+            raise APIError(400, "Request body must be a JSON object")
+        if name not in self.body:
+            if default is ...:
+                raise APIError(400, f"Missing required field '{name}'")
+            return default
+        return self.body[name]
+
+    def column_field(self, name: str, default: Any = ...) -> Any:
+        """Body field whose keys are column names of the requested table.
+
+        Accepts a record, a list of records or a list of column names.
+        Keys are used as SQL column names, so each must be a column of
+        the table.
+        """
+        value = self.field(name, default)
+        if value is None or value is default:
+            return value
+        for item in value if isinstance(value, list) else [value]:
+            for key in item if isinstance(item, dict) else [item]:
+                if key not in self.columns:
+                    raise APIError(400, f"Invalid column '{key}' in '{name}': no such column")
+        return value
+
+    def check_table(self) -> None:
+        """Check the {table} path segment and load the table's columns.
+
+        Table names are interpolated into SQL, so the name must be valid
+        and name an existing table.
+        """
+        table = self.arg("table")
+        validate_name(table, "table")
+        for existing in self.db().list_tables():
+            if existing.name == table:
+                self.columns = {column.name for column in existing.columns}
+                return
+        raise APIError(404, f"Table '{table}' not found")
+
+    def db(self, branch: Optional[str] = None) -> CinchDB:
+        """Connection for the requested database, branch and tenant."""
+        database = self.params.get("database")
+        if not database:
+            raise APIError(400, "Missing required query parameter 'database'")
+        return self._server.connections.get(
+            database, branch or self.params.get("branch", "main"), self.params.get("tenant", "main")
+        )
+
+    def filters(self, exclude: Tuple[str, ...]) -> Dict[str, str]:
+        """Query parameters that aren't connection or paging options.
+
+        Filter keys become SQL column names, so each one (without its
+        "__operator" suffix) must be a column of the requested table.
+        """
+        filters = {k: v for k, v in self.params.items() if k not in CONTEXT_PARAMS and k not in exclude}
+        for key in filters:
+            if key.split("__", 1)[0] not in self.columns:
+                raise APIError(400, f"Invalid filter '{key}': no such column")
+        return filters
+
+
+def _dump(model: Any) -> Any:
+    return model.model_dump(mode="json")
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    return value.split(",") if value else None
+
+
+def _int_param(request: Request, name: str, default: Optional[int]) -> Optional[int]:
+    value = request.params.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise APIError(400, f"Query parameter '{name}' must be an integer")
+
+
+class CinchServer:
+    """Serve a CinchDB project over HTTP.
+
+    Examples:
+        server = CinchServer("/path/to/project", port=8000, api_key="secret")
+        server.serve_forever()
+
+        # In another process
+        db = cinchdb.connect_api("http://127.0.0.1:8000", "secret", "main")
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        api_key: Optional[str] = None,
+        workers: int = 16,
+        writer_options: Optional[WriterOptions] = None,
+        max_connections: int = 256,
+        keepalive_timeout: float = 5.0,
+    ):
+        """Create the server and bind its socket.
+
+        Args:
+            project_dir: Project directory containing .cinchdb
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            api_key: Key clients must send in X-API-Key (None disables auth)
+            workers: Worker threads handling client connections
+            writer_options: Group-commit settings for writes (None writes directly)
+            max_connections: Tenant connections kept cached
+            keepalive_timeout: Seconds an idle keep-alive connection holds a worker
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.project_dir = Path(project_dir)
+        self.api_key = api_key
+        self.connections = ConnectionCache(self.project_dir, writer_options, max_connections)
+        self._routes = self._build_routes()
+
+        handler = type("CinchRequestHandler", (_RequestHandler,), {"timeout": keepalive_timeout})
+        self.httpd = _PooledHTTPServer((host, port), handler, self, workers)
+
+    @property
+    def url(self) -> str:
+        """Base URL clients connect to."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Handle requests until shutdown() is called."""
+        self.httpd.serve_forever(poll_interval)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() and close the listening socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "CinchServer":
+        threading.Thread(target=self.serve_forever, args=(0.05,), name="cinch-serve", daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    # Dispatch
+
+    def authorized(self, api_key: Optional[str]) -> bool:
+        """Whether a request with this X-API-Key may be served."""
+        if self.api_key is None:
+            return True
+        return api_key is not None and hmac.compare_digest(api_key.encode(), self.api_key.encode())
+
+    def handle(self, method: str, path: str, params: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        """Route a request and return its status code and JSON payload."""
+        api_v1 = path.startswith(API_PREFIX + "/")
+        if api_v1:
+            path = path[len(API_PREFIX):]
+        request = Request(self, method, path.rstrip("/") or "/", params, body, api_v1)
+
+        try:
+            handler = self._route(request)
+            if "table" in request.match.groupdict():
+                request.check_table()
+            return 200, handler(request)
+        except APIError as e:
+            return e.status, {"detail": e.detail}
+        except Exception as e:
+            status = _status_for(e)
+            if status >= 500:
+                logger.exception("Error handling %s %s", method, path)
+            return status, {"detail": str(e)}
+
+    def _route(self, request: Request) -> Handler:
+        allowed = False
+        for method, pattern, handler in self._routes:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if method == request.method:
+                request.match = match
+                return handler
+            allowed = True
+        if allowed:
+            raise APIError(405, f"Method {request.method} not allowed for {request.path}")
+        raise APIError(404, f"Endpoint {request.path} not found")
+
+    def _build_routes(self) -> List[Tuple[str, "re.Pattern", Handler]]:
+        seg = r"[^/]+"
+        routes = [
+            ("GET", "/health", lambda r: {"status": "ok"}),
+            ("POST", "/query", self._query),
+            ("POST", "/query/execute", self._query_execute),
+            ("POST", "/batch", self._batch),
+            # Tables and indexes
+            ("GET", "/tables", lambda r: [_dump(t) for t in r.db().list_tables()]),
+            ("POST", "/tables", self._create_table),
+            ("GET", f"/tables/(?P<table>{seg})", lambda r: _dump(r.db().get_table(r.arg("table")))),
+            ("DELETE", f"/tables/(?P<table>{seg})", self._drop_table),
+            ("POST", "/indexes", self._create_index),
+            # Data
+            ("GET", f"/tables/(?P<table>{seg})/data", self._select),
+            ("POST", f"/tables/(?P<table>{seg})/data", lambda r: r.db().insert(r.arg("table"), r.column_field("data"))),
+            ("POST", f"/tables/(?P<table>{seg})/data/bulk", self._bulk_insert),
+            ("PUT", f"/tables/(?P<table>{seg})/data/bulk", self._bulk_update),
+            ("DELETE", f"/tables/(?P<table>{seg})/data/bulk", self._bulk_delete),
+            ("POST", f"/tables/(?P<table>{seg})/data/upsert", self._upsert),
+            ("GET", f"/tables/(?P<table>{seg})/data/count", self._count),
+            ("GET", f"/tables/(?P<table>{seg})/data/(?P<id>{seg})", self._get_record),
+            ("PUT", f"/tables/(?P<table>{seg})/data/(?P<id>{seg})", self._update_record),
+            ("DELETE", f"/tables/(?P<table>{seg})/data/(?P<id>{seg})", self._delete_record),
+            ("GET", f"/tables/(?P<table>{seg})/aggregate", self._aggregate),
+            # Tenants
+            ("GET", "/tenants", lambda r: [_dump(t) for t in r.db().list_tenants()]),
+            ("POST", "/tenants", self._create_tenant),
+            ("POST", "/tenants/copy", self._copy_tenant),
+            ("DELETE", f"/tenants/(?P<name>{seg})", self._delete_tenant),
+            ("PUT", f"/tenants/(?P<name>{seg})/rename", self._rename_tenant),
+            # Branches
+            ("GET", "/branches", lambda r: [_dump(b) for b in r.db().list_branches()]),
+            ("POST", "/branches", self._create_branch),
+            ("DELETE", f"/branches/(?P<name>{seg})", self._delete_branch),
+            ("GET", f"/branches/(?P<name>{seg})/changes", self._list_changes),
+        ]
+        return [(method, re.compile(path), handler) for method, path, handler in routes]
+
+    # Queries
+
+    def _query(self, request: Request) -> Dict[str, Any]:
+        return {"data": request.db().query(request.field("sql"), request.field("params", None))}
+
+    def _query_execute(self, request: Request) -> Dict[str, Any]:
+        rows = request.db().query(request.field("sql"), request.field("params", None))
+        columns = list(rows[0].keys()) if rows else []
+        return {"columns": columns, "rows": [list(row.values()) for row in rows], "row_count": len(rows)}
+
+    def _batch(self, request: Request) -> Dict[str, Any]:
+        operations = request.field("operations")
+        if not isinstance(operations, list):
+            raise APIError(400, "'operations' must be a list")
+
+        context = {k: v for k, v in request.params.items() if k in CONTEXT_PARAMS}
+        results = []
+        for operation in operations:
+            if not isinstance(operation, dict) or "method" not in operation or "path" not in operation:
+                status, body = 400, {"detail": "Each operation needs a method and path"}
+            elif urlsplit(operation["path"]).path.rstrip("/").endswith("/batch"):
+                status, body = 400, {"detail": "Batches cannot be nested"}
+            else:
+                params = {**context, **{k: str(v) for k, v in operation.get("params", {}).items()}}
+                status, body = self.handle(operation["method"].upper(), operation["path"], params, operation.get("body"))
+            results.append({"status": status, "body": body})
+            # Later operations may depend on this one, so stop like sequential calls would
+            if status >= 400:
+                break
+        return {"results": results}
+
+    # Tables and indexes
+
+    def _create_table(self, request: Request) -> Dict[str, Any]:
+        try:
+            columns = [Column(**column) for column in request.field("columns")]
+            indexes = [Index(**index) for index in request.field("indexes", None) or []]
+        except (TypeError, ValidationError) as e:
+            raise APIError(400, f"Invalid table definition: {e}")
+        return _dump(request.db().create_table(request.field("name"), columns, indexes or None))
+
+    def _drop_table(self, request: Request) -> Dict[str, Any]:
+        request.db().drop_table(request.arg("table"))
+        return {"deleted": request.arg("table")}
+
+    def _create_index(self, request: Request) -> Dict[str, Any]:
+        name = request.db().create_index(
+            request.field("table"), request.field("columns"),
+            name=request.field("name", None), unique=request.field("unique", False),
+        )
+        return {"name": name}
+
+    # Data
+
+    def _select(self, request: Request) -> Any:
+        table = request.arg("table")
+        db = request.db()
+        limit = _int_param(request, "limit", 100)
+        filters = request.filters(PAGE_PARAMS)
+
+        if "offset" in request.params:
+            # Offset paging as used by the TypeScript SDK
+            sql = f'SELECT * FROM "{table}" ORDER BY id LIMIT ? OFFSET ?'
+            return db.query(sql, [limit, _int_param(request, "offset", 0)])
+
+        page = db.select_page(
+            table, limit=limit, order_by=request.params.get("order_by", "id"),
+            cursor=request.params.get("cursor"), columns=_split(request.params.get("columns")),
+            **filters,
+        )
+        if request.api_v1:
+            return page.records
+        return {"records": page.records, "next_cursor": page.next_cursor}
+
+    def _count(self, request: Request) -> Dict[str, Any]:
+        rows = request.db().aggregate(request.arg("table"), **request.filters(()))
+        return {"count": rows[0]["count"] if rows else 0}
+
+    def _get_record(self, request: Request) -> Dict[str, Any]:
+        page = request.db().select_page(request.arg("table"), limit=1, id=request.arg("id"))
+        if not page.records:
+            raise APIError(404, f"Record {request.arg('id')} not found")
+        return page.records[0]
+
+    def _update_record(self, request: Request) -> Dict[str, Any]:
+        return request.db().update(request.arg("table"), {**request.column_field("data"), "id": request.arg("id")})
+
+    def _delete_record(self, request: Request) -> Dict[str, Any]:
+        return {"deleted_count": request.db().delete(request.arg("table"), request.arg("id"))}
+
+    def _bulk_insert(self, request: Request) -> List[Dict[str, Any]]:
+        records = request.column_field("records")
+        if not records:
+            return []
+        result = request.db().insert(request.arg("table"), *records)
+        return result if len(records) > 1 else [result]
+
+    def _bulk_update(self, request: Request) -> List[Dict[str, Any]]:
+        updates = request.column_field("updates")
+        if not updates:
+            return []
+        result = request.db().update(request.arg("table"), *updates)
+        return result if len(updates) > 1 else [result]
+
+    def _bulk_delete(self, request: Request) -> Dict[str, Any]:
+        ids = request.field("ids")
+        if not ids:
+            return {"deleted_count": 0}
+        return {"deleted_count": request.db().delete(request.arg("table"), *ids)}
+
+    def _upsert(self, request: Request) -> Any:
+        records = request.column_field("records")
+        if not records:
+            raise APIError(400, "At least one record must be provided")
+        return request.db().upsert(
+            request.arg("table"), *records,
+            conflict=tuple(request.column_field("conflict", ["id"])),
+            update_columns=request.column_field("update_columns", None),
+        )
+
+    def _aggregate(self, request: Request) -> Dict[str, Any]:
+        options = {name: _split(request.params.get(name)) for name in AGGREGATE_PARAMS}
+        rows = request.db().aggregate(request.arg("table"), **options, **request.filters(AGGREGATE_PARAMS))
+        return {"data": rows}
+
+    # Tenants and branches
+
+    def _create_tenant(self, request: Request) -> Dict[str, Any]:
+        tenant = request.db().create_tenant(
+            request.field("name"), description=request.field("description", None),
+            copy_from=request.field("copy_from", None),
+        )
+        return _dump(tenant)
+
+    def _copy_tenant(self, request: Request) -> Dict[str, Any]:
+        return _dump(request.db().copy_tenant(request.field("source"), request.field("target")))
+
+    def _delete_tenant(self, request: Request) -> Dict[str, Any]:
+        request.db().delete_tenant(request.arg("name"))
+        self.connections.clear()
+        return {"deleted": request.arg("name")}
+
+    def _rename_tenant(self, request: Request) -> Dict[str, Any]:
+        request.db().rename_tenant(request.arg("name"), request.field("new_name"))
+        self.connections.clear()
+        return {"renamed": request.arg("name"), "new_name": request.field("new_name")}
+
+    def _create_branch(self, request: Request) -> Dict[str, Any]:
+        return _dump(request.db().create_branch(request.field("name"), request.field("source", "main")))
+
+    def _delete_branch(self, request: Request) -> Dict[str, Any]:
+        request.db().delete_branch(request.arg("name"))
+        self.connections.clear()
+        return {"deleted": request.arg("name")}
+
+    def _list_changes(self, request: Request) -> Dict[str, Any]:
+        return {"changes": [_dump(c) for c in request.db(branch=request.arg("name")).list_changes()]}
+
+
+def _status_for(error: Exception) -> int:
+    """HTTP status code for an exception raised by a CinchDB call."""
+    message = str(error).lower()
+    if "not found" in message or "does not exist" in message or "no such table" in message:
+        return 404
+    if isinstance(error, sqlite3.IntegrityError):
+        return 409
+    if isinstance(error, NotImplementedError):
+        return 501
+    if isinstance(error, (ValueError, TypeError, KeyError, SQLValidationError, ValidationError, sqlite3.OperationalError)):
+        return 400
+    return 500
+
+
+class _PooledHTTPServer(HTTPServer):
+    """HTTPServer that hands each connection to a bounded thread pool."""
+
+    def __init__(self, address, handler, app: CinchServer, workers: int):
+        self.app = app
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cinch-serve")
+        super().__init__(address, handler)
+
+    def process_request(self, request, client_address) -> None:
+        self._pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP/1.1 requests into CinchServer.handle() calls."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+    server: _PooledHTTPServer
+
+    def do_GET(self) -> None:
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    def do_DELETE(self) -> None:
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        app = self.server.app
+        url = urlsplit(self.path)
+        try:
+            body = self._read_body()
+        except ValueError as e:
+            self._respond(400, {"detail": f"Invalid request body: {e}"})
+            return
+
+        if not app.authorized(self.headers.get("X-API-Key")):
+            self._respond(401, {"detail": "Invalid or missing API key"})
+            return
+
+        status, payload = app.handle(self.command, url.path, dict(parse_qsl(url.query)), body)
+        self._respond(status, payload)
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        data = self.rfile.read(length)
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            try:
+                data = gzip.decompress(data)
+            except OSError as e:
+                raise ValueError(str(e))
+        return json.loads(data)
+
+    def _respond(self, status: int, payload: Any) -> None:
+        data = json.dumps(payload, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if len(data) >= COMPRESS_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
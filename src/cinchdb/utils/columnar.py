@@ -0,0 +1,168 @@
+"""Columnar result building for analytic queries.
+
+Rows are transposed batch by batch (``zip(*rows)``) and each column slice is
+converted straight into a typed array, so no per-row dict is ever built and
+numeric columns are held as machine values rather than Python objects.
+NumPy is used when installed; otherwise columns are ``array.array`` for
+INTEGER/REAL/BOOLEAN data and plain lists for everything else.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# array.array typecodes for declared column types
+_ARRAY_TYPECODES = {"INTEGER": "q", "REAL": "d", "BOOLEAN": "b"}
+
+
+def numpy_available() -> bool:
+    """Return True if NumPy can be used for columnar results."""
+    return np is not None
+
+
+def columns_from_batches(
+    columns: Sequence[str],
+    batches: Iterable[Sequence[Sequence[Any]]],
+    column_types: Optional[Mapping[str, str]] = None,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Build one array per result column from batches of row tuples.
+
+    Args:
+        columns: Result column names in row order
+        batches: Iterable of row batches, e.g. successive cursor.fetchmany() calls
+        column_types: Declared CinchDB types by column name. Columns without a
+            declared type (expressions, aggregates) are typed from their first
+            non-NULL value.
+        use_numpy: Force NumPy on or off (default: use it if installed)
+
+    Returns:
+        Dictionary of column name to array. With NumPy, INTEGER columns are
+        int64 (float64 with NaN when NULLs occur), REAL is float64, BOOLEAN is
+        bool (object when NULLs occur) and other types are object arrays.
+
+    Raises:
+        ImportError: If use_numpy is True and NumPy is not installed
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError(
+            "NumPy is required for use_numpy=True. Install it with: pip install numpy"
+        )
+
+    column_types = column_types or {}
+    types: List[Optional[str]] = [column_types.get(name) for name in columns]
+    if use_numpy:
+        built: List[Any] = [[] for _ in columns]
+    else:
+        built = [_empty_array(col_type) for col_type in types]
+
+    for batch in batches:
+        if not batch:
+            continue
+        for i, values in enumerate(zip(*batch)):
+            if types[i] is None:
+                types[i] = _infer_type(values)
+                if not use_numpy and not built[i]:
+                    built[i] = _empty_array(types[i])
+            if use_numpy:
+                built[i].append(_numpy_chunk(values, types[i]))
+            else:
+                built[i] = _extend_array(built[i], values, types[i])
+
+    if not use_numpy:
+        return dict(zip(columns, built))
+
+    result = {}
+    for name, chunks, col_type in zip(columns, built, types):
+        if not chunks:
+            result[name] = np.empty(0, dtype=_numpy_dtype(col_type))
+        elif len(chunks) == 1:
+            result[name] = chunks[0]
+        else:
+            result[name] = np.concatenate(chunks)
+    return result
+
+
+def _infer_type(values: Sequence[Any]) -> Optional[str]:
+    """Type an undeclared column from its first non-NULL value."""
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return "BOOLEAN"
+        if isinstance(value, int):
+            return "INTEGER"
+        if isinstance(value, float):
+            return "REAL"
+        return "TEXT"
+    return None
+
+
+def _numpy_dtype(col_type: Optional[str]):
+    return {"INTEGER": np.int64, "REAL": np.float64, "BOOLEAN": np.bool_}.get(col_type, object)
+
+
+def _numpy_chunk(values: Sequence[Any], col_type: Optional[str]):
+    """Convert one batch of a column to a NumPy array."""
+    try:
+        if col_type == "INTEGER":
+            if None in values:
+                return np.array(values, dtype=np.float64)
+            # Let NumPy pick int64 or float64 so stray REAL values aren't truncated
+            chunk = np.array(values)
+            if chunk.dtype.kind in "iuf":
+                return chunk
+        if col_type == "REAL":
+            return np.array(values, dtype=np.float64)
+        if col_type == "BOOLEAN":
+            if None in values:
+                return np.array([None if v is None else bool(v) for v in values], dtype=object)
+            return np.array(values, dtype=np.bool_)
+    except (TypeError, ValueError, OverflowError):
+        # SQLite doesn't enforce declared types; keep mismatched data as objects
+        pass
+    chunk = np.empty(len(values), dtype=object)
+    chunk[:] = values
+    return chunk
+
+
+def _empty_array(col_type: Optional[str]):
+    typecode = _ARRAY_TYPECODES.get(col_type)
+    return array(typecode) if typecode else []
+
+
+def _extend_array(column, values: Sequence[Any], col_type: Optional[str]):
+    """Append one batch of a column, widening the container if needed."""
+    if isinstance(column, list):
+        if col_type == "BOOLEAN":
+            values = [None if v is None else bool(v) for v in values]
+        column.extend(values)
+        return column
+
+    if None in values:
+        if column.typecode == "b":
+            # NULL booleans can't be stored in a typed array
+            return _extend_array([bool(v) for v in column], values, col_type)
+        if column.typecode == "q":
+            column = array("d", column)
+        values = [math.nan if v is None else v for v in values]
+
+    try:
+        chunk = array(column.typecode, values)
+    except (TypeError, OverflowError):
+        if column.typecode == "q" and all(isinstance(v, (int, float)) for v in values):
+            column = array("d", column)
+            chunk = array("d", values)
+        else:
+            # SQLite doesn't enforce declared types; keep mismatched data as a list
+            existing = [bool(v) for v in column] if column.typecode == "b" else list(column)
+            return _extend_array(existing, values, col_type)
+    column.extend(chunk)
+    return column
@@ -0,0 +1,127 @@
+"""Keyset (cursor) pagination helpers.
+
+Instead of ``LIMIT/OFFSET``, which makes SQLite step over every skipped row,
+a page continues from the sort key of the last row seen:
+``WHERE (sort_col, id) > (:last_value, :last_id) ORDER BY sort_col, id``.
+The position is handed to callers as an opaque continuation token.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from cinchdb.utils.name_validator import VALID_TABLE_NAME_PATTERN
+
+# Bump if the token layout changes so old tokens are rejected cleanly
+_CURSOR_VERSION = 1
+
+
+@dataclass
+class Page:
+    """One page of records from a keyset-paginated select.
+
+    Attributes:
+        records: Records in this page (model instances or dictionaries)
+        next_cursor: Token for the following page, or None on the last page
+    """
+
+    records: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows this one."""
+        return self.next_cursor is not None
+
+
+def parse_order_by(order_by: str) -> Tuple[str, bool]:
+    """Split an order_by value into (column, descending).
+
+    A leading "-" sorts descending, e.g. "-created_at".
+
+    Raises:
+        ValueError: If the column name is not a valid identifier
+    """
+    descending = order_by.startswith("-")
+    column = order_by[1:] if descending else order_by
+    if not VALID_TABLE_NAME_PATTERN.match(column):
+        raise ValueError(f"Invalid order_by column: '{column}'")
+    return column, descending
+
+
+def order_clause(column: str, descending: bool) -> str:
+    """Build the ORDER BY clause, with id as tie-breaker for other columns."""
+    direction = "DESC" if descending else "ASC"
+    if column == "id":
+        return f"id {direction}"
+    return f"{column} {direction}, id {direction}"
+
+
+def keyset_condition(
+    column: str, descending: bool, value: Any, last_id: Optional[str] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the WHERE condition selecting rows after a position.
+
+    Args:
+        column: Sort column
+        descending: Whether the sort is descending
+        value: Sort key of the last row seen
+        last_id: id of the last row seen. Without it, rows whose sort key
+            equals value are skipped, which is only exact for unique columns.
+
+    Returns:
+        Tuple of (condition, parameters). SQLite sorts NULLs first, so NULL
+        sort keys are handled explicitly.
+    """
+    op = "<" if descending else ">"
+    params: Dict[str, Any] = {"_after_value": value}
+
+    if value is None and last_id is None:
+        # NULLs sort first: ascending continues with the non-NULL keys, and
+        # nothing follows them in descending order
+        return ("0" if descending else f"{column} IS NOT NULL"), {}
+
+    if column == "id" or last_id is None:
+        condition = f"{column} {op} :_after_value"
+        if descending and column != "id":
+            condition = f"({condition} OR {column} IS NULL)"
+        return condition, params
+
+    params["_after_id"] = last_id
+    if value is None:
+        params.pop("_after_value")
+        if descending:
+            return f"({column} IS NULL AND id < :_after_id)", params
+        return f"({column} IS NOT NULL OR id > :_after_id)", params
+
+    condition = f"({column}, id) {op} (:_after_value, :_after_id)"
+    if descending:
+        condition = f"({condition} OR {column} IS NULL)"
+    return condition, params
+
+
+def encode_cursor(order_by: str, value: Any, last_id: Optional[str]) -> str:
+    """Encode a page position as an opaque, URL-safe token."""
+    payload = json.dumps([_CURSOR_VERSION, order_by, value, last_id], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, order_by: str) -> Tuple[Any, Optional[str]]:
+    """Decode a token from encode_cursor into (value, last_id).
+
+    Raises:
+        ValueError: If the token is malformed or was issued for another order_by
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        version, token_order_by, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    if version != _CURSOR_VERSION:
+        raise ValueError("Invalid pagination cursor")
+    if token_order_by != order_by:
+        raise ValueError(
+            f"Pagination cursor was issued for order_by='{token_order_by}', not '{order_by}'"
+        )
+    return value, last_id
@@ -0,0 +1,102 @@
+"""Precompiled row decoders for query results.
+
+SQLite stores BOOLEAN columns as 0/1 integers. Instead of looping every
+column of every row through convert_value_from_storage, a decoder is
+generated once per result shape that converts only the BOOLEAN positions
+and builds the output (dict, tuple or model) in a single expression.
+"""
+
+import types
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+ROW_FORMATS = ("dict", "tuple", "model")
+
+RowDecoder = Callable[[Sequence[Any]], Any]
+
+
+@lru_cache(maxsize=256)
+def compile_row_decoder(
+    columns: Tuple[str, ...],
+    bool_columns: FrozenSet[str] = frozenset(),
+    row_format: str = "dict",
+    model: Optional[Type[BaseModel]] = None,
+) -> RowDecoder:
+    """Build a function that decodes one raw result row.
+
+    Decoders are cached on their arguments, so a query whose result columns
+    and schema are unchanged reuses the same compiled function. A schema
+    change alters bool_columns and therefore produces a new decoder.
+
+    Args:
+        columns: Result column names in cursor.description order
+        bool_columns: Names of columns declared BOOLEAN in the schema
+        row_format: "dict", "tuple" or "model"
+        model: Pydantic model class, required for the "model" format. Rows
+            are built with model_construct, skipping validation.
+
+    Returns:
+        Callable taking a row (tuple or sqlite3.Row) and returning the
+        decoded value
+
+    Raises:
+        ValueError: If row_format is unknown or model is missing
+    """
+    if row_format not in ROW_FORMATS:
+        raise ValueError(f"row_format must be one of {', '.join(ROW_FORMATS)}")
+    if row_format == "model" and model is None:
+        raise ValueError("A model class is required for row_format='model'")
+
+    if row_format == "tuple" and not bool_columns.intersection(columns):
+        return tuple
+
+    values = [
+        f"(None if r[{i}] is None else bool(r[{i}]))" if name in bool_columns else f"r[{i}]"
+        for i, name in enumerate(columns)
+    ]
+
+    if row_format == "tuple":
+        body = "(" + "".join(f"{value}, " for value in values) + ")"
+    else:
+        # Like dict(sqlite3.Row), the first of several same-named columns wins
+        entries, seen = [], set()
+        for name, value in zip(columns, values):
+            if name not in seen:
+                seen.add(name)
+                entries.append(f"{name!r}: {value}")
+        body = "{" + ", ".join(entries) + "}"
+        if row_format == "model":
+            body = f"construct(**{body})"
+
+    namespace = {"construct": model.model_construct} if model is not None else {}
+    return eval(f"lambda r: {body}", namespace)
+
+
+def as_row_factory(decoder: RowDecoder) -> Callable[[Any, Tuple[Any, ...]], Any]:
+    """Adapt a decoder to the sqlite3 row_factory signature.
+
+    Example:
+        cursor = conn.execute(sql)
+        cursor.row_factory = as_row_factory(decoder)
+    """
+    return lambda cursor, row: decoder(row)
+
+
+def bool_columns_of(column_types: dict) -> FrozenSet[str]:
+    """Return the names of BOOLEAN columns in a name -> type mapping."""
+    return frozenset(name for name, col_type in column_types.items() if col_type == "BOOLEAN")
+
+
+def bool_fields_of(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Return the names of fields annotated bool or Optional[bool] on a model."""
+    names = set()
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, types.UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = args[0] if len(args) == 1 else None
+        if annotation is bool:
+            names.add(name)
+    return frozenset(names)
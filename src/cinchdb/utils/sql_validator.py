@@ -5,8 +5,9 @@ preventing structural database changes.
 """
 
 import re
-from typing import Tuple, Optional
 from enum import Enum
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
 class SQLOperation(Enum):
@@ -37,26 +38,35 @@ RESTRICTED_OPERATIONS = {
     "RELEASE",
 }
 
-# Additional restricted keywords that could modify schema
-RESTRICTED_KEYWORDS = {
-    "ADD COLUMN",
-    "DROP COLUMN",
-    "MODIFY COLUMN",
-    "ADD CONSTRAINT",
-    "DROP CONSTRAINT",
-    "ADD INDEX",
-    "DROP INDEX",
-    "CREATE INDEX",
-    "CREATE UNIQUE",
-    "CREATE VIEW",
-    "DROP VIEW",
-    "CREATE TRIGGER",
-    "DROP TRIGGER",
-    "CREATE PROCEDURE",
-    "DROP PROCEDURE",
-    "CREATE FUNCTION",
-    "DROP FUNCTION",
-}
+# Statement verbs that can follow a WITH clause
+_MAIN_VERBS = {op.value for op in SQLOperation} | RESTRICTED_OPERATIONS
+
+# Single-pass tokenizer. Each match skips any run of whitespace, comments,
+# string literals, quoted identifiers, numbers and operators inside the regex
+# engine and captures the next significant token: a word, a semicolon or a
+# parenthesis (or the empty string at end of input). Keywords and semicolons
+# inside literals, identifiers and comments are therefore never seen.
+_TOKEN_RE = re.compile(
+    r"""
+    (?:
+        \s+
+      | --[^\n]*                                  # line comment
+      | /\*.*?(?:\*/|\Z)                          # block comment
+      | '[^']*(?:''[^']*)*'?                       # string literal
+      | "[^"]*(?:""[^"]*)*"?                       # quoted identifiers
+      | `[^`]*(?:``[^`]*)*`?
+      | \[[^\]]*\]?
+      | [^\sA-Za-z_'"`\[;()\-/]+                   # numbers, operators, params
+      | -(?!-)
+      | /(?!\*)
+    )*
+    ([A-Za-z_][A-Za-z0-9_$]*|[;()]|\Z)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Keywords that may start an allowed CTE or subquery body
+_SUBQUERY_STARTS = {"SELECT", "VALUES", "WITH"}
 
 
 class SQLValidationError(Exception):
@@ -70,9 +80,13 @@ def validate_sql_query(
 ) -> Tuple[bool, Optional[str], Optional[SQLOperation]]:
     """Validate a SQL query to ensure it only contains allowed operations.
 
-    Allowed operations: SELECT, INSERT, UPDATE, DELETE
+    Allowed operations: SELECT, INSERT, UPDATE, DELETE (optionally preceded by
+    a WITH clause)
     Blocked operations: All DDL operations (CREATE, ALTER, DROP, etc.)
 
+    The query is tokenized once, so keywords inside string literals, quoted
+    identifiers and comments are ignored. Verdicts are cached by query text.
+
     Args:
         query: The SQL query to validate
         allow_multiple_statements: Whether to allow multiple SQL statements (default: False)
@@ -83,93 +97,104 @@ def validate_sql_query(
         - error_message: Error description if invalid, None if valid
         - operation: The SQL operation type if valid, None if invalid
     """
-    if not query or not query.strip():
+    if not query or query.isspace():
         return False, "Query cannot be empty", None
+    return _validate_cached(query, allow_multiple_statements)
 
-    # Normalize the query - remove comments and extra whitespace
-    normalized_query = query
-    # Remove single-line comments
-    normalized_query = re.sub(r"--.*$", "", normalized_query, flags=re.MULTILINE)
-    # Remove multi-line comments
-    normalized_query = re.sub(r"/\*[\s\S]*?\*/", "", normalized_query)
-    # Replace multiple spaces with single space
-    normalized_query = re.sub(r"\s+", " ", normalized_query)
-    normalized_query = normalized_query.strip().upper()
-
-    if not normalized_query:
-        return False, "Query cannot be empty after removing comments", None
-
-    # Check for multiple statements (security risk)
-    if not allow_multiple_statements:
-        # Count semicolons that are not at the end
-        semicolon_pos = normalized_query.find(";")
-        if semicolon_pos != -1 and semicolon_pos < len(normalized_query) - 1:
-            # Check if there's non-whitespace after the semicolon
-            remaining = normalized_query[semicolon_pos + 1 :].strip()
-            if remaining:
-                return (
-                    False,
-                    "Multiple statements are not allowed. Please execute one query at a time.",
-                    None,
-                )
-
-    # Extract the first word (operation)
-    first_word = normalized_query.split()[0].rstrip(";")
-
-    # Check if it's an allowed operation
-    try:
-        operation = SQLOperation(first_word)
-
-        # Additional validation for UPDATE and DELETE
-        if operation in (SQLOperation.UPDATE, SQLOperation.DELETE):
-            # Warning if no WHERE clause (we don't block it, just log)
-            if "WHERE" not in normalized_query:
-                import logging
 
-                logging.warning(
-                    f"{operation.value} statement without WHERE clause detected"
-                )
+@lru_cache(maxsize=1024)
+def _validate_cached(
+    query: str, allow_multiple_statements: bool
+) -> Tuple[bool, Optional[str], Optional[SQLOperation]]:
+    """Tokenize, split and classify a query (cached by query text)."""
+    statements = _split_statements(query)
 
-        return True, None, operation
-    except ValueError:
-        # Not a recognized allowed operation
-        pass
+    if not statements:
+        return False, "Query cannot be empty after removing comments", None
 
-    # Check for restricted operations
-    for restricted in RESTRICTED_OPERATIONS:
-        if normalized_query.startswith(restricted):
+    # Check for multiple statements (security risk)
+    if len(statements) > 1 and not allow_multiple_statements:
+        return (
+            False,
+            "Multiple statements are not allowed. Please execute one query at a time.",
+            None,
+        )
+
+    operation = None
+    for tokens in statements:
+        is_valid, error, statement_operation = _classify_statement(tokens)
+        if not is_valid:
+            return False, error, None
+        operation = operation or statement_operation
+    return True, None, operation
+
+
+def _split_statements(query: str) -> List[List[str]]:
+    """Tokenize a query into statements of upper-cased words and parentheses."""
+    statements: List[List[str]] = []
+    current: List[str] = []
+    for token in _TOKEN_RE.findall(query):
+        if token == ";":
+            if current:
+                statements.append(current)
+            current = []
+        elif token:
+            current.append(token.upper())
+    if current:
+        statements.append(current)
+    return statements
+
+
+def _classify_statement(tokens: List[str]) -> Tuple[bool, Optional[str], Optional[SQLOperation]]:
+    """Determine the operation of one tokenized statement."""
+    in_cte = tokens[0] == "WITH"
+    main_verb = None
+    depth = 0
+    previous = None
+
+    for token in tokens:
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth = max(depth - 1, 0)
+        elif main_verb is None and depth == 0 and (not in_cte or token in _MAIN_VERBS):
+            main_verb = token
+        elif previous == "(" and token not in _SUBQUERY_STARTS and token in RESTRICTED_OPERATIONS:
+            # DDL in a subquery or CTE body position
+            if in_cte and main_verb is None:
+                return False, f"CTE (WITH clause) containing {token} operations is not allowed.", None
             return (
                 False,
-                f"{restricted} operations are not allowed. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
+                f"Query contains restricted operation: {token}. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
                 None,
             )
+        previous = token
 
-    # Check for restricted keywords anywhere in the query
-    for keyword in RESTRICTED_KEYWORDS:
-        if keyword in normalized_query:
-            return (
-                False,
-                f"Query contains restricted operation: {keyword}. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
-                None,
-            )
+    if main_verb in RESTRICTED_OPERATIONS:
+        if in_cte:
+            return False, f"CTE (WITH clause) containing {main_verb} operations is not allowed.", None
+        return (
+            False,
+            f"{main_verb} operations are not allowed. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
+            None,
+        )
+
+    try:
+        operation = SQLOperation(main_verb)
+    except ValueError:
+        return (
+            False,
+            "Unrecognized or restricted SQL operation. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
+            None,
+        )
+
+    # Warning if UPDATE/DELETE has no WHERE clause (we don't block it, just log)
+    if operation in (SQLOperation.UPDATE, SQLOperation.DELETE) and "WHERE" not in tokens:
+        import logging
+
+        logging.warning(f"{operation.value} statement without WHERE clause detected")
 
-    # Check for WITH statements that might contain DDL
-    if normalized_query.startswith("WITH"):
-        # Check if the CTE contains any DDL operations
-        for restricted in RESTRICTED_OPERATIONS:
-            if restricted in normalized_query:
-                return (
-                    False,
-                    f"CTE (WITH clause) containing {restricted} operations is not allowed.",
-                    None,
-                )
-
-    # If we get here, it's an unrecognized operation
-    return (
-        False,
-        "Unrecognized or restricted SQL operation. Only SELECT, INSERT, UPDATE, and DELETE queries are permitted.",
-        None,
-    )
+    return True, None, operation
 
 
 def validate_query_safe(query: str, allow_multiple_statements: bool = False) -> None:
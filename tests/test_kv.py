@@ -9,6 +9,7 @@ from unittest.mock import patch
 
 from cinchdb.core.database import CinchDB
 from cinchdb.core.initializer import ProjectInitializer
+from cinchdb.managers.kv import WrongTypeError
 
 
 class TestKVStore:
@@ -992,4 +993,740 @@ class TestKVStoreMultiTenant:
             db_main.kv.delete(key)
         assert db_main.kv.key_count() == 0
         assert db_tenant1.kv.key_count() == 2
-        assert db_tenant1.kv.get("key1") == "tenant1"
\ No newline at end of file
+        assert db_tenant1.kv.get("key1") == "tenant1"
+
+class TestKVDataStructures:
+    """Test hashes, lists, sets and sorted sets."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+
+            # Initialize project
+            initializer = ProjectInitializer(project_dir)
+            initializer.init_project("testdb")
+
+            yield project_dir
+
+    @pytest.fixture
+    def db(self, temp_project):
+        """Create a CinchDB instance for testing."""
+        db = CinchDB(database="testdb", project_dir=temp_project)
+        from cinchdb.models import Column
+        db.create_table("testtable", [Column(name="testcol", type="INTEGER")])
+        return db
+
+    def test_hash_operations(self, db):
+        """Test hset/hget/hgetall/hdel with typed values."""
+        assert db.kv.hset("user:1", "name", "Alice") == 1
+        assert db.kv.hset("user:1", mapping={"name": "Alicia", "age": 30, "admin": True}) == 2
+
+        assert db.kv.hget("user:1", "name") == "Alicia"
+        assert db.kv.hget("user:1", "age") == 30
+        assert db.kv.hget("user:1", "admin") is True
+        assert db.kv.hget("user:1", "missing") is None
+        assert db.kv.hgetall("user:1") == {"name": "Alicia", "age": 30, "admin": True}
+
+        assert db.kv.hdel("user:1", "age", "missing") == 1
+        assert db.kv.hgetall("user:1") == {"name": "Alicia", "admin": True}
+        assert db.kv.hgetall("nonexistent") == {}
+
+        # Hashes share the key namespace with plain values
+        with pytest.raises(WrongTypeError):
+            db.kv.get("user:1")
+
+    def test_hincrby(self, db):
+        """Test atomic hash field increments."""
+        assert db.kv.hincrby("stats", "views") == 1
+        assert db.kv.hincrby("stats", "views", 5) == 6
+        assert db.kv.hincrby("stats", "score", 1.5) == 1.5
+
+        db.kv.hset("stats", "label", "text")
+        with pytest.raises(ValueError, match="Cannot increment non-numeric"):
+            db.kv.hincrby("stats", "label")
+        assert db.kv.hget("stats", "label") == "text"
+
+    def test_list_operations(self, db):
+        """Test pushes, pops and ranges on lists."""
+        assert db.kv.rpush("queue", "a", "b") == 2
+        assert db.kv.lpush("queue", "z", "y") == 4
+        assert db.kv.rpush("queue", {"job": 1}) == 5
+
+        assert db.kv.lrange("queue") == ["y", "z", "a", "b", {"job": 1}]
+        assert db.kv.lrange("queue", 1, 2) == ["z", "a"]
+        assert db.kv.lrange("queue", -2, -1) == ["b", {"job": 1}]
+        assert db.kv.lrange("queue", 3, 100) == ["b", {"job": 1}]
+        assert db.kv.lrange("queue", 4, 1) == []
+        assert db.kv.llen("queue") == 5
+
+        assert db.kv.lpop("queue") == "y"
+        assert db.kv.rpop("queue") == {"job": 1}
+        assert db.kv.lrange("queue") == ["z", "a", "b"]
+        assert db.kv.llen("queue") == 3
+
+        assert db.kv.rpop("empty") is None
+        assert db.kv.lrange("empty") == []
+        assert db.kv.llen("empty") == 0
+
+    def test_set_operations(self, db):
+        """Test set membership operations."""
+        assert db.kv.sadd("tags", "red", "green", "red") == 2
+        assert db.kv.sadd("tags", "green", "blue") == 1
+        assert db.kv.smembers("tags") == {"red", "green", "blue"}
+        assert db.kv.sismember("tags", "red") is True
+        assert db.kv.sismember("tags", "purple") is False
+
+        assert db.kv.srem("tags", "red", "purple") == 1
+        assert db.kv.smembers("tags") == {"green", "blue"}
+
+        with pytest.raises(ValueError):
+            db.kv.sadd("tags", 42)
+
+    def test_sorted_set_operations(self, db):
+        """Test sorted set scores and range queries."""
+        assert db.kv.zadd("leaderboard", {"alice": 10, "bob": 5, "carol": 20}) == 3
+        assert db.kv.zadd("leaderboard", {"bob": 15, "dave": 1}) == 1
+
+        assert db.kv.zscore("leaderboard", "bob") == 15
+        assert db.kv.zscore("leaderboard", "nobody") is None
+        assert db.kv.zcard("leaderboard") == 4
+
+        assert db.kv.zrangebyscore("leaderboard") == ["dave", "alice", "bob", "carol"]
+        assert db.kv.zrangebyscore("leaderboard", 10, 15) == ["alice", "bob"]
+        assert db.kv.zrangebyscore("leaderboard", 10, 20, withscores=True, limit=2) == [
+            ("alice", 10.0),
+            ("bob", 15.0),
+        ]
+        assert db.kv.zrangebyscore("leaderboard", limit=2, offset=1) == ["alice", "bob"]
+
+        assert db.kv.zrem("leaderboard", "dave") == 1
+        assert db.kv.zcard("leaderboard") == 3
+
+        with pytest.raises(ValueError, match="Score must be numeric"):
+            db.kv.zadd("leaderboard", {"eve": "high"})
+
+    def test_infinite_numbers(self, db):
+        """Test that infinite scores and values read back without errors."""
+        inf = float("inf")
+        db.kv.zadd("bounds", {"low": -inf, "mid": 0, "high": inf})
+        assert db.kv.zscore("bounds", "high") == inf
+        assert db.kv.zrangebyscore("bounds", withscores=True) == [("low", -inf), ("mid", 0), ("high", inf)]
+
+        db.kv.hset("h", "f", inf)
+        db.kv.rpush("l", -inf, 2)
+        db.kv.set("k", inf)
+        assert db.kv.hget("h", "f") == inf
+        assert db.kv.lrange("l") == [-inf, 2]
+        assert db.kv.get("k") == inf
+
+    def test_structure_keys_are_visible(self, db):
+        """Test that exists/keys/ttl/expire/key_count see structure keys."""
+        db.kv.set("plain", "value", ttl=60)
+        db.kv.hset("hash", "f", 1)
+        db.kv.rpush("list", 1)
+        db.kv.sadd("set", "m")
+        db.kv.zadd("zset", {"m": 1})
+
+        assert all(db.kv.exists(key) for key in ("plain", "hash", "list", "set", "zset"))
+        assert not db.kv.exists("missing")
+        assert db.kv.keys() == ["hash", "list", "plain", "set", "zset"]
+        assert db.kv.keys("*set") == ["set", "zset"]
+        assert db.kv.key_count() == 5
+        assert db.kv.key_count("h*") == 1
+
+        assert 0 < db.kv.ttl("plain") <= 60
+        assert db.kv.ttl("hash") is None
+        assert db.kv.ttl("missing") == -1
+        with pytest.raises(WrongTypeError):
+            db.kv.expire("hash", 10)
+        assert db.kv.setnx("list", "value") is False
+
+        db.kv.lpop("list")
+        assert not db.kv.exists("list")
+        assert db.kv.key_count() == 4
+
+    def test_wrong_type_operations(self, db):
+        """Test that operations on a key of another type raise WrongTypeError."""
+        db.kv.set("plain", "value")
+        db.kv.hset("hash", "f", 1)
+        db.kv.rpush("list", 1)
+
+        for operation in (
+            lambda: db.kv.hset("plain", "f", 1),
+            lambda: db.kv.hincrby("plain", "f"),
+            lambda: db.kv.hget("plain", "f"),
+            lambda: db.kv.rpush("plain", 1),
+            lambda: db.kv.lrange("plain"),
+            lambda: db.kv.sadd("plain", "m"),
+            lambda: db.kv.smembers("plain"),
+            lambda: db.kv.zadd("plain", {"m": 1}),
+            lambda: db.kv.zscore("plain", "m"),
+            lambda: db.kv.set("hash", "value"),
+            lambda: db.kv.mset({"other": 1, "hash": 2}),
+            lambda: db.kv.increment("hash"),
+            lambda: db.kv.incr_with_ttl("hash"),
+            lambda: db.kv.get("list"),
+            lambda: db.kv.hset("list", "f", 1),
+            lambda: db.kv.sadd("list", "m"),
+            lambda: db.kv.zcard("list"),
+        ):
+            with pytest.raises(WrongTypeError, match="WRONGTYPE"):
+                operation()
+
+        # Nothing was written under the wrong type
+        assert db.kv.get("plain") == "value"
+        assert db.kv.hgetall("hash") == {"f": 1}
+        assert db.kv.lrange("list") == [1]
+        assert not db.kv.exists("other")
+
+        # A key can change type once it is deleted or expired
+        db.kv.delete("plain")
+        assert db.kv.hset("plain", "f", 1) == 1
+        db.kv.set("short", "value", ttl=0.05)
+        time.sleep(0.1)
+        assert db.kv.sadd("short", "m") == 1
+        assert db.kv.ttl("short") is None
+
+    def test_delete_removes_structures(self, db):
+        """Test that delete() removes keys of every type."""
+        db.kv.set("plain", "value")
+        db.kv.hset("hash", "f", 1)
+        db.kv.rpush("list", 1, 2)
+        db.kv.sadd("set", "m")
+        db.kv.zadd("zset", {"m": 1})
+
+        assert db.kv.delete("plain", "hash", "list", "set", "zset", "missing") == 5
+        assert db.kv.hgetall("hash") == {}
+        assert db.kv.llen("list") == 0
+        assert db.kv.smembers("set") == set()
+        assert db.kv.zcard("zset") == 0
+
+    def test_structure_writes_use_writer(self, temp_project):
+        """Test that structure writes go through the tenant's writer."""
+        import threading
+        from cinchdb.core.writer import WriterOptions, close_writers, submit_write
+
+        db = CinchDB(database="testdb", project_dir=temp_project, writer_options=WriterOptions())
+        with patch("cinchdb.managers.kv.submit_write", wraps=submit_write) as submitted:
+            db.kv.hset("h", "f", 1)
+            db.kv.hincrby("h", "f")
+            db.kv.hdel("h", "f")
+            db.kv.rpush("l", 1)
+            db.kv.lpop("l")
+            db.kv.sadd("s", "m")
+            db.kv.srem("s", "m")
+            db.kv.zadd("z", {"m": 1})
+            db.kv.zrem("z", "m")
+        assert submitted.call_count == 9
+
+        errors = []
+
+        def write(n):
+            try:
+                for i in range(25):
+                    db.kv.hincrby("hits", "total")
+                    db.kv.rpush("log", i)
+                    db.kv.sadd("seen", f"{n}:{i}")
+                    db.kv.zadd("board", {f"{n}:{i}": i})
+                    db.kv.set(f"plain:{n}", i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        close_writers()
+
+        assert errors == []
+        assert db.kv.hget("hits", "total") == 100
+        assert db.kv.llen("log") == 100
+        assert len(db.kv.smembers("seen")) == 100
+        assert db.kv.zcard("board") == 100
+
+    def test_structures_on_lazy_tenant(self, temp_project):
+        """Test reads on lazy tenants are empty and writes materialize them."""
+        setup = CinchDB(database="testdb", project_dir=temp_project)
+        from cinchdb.models import Column
+        setup.create_table("testtable", [Column(name="testcol", type="INTEGER")])
+        setup.create_tenant("lazy_one")
+
+        db = CinchDB(database="testdb", project_dir=temp_project, tenant="lazy_one")
+        assert db.kv.hgetall("h") == {}
+        assert db.kv.lpop("l") is None
+        assert db.kv.smembers("s") == set()
+        assert db.kv.zrangebyscore("z") == []
+
+        db.kv.rpush("l", "first")
+        assert db.kv.lrange("l") == ["first"]
+        assert setup.kv.llen("l") == 0
+
+
+class TestKVCompression:
+    """Test transparent compression of large values."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+
+            # Initialize project
+            initializer = ProjectInitializer(project_dir)
+            initializer.init_project("testdb")
+
+            yield project_dir
+
+    def _raw_row(self, db, key):
+        """Read the stored __kv row for a key, bypassing KVManager."""
+        import sqlite3
+        conn = sqlite3.connect(str(db.kv.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute("SELECT * FROM __kv WHERE key = ?", [key]).fetchone()
+        finally:
+            conn.close()
+
+    def test_large_values_compressed(self, temp_project):
+        """Test values above the threshold are compressed and read back intact."""
+        from cinchdb.managers.kv import KVOptions
+        db = CinchDB(database="testdb", project_dir=temp_project,
+                     kv_options=KVOptions(compression_threshold=1024))
+
+        text = "cached payload " * 500
+        payload = {"items": [{"id": i, "name": f"item {i}"} for i in range(200)]}
+        blob = b"\x00\x01" * 2000
+
+        db.kv.set("text", text)
+        db.kv.mset({"json": payload, "blob": blob})
+        db.kv.set("small", "tiny")
+
+        assert db.kv.get("text") == text
+        assert db.kv.get("blob") == blob
+        assert db.kv.mget(["text", "json", "blob", "small"]) == {
+            "text": text, "json": payload, "blob": blob, "small": "tiny"
+        }
+
+        row = self._raw_row(db, "text")
+        assert row["value_codec"] == "zlib"
+        assert len(row["value_text"]) < len(text)
+        # Size accounting reports the logical (uncompressed) size
+        assert row["value_size"] == len(text.encode("utf-8"))
+        assert db.kv.storage_size("text") == {"text": len(text.encode("utf-8"))}
+
+        assert self._raw_row(db, "json")["value_codec"] == "zlib"
+        assert self._raw_row(db, "small")["value_codec"] is None
+
+    def test_compression_disabled(self, temp_project):
+        """Test compression can be turned off."""
+        from cinchdb.managers.kv import KVOptions
+        db = CinchDB(database="testdb", project_dir=temp_project,
+                     kv_options=KVOptions(compression_threshold=None))
+
+        text = "x" * 10000
+        db.kv.set("text", text)
+        assert db.kv.get("text") == text
+        assert self._raw_row(db, "text")["value_codec"] is None
+
+    def test_incompressible_values_stored_raw(self, temp_project):
+        """Test values that don't shrink are left uncompressed."""
+        import os
+        from cinchdb.managers.kv import KVOptions
+        db = CinchDB(database="testdb", project_dir=temp_project,
+                     kv_options=KVOptions(compression_threshold=16))
+
+        random_bytes = os.urandom(4096)
+        db.kv.set("random", random_bytes)
+        assert db.kv.get("random") == random_bytes
+        assert self._raw_row(db, "random")["value_codec"] is None
+
+    def test_custom_codec(self, temp_project):
+        """Test a registered codec is used for writes and reads."""
+        import bz2
+        from cinchdb.managers.kv import KVCodec, KVOptions, register_codec
+
+        class Bz2Codec(KVCodec):
+            name = "bz2-test"
+
+            def compress(self, data):
+                return bz2.compress(data)
+
+            def decompress(self, data):
+                return bz2.decompress(data)
+
+        register_codec(Bz2Codec())
+        db = CinchDB(database="testdb", project_dir=temp_project,
+                     kv_options=KVOptions(compression_threshold=64, compression_codec="bz2-test"))
+
+        db.kv.set("doc", {"body": "lorem ipsum " * 100})
+        assert db.kv.get("doc") == {"body": "lorem ipsum " * 100}
+        assert self._raw_row(db, "doc")["value_codec"] == "bz2-test"
+
+        # Values stay readable by managers configured with a different codec
+        plain = CinchDB(database="testdb", project_dir=temp_project)
+        assert plain.kv.get("doc") == {"body": "lorem ipsum " * 100}
+
+    def test_legacy_table_gains_codec_column(self, temp_project):
+        """Test __kv tables created without the codec column are migrated."""
+        import sqlite3
+        db = CinchDB(database="testdb", project_dir=temp_project)
+        db.kv.set("warmup", 1)
+
+        # Simulate a table created by an older version
+        conn = sqlite3.connect(str(db.kv.db_path))
+        conn.execute("DROP TABLE __kv")
+        conn.execute("""
+            CREATE TABLE __kv (
+                key TEXT PRIMARY KEY, value_type TEXT NOT NULL, value_text TEXT,
+                value_number REAL, value_bool BOOLEAN, value_blob BLOB, value_json TEXT,
+                value_size INTEGER, expires_at INTEGER,
+                created_at INTEGER DEFAULT (unixepoch()), updated_at INTEGER DEFAULT (unixepoch())
+            )
+        """)
+        conn.execute("INSERT INTO __kv (key, value_type, value_text, value_size) VALUES ('old', 'text', 'hi', 2)")
+        conn.commit()
+        conn.close()
+
+        assert db.kv.get("old") == "hi"
+        db.kv.set("new", "y" * 8000)
+        assert db.kv.get("new") == "y" * 8000
+
+
+class TestKVCounters:
+    """Test windowed counters and rate limiting."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+
+            # Initialize project
+            initializer = ProjectInitializer(project_dir)
+            initializer.init_project("testdb")
+
+            yield project_dir
+
+    @pytest.fixture
+    def db(self, temp_project):
+        """Create a CinchDB instance for testing."""
+        return CinchDB(database="testdb", project_dir=temp_project)
+
+    def test_incr_with_ttl(self, db):
+        """Test counters start a TTL on creation and keep it on increment."""
+        assert db.kv.incr_with_ttl("hits", ttl=60) == 1
+        first_ttl = db.kv.ttl("hits")
+        assert 59 < first_ttl <= 60
+
+        assert db.kv.incr_with_ttl("hits", 4, ttl=3600) == 5
+        assert db.kv.ttl("hits") <= first_ttl
+        assert db.kv.incr_with_ttl("hits", 0.5, ttl=60) == 5.5
+
+        # Existing counters without a TTL gain one
+        db.kv.set("plain", 10)
+        assert db.kv.incr_with_ttl("plain", ttl=30) == 11
+        assert db.kv.ttl("plain") is not None
+
+    def test_incr_with_ttl_resets_after_expiry(self, db):
+        """Test an expired counter restarts from the increment amount."""
+        db.kv.incr_with_ttl("window", 5, ttl=0.1)
+        time.sleep(0.2)
+        assert db.kv.incr_with_ttl("window", ttl=60) == 1
+        assert db.kv.ttl("window") > 59
+
+        # Expired non-numeric values are replaced too
+        db.kv.set("stale", "text", ttl=0.1)
+        time.sleep(0.2)
+        assert db.kv.incr_with_ttl("stale", ttl=60) == 1
+        assert db.kv.get("stale") == 1
+
+    def test_incr_with_ttl_validation(self, db):
+        """Test invalid arguments and non-numeric values are rejected."""
+        db.kv.set("name", "alice")
+        with pytest.raises(ValueError, match="non-numeric"):
+            db.kv.incr_with_ttl("name", ttl=60)
+        assert db.kv.get("name") == "alice"
+
+        with pytest.raises(ValueError, match="TTL must be positive"):
+            db.kv.incr_with_ttl("hits", ttl=0)
+        with pytest.raises(ValueError, match="Amount must be numeric"):
+            db.kv.incr_with_ttl("hits", "1", ttl=60)
+
+    def test_fixed_window_rate_limit(self, db):
+        """Test the fixed window allows limit hits and then rejects."""
+        results = [db.kv.rate_limit("rate:user:1", limit=3, window=60) for _ in range(5)]
+
+        assert [r["allowed"] for r in results] == [True, True, True, False, False]
+        assert [r["remaining"] for r in results] == [2, 1, 0, 0, 0]
+        assert results[-1]["count"] == 5
+        assert 0 < results[-1]["reset_in"] <= 60
+
+        # Other keys are independent
+        assert db.kv.rate_limit("rate:user:2", limit=3, window=60)["allowed"]
+
+    def test_sliding_window_rate_limit(self, db):
+        """Test the sliding window weights the previous window's hits."""
+        window = 60
+        start = 1_000_000 * window
+
+        with patch("cinchdb.managers.kv.time.time", return_value=start + 1):
+            for _ in range(10):
+                result = db.kv.rate_limit("api", limit=10, window=window, sliding=True)
+            assert result["allowed"]
+            assert result["remaining"] == 0
+
+        # Halfway through the next window half of the previous hits still count
+        with patch("cinchdb.managers.kv.time.time", return_value=start + window + 30):
+            result = db.kv.rate_limit("api", limit=10, window=window, sliding=True)
+            assert result["count"] == pytest.approx(6)
+            assert result["allowed"]
+            assert result["reset_in"] == pytest.approx(30)
+
+        # Two windows later the old hits no longer count
+        with patch("cinchdb.managers.kv.time.time", return_value=start + 3 * window):
+            result = db.kv.rate_limit("api", limit=10, window=window, sliding=True)
+            assert result["count"] == 1
+
+    def test_rate_limit_validation(self, db):
+        """Test invalid limits and windows are rejected."""
+        with pytest.raises(ValueError, match="Limit"):
+            db.kv.rate_limit("rate", limit=-1, window=60)
+        with pytest.raises(ValueError, match="Window"):
+            db.kv.rate_limit("rate", limit=10, window=0)
+
+    def test_counter_upserts_in_place(self, db):
+        """Test that repeated increments accumulate and keep the creation TTL."""
+        iterations = 200
+        for _ in range(iterations):
+            db.kv.incr_with_ttl("counter", ttl=60)
+        first_ttl = db.kv.ttl("counter")
+
+        assert db.kv.get("counter") == iterations
+        assert 0 < first_ttl <= 60
+        assert db.kv.incr_with_ttl("counter", amount=0.5, ttl=3600) == iterations + 0.5
+        # Later increments don't extend the TTL
+        assert db.kv.ttl("counter") <= first_ttl
+
+    @pytest.mark.slow
+    def test_counter_benchmark(self, db):
+        """Report counter throughput against a get/set read-modify-write."""
+        iterations = 1000
+
+        def get_set(key):
+            db.kv.set(key, (db.kv.get(key) or 0) + 1, ttl=60)
+
+        operations = {
+            "get/set": get_set,
+            "incr_with_ttl": lambda key: db.kv.incr_with_ttl(key, ttl=60),
+            "rate_limit": lambda key: db.kv.rate_limit(key, limit=iterations, window=60),
+            "rate_limit sliding": lambda key: db.kv.rate_limit(key, limit=iterations, window=60, sliding=True),
+        }
+        rates = {}
+        for name, operation in operations.items():
+            key = f"bench:{name}"
+            started = time.perf_counter()
+            for _ in range(iterations):
+                operation(key)
+            rates[name] = iterations / (time.perf_counter() - started)
+
+        print("\n" + ", ".join(f"{name}: {rate:,.0f} ops/s" for name, rate in rates.items()))
+        assert db.kv.get("bench:get/set") == iterations
+        assert db.kv.get("bench:incr_with_ttl") == iterations
+        assert db.kv.get("bench:rate_limit") == iterations
+
+
+class TestKVSeparateFile:
+    """Test storing KV data in a dedicated per-tenant file."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+
+            # Initialize project
+            initializer = ProjectInitializer(project_dir)
+            initializer.init_project("testdb")
+
+            yield project_dir
+
+    @pytest.fixture
+    def options(self):
+        """KV options using a separate, cache-tuned file."""
+        from cinchdb.managers.kv import KVOptions
+        return KVOptions(separate_file=True, pragmas={"synchronous": "OFF", "page_size": 1024})
+
+    def test_kv_written_to_separate_file(self, temp_project, options):
+        """Test KV data lands in {tenant}.kv.db with its own PRAGMAs."""
+        db = CinchDB(database="testdb", tenant="acme", project_dir=temp_project, kv_options=options)
+
+        assert db.kv.get("missing") is None
+        assert not db.kv.kv_path.exists()
+
+        db.kv.set("session:1", {"user": 1})
+        db.kv.hset("profile", "name", "Ada")
+        db.kv.incr_with_ttl("hits", ttl=60)
+
+        kv_path = db.kv.kv_path
+        assert kv_path.name == "acme.kv.db"
+        assert kv_path.parent == db.kv.db_path.parent
+        assert kv_path.exists()
+
+        # Writing KV data does not materialize the tenant database
+        assert db._context.tenants.is_tenant_lazy("acme")
+        assert not db.kv.db_path.exists()
+
+        assert db.kv.get("session:1") == {"user": 1}
+        assert db.kv.hget("profile", "name") == "Ada"
+
+        with db.kv._connect() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA page_size").fetchone()[0] == 1024
+
+    def test_separate_file_isolated_from_tenant_db(self, temp_project, options):
+        """Test shared and separate KV storage don't see each other's keys."""
+        shared = CinchDB(database="testdb", project_dir=temp_project)
+        separate = CinchDB(database="testdb", project_dir=temp_project, kv_options=options)
+
+        shared.kv.set("where", "tenant db")
+        separate.kv.set("where", "kv file")
+
+        assert shared.kv.get("where") == "tenant db"
+        assert separate.kv.get("where") == "kv file"
+
+    def test_tenant_lifecycle_moves_kv_file(self, temp_project, options):
+        """Test copy, rename and delete carry the KV file along."""
+        from cinchdb.models import Column
+        db = CinchDB(database="testdb", project_dir=temp_project)
+        db.create_table("items", [Column(name="name", type="TEXT")])
+        db._context.tenants.create_tenant("source")
+        db._context.tenants.materialize_tenant("source")
+
+        def kv(tenant):
+            return CinchDB(database="testdb", tenant=tenant, project_dir=temp_project,
+                           kv_options=options).kv
+
+        kv("source").set("token", "abc")
+
+        db._context.tenants.copy_tenant("source", "copy")
+        assert kv("copy").get("token") == "abc"
+
+        db._context.tenants.rename_tenant("copy", "renamed")
+        assert kv("renamed").get("token") == "abc"
+        assert kv("copy").get("token") is None
+        assert not kv("copy").kv_path.exists()
+
+        renamed_path = kv("renamed").kv_path
+        db._context.tenants.delete_tenant("renamed")
+        assert not renamed_path.exists()
+
+        # A lazy tenant's KV file is removed too
+        kv("lazy").set("k", 1)
+        lazy_path = kv("lazy").kv_path
+        assert lazy_path.exists()
+        db._context.tenants.delete_tenant("lazy")
+        assert not lazy_path.exists()
+
+
+class TestKVInMemory:
+    """Test the in-memory KV mode with snapshots."""
+
+    @pytest.fixture
+    def temp_project(self):
+        """Create a temporary project for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+
+            # Initialize project
+            initializer = ProjectInitializer(project_dir)
+            initializer.init_project("testdb")
+
+            yield project_dir
+
+            # Drop stores so nothing is snapshotted into the removed directory
+            from cinchdb.managers import kv
+            for path in list(kv._MEMORY_STORES):
+                if str(path).startswith(temp_dir):
+                    kv.discard_memory_store(path)
+
+    def connect(self, temp_project, tenant="main", **kwargs):
+        from cinchdb.managers.kv import KVOptions
+        kwargs.setdefault("snapshot_interval", None)
+        return CinchDB(database="testdb", tenant=tenant, project_dir=temp_project,
+                       kv_options=KVOptions(in_memory=True, **kwargs))
+
+    def test_same_api_without_disk_writes(self, temp_project):
+        """Test the KV API works in memory and nothing hits disk until a snapshot."""
+        db = self.connect(temp_project)
+
+        db.kv.set("user", {"name": "Ada"})
+        db.kv.set("temp", "x", ttl=0.1)
+        db.kv.rpush("queue", "a", "b")
+        assert db.kv.get("user") == {"name": "Ada"}
+        assert db.kv.lrange("queue") == ["a", "b"]
+        assert not db.kv.kv_path.exists()
+
+        time.sleep(0.2)
+        assert db.kv.get("temp") is None
+        assert db.kv.exists("user")
+
+    def test_snapshot_and_reload(self, temp_project):
+        """Test snapshots persist data that a fresh store loads back."""
+        from cinchdb.managers import kv
+        db = self.connect(temp_project)
+        db.kv.set("session:1", "alive", ttl=3600)
+        db.kv.zadd("scores", {"ada": 3})
+
+        assert db.kv.snapshot() is True
+        assert db.kv.snapshot() is False  # Nothing changed
+        assert db.kv.kv_path.exists()
+
+        # Simulate a restart
+        kv.discard_memory_store(db.kv.kv_path)
+        db = self.connect(temp_project)
+        assert db.kv.get("session:1") == "alive"
+        assert db.kv.ttl("session:1") > 3500
+        assert db.kv.zscore("scores", "ada") == 3
+
+    def test_unsnapshotted_writes_lost_on_discard(self, temp_project):
+        """Test writes after the last snapshot are not on disk."""
+        from cinchdb.managers import kv
+        db = self.connect(temp_project)
+        db.kv.set("kept", 1)
+        db.kv.snapshot()
+        db.kv.set("lost", 2)
+
+        kv.discard_memory_store(db.kv.kv_path)
+        db = self.connect(temp_project)
+        assert db.kv.get("kept") == 1
+        assert db.kv.get("lost") is None
+
+    def test_periodic_snapshot(self, temp_project):
+        """Test the background thread snapshots changed stores."""
+        db = self.connect(temp_project, snapshot_interval=0.05)
+        db.kv.set("key", "value")
+
+        deadline = time.time() + 2
+        while not db.kv.kv_path.exists() and time.time() < deadline:
+            time.sleep(0.02)
+        assert db.kv.kv_path.exists()
+
+    def test_snapshot_requires_in_memory_mode(self, temp_project):
+        """Test snapshot() is rejected for file-backed KV."""
+        db = CinchDB(database="testdb", project_dir=temp_project)
+        with pytest.raises(ValueError, match="in-memory"):
+            db.kv.snapshot()
+
+    def test_tenant_delete_discards_store(self, temp_project):
+        """Test deleting a tenant drops its in-memory store and snapshot."""
+        db = self.connect(temp_project, tenant="acme")
+        db.kv.set("k", "v")
+        db.kv.snapshot()
+        kv_path = db.kv.kv_path
+
+        db._context.tenants.delete_tenant("acme")
+        assert not kv_path.exists()
+        assert self.connect(temp_project, tenant="acme").kv.get("k") is None
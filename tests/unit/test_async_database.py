@@ -0,0 +1,183 @@
+"""Tests for the asyncio interface."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import PropertyMock, patch
+
+import httpx
+import pytest
+
+from cinchdb.core.async_database import AsyncCinchDB, connect_async
+from cinchdb.core.initializer import init_project
+from cinchdb.models import Column
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with an events table on the main tenant."""
+    init_project(tmp_path)
+    db = AsyncCinchDB(database="main", project_dir=tmp_path)
+    db.sync.create_table("events", [Column(name="kind", type="TEXT")])
+    return tmp_path
+
+
+class TestAsyncCinchDBLocal:
+    """Test local async calls."""
+
+    def test_crud_and_kv(self, project):
+        """Test that data and KV calls round-trip through the workers."""
+        async def main():
+            async with connect_async("main", project_dir=project) as db:
+                record = await db.insert("events", {"kind": "click"})
+                await db.update("events", {"id": record["id"], "kind": "view"})
+                rows = await db.query("SELECT kind FROM events")
+
+                await db.kv.set("hits", 1)
+                await db.kv.increment("hits", 2)
+                hits = await db.kv.get("hits")
+
+                deleted = await db.delete("events", record["id"])
+                return rows, hits, deleted
+
+        rows, hits, deleted = asyncio.run(main())
+        assert rows == [{"kind": "view"}]
+        assert hits == 3
+        assert deleted == 1
+
+    def test_tenant_operations(self, project):
+        """Test tenant management and per-tenant handles."""
+        async def main():
+            async with AsyncCinchDB(database="main", project_dir=project) as db:
+                await db.create_tenant("acme")
+                acme = db.for_tenant("acme")
+                await acme.insert("events", {"kind": "signup"})
+                names = {tenant.name for tenant in await db.list_tenants()}
+                return names, await acme.query("SELECT kind FROM events"), await db.query("SELECT kind FROM events")
+
+        names, acme_rows, main_rows = asyncio.run(main())
+        assert {"main", "acme"} <= names
+        assert acme_rows == [{"kind": "signup"}]
+        assert main_rows == []
+
+    def test_calls_for_a_tenant_share_a_worker(self, project):
+        """Test that a tenant's calls always run on the same thread, in order."""
+        async def main():
+            async with AsyncCinchDB(database="main", project_dir=project, max_workers=4) as db:
+                threads = await asyncio.gather(*[
+                    db.run_sync(lambda _: threading.current_thread().name) for _ in range(10)
+                ])
+                await asyncio.gather(*[db.insert("events", {"kind": str(i)}) for i in range(20)])
+                rows = await db.query("SELECT kind FROM events ORDER BY rowid")
+                return threads, [row["kind"] for row in rows]
+
+        threads, kinds = asyncio.run(main())
+        assert len(set(threads)) == 1
+        assert kinds == [str(i) for i in range(20)]
+
+    def test_max_pending_applies_backpressure(self, project):
+        """Test that calls beyond max_pending wait for a free slot."""
+        release = threading.Event()
+        running = []
+
+        def block(db):
+            running.append(1)
+            release.wait(5)
+
+        async def main():
+            async with AsyncCinchDB(database="main", project_dir=project, max_pending=2) as db:
+                tasks = [asyncio.create_task(db.for_tenant(f"t{i}").run_sync(block)) for i in range(3)]
+                await asyncio.sleep(0.2)
+                waiting = db._shared.slots.locked()
+                release.set()
+                await asyncio.gather(*tasks)
+                return waiting
+
+        assert asyncio.run(main()) is True
+        assert len(running) == 3
+
+    def test_cancelling_a_queued_call(self, project):
+        """Test that a call waiting behind another for the same tenant is dropped."""
+        release = threading.Event()
+        ran = []
+
+        async def main():
+            async with AsyncCinchDB(database="main", project_dir=project) as db:
+                first = asyncio.create_task(db.run_sync(lambda _: release.wait(5)))
+                await asyncio.sleep(0.05)
+                second = asyncio.create_task(db.run_sync(lambda _: ran.append(1)))
+                await asyncio.sleep(0.05)
+                second.cancel()
+                await asyncio.sleep(0.05)
+                release.set()
+                await first
+                with pytest.raises(asyncio.CancelledError):
+                    await second
+                # The slot held by the cancelled call is returned
+                await db.run_sync(lambda _: None)
+
+        asyncio.run(main())
+        assert ran == []
+
+    def test_connect_async_requires_project(self, tmp_path, monkeypatch):
+        """Test that connect_async needs a .cinchdb project."""
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(ValueError, match="No .cinchdb directory"):
+            connect_async("main")
+
+
+class TestAsyncCinchDBRemote:
+    """Test remote async calls over httpx."""
+
+    def test_remote_calls(self):
+        """Test that remote calls send the same requests as CinchDB."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content) if request.content else None
+            requests.append((request.method, request.url.path, dict(request.url.params), body))
+            if request.url.path == "/query":
+                return httpx.Response(200, json={"data": [{"id": 1, "secret": "x"}]})
+            if request.method == "DELETE":
+                return httpx.Response(200, json={"deleted_count": 2})
+            return httpx.Response(200, json={"id": "1"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def main():
+            with patch.object(AsyncCinchDB, "client", new_callable=PropertyMock) as mock_client:
+                mock_client.return_value = client
+                db = AsyncCinchDB(database="test_db", api_url="https://api.example.com", api_key="test-key")
+                rows = await db.query("SELECT * FROM users", mask_columns=["secret"])
+                await db.insert("users", {"name": "a"})
+                deleted = await db.delete("users", "1", "2")
+                await client.aclose()
+                return rows, deleted
+
+        rows, deleted = asyncio.run(main())
+        assert rows == [{"id": 1, "secret": "***REDACTED***"}]
+        assert deleted == 2
+        params = {"database": "test_db", "branch": "main", "tenant": "main"}
+        assert requests == [
+            ("POST", "/query", params, {"sql": "SELECT * FROM users"}),
+            ("POST", "/tables/users/data", params, {"data": {"name": "a"}}),
+            ("DELETE", "/tables/users/data/bulk", params, {"ids": ["1", "2"]}),
+        ]
+
+    def test_remote_error_status(self):
+        """Test that API errors raise like the synchronous client."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(404, json={"detail": "Table not found"})
+        ))
+
+        async def main():
+            with patch.object(AsyncCinchDB, "client", new_callable=PropertyMock) as mock_client:
+                mock_client.return_value = client
+                db = AsyncCinchDB(database="test_db", api_url="https://api.example.com", api_key="test-key")
+                with pytest.raises(Exception, match=r"API Error \(404\): Table not found"):
+                    await db.query("SELECT * FROM missing")
+                with pytest.raises(RuntimeError):
+                    db.kv
+                await client.aclose()
+
+        asyncio.run(main())
@@ -0,0 +1,149 @@
+"""Tests for batched operations."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from cinchdb.core.async_database import AsyncCinchDB
+from cinchdb.core.database import CinchDB
+from cinchdb.core.initializer import init_project
+from cinchdb.models import Column
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Local connection with an events table."""
+    init_project(tmp_path)
+    db = CinchDB(database="main", project_dir=tmp_path)
+    db.create_table("events", [Column(name="kind", type="TEXT")])
+    return db
+
+
+def remote(handler):
+    """Remote CinchDB whose HTTP client sends requests to handler."""
+    db = CinchDB(database="test_db", api_url="https://api.example.com", api_key="test-key")
+    db._session = httpx.Client(transport=httpx.MockTransport(handler))
+    return db
+
+
+class TestLocalBatch:
+    """Test batches on local connections."""
+
+    def test_operations_run_in_order(self, db):
+        """Test that results come back in the order operations were added."""
+        with db.batch() as batch:
+            first = batch.insert("events", {"kind": "click"})
+            batch.insert("events", {"kind": "view"}, {"kind": "scroll"})
+            rows = batch.query("SELECT kind FROM events ORDER BY rowid")
+
+        assert first.value["kind"] == "click"
+        assert [row["kind"] for row in rows.value] == ["click", "view", "scroll"]
+        assert len(batch.results) == 3
+
+        with db.batch() as batch:
+            batch.update("events", {"id": first.value["id"], "kind": "tap"})
+            deleted = batch.delete("events", first.value["id"])
+        assert deleted.value == 1
+        assert db.query("SELECT COUNT(*) AS n FROM events")[0]["n"] == 2
+
+    def test_stops_at_first_failure(self, db):
+        """Test that a failing operation raises and later operations don't run."""
+        batch = db.batch()
+        kept = batch.insert("events", {"kind": "kept"})
+        failed = batch.insert("missing", {"kind": "x"})
+        skipped = batch.insert("events", {"kind": "skipped"})
+
+        with pytest.raises(Exception):
+            batch.execute()
+        assert kept.value["kind"] == "kept"
+        with pytest.raises(Exception):
+            failed.value
+        assert not skipped.done
+        assert [row["kind"] for row in db.query("SELECT kind FROM events")] == ["kept"]
+
+    def test_error_in_block_discards_batch(self, db):
+        """Test that nothing runs if the with block raises."""
+        with pytest.raises(KeyError):
+            with db.batch() as batch:
+                batch.insert("events", {"kind": "click"})
+                raise KeyError("boom")
+        assert db.query("SELECT COUNT(*) AS n FROM events")[0]["n"] == 0
+
+    def test_arguments_are_checked_when_added(self, db):
+        """Test that invalid operations fail before anything is sent."""
+        batch = db.batch()
+        with pytest.raises(ValueError, match="missing required 'id'"):
+            batch.update("events", {"kind": "x"})
+        with pytest.raises(Exception):
+            batch.query("DROP TABLE events")
+        assert len(batch) == 0
+        assert batch.execute() == []
+
+
+class TestRemoteBatch:
+    """Test batches sent to the API."""
+
+    def test_sends_one_request(self):
+        """Test that the batch is one POST /batch with every operation."""
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.path, dict(request.url.params), json.loads(request.content)))
+            return httpx.Response(200, json={"results": [
+                {"status": 200, "body": {"id": "1", "name": "a"}},
+                {"status": 200, "body": {"data": [{"id": "1", "secret": "s"}]}},
+                {"status": 200, "body": {"deleted_count": 2}},
+            ]})
+
+        db = remote(handler)
+        with db.batch() as batch:
+            inserted = batch.insert("users", {"name": "a"})
+            rows = batch.query("SELECT * FROM users", mask_columns=["secret"])
+            deleted = batch.delete("users", "1", "2")
+
+        assert inserted.value == {"id": "1", "name": "a"}
+        assert rows.value == [{"id": "1", "secret": "***REDACTED***"}]
+        assert deleted.value == 2
+        assert requests == [(
+            "POST", "/batch", {"database": "test_db", "branch": "main", "tenant": "main"},
+            {"operations": [
+                {"method": "POST", "path": "/tables/users/data", "body": {"data": {"name": "a"}}},
+                {"method": "POST", "path": "/query", "body": {"sql": "SELECT * FROM users"}},
+                {"method": "DELETE", "path": "/tables/users/data/bulk", "body": {"ids": ["1", "2"]}},
+            ]},
+        )]
+
+    def test_failed_operation_raises(self):
+        """Test that an operation's error status raises like a single request."""
+        db = remote(lambda request: httpx.Response(200, json={"results": [
+            {"status": 200, "body": {"id": "1"}},
+            {"status": 404, "body": {"detail": "Table not found"}},
+        ]}))
+        batch = db.batch()
+        first = batch.insert("users", {"name": "a"})
+        batch.insert("missing", {"name": "b"})
+        third = batch.insert("users", {"name": "c"})
+
+        with pytest.raises(Exception, match=r"API Error \(404\): Table not found"):
+            batch.execute()
+        assert first.value == {"id": "1"}
+        assert not third.done
+        with pytest.raises(Exception, match="404"):
+            batch.execute()
+
+
+class TestAsyncBatch:
+    """Test AsyncCinchDB.batch()."""
+
+    def test_local_async_batch(self, db):
+        """Test that an async batch runs on the tenant's worker."""
+        async def main():
+            async with AsyncCinchDB(database="main", project_dir=db.project_dir) as adb:
+                async with adb.batch() as batch:
+                    batch.insert("events", {"kind": "click"})
+                    count = batch.query("SELECT COUNT(*) AS n FROM events")
+                return count.value
+
+        assert asyncio.run(main()) == [{"n": 1}]
@@ -403,4 +403,217 @@ def test_or_operator():
         
         # Verify remaining records
         remaining_count = db.query("SELECT COUNT(*) as count FROM users")[0]["count"]
-        assert remaining_count == 3  # Alice, Bob, Charlie should remain
\ No newline at end of file
+        assert remaining_count == 3  # Alice, Bob, Charlie should remain
+
+def test_bulk_update_reports_missing_records():
+    """Test bulk update applies in one pass and reports missing IDs inline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("users", [
+            Column(name="name", type="TEXT"),
+            Column(name="status", type="TEXT")
+        ])
+
+        results = db.insert("users",
+            {"name": "Alice", "status": "active"},
+            {"name": "Bob", "status": "active"}
+        )
+        alice, bob = (result["id"] for result in results)
+
+        updated = db.update("users",
+            {"id": alice, "status": "premium"},
+            {"id": "missing", "status": "premium"},
+            {"id": bob, "name": "Bobby", "status": "inactive"},
+            {"id": alice, "status": "vip"},  # Later updates to the same record win
+            {"id": bob}
+        )
+
+        assert [row["id"] for row in updated] == [alice, "missing", bob, alice, bob]
+        assert updated[0]["status"] == "vip"
+        assert updated[1] == {"id": "missing", "error": "No record found with id: missing"}
+        assert updated[2]["name"] == "Bobby"
+        assert updated[4]["error"] == "No data provided for update"
+
+        rows = {row["id"]: row for row in db.query("SELECT * FROM users")}
+        assert rows[alice]["status"] == "vip"
+        assert rows[bob]["status"] == "inactive"
+
+
+def test_bulk_delete_chunks_and_outcomes():
+    """Test bulk delete handles more IDs than SQLite's variable limit."""
+    from cinchdb.managers.data import MAX_SQL_VARIABLES
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("events", [Column(name="kind", type="TEXT")])
+
+        count = MAX_SQL_VARIABLES * 2 + 10
+        results = db.insert("events", *({"kind": "click"} for _ in range(count)))
+        ids = [result["id"] for result in results]
+
+        outcomes = db._context.data.bulk_delete_by_id("events", ids[:-5] + ["missing"])
+        assert sum(outcomes.values()) == count - 5
+        assert outcomes["missing"] is False
+
+        assert db.delete("events", *ids) == 5
+        assert db.query("SELECT COUNT(*) as count FROM events")[0]["count"] == 0
+
+
+def test_bulk_update_rolls_back_on_error():
+    """Test a failing bulk update leaves every record untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("accounts", [
+            Column(name="email", type="TEXT", unique=True)
+        ])
+
+        first, second = db.insert("accounts",
+            {"email": "a@example.com"},
+            {"email": "b@example.com"}
+        )
+
+        try:
+            db.update("accounts",
+                {"id": first["id"], "email": "new@example.com"},
+                {"id": second["id"], "email": "new@example.com"}
+            )
+            assert False, "Should have raised an integrity error"
+        except Exception as e:
+            assert "UNIQUE" in str(e)
+
+        emails = sorted(row["email"] for row in db.query("SELECT email FROM accounts"))
+        assert emails == ["a@example.com", "b@example.com"]
+
+
+def test_upsert():
+    """Test db.upsert inserts and updates in one call."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("products", [
+            Column(name="sku", type="TEXT", unique=True),
+            Column(name="price", type="REAL"),
+            Column(name="active", type="BOOLEAN")
+        ])
+
+        single = db.upsert("products", {"sku": "A", "price": 1.0, "active": True}, conflict=("sku",))
+        assert single["sku"] == "A"
+
+        results = db.upsert("products",
+            {"sku": "A", "price": 2.0, "active": False},
+            {"sku": "B", "price": 3.0, "active": True},
+            conflict=("sku",)
+        )
+        assert len(results) == 2
+
+        rows = {row["sku"]: row for row in db.query("SELECT * FROM products")}
+        assert len(rows) == 2
+        assert rows["A"]["id"] == single["id"]
+        assert rows["A"]["price"] == 2.0
+        assert rows["A"]["active"] == 0
+        assert rows["B"]["price"] == 3.0
+
+
+def test_insert_stream():
+    """Test streaming inserts from a generator in chunks."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("events", [
+            Column(name="seq", type="INTEGER"),
+            Column(name="flagged", type="BOOLEAN")
+        ])
+
+        def rows():
+            for i in range(2500):
+                yield {"seq": i, "flagged": i % 2 == 0}
+
+        reports = []
+        stats = db.insert_stream("events", rows(), chunk_size=1000, progress=reports.append)
+
+        assert stats["inserted"] == 2500
+        assert stats["chunks"] == 3
+        assert stats["rows_per_sec"] > 0
+        assert [r["inserted"] for r in reports] == [1000, 2000, 2500]
+
+        result = db.query("SELECT COUNT(*) as count, SUM(flagged) as flagged_count FROM events")[0]
+        assert result["count"] == 2500
+        assert result["flagged_count"] == 1250
+
+
+def test_insert_stream_failure_modes():
+    """Test per-chunk commits keep earlier chunks; single transaction keeps nothing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+
+        # Initialize project
+        initializer = ProjectInitializer(project_dir)
+        initializer.init_project("testdb", "main")
+
+        # Connect to database
+        db = CinchDB("testdb", project_dir=project_dir)
+
+        # Create table
+        db.create_table("items", [Column(name="name", type="TEXT")])
+
+        def rows():
+            for i in range(25):
+                yield {"id": "dup" if i == 22 else f"item-{i}", "name": f"item {i}"}
+            yield {"id": "dup", "name": "again"}
+
+        try:
+            db.insert_stream("items", rows(), chunk_size=10, single_transaction=True)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "0 records committed" in str(e)
+        assert db.query("SELECT COUNT(*) as count FROM items")[0]["count"] == 0
+
+        try:
+            db.insert_stream("items", rows(), chunk_size=10)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "20 records committed" in str(e)
+        assert db.query("SELECT COUNT(*) as count FROM items")[0]["count"] == 20
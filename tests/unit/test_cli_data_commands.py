@@ -277,4 +277,235 @@ class TestCLIDataCommands:
             )
             
             assert result.exit_code == 0
-            assert "Deleted" in result.stdout
\ No newline at end of file
+            assert "Deleted" in result.stdout
+    def test_select_pages_with_after_token(self, runner, temp_project):
+        """Test paging through a table with the token printed by each page."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            db = CinchDB("main", project_dir=temp_project)
+            db.insert("users", *[{"name": f"user{i}", "age": i} for i in range(5)])
+
+            ages = []
+            args = ["select", "users", "--limit", "2", "--order-by", "-age", "--format", "json"]
+            result = runner.invoke(app, args)
+            while True:
+                assert result.exit_code == 0, result.stdout
+                page = json.loads(result.stdout)
+                ages.extend(record["age"] for record in page["records"])
+                if page["next_cursor"] is None:
+                    break
+                result = runner.invoke(app, args + ["--after", page["next_cursor"]])
+            assert ages == [4, 3, 2, 1, 0]
+
+            result = runner.invoke(app, ["select", "users", "--limit", "2", "--where", "age__gte=3"])
+            assert result.exit_code == 0, result.stdout
+            assert "user3" in result.stdout and "user4" in result.stdout
+            assert "Next page" not in result.stdout
+
+            result = runner.invoke(app, ["select", "users", "--after", "bogus"])
+            assert result.exit_code == 1
+            assert "Invalid pagination cursor" in result.stdout
+
+    def test_import_csv(self, runner, temp_project):
+        """Test importing a CSV file with type coercion."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            csv_file = temp_project / "users.csv"
+            lines = ["name,email,age,active"]
+            lines += [f"user{i},user{i}@example.com,{20 + i},{'true' if i % 2 else 'false'}" for i in range(25)]
+            lines.append("nobody,,,")
+            csv_file.write_text("\n".join(lines) + "\n")
+
+            result = runner.invoke(
+                app,
+                ["import", "users", str(csv_file), "--batch-size", "10"],
+            )
+
+            assert result.exit_code == 0, result.stdout
+            assert "Imported 26 record(s)" in result.stdout
+            assert "rows/sec" in result.stdout
+
+            db = CinchDB("main", project_dir=temp_project)
+            rows = db.query("SELECT name, email, age, active FROM users ORDER BY age")
+            assert len(rows) == 26
+            assert rows[0] == {"name": "nobody", "email": "", "age": None, "active": None}
+            assert rows[1]["age"] == 20 and isinstance(rows[1]["age"], int)
+            assert rows[2]["active"] in (True, 1)
+
+    def test_import_jsonl_gzip(self, runner, temp_project):
+        """Test importing a gzipped JSON Lines file."""
+        import gzip
+
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            jsonl_file = temp_project / "users.jsonl.gz"
+            with gzip.open(jsonl_file, "wt") as f:
+                f.write(json.dumps({"name": "Alice", "age": "30", "active": True}) + "\n\n")
+                f.write(json.dumps({"name": "Bob", "age": 25}) + "\n")
+
+            result = runner.invoke(app, ["import", "users", str(jsonl_file)])
+
+            assert result.exit_code == 0, result.stdout
+            db = CinchDB("main", project_dir=temp_project)
+            rows = db.query("SELECT name, age FROM users ORDER BY name")
+            assert rows == [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+
+    def test_import_rejects_bad_input(self, runner, temp_project):
+        """Test unknown columns and bad values fail unless skipped."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            csv_file = temp_project / "users.csv"
+            csv_file.write_text("name,nickname\nAlice,Al\n")
+
+            result = runner.invoke(app, ["import", "users", str(csv_file)])
+            assert result.exit_code == 1
+            assert "nickname" in result.stdout
+
+            result = runner.invoke(app, ["import", "users", str(csv_file), "--skip-unknown"])
+            assert result.exit_code == 0, result.stdout
+
+            csv_file.write_text("name,age\nBob,old\n")
+            result = runner.invoke(app, ["import", "users", str(csv_file)])
+            assert result.exit_code == 1
+            assert "Invalid INTEGER value" in result.stdout
+
+            result = runner.invoke(app, ["import", "users", str(temp_project / "users.txt")])
+            assert result.exit_code == 1
+
+    def test_import_tenant_column(self, runner, temp_project):
+        """Test fanning rows out to tenants from a tenant column."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            csv_file = temp_project / "users.csv"
+            lines = ["customer,name,age"]
+            lines += [f"{'acme' if i % 3 else 'globex'},user{i},{i}" for i in range(12)]
+            csv_file.write_text("\n".join(lines) + "\n")
+
+            result = runner.invoke(
+                app,
+                ["import", "users", str(csv_file), "--tenant-column", "customer", "-b", "2"],
+            )
+            assert result.exit_code == 1
+            assert "--create-tenants" in result.stdout
+
+            result = runner.invoke(
+                app,
+                ["import", "users", str(csv_file), "--tenant-column", "customer",
+                 "-b", "2", "--create-tenants"],
+            )
+            assert result.exit_code == 0, result.stdout
+            assert "Imported 12 record(s)" in result.stdout
+
+            acme = CinchDB("main", tenant="acme", project_dir=temp_project)
+            globex = CinchDB("main", tenant="globex", project_dir=temp_project)
+            assert acme.query("SELECT COUNT(*) AS n FROM users")[0]["n"] == 8
+            assert globex.query("SELECT COUNT(*) AS n FROM users")[0]["n"] == 4
+            main = CinchDB("main", project_dir=temp_project)
+            assert main.query("SELECT COUNT(*) AS n FROM users")[0]["n"] == 0
+
+    def test_export_csv_round_trip(self, runner, temp_project):
+        """Test exporting to CSV and importing the file back."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            db = CinchDB("main", project_dir=temp_project)
+            db.insert("users", *[
+                {"name": f"user{i}", "email": f"user{i}@example.com", "age": i, "active": i % 2 == 0}
+                for i in range(30)
+            ])
+
+            out = temp_project / "users.csv"
+            result = runner.invoke(app, ["export", "users", "--out", str(out), "-b", "7"])
+            assert result.exit_code == 0, result.stdout
+            assert "Exported 30 row(s)" in result.stdout
+
+            lines = out.read_text().splitlines()
+            assert len(lines) == 31
+            assert lines[0].startswith("id,")
+
+            db.delete_where("users", age__gte=0)
+            result = runner.invoke(app, ["import", "users", str(out)])
+            assert result.exit_code == 0, result.stdout
+            rows = db.query("SELECT age, active FROM users ORDER BY age")
+            assert len(rows) == 30
+            assert rows[1] == {"age": 1, "active": False}
+
+    def test_export_query_jsonl(self, runner, temp_project):
+        """Test exporting a query to stdout and to a gzipped file."""
+        import gzip
+
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            db = CinchDB("main", project_dir=temp_project)
+            db.insert("users", {"name": "Alice", "age": 30}, {"name": "Bob", "age": 20})
+
+            sql = "SELECT name, age FROM users ORDER BY age"
+            result = runner.invoke(app, ["export", sql, "--format", "jsonl"])
+            assert result.exit_code == 0, result.stdout
+            assert [json.loads(line) for line in result.stdout.splitlines()] == [
+                {"name": "Bob", "age": 20},
+                {"name": "Alice", "age": 30},
+            ]
+
+            out = temp_project / "users.jsonl.gz"
+            result = runner.invoke(app, ["export", sql, "--out", str(out)])
+            assert result.exit_code == 0, result.stdout
+            with gzip.open(out, "rt") as f:
+                assert [json.loads(line)["name"] for line in f] == ["Bob", "Alice"]
+
+            result = runner.invoke(app, ["export", "DELETE FROM users"])
+            assert result.exit_code == 1
+
+    def test_export_all_tenants(self, runner, temp_project):
+        """Test exporting every tenant to its own file."""
+        with patch("cinchdb.cli.commands.data.get_config_with_data") as mock_config:
+            mock_config.return_value = (
+                MagicMock(project_dir=temp_project),
+                MagicMock(active_database="main", active_branch="main"),
+            )
+
+            db = CinchDB("main", project_dir=temp_project)
+            db.insert("users", {"name": "main-user"})
+            db.create_tenant("acme")
+            db.create_tenant("empty")
+            CinchDB("main", tenant="acme", project_dir=temp_project).insert(
+                "users", {"name": "a1"}, {"name": "a2"}
+            )
+
+            out = temp_project / "exports"
+            result = runner.invoke(
+                app, ["export", "users", "--tenants", "all", "--out", str(out), "--format", "jsonl"]
+            )
+            assert result.exit_code == 0, result.stdout
+            assert "Exported 3 tenant(s)" in result.stdout
+
+            assert len((out / "main.jsonl").read_text().splitlines()) == 1
+            assert len((out / "acme.jsonl").read_text().splitlines()) == 2
+            assert (out / "empty.jsonl").read_text() == ""
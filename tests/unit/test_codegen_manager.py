@@ -105,6 +105,8 @@ class TestCodegenManager:
         assert "id: Optional[str]" in users_content
         assert "created_at: Optional[datetime]" in users_content
         assert "updated_at: Optional[datetime]" in users_content
+        assert "def select_page(cls, limit: int = 100, order_by: str = 'id', cursor: Optional[str] = None" in users_content
+        compile(users_content, "users.py", "exec")
 
         # Check __init__.py content
         init_content = (output_dir / "__init__.py").read_text()
@@ -322,6 +324,7 @@ class TestCodegenManager:
         assert "async update<T = any>" in client_content
         assert "async delete" in client_content
         assert "async bulkCreate<T = any>" in client_content
+        assert "async selectPage<T = any>" in client_content
         
         # Check types.ts content
         types_content = (output_dir / "types.ts").read_text()
@@ -331,6 +334,8 @@ class TestCodegenManager:
         assert "export interface DeleteResult" in types_content
         assert "export interface PaginationParams" in types_content
         assert "export interface FilterParams" in types_content
+        assert "export interface CursorPaginationParams" in types_content
+        assert "export interface Page<T = any>" in types_content
     
     def test_sqlite_to_typescript_type_mapping(self, codegen_manager):
         """Test SQLite to TypeScript type mapping."""
@@ -29,7 +29,7 @@ class TestColumnMasking:
                     {"id": 2, "name": "Bob", "email": "bob@example.com"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query("SELECT * FROM users", mask_columns=["email"])
 
@@ -57,7 +57,7 @@ class TestColumnMasking:
                     {"id": 2, "name": "Bob", "email": "bob@example.com", "ssn": "987-65-4321", "phone": "555-5678"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query(
                     "SELECT * FROM users",
@@ -89,7 +89,7 @@ class TestColumnMasking:
                     {"id": 3, "name": "Charlie", "email": None, "phone": None}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query(
                     "SELECT * FROM users",
@@ -122,7 +122,7 @@ class TestColumnMasking:
                     {"id": 2, "name": "Bob"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 # Try to mask columns that don't exist
                 result = db.query(
@@ -154,7 +154,7 @@ class TestColumnMasking:
                     {"id": 1, "name": "Alice", "email": "alice@example.com"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 # Empty mask_columns list
                 result = db.query("SELECT * FROM users", mask_columns=[])
@@ -180,7 +180,7 @@ class TestColumnMasking:
                 mock_cursor = Mock()
                 mock_cursor.fetchall.return_value = []  # Empty results
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query(
                     "SELECT * FROM users WHERE id = 999",
@@ -215,7 +215,7 @@ class TestColumnMasking:
                     }
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query(
                     "SELECT * FROM mixed_types",
@@ -252,7 +252,7 @@ class TestColumnMasking:
                     {"id": 1, "Email": "alice@example.com", "email": "bob@example.com"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 # Mask only lowercase 'email'
                 result = db.query(
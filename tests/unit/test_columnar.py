@@ -0,0 +1,111 @@
+"""Tests for columnar query results."""
+
+import math
+from array import array
+
+import pytest
+
+from cinchdb.core.database import CinchDB
+from cinchdb.core.initializer import init_project
+from cinchdb.models import Column
+from cinchdb.utils.columnar import columns_from_batches, numpy_available
+
+
+COLUMNS = ("n", "price", "active", "name", "total")
+TYPES = {"n": "INTEGER", "price": "REAL", "active": "BOOLEAN", "name": "TEXT"}
+BATCHES = [
+    [(1, 1.5, 1, "a", 10), (2, 2.5, 0, "b", 20)],
+    [(3, None, 1, None, 30)],
+]
+
+
+class TestArrayFallback:
+    """Test columns built without NumPy."""
+
+    def test_typed_arrays(self):
+        cols = columns_from_batches(COLUMNS, BATCHES, TYPES, use_numpy=False)
+
+        assert cols["n"] == array("q", [1, 2, 3])
+        assert cols["price"][:2] == array("d", [1.5, 2.5])
+        assert math.isnan(cols["price"][2])
+        assert cols["active"] == array("b", [1, 0, 1])
+        assert cols["name"] == ["a", "b", None]
+        # Undeclared columns are typed from their values
+        assert cols["total"] == array("q", [10, 20, 30])
+
+    def test_nulls_widen_columns(self):
+        cols = columns_from_batches(
+            ("n", "active"),
+            [[(1, 1)], [(None, None)]],
+            {"n": "INTEGER", "active": "BOOLEAN"},
+            use_numpy=False,
+        )
+
+        assert cols["n"].typecode == "d"
+        assert cols["n"][0] == 1.0 and math.isnan(cols["n"][1])
+        assert cols["active"] == [True, None]
+
+    def test_mismatched_values_fall_back_to_list(self):
+        cols = columns_from_batches(("n",), [[(1,)], [("x",)]], {"n": "INTEGER"}, use_numpy=False)
+        assert cols["n"] == [1, "x"]
+
+    def test_empty_result(self):
+        cols = columns_from_batches(("n", "name"), [], TYPES, use_numpy=False)
+        assert cols == {"n": array("q"), "name": []}
+
+
+class TestNumpy:
+    """Test columns built with NumPy."""
+
+    def test_numpy_arrays(self):
+        np = pytest.importorskip("numpy")
+        cols = columns_from_batches(COLUMNS, BATCHES, TYPES, use_numpy=True)
+
+        assert cols["n"].dtype == np.int64
+        assert cols["price"].dtype == np.float64 and np.isnan(cols["price"][2])
+        assert cols["active"].dtype == np.bool_
+        assert cols["active"].tolist() == [True, False, True]
+        assert cols["name"].dtype == object
+        assert cols["total"].sum() == 60
+
+    def test_numpy_nulls_and_empty(self):
+        np = pytest.importorskip("numpy")
+        cols = columns_from_batches(
+            ("n", "active"), [[(1, 1)], [(None, None)]], {"n": "INTEGER", "active": "BOOLEAN"}
+        )
+        assert cols["n"].dtype == np.float64
+        assert cols["active"].tolist() == [True, None]
+
+        empty = columns_from_batches(("n",), [], {"n": "INTEGER"}, use_numpy=True)
+        assert empty["n"].dtype == np.int64 and len(empty["n"]) == 0
+
+    def test_use_numpy_requires_numpy(self):
+        if numpy_available():
+            pytest.skip("NumPy is installed")
+        with pytest.raises(ImportError, match="NumPy"):
+            columns_from_batches(("n",), [], use_numpy=True)
+
+
+def test_query_columns(tmp_path):
+    """Test CinchDB.query_columns reads batches into columns."""
+    init_project(tmp_path)
+    db = CinchDB(database="main", project_dir=tmp_path)
+    db.create_table("orders", [
+        Column(name="price", type="REAL"),
+        Column(name="quantity", type="INTEGER"),
+        Column(name="paid", type="BOOLEAN"),
+    ])
+    db.insert_stream("orders", ({"price": 2.0, "quantity": i, "paid": i % 2 == 0} for i in range(25)))
+
+    cols = db.query_columns(
+        "SELECT price, quantity, paid FROM orders ORDER BY quantity", batch_size=7, use_numpy=False
+    )
+    assert cols["price"] == array("d", [2.0] * 25)
+    assert cols["quantity"] == array("q", range(25))
+    assert list(cols["paid"][:3]) == [1, 0, 1]
+
+    totals = db.query_columns("SELECT COUNT(*) AS n, SUM(price * quantity) AS revenue FROM orders", use_numpy=False)
+    assert totals == {"n": array("q", [25]), "revenue": array("d", [600.0])}
+
+    with pytest.raises(ValueError, match="SELECT"):
+        db.query_columns("DELETE FROM orders")
@@ -12,7 +12,7 @@ import os
 import psutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from cinchdb.core.connection import DatabaseConnection, ConnectionPool
+from cinchdb.core.connection import DatabaseConnection, ConnectionPool, ReaderPool
 
 
 class TestDatabaseConnection:
@@ -61,6 +61,20 @@ class TestDatabaseConnection:
 
         conn.close()
 
+    def test_extra_pragmas(self, temp_db):
+        """Test extra PRAGMAs override the defaults and set page size on creation."""
+        conn = DatabaseConnection(temp_db, pragmas={"synchronous": "OFF", "page_size": 1024})
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.commit()
+
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert conn.execute("PRAGMA page_size").fetchone()[0] == 1024
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+        with pytest.raises(ValueError, match="Invalid PRAGMA name"):
+            DatabaseConnection(temp_db, pragmas={"synchronous; DROP": "OFF"})
+
     def test_execute(self, temp_db):
         """Test executing SQL statements."""
         conn = DatabaseConnection(temp_db)
@@ -191,6 +205,94 @@ class TestConnectionPool:
 
         # Pool should be empty
         assert len(pool._connections) == 0
+class TestReaderPool:
+    """Test read-only connections and the reader pool."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """WAL database with one row."""
+        path = tmp_path / "reader.db"
+        with DatabaseConnection(path) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER)")
+            conn.execute("INSERT INTO items VALUES (1)")
+            conn.commit()
+        return path
+
+    def test_read_only_connection(self, db_path, tmp_path):
+        """Test that read-only connections reject writes and keep WAL mode."""
+        with DatabaseConnection(db_path, read_only=True) as conn:
+            assert conn.read_only
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly|query_only"):
+                conn.execute("INSERT INTO items VALUES (2)")
+
+        # Readers never create a missing file
+        with pytest.raises(sqlite3.OperationalError, match="does not exist"):
+            DatabaseConnection(tmp_path / "new.db", read_only=True)
+        with pytest.raises(sqlite3.OperationalError, match="does not exist"):
+            with ReaderPool().connection(tmp_path / "new.db"):
+                pass
+        assert not (tmp_path / "new.db").exists()
+
+    def test_readers_do_not_wait_for_writer(self, db_path):
+        """Test that pooled readers see committed data while a write is open."""
+        pool = ReaderPool()
+        writer = DatabaseConnection(db_path)
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute("INSERT INTO items VALUES (2)")
+            with pool.connection(db_path) as reader:
+                assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+            writer.commit()
+
+            with pool.connection(db_path) as again:
+                assert again is reader
+                assert again.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+        finally:
+            writer.close()
+            pool.clear()
+
+    def test_replaced_file_is_not_reused(self, db_path):
+        """Test that a pooled connection is dropped when its file is replaced."""
+        pool = ReaderPool()
+        with pool.connection(db_path) as first:
+            pass
+
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        with DatabaseConnection(db_path) as conn:
+            conn.execute("CREATE TABLE other (id INTEGER)")
+            conn.commit()
+
+        with pool.connection(db_path) as second:
+            assert second is not first
+            assert second.execute("SELECT name FROM sqlite_master").fetchall()[0][0] == "other"
+        assert first._conn is None
+        pool.clear()
+
+    def test_pool_limits(self, tmp_path):
+        """Test that idle connections are capped per file and across files."""
+        pool = ReaderPool(max_idle_per_file=1, max_files=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"db{i}.db"
+            DatabaseConnection(path).close()
+            paths.append(path)
+
+        with pool.connection(paths[0]) as a, pool.connection(paths[0]) as b:
+            pass
+        # b went back to the pool first, so a didn't fit
+        assert a._conn is None and b._conn is not None
+
+        for path in paths[1:]:
+            with pool.connection(path):
+                pass
+        assert b._conn is None
+        assert len(pool._idle) == 2
+        pool.clear()
+
+
 class TestConnectionEdgeCases:
     """Test database connection edge cases and stress scenarios."""
 
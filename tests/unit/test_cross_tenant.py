@@ -0,0 +1,52 @@
+"""Tests for the ATTACH-based cross-tenant query engine."""
+
+import sqlite3
+
+import pytest
+
+from cinchdb.core.cross_tenant import query_attached, referenced_tables
+
+
+def _make_tenant(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE events (id TEXT, kind TEXT, amount INTEGER)")
+    conn.executemany("INSERT INTO events VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestQueryAttached:
+    """Test query_attached over plain SQLite files."""
+
+    def test_views_and_batches_agree(self, tmp_path):
+        """Test that batched copies give the same result as attached views."""
+        paths = {
+            f"tenant{i}": _make_tenant(tmp_path / f"tenant{i}.db", [(f"e{j}", "click" if j % 2 else "view", j) for j in range(i + 1)])
+            for i in range(7)
+        }
+        tables = {"events": ["id", "kind", "amount"]}
+        sql = "SELECT kind, COUNT(DISTINCT tenant) AS tenants, SUM(amount) AS total FROM events GROUP BY kind ORDER BY kind"
+
+        columns, rows = query_attached(paths, tables, sql)
+        assert columns == ("kind", "tenants", "total")
+        assert rows == [("click", 6, 28), ("view", 7, 28)]
+        assert query_attached(paths, tables, sql, batch_size=3) == (columns, rows)
+
+    def test_attached_files_are_read_only(self, tmp_path):
+        """Test that tenant files can't be modified through the scratch connection."""
+        paths = {"a": _make_tenant(tmp_path / "a.db", [("e1", "view", 1)])}
+
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            query_attached(paths, {}, "DELETE FROM t0.events")
+
+    def test_tenant_column_clash(self, tmp_path):
+        """Test that a real tenant column is rejected."""
+        paths = {"a": _make_tenant(tmp_path / "a.db", [])}
+
+        with pytest.raises(ValueError, match="tenant"):
+            query_attached(paths, {"events": ["id", "tenant"]}, "SELECT * FROM events")
+
+    def test_referenced_tables(self):
+        """Test table detection in query text."""
+        assert referenced_tables("SELECT * FROM Events e JOIN users u ON u.id = e.user_id", ["events", "users", "orders"]) == ["events", "users"]
@@ -247,6 +247,146 @@ class TestDataManager:
         offset_results = data_manager.select(UserModel, limit=3, offset=2)
         assert len(offset_results) == 3
 
+    def test_select_with_keyset_after(self, data_manager):
+        """Test continuing a select after the last sort key seen."""
+        for i in range(10):
+            data_manager.create(UserModel(id=f"u{i:02d}", name=f"User{i}", email=f"user{i}@example.com", age=20 + i))
+
+        next_page = data_manager.select(UserModel, limit=3, after="u02")
+        assert [u.id for u in next_page] == ["u03", "u04", "u05"]
+
+        older_first = data_manager.select(UserModel, limit=2, order_by="-age", after=25)
+        assert [u.age for u in older_first] == [24, 23]
+
+    def test_select_page_walks_all_records(self, data_manager):
+        """Test paging through a non-unique sort column with continuation tokens."""
+        for i in range(10):
+            # Three users share each age, so pages must break ties by id
+            data_manager.create(UserModel(id=f"u{i:02d}", name=f"User{i}", email=f"user{i}@example.com", age=20 + i // 3))
+
+        seen = []
+        page = data_manager.select_page(UserModel, limit=4, order_by="-age")
+        while True:
+            assert all(isinstance(u, UserModel) for u in page.records)
+            seen.extend(page.records)
+            if not page.has_more:
+                break
+            page = data_manager.select_page(UserModel, limit=4, order_by="-age", cursor=page.next_cursor)
+
+        assert len(page.records) == 2
+        assert [u.id for u in seen] == [u.id for u in data_manager.select(UserModel, order_by="-age")]
+        assert len({u.id for u in seen}) == 10
+
+    def test_select_page_with_nulls_and_table_name(self, data_manager):
+        """Test that NULL sort keys are paged in SQLite order and dicts are returned for a table name."""
+        table_manager = TableManager(data_manager.context)
+        table_manager.create_table("scores", [Column(name="score", type="INTEGER", nullable=True)])
+        for i, score in enumerate([None, 3, None, 1, 2, None]):
+            data_manager.create_from_dict("scores", {"id": f"s{i}", "score": score})
+
+        for order_by in ("score", "-score"):
+            ids = []
+            cursor = None
+            while True:
+                page = data_manager.select_page("scores", limit=2, order_by=order_by, cursor=cursor)
+                assert all(isinstance(row, dict) for row in page.records)
+                ids.extend(row["id"] for row in page.records)
+                if not page.has_more:
+                    break
+                cursor = page.next_cursor
+            assert ids == [row["id"] for row in data_manager._select_rows("scores", {}, order_by=order_by)]
+            assert len(set(ids)) == 6
+
+    def test_keyset_after_null_without_id(self, data_manager):
+        """Test continuing after a NULL sort key when the cursor has no id."""
+        from cinchdb.core.connection import DatabaseConnection
+        from cinchdb.utils.pagination import keyset_condition
+
+        table_manager = TableManager(data_manager.context)
+        table_manager.create_table("scores", [Column(name="score", type="INTEGER", nullable=True)])
+        for i, score in enumerate([None, 2, 1]):
+            data_manager.create_from_dict("scores", {"id": f"s{i}", "score": score})
+
+        def after_null(descending):
+            condition, params = keyset_condition("score", descending, None)
+            with DatabaseConnection(data_manager.db_path) as conn:
+                rows = conn.execute(f"SELECT id FROM scores WHERE {condition} ORDER BY score", params)
+                return [row["id"] for row in rows]
+
+        assert after_null(descending=False) == ["s2", "s1"]
+        assert after_null(descending=True) == []
+
+    def test_select_page_rejects_invalid_input(self, data_manager):
+        """Test validation of order_by, limit and cursors."""
+        for i in range(3):
+            data_manager.create(UserModel(name=f"User{i}", email=f"user{i}@example.com", age=20 + i))
+
+        page = data_manager.select_page(UserModel, limit=1, order_by="age")
+        with pytest.raises(ValueError, match="order_by='age'"):
+            data_manager.select_page(UserModel, limit=1, order_by="name", cursor=page.next_cursor)
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            data_manager.select_page(UserModel, cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid order_by column"):
+            data_manager.select_page(UserModel, order_by="age; DROP TABLE users")
+        with pytest.raises(ValueError, match="limit must be positive"):
+            data_manager.select_page(UserModel, limit=0)
+
+    def test_select_with_columns(self, data_manager):
+        """Test that a column projection returns only those columns."""
+        for i in range(5):
+            data_manager.create(UserModel(id=f"u{i}", name=f"User{i}", email=f"user{i}@example.com", age=20 + i))
+
+        rows = data_manager.select(UserModel, columns=["name", "age"], age__gte=23, order_by="age")
+        assert rows == [{"name": "User3", "age": 23}, {"name": "User4", "age": 24}]
+
+        page = data_manager.select_page(UserModel, limit=2, order_by="-age", columns=["name"])
+        assert page.records == [{"name": "User4"}, {"name": "User3"}]
+        page = data_manager.select_page(UserModel, limit=2, order_by="-age", columns=["name"], cursor=page.next_cursor)
+        assert page.records == [{"name": "User2"}, {"name": "User1"}]
+
+        with pytest.raises(ValueError, match="Invalid column name"):
+            data_manager.select(UserModel, columns=["name, (SELECT 1)"])
+
+    def test_aggregate(self, data_manager):
+        """Test grouped and filtered aggregates computed in SQLite."""
+        table_manager = TableManager(data_manager.context)
+        table_manager.create_table("orders", [
+            Column(name="status", type="TEXT"),
+            Column(name="paid", type="BOOLEAN"),
+            Column(name="total", type="REAL"),
+        ])
+        orders = [("open", False, 10.0), ("open", False, 20.0), ("done", True, 5.0), ("done", True, 15.0), ("done", False, 40.0)]
+        for i, (status, paid, total) in enumerate(orders):
+            data_manager.create_from_dict("orders", {"id": f"o{i}", "status": status, "paid": paid, "total": total})
+
+        (overall,) = data_manager.aggregate("orders", sum="total", min="total", max="total")
+        assert overall == {"count": 5, "sum_total": 90.0, "min_total": 5.0, "max_total": 40.0}
+
+        by_status = data_manager.aggregate("orders", group_by="status", sum="total", avg="total")
+        assert by_status == [
+            {"status": "done", "count": 3, "sum_total": 60.0, "avg_total": 20.0},
+            {"status": "open", "count": 2, "sum_total": 30.0, "avg_total": 15.0},
+        ]
+
+        by_paid = data_manager.aggregate("orders", group_by=["paid"], sum=["total"], total__gt=5)
+        assert by_paid == [
+            {"paid": False, "count": 3, "sum_total": 70.0},
+            {"paid": True, "count": 1, "sum_total": 15.0},
+        ]
+        assert by_paid[1]["paid"] is True
+
+        # MIN/MAX of a BOOLEAN decode like select(); SUM stays a number
+        by_status_paid = data_manager.aggregate("orders", group_by="status", min="paid", max="paid", sum="paid")
+        rows = data_manager.select_page("orders").records
+        for row in by_status_paid:
+            paid = [r["paid"] for r in rows if r["status"] == row["status"]]
+            assert row["min_paid"] is min(paid) and row["max_paid"] is max(paid)
+            assert row["sum_paid"] == sum(paid) and not isinstance(row["sum_paid"], bool)
+
+        assert data_manager.aggregate(UserModel) == [{"count": 0}]
+        with pytest.raises(ValueError, match="Invalid column name"):
+            data_manager.aggregate("orders", sum="total) FROM orders; --")
+
     def test_update_record(self, data_manager):
         """Test updating an existing record."""
         user = UserModel(name="John Doe", email="john@example.com", age=30)
@@ -301,6 +441,62 @@ class TestDataManager:
         assert saved_user.name == "John Smith"
         assert saved_user.updated_at > created_user.updated_at
 
+    def test_upsert_from_dict(self, data_manager):
+        """Test upsert inserts new rows and updates existing ones in place."""
+        created = data_manager.create_from_dict(
+            "users", {"id": "u1", "name": "John", "email": "john@example.com", "age": 30}
+        )
+
+        results = data_manager.upsert_from_dict("users", [
+            {"id": "u1", "name": "John Smith", "email": "john@example.com", "age": 31},
+            {"id": "u2", "name": "Jane", "email": "jane@example.com", "age": 25},
+        ])
+        assert [r["id"] for r in results] == ["u1", "u2"]
+        assert "created_at" not in results[0]
+
+        john = data_manager.find_by_id(UserModel, "u1")
+        assert john.name == "John Smith"
+        assert john.age == 31
+        assert john.created_at == created["created_at"]
+        assert john.updated_at > created["updated_at"]
+
+        jane = data_manager.find_by_id(UserModel, "u2")
+        assert jane.created_at is not None
+        assert data_manager.count(UserModel) == 2
+
+    def test_upsert_from_dict_conflict_and_update_columns(self, data_manager):
+        """Test upsert on a unique column only overwrites the chosen columns."""
+        from cinchdb.core.connection import DatabaseConnection
+        with DatabaseConnection(data_manager.db_path) as conn:
+            conn.execute("CREATE UNIQUE INDEX idx_users_email ON users(email)")
+            conn.commit()
+
+        data_manager.create_from_dict(
+            "users", {"id": "u1", "name": "John", "email": "john@example.com", "age": 30}
+        )
+        data_manager.upsert_from_dict(
+            "users",
+            [{"name": "Ignored", "email": "john@example.com", "age": 40}],
+            conflict=("email",),
+            update_columns=["age"],
+        )
+
+        john = data_manager.find_by_id(UserModel, "u1")
+        assert john.name == "John"
+        assert john.age == 40
+
+        # An empty update_columns list leaves existing rows alone
+        data_manager.upsert_from_dict(
+            "users",
+            [{"name": "Ignored", "email": "john@example.com", "age": 50}],
+            conflict=("email",),
+            update_columns=[],
+        )
+        assert data_manager.find_by_id(UserModel, "u1").age == 40
+
+        with pytest.raises(ValueError, match="missing conflict column"):
+            data_manager.upsert_from_dict("users", [{"name": "X", "age": 1}], conflict=("email",))
+
     def test_delete_by_filters(self, data_manager):
         """Test deleting records by filters."""
         # Create test users
@@ -104,7 +104,7 @@ class TestCinchDB:
                 mock_cursor = Mock()
                 mock_cursor.fetchall.return_value = [{"id": 1, "name": "test"}]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 result = db.query("SELECT * FROM users WHERE id = ?", [1])
 
@@ -175,7 +175,7 @@ class TestCinchDB:
                     {"id": 3, "name": "Charlie", "email": None, "ssn": None}  # Test NULL values
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 # Query with masking
                 result = db.query(
@@ -252,7 +252,7 @@ class TestCinchDB:
                     {"id": 1, "name": "Alice", "email": "alice@example.com"}
                 ]
                 mock_conn.execute.return_value = mock_cursor
-                mock_db_conn.return_value.__enter__.return_value = mock_conn
+                mock_db_conn.return_value = mock_conn
 
                 # Query without masking - data should be unchanged
                 result = db.query("SELECT * FROM users")
@@ -261,6 +261,242 @@ class TestCinchDB:
 
             temp_db_path.unlink(missing_ok=True)
 
+    def test_local_query_iter(self, tmp_path):
+        """Test streaming query results in fetchmany batches."""
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("flags", [
+            Column(name="name", type="TEXT"),
+            Column(name="enabled", type="BOOLEAN"),
+        ])
+        db.insert("flags", *[{"name": f"f{i}", "enabled": i % 2 == 0} for i in range(25)])
+
+        rows = db.query_iter("SELECT name, enabled FROM flags ORDER BY name", batch_size=7)
+        assert not isinstance(rows, list)
+        rows = list(rows)
+
+        assert len(rows) == 25
+        assert rows == db.query("SELECT name, enabled FROM flags ORDER BY name")
+        assert rows[0] == {"name": "f0", "enabled": True}
+        assert rows[0]["enabled"] is True and rows[1]["enabled"] is False
+
+        with pytest.raises(ValueError, match="SELECT"):
+            list(db.query_iter("DELETE FROM flags"))
+        with pytest.raises(ValueError, match="batch_size"):
+            list(db.query_iter("SELECT * FROM flags", batch_size=0))
+
+    def test_local_aggregate_and_projection(self, tmp_path):
+        """Test aggregate and select_page column projection on a local connection."""
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("flags", [
+            Column(name="name", type="TEXT"),
+            Column(name="enabled", type="BOOLEAN"),
+        ])
+        db.insert("flags", *[{"name": f"f{i}", "enabled": i % 2 == 0} for i in range(5)])
+
+        assert db.aggregate("flags", group_by="enabled", max="name") == [
+            {"enabled": False, "count": 2, "max_name": "f3"},
+            {"enabled": True, "count": 3, "max_name": "f4"},
+        ]
+
+        page = db.select_page("flags", order_by="name", columns=["enabled"])
+        assert page.records[:2] == [{"enabled": True}, {"enabled": False}]
+
+    def test_local_query_tenants(self, tmp_path):
+        """Test fanning a query out across materialized tenants."""
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("flags", [
+            Column(name="name", type="TEXT"),
+            Column(name="enabled", type="BOOLEAN"),
+        ])
+        db.insert("flags", {"name": "main-flag", "enabled": True})
+        for tenant in ("acme", "globex", "idle"):
+            db.create_tenant(tenant)
+        for tenant, count in (("acme", 2), ("globex", 3)):
+            CinchDB(database="main", tenant=tenant, project_dir=tmp_path).insert(
+                "flags", *[{"name": f"{tenant}-{i}", "enabled": False} for i in range(count)]
+            )
+
+        results = dict(db.query_tenants("SELECT name, enabled FROM flags", max_workers=2))
+        # "idle" is still lazy and is skipped
+        assert set(results) == {"main", "acme", "globex"}
+        assert results["main"] == [{"name": "main-flag", "enabled": True}]
+        assert len(results["globex"]) == 3 and results["globex"][0]["enabled"] is False
+
+        total = db.query_tenants(
+            "SELECT COUNT(*) AS n FROM flags WHERE enabled = ?", [False],
+            tenants=["acme", "globex", "idle"],
+            reducer=lambda acc, tenant, rows: acc + rows[0]["n"],
+            initial=0,
+        )
+        assert total == 5
+
+        assert [tenant for tenant, _ in db.query_tenants("SELECT * FROM flags", tenants="acme")] == ["acme"]
+
+        with pytest.raises(ValueError, match="does not exist"):
+            db.query_tenants("SELECT * FROM flags", tenants=["missing"])
+        with pytest.raises(ValueError, match="SELECT"):
+            db.query_tenants("DELETE FROM flags")
+
+    def test_local_lazy_tenant_reads_skip_database(self, tmp_path):
+        """Test that simple reads on a lazy tenant are answered without opening a file."""
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("orders", [
+            Column(name="total", type="REAL"),
+            Column(name="paid", type="BOOLEAN"),
+        ])
+        db.insert("orders", {"total": 5.0, "paid": True})
+        db.create_tenant("lazy")
+        lazy = CinchDB(database="main", tenant="lazy", project_dir=tmp_path)
+        empty = CinchDB(database="main", tenant="__empty__", project_dir=tmp_path)
+
+        queries = [
+            "SELECT * FROM orders WHERE paid = 1 ORDER BY total LIMIT 5",
+            "SELECT COUNT(*) AS n, SUM(total), TOTAL(total) FROM orders",
+        ]
+        with patch("cinchdb.core.connection.DatabaseConnection.__init__", side_effect=AssertionError("opened")):
+            results = [lazy.query(sql) for sql in queries]
+            assert list(lazy.query_iter(queries[1])) == results[1]
+            assert lazy.query(queries[1], row_format="tuple") == [(0, None, 0.0)]
+            assert lazy.prepare(queries[1]).run() == results[1]
+        assert results == [empty.query(sql) for sql in queries]
+
+        # Joins are not short-circuited and still run against __empty__
+        assert lazy.query("SELECT a.id FROM orders a JOIN orders b ON a.id = b.id") == []
+
+        # A dropped column leaves the snapshot stale, so reads go to SQLite again
+        db.drop_column("orders", "paid")
+        with pytest.raises(Exception, match="paid"):
+            lazy.query("SELECT paid FROM orders")
+
+        lazy.insert("orders", {"total": 3.0})
+        assert lazy.query("SELECT COUNT(*) AS n FROM orders") == [{"n": 1}]
+
+    def test_local_concurrent_readers_and_writer(self, tmp_path):
+        """Test that queries from several threads run alongside inserts."""
+        import threading
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("events", [Column(name="n", type="INTEGER")])
+        db.insert("events", {"n": 0})
+
+        errors = []
+        counts = []
+
+        def reader():
+            try:
+                for _ in range(20):
+                    counts.append(db.query("SELECT COUNT(*) AS c FROM events")[0]["c"])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(1, 21):
+            db.insert("events", {"n": i})
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(counts) == 80 and all(1 <= c <= 21 for c in counts)
+        assert db.query("SELECT COUNT(*) AS c FROM events") == [{"c": 21}]
+
+    def test_local_writer_group_commits_concurrent_writes(self, tmp_path):
+        """Test that writes from several threads go through the tenant's writer."""
+        import threading
+        from cinchdb.core.initializer import init_project
+        from cinchdb.core.writer import WriterOptions, close_writers
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path, writer_options=WriterOptions())
+        db.create_table("events", [Column(name="n", type="INTEGER")])
+        errors = []
+
+        def writer(start):
+            try:
+                for i in range(start, start + 25):
+                    db.insert("events", {"n": i})
+                    db.kv.increment("hits")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n * 25,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert db.query("SELECT COUNT(*) AS c, SUM(n) AS s FROM events") == [{"c": 100, "s": sum(range(100))}]
+        assert db.kv.get("hits") == 100
+
+        record = db.insert("events", {"n": -1})
+        with pytest.raises(ValueError, match="already exists"):
+            db.insert("events", {"id": record["id"], "n": -2})
+        assert db.update("events", {"id": record["id"], "n": -3})["n"] == -3
+        assert db.delete("events", record["id"]) == 1
+        close_writers()
+
+    def test_local_query_across_tenants(self, tmp_path):
+        """Test aggregating over attached tenant databases in one statement."""
+        from cinchdb.core.initializer import init_project
+        init_project(tmp_path)
+
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("orders", [
+            Column(name="total", type="REAL"),
+            Column(name="paid", type="BOOLEAN"),
+        ])
+        totals = {"main": [1.0], "t1": [10.0, 20.0], "t2": [5.0], "t3": [2.0, 4.0, 6.0], "t4": [7.0]}
+        for tenant, values in totals.items():
+            if tenant != "main":
+                db.create_tenant(tenant)
+            CinchDB(database="main", tenant=tenant, project_dir=tmp_path).insert(
+                "orders", *[{"total": value, "paid": value > 5} for value in values]
+            )
+        db.create_tenant("lazy")
+
+        sql = "SELECT tenant, COUNT(*) AS n, AVG(total) AS avg_total FROM orders GROUP BY tenant ORDER BY tenant"
+        expected = [
+            {"tenant": tenant, "n": len(values), "avg_total": sum(values) / len(values)}
+            for tenant, values in sorted(totals.items())
+        ]
+        assert db.query_across_tenants(sql) == expected
+        # More tenants than fit in one batch are copied into temp tables
+        assert db.query_across_tenants(sql, batch_size=2) == expected
+
+        overall = db.query_across_tenants("SELECT AVG(total) AS avg_total FROM orders", batch_size=2)
+        all_totals = [value for values in totals.values() for value in values]
+        assert overall == [{"avg_total": sum(all_totals) / len(all_totals)}]
+
+        paid = db.query_across_tenants(
+            "SELECT tenant, paid FROM orders WHERE total > ? ORDER BY total", [6.0], tenants=["t1", "t3", "t4"]
+        )
+        assert paid == [{"tenant": "t4", "paid": True}, {"tenant": "t1", "paid": True}, {"tenant": "t1", "paid": True}]
+        assert paid[0]["paid"] is True
+
+        assert db.query_across_tenants("SELECT * FROM orders", tenants=["lazy"]) == []
+        # Aggregates over only lazy tenants match db.query on one of them
+        count_sql = "SELECT COUNT(*) AS c, SUM(total) AS s FROM orders"
+        lazy = CinchDB(database="main", tenant="lazy", project_dir=tmp_path)
+        assert db.query_across_tenants(count_sql, tenants=["lazy"]) == lazy.query(count_sql) == [{"c": 0, "s": None}]
+        with pytest.raises(ValueError, match="SELECT"):
+            db.query_across_tenants("DELETE FROM orders")
+
     def test_local_create_table(self, tmp_path):
         """Test table creation on local connection."""
         db = CinchDB(database="test_db", project_dir=tmp_path)
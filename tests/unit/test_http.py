@@ -0,0 +1,180 @@
+"""Tests for remote HTTP pooling, compression and retries."""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import PropertyMock, patch
+
+import httpx
+import pytest
+
+from cinchdb.core.async_database import AsyncCinchDB
+from cinchdb.core.database import CinchDB
+from cinchdb.core.http import HTTPOptions, compress_body, retry_delay
+
+FAST = HTTPOptions(backoff_factor=0, retries=2)
+
+
+def remote(handler, options=FAST):
+    """CinchDB whose HTTP client sends requests to handler."""
+    db = CinchDB(database="test_db", api_url="https://api.example.com", api_key="test-key", http_options=options)
+    db._session = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        headers={"X-API-Key": "test-key", "Content-Type": "application/json"},
+    )
+    return db
+
+
+class TestCompressBody:
+    """Test gzip compression of request bodies."""
+
+    def test_small_body_is_sent_as_json(self):
+        """Test that bodies below the threshold are left alone."""
+        kwargs = {"json": {"sql": "SELECT 1"}, "params": {}}
+        assert compress_body(kwargs, HTTPOptions()) is kwargs
+
+    def test_large_body_is_gzipped(self):
+        """Test that bodies at the threshold are gzipped with matching headers."""
+        body = {"records": [{"name": "x" * 100}] * 20}
+        kwargs = compress_body({"json": body}, HTTPOptions(compress_min_bytes=1024))
+
+        assert "json" not in kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["content"])) == body
+
+    def test_compression_can_be_disabled(self):
+        """Test that compress_min_bytes=None never compresses."""
+        kwargs = {"json": {"records": ["x" * 100000]}}
+        assert compress_body(kwargs, HTTPOptions(compress_min_bytes=None)) is kwargs
+
+    def test_remote_insert_sends_gzip(self):
+        """Test that a large bulk insert reaches the server compressed."""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200, json=[{"id": "1"}])
+
+        db = remote(handler, HTTPOptions(compress_min_bytes=256))
+        db.insert("users", *[{"name": f"user {i}"} for i in range(50)])
+
+        request = received[0]
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(request.content))["records"]) == 50
+
+
+class TestRetryDelay:
+    """Test the retry policy."""
+
+    def test_retry_statuses_only_for_idempotent_methods(self):
+        """Test that a 503 retries GET/PUT/DELETE but not POST."""
+        response = httpx.Response(503)
+        assert retry_delay(FAST, "GET", 1, response=response) is not None
+        assert retry_delay(FAST, "PUT", 1, response=response) is not None
+        assert retry_delay(FAST, "POST", 1, response=response) is None
+        assert retry_delay(FAST, "GET", 1, response=httpx.Response(500)) is None
+
+    def test_connect_errors_retry_any_method(self):
+        """Test that requests which never connected are always retried."""
+        assert retry_delay(FAST, "POST", 1, error=httpx.ConnectError("refused")) is not None
+        assert retry_delay(FAST, "POST", 1, error=httpx.ReadTimeout("slow")) is None
+        assert retry_delay(FAST, "GET", 1, error=httpx.ReadTimeout("slow")) is not None
+
+    def test_gives_up_after_retries(self):
+        """Test that no delay is returned once retries are used up."""
+        response = httpx.Response(503)
+        assert retry_delay(FAST, "GET", 2, response=response) is not None
+        assert retry_delay(FAST, "GET", 3, response=response) is None
+
+    def test_honours_retry_after_and_backoff(self):
+        """Test Retry-After and the exponential backoff cap."""
+        options = HTTPOptions(backoff_factor=1, backoff_max=4, retries=10)
+        assert retry_delay(options, "GET", 1, response=httpx.Response(429, headers={"Retry-After": "2"})) == 2
+        assert retry_delay(options, "GET", 1, response=httpx.Response(429, headers={"Retry-After": "60"})) == 4
+        assert 4 <= retry_delay(options, "GET", 8, response=httpx.Response(503)) * 2 <= 8
+
+
+class TestRemoteRetries:
+    """Test retries through CinchDB and AsyncCinchDB."""
+
+    def test_idempotent_request_is_retried(self):
+        """Test that a DELETE succeeds after transient 503s."""
+        statuses = iter([503, 502, 200])
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            status = next(statuses)
+            return httpx.Response(status, json={"deleted_count": 1} if status == 200 else {"detail": "busy"})
+
+        assert remote(handler).delete("users", "1") == 1
+        assert calls == ["DELETE"] * 3
+
+    def test_post_is_not_retried_on_status(self):
+        """Test that a POST failing with 503 raises without being resent."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(503, json={"detail": "busy"})
+
+        with pytest.raises(Exception, match=r"API Error \(503\): busy"):
+            remote(handler).query("SELECT 1")
+        assert calls == ["POST"]
+
+    def test_connect_error_is_retried(self):
+        """Test that a POST is resent when the connection couldn't be opened."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"data": [{"n": 1}]})
+
+        assert remote(handler).query("SELECT 1 AS n") == [{"n": 1}]
+        assert calls == ["POST", "POST"]
+
+    def test_persistent_connect_error_raises(self):
+        """Test that the transport error surfaces once retries are used up."""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(httpx.ConnectError):
+            remote(handler).query("SELECT 1")
+
+    def test_async_client_retries(self):
+        """Test that AsyncCinchDB applies the same retry policy."""
+        statuses = iter([503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(status, json={"deleted_count": 1} if status == 200 else {"detail": "busy"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def main():
+            with patch.object(AsyncCinchDB, "client", new_callable=PropertyMock) as mock_client:
+                mock_client.return_value = client
+                db = AsyncCinchDB(
+                    database="test_db", api_url="https://api.example.com", api_key="test-key", http_options=FAST
+                )
+                deleted = await db.delete("users", "1")
+                await client.aclose()
+                return deleted
+
+        assert asyncio.run(main()) == 1
+
+    def test_client_uses_pool_limits(self):
+        """Test that the session is built from http_options."""
+        db = CinchDB(
+            database="test_db", api_url="https://api.example.com", api_key="test-key",
+            http_options=HTTPOptions(max_connections=7, timeout=3),
+        )
+        session = db.session
+        try:
+            assert isinstance(session, httpx.Client)
+            assert session.timeout.connect == 3
+            assert session.headers["X-API-Key"] == "test-key"
+        finally:
+            db.close()
@@ -0,0 +1,73 @@
+"""Tests for answering lazy-tenant reads from the schema snapshot."""
+
+import sqlite3
+
+import pytest
+
+from cinchdb.core.lazy_reads import empty_result, plan_empty_result
+from cinchdb.models import Column, SchemaSnapshot
+
+
+@pytest.fixture
+def schema():
+    """Snapshot of an Events table, mirrored by empty_db."""
+    columns = [Column(name="id", type="TEXT"), Column(name="KIND", type="TEXT"), Column(name="amount", type="INTEGER")]
+    return SchemaSnapshot.from_dict({"Events": [column.model_dump() for column in columns]})
+
+
+@pytest.fixture
+def empty_db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE Events (id TEXT, KIND TEXT, amount INTEGER)")
+    yield conn
+    conn.close()
+
+
+class TestEmptyResult:
+    """Test that short-circuited results match SQLite on an empty table."""
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT * FROM events WHERE kind = ? ORDER BY id DESC LIMIT 10",
+        "SELECT kind k, amount AS \"Amount\" FROM Events e WHERE e.amount > ?",
+        "select count(*) from events",
+        "SELECT count( * ) AS n, Sum(amount), total(amount), max(kind) FROM events WHERE amount > ?",
+        "SELECT kind, COUNT(DISTINCT id) FROM events;",
+        "SELECT kind, count(*) FROM events GROUP BY kind",
+        "SELECT DISTINCT avg(amount) 'mean' FROM events -- trailing comment",
+    ])
+    def test_matches_sqlite(self, schema, empty_db, sql):
+        params = [1] if "?" in sql else []
+        expected = [dict(row) for row in empty_db.execute(sql, params)]
+
+        assert empty_result(sql, schema) == expected
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT * FROM events e JOIN events f ON e.id = f.id",
+        "SELECT * FROM events, events",
+        "SELECT id FROM events UNION SELECT id FROM events",
+        "WITH x AS (SELECT 1) SELECT * FROM x",
+        "SELECT * FROM (SELECT * FROM events)",
+        "SELECT id FROM events WHERE id IN (SELECT id FROM events)",
+        "SELECT amount + 1 FROM events",
+        "SELECT e.kind FROM events e",
+        "SELECT count(*) FROM events LIMIT 0",
+        "SELECT count(*) c FROM events HAVING c > 0",
+        "SELECT 1",
+    ])
+    def test_falls_back_for_unsupported_queries(self, schema, sql):
+        assert plan_empty_result(sql) is None or empty_result(sql, schema) is None
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT * FROM missing",
+        "SELECT nope FROM events",
+        "SELECT count(nope) FROM events",
+        "SELECT id FROM events WHERE nope = 1",
+        "SELECT id FROM events WHERE other.id = 1",
+    ])
+    def test_unknown_names_fall_back(self, schema, sql):
+        # SQLite raises for these, so the query must reach a real database
+        assert empty_result(sql, schema) is None
+
+    def test_no_snapshot_falls_back(self):
+        assert empty_result("SELECT * FROM events", None) is None
@@ -226,3 +226,21 @@ def test_delete_lazy_tenant():
         # Tenant should not appear in list
         tenants = list_tenants(project_dir, "testdb", "main")
         assert "lazy-tenant" not in tenants
+
+
+def test_reads_never_create_tenant_files(tmp_path):
+    """Test that select/count/aggregate on lazy or unknown tenants create no files."""
+    init_project(tmp_path, database_name="testdb", branch_name="main")
+    db = CinchDB(database="testdb", branch="main", project_dir=tmp_path)
+    db.create_table("users", [Column(name="name", type="TEXT")])
+    db.create_tenant("lazy-tenant", lazy=True)
+
+    lazy = CinchDB(database="testdb", branch="main", tenant="lazy-tenant", project_dir=tmp_path)
+    assert lazy.select_page("users").records == []
+    assert lazy.aggregate("users") == [{"count": 0}]
+    assert not get_tenant_db_path(tmp_path, "testdb", "main", "lazy-tenant").exists()
+
+    ghost = CinchDB(database="testdb", branch="main", tenant="ghost", project_dir=tmp_path)
+    with pytest.raises(ValueError, match="does not exist"):
+        ghost.select_page("users")
+    assert not get_tenant_db_path(tmp_path, "testdb", "main", "ghost").exists()
@@ -0,0 +1,118 @@
+"""Tests for prepared query handles."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from cinchdb.core.database import CinchDB
+from cinchdb.core.initializer import init_project
+from cinchdb.core.prepared import PreparedQuery
+from cinchdb.models import Column
+from cinchdb.utils.sql_validator import SQLValidationError
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Project with a users table holding a BOOLEAN column."""
+    init_project(tmp_path)
+    db = CinchDB(database="main", project_dir=tmp_path)
+    db.create_table("users", [
+        Column(name="name", type="TEXT"),
+        Column(name="active", type="BOOLEAN"),
+    ])
+    db.insert("users", *[{"name": f"user{i}", "active": i % 2 == 0} for i in range(10)])
+    return db
+
+
+class TestPreparedQuery:
+    """Test PreparedQuery execution."""
+
+    def test_run_reuses_connection(self, db):
+        with db.prepare("SELECT name, active FROM users WHERE name = ?") as query:
+            assert query.run(["user0"]) == [{"name": "user0", "active": True}]
+            assert query.run(["user1"])[0]["active"] is False
+            assert query.run(["missing"]) == []
+            assert len(query._connections) == 1
+
+    def test_iter_and_tuple_format(self, db):
+        query = db.prepare("SELECT name, active FROM users ORDER BY name", row_format="tuple")
+        rows = list(query.iter(batch_size=3))
+
+        assert len(rows) == 10
+        assert rows[0] == ("user0", True)
+        assert query.run()[1][1] is False
+        query.close()
+
+    def test_schema_change_rebuilds_decoder(self, db):
+        query = db.prepare("SELECT * FROM users WHERE name = ?")
+        assert "verified" not in query.run(["user0"])[0]
+
+        db.add_column("users", Column(name="verified", type="BOOLEAN"))
+        db.update_where("users", {"verified": True}, name="user0")
+
+        row = query.run(["user0"])[0]
+        assert row["verified"] is True
+        query.close()
+
+    def test_lazy_tenant_switches_to_materialized_file(self, db):
+        db.create_tenant("acme")
+        acme = CinchDB(database="main", tenant="acme", project_dir=db.project_dir)
+        query = acme.prepare("SELECT name FROM users")
+
+        assert query.run() == []
+        assert query._connections == []
+
+        acme.insert("users", {"name": "first", "active": True})
+        assert query.run() == [{"name": "first"}]
+        assert len(query._connections) == 1
+        query.close()
+
+    def test_threads_get_their_own_connection(self, db):
+        query = db.prepare("SELECT COUNT(*) AS n FROM users")
+        results = []
+
+        def worker():
+            results.append(query.run()[0]["n"])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [10, 10, 10, 10]
+        assert len(query._connections) == 4
+        query.close()
+
+    def test_validation_happens_once_at_prepare(self, db):
+        with pytest.raises(SQLValidationError):
+            db.prepare("DROP TABLE users")
+        with pytest.raises(ValueError, match="SELECT"):
+            db.prepare("DELETE FROM users")
+        with pytest.raises(ValueError, match="row_format"):
+            db.prepare("SELECT * FROM users", row_format="model")
+
+        query = db.prepare("SELECT * FROM users")
+        with patch("cinchdb.utils.sql_validator.validate_query_safe") as mock_validate:
+            query.run()
+            mock_validate.assert_not_called()
+
+    def test_closed_query_raises(self, db):
+        query = db.prepare("SELECT * FROM users")
+        query.close()
+        with pytest.raises(ValueError, match="closed"):
+            query.run()
+
+    def test_remote_run(self):
+        db = CinchDB(database="main", api_url="https://api.example.com", api_key="key")
+        query = db.prepare("SELECT name FROM users WHERE name = ?")
+        assert isinstance(query, PreparedQuery)
+
+        with patch.object(db, "_make_request", return_value={"data": [{"name": "a"}]}) as mock_request:
+            assert query.run(["a"]) == [{"name": "a"}]
+            assert list(query.iter(["a"])) == [{"name": "a"}]
+
+        mock_request.assert_called_with(
+            "POST", "/query", json={"sql": "SELECT name FROM users WHERE name = ?", "params": ["a"]}
+        )
@@ -167,4 +167,18 @@ class TestQueryManager:
             "SELECT * FROM users WHERE active IS NULL", QueryTestUser
         )
         assert len(typed_results) == 1
-        assert typed_results[0].active is None
\ No newline at end of file
+        assert typed_results[0].active is None
+
+    def test_query_typed_without_validation(self, query_manager):
+        """Test building instances with model_construct via a compiled decoder."""
+        validated = query_manager.query_typed(
+            "SELECT * FROM users ORDER BY age", QueryTestUser
+        )
+        constructed = query_manager.query_typed(
+            "SELECT * FROM users ORDER BY age", QueryTestUser, validate=False
+        )
+
+        assert len(constructed) == 4
+        assert all(isinstance(r, QueryTestUser) for r in constructed)
+        assert [u.name for u in constructed] == [u.name for u in validated]
+        assert [u.age for u in constructed] == [u.age for u in validated]
@@ -0,0 +1,167 @@
+"""Tests for precompiled row decoders."""
+
+import sqlite3
+import time
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from cinchdb.core.database import CinchDB
+from cinchdb.core.initializer import init_project
+from cinchdb.models import Column
+from cinchdb.utils.row_decoder import (
+    as_row_factory,
+    bool_columns_of,
+    bool_fields_of,
+    compile_row_decoder,
+)
+from cinchdb.utils.type_utils import convert_value_from_storage
+
+
+class Flag(BaseModel):
+    name: str
+    enabled: Optional[bool] = None
+    archived: bool | None = None
+    score: int = 0
+
+
+class TestCompileRowDecoder:
+    """Test decoder generation."""
+
+    def test_dict_format_converts_only_booleans(self):
+        decode = compile_row_decoder(("name", "enabled", "score"), frozenset({"enabled"}))
+
+        assert decode(("a", 1, 5)) == {"name": "a", "enabled": True, "score": 5}
+        assert decode(("b", 0, 0)) == {"name": "b", "enabled": False, "score": 0}
+        assert decode(("c", None, None)) == {"name": "c", "enabled": None, "score": None}
+
+    def test_tuple_format(self):
+        decode = compile_row_decoder(("name", "enabled"), frozenset({"enabled"}), "tuple")
+        assert decode(("a", 1)) == ("a", True)
+
+        # Without BOOLEAN columns the decoder is just tuple()
+        assert compile_row_decoder(("name",), frozenset({"enabled"}), "tuple") is tuple
+
+    def test_model_format(self):
+        decode = compile_row_decoder(
+            ("name", "enabled", "archived", "score"), bool_fields_of(Flag), "model", Flag
+        )
+        flag = decode(("a", 1, 0, 3))
+
+        assert isinstance(flag, Flag)
+        assert flag.enabled is True
+        assert flag.archived is False
+        assert flag.score == 3
+
+    def test_decoders_are_cached(self):
+        first = compile_row_decoder(("a", "b"), frozenset({"b"}))
+        assert compile_row_decoder(("a", "b"), frozenset({"b"})) is first
+        assert compile_row_decoder(("a", "b"), frozenset()) is not first
+
+    def test_unusual_column_names(self):
+        decode = compile_row_decoder(("COUNT(*)", "it's"), frozenset({"it's"}))
+        assert decode((3, 1)) == {"COUNT(*)": 3, "it's": True}
+
+    def test_duplicate_column_names_keep_first(self):
+        decode = compile_row_decoder(("id", "name", "id"), frozenset())
+        assert decode(("u1", "a", "o1")) == {"id": "u1", "name": "a"}
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="row_format"):
+            compile_row_decoder(("a",), frozenset(), "list")
+        with pytest.raises(ValueError, match="model class"):
+            compile_row_decoder(("a",), frozenset(), "model")
+
+    def test_as_row_factory(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (name TEXT, enabled BOOLEAN)")
+        conn.execute("INSERT INTO t VALUES ('a', 1)")
+        cursor = conn.execute("SELECT * FROM t")
+        columns = tuple(desc[0] for desc in cursor.description)
+        cursor.row_factory = as_row_factory(compile_row_decoder(columns, frozenset({"enabled"})))
+
+        assert cursor.fetchall() == [{"name": "a", "enabled": True}]
+        conn.close()
+
+    def test_helpers(self):
+        assert bool_columns_of({"a": "TEXT", "b": "BOOLEAN"}) == frozenset({"b"})
+        assert bool_fields_of(Flag) == frozenset({"enabled", "archived"})
+
+
+class TestQueryRowFormat:
+    """Test row formats on CinchDB.query."""
+
+    def test_tuple_rows(self, tmp_path):
+        init_project(tmp_path)
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("flags", [
+            Column(name="name", type="TEXT"),
+            Column(name="enabled", type="BOOLEAN"),
+            Column(name="secret", type="TEXT"),
+        ])
+        db.insert("flags", {"name": "a", "enabled": True, "secret": "x"}, {"name": "b", "enabled": False, "secret": None})
+
+        sql = "SELECT name, enabled, secret FROM flags ORDER BY name"
+        assert db.query(sql, row_format="tuple") == [("a", True, "x"), ("b", False, None)]
+        assert db.query(sql, row_format="tuple", mask_columns=["secret"]) == [
+            ("a", True, "***REDACTED***"),
+            ("b", False, None),
+        ]
+        assert db.query(sql)[0] == {"name": "a", "enabled": True, "secret": "x"}
+        assert db.query(sql, row_format="tuple")[1][1] is False
+
+        with pytest.raises(ValueError, match="row_format"):
+            db.query(sql, row_format="model")
+
+    def test_join_with_duplicate_columns_matches_sqlite_row(self, tmp_path):
+        """Regression: the first of two same-named columns is returned, as with dict(sqlite3.Row)."""
+        init_project(tmp_path)
+        db = CinchDB(database="main", project_dir=tmp_path)
+        db.create_table("users", [Column(name="name", type="TEXT"), Column(name="active", type="BOOLEAN")])
+        db.create_table("orders", [Column(name="user_id", type="TEXT"), Column(name="total", type="REAL")])
+        user = db.insert("users", {"name": "a", "active": True})
+        order = db.insert("orders", {"user_id": user["id"], "total": 5.0})
+
+        sql = "SELECT * FROM users JOIN orders ON orders.user_id = users.id"
+        for rows in (db.query(sql), list(db.query_iter(sql))):
+            assert rows[0]["id"] == user["id"] != order["id"]
+            assert rows[0]["active"] is True
+
+
+@pytest.mark.slow
+def test_decoder_benchmark_1m_rows():
+    """Compare compiled decoding against the per-column conversion loop on 1M rows."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id TEXT, name TEXT, n INTEGER, a BOOLEAN, b BOOLEAN, x REAL)")
+    conn.executemany(
+        "INSERT INTO t VALUES (?, ?, ?, ?, ?, ?)",
+        ((str(i), f"name{i}", i, i % 2, None, 1.5) for i in range(1_000_000)),
+    )
+    column_types = {"id": "TEXT", "name": "TEXT", "n": "INTEGER", "a": "BOOLEAN", "b": "BOOLEAN", "x": "REAL"}
+
+    conn.row_factory = sqlite3.Row
+    started = time.perf_counter()
+    baseline = [dict(row) for row in conn.execute("SELECT * FROM t").fetchall()]
+    for row in baseline:
+        for col_name, value in row.items():
+            if col_name in column_types:
+                row[col_name] = convert_value_from_storage(column_types[col_name], value)
+    baseline_time = time.perf_counter() - started
+
+    timings = {}
+    for row_format in ("dict", "tuple"):
+        started = time.perf_counter()
+        cursor = conn.execute("SELECT * FROM t")
+        columns = tuple(desc[0] for desc in cursor.description)
+        decode = compile_row_decoder(columns, bool_columns_of(column_types), row_format)
+        cursor.row_factory = None
+        decoded = list(map(decode, cursor.fetchall()))
+        timings[row_format] = time.perf_counter() - started
+        assert len(decoded) == 1_000_000
+
+    print(f"\nbaseline: {baseline_time:.2f}s, dict: {timings['dict']:.2f}s, tuple: {timings['tuple']:.2f}s")
+    assert decoded[1] == ("1", "name1", 1, True, None, 1.5)
+    assert timings["dict"] < baseline_time
+    assert timings["tuple"] < baseline_time
+    conn.close()
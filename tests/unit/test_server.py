@@ -0,0 +1,217 @@
+"""Tests for the cinch serve HTTP server."""
+
+import threading
+
+import httpx
+import pytest
+
+from cinchdb.core.database import CinchDB, connect_api
+from cinchdb.core.http import HTTPOptions
+from cinchdb.core.initializer import init_project
+from cinchdb.core.writer import WriterOptions
+from cinchdb.models import Column
+from cinchdb.server import CinchServer
+
+CONTEXT = {"database": "main", "branch": "main", "tenant": "main"}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with an events table on the main tenant."""
+    init_project(tmp_path)
+    db = CinchDB(database="main", project_dir=tmp_path)
+    db.create_table("events", [Column(name="kind", type="TEXT"), Column(name="n", type="INTEGER")])
+    return tmp_path
+
+
+@pytest.fixture
+def server(project):
+    """Running server that requires an API key."""
+    with CinchServer(project, port=0, api_key="secret", workers=4, writer_options=WriterOptions()) as server:
+        yield server
+
+
+@pytest.fixture
+def db(server):
+    """Remote connection to the server."""
+    db = connect_api(server.url, "secret", "main")
+    yield db
+    db.close()
+
+
+class TestRemoteClient:
+    """Test CinchDB(api_url=...) against the server."""
+
+    def test_data_round_trip(self, db):
+        """Test insert, update, query, select_page, aggregate and delete."""
+        first = db.insert("events", {"kind": "a", "n": 1})
+        db.insert("events", {"kind": "b", "n": 2}, {"kind": "c", "n": 3})
+        db.update("events", {"id": first["id"], "kind": "z"})
+
+        assert db.query("SELECT kind FROM events ORDER BY n") == [{"kind": "z"}, {"kind": "b"}, {"kind": "c"}]
+        page = db.select_page("events", limit=2, order_by="n")
+        assert [row["n"] for row in page.records] == [1, 2]
+        assert [row["n"] for row in db.select_page("events", limit=2, order_by="n", cursor=page.next_cursor).records] == [3]
+        assert db.aggregate("events", sum="n") == [{"count": 3, "sum_n": 6}]
+        assert db.delete("events", first["id"]) == 1
+        assert db.query("SELECT COUNT(*) AS c FROM events") == [{"c": 2}]
+
+    def test_upsert_and_bulk_operations(self, db):
+        """Test the bulk and upsert endpoints."""
+        records = db.insert("events", {"kind": "a", "n": 1}, {"kind": "b", "n": 2})
+        updated = db.update("events", *[{"id": r["id"], "n": r["n"] * 10} for r in records])
+        assert [r["n"] for r in updated] == [10, 20]
+
+        db.upsert("events", {"id": records[0]["id"], "kind": "a", "n": 99})
+        assert db.query("SELECT n FROM events ORDER BY n") == [{"n": 20}, {"n": 99}]
+        assert db.delete("events", *[r["id"] for r in records]) == 2
+
+    def test_batch_is_one_request(self, db):
+        """Test that a batch runs every operation in order."""
+        with db.batch() as batch:
+            inserted = batch.insert("events", {"kind": "a"})
+            count = batch.query("SELECT COUNT(*) AS c FROM events")
+        assert inserted.value["kind"] == "a"
+        assert count.value == [{"c": 1}]
+
+    def test_errors_map_to_status_codes(self, db, server):
+        """Test that errors come back as API errors with a matching status."""
+        with pytest.raises(Exception, match=r"API Error \(404\)"):
+            db.query("SELECT * FROM missing")
+        with pytest.raises(Exception, match=r"API Error \(400\)"):
+            db.insert("events", {"nope": 1})
+
+        wrong_key = connect_api(server.url, "wrong", "main")
+        with pytest.raises(Exception, match=r"API Error \(401\)"):
+            wrong_key.query("SELECT 1")
+
+    def test_gzipped_request_bodies(self, server):
+        """Test that compressed bodies from the client are accepted."""
+        db = connect_api(server.url, "secret", "main", http_options=HTTPOptions(compress_min_bytes=1))
+        db.insert("events", *[{"kind": "x" * 50, "n": i} for i in range(100)])
+        assert db.query("SELECT COUNT(*) AS c FROM events") == [{"c": 100}]
+
+    def test_concurrent_writes(self, db):
+        """Test that writes from many client threads all land."""
+        errors = []
+
+        def write(start):
+            try:
+                for i in range(start, start + 20):
+                    db.insert("events", {"kind": "t", "n": i})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n * 20,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert db.query("SELECT COUNT(DISTINCT n) AS c FROM events") == [{"c": 80}]
+
+
+class TestEndpoints:
+    """Test endpoints used by the TypeScript SDK and management calls."""
+
+    def test_api_v1_prefix(self, server, db):
+        """Test offset paging, record lookup and counting under /api/v1."""
+        records = db.insert("events", {"kind": "a", "n": 1}, {"kind": "b", "n": 2})
+        client = httpx.Client(base_url=f"{server.url}/api/v1", headers={"X-API-Key": "secret"}, params=CONTEXT)
+
+        rows = client.get("/tables/events/data", params={**CONTEXT, "limit": 1, "offset": 1}).json()
+        assert len(rows) == 1
+        assert client.get(f"/tables/events/data/{records[0]['id']}").json()["kind"] == "a"
+        assert client.get("/tables/events/data/missing").status_code == 404
+        assert client.get("/tables/events/data/count", params={**CONTEXT, "kind": "b"}).json() == {"count": 1}
+        result = client.post("/query/execute", json={"sql": "SELECT kind FROM events ORDER BY n"}).json()
+        assert result == {"columns": ["kind"], "rows": [["a"], ["b"]], "row_count": 2}
+
+    def test_filter_keys_must_be_columns(self, server, db):
+        """Test that filter keys can't inject SQL through column names."""
+        db.insert("events", {"kind": "a", "n": 1}, {"kind": "b", "n": 2})
+        injected = {**CONTEXT, "1) OR 1=1 --__gt": "x"}
+
+        for path in ("/tables/events/data", "/tables/events/data/count", "/tables/events/aggregate"):
+            status, body = server.handle("GET", path, injected, None)
+            assert status == 400, path
+            assert "Invalid filter" in body["detail"]
+        assert server.handle("GET", "/tables/events/data", {**CONTEXT, "nope": "x"}, None)[0] == 400
+        assert server.handle("GET", "/tables/missing/data", {**CONTEXT, "n": "1"}, None)[0] == 404
+
+        status, body = server.handle("GET", "/tables/events/data/count", {**CONTEXT, "n__gt": "1"}, None)
+        assert body == {"count": 1}
+
+    def test_table_names_and_body_keys_must_exist(self, server, db):
+        """Test that path table names and body keys can't inject SQL."""
+        db.create_table("secrets", [Column(name="s", type="TEXT")])
+        db.insert("secrets", {"s": "hunter2"})
+        record = db.insert("events", {"kind": "a", "n": 1})
+
+        for method, path, body in (
+            ("DELETE", "/tables/events WHERE 1 OR id IN (?) --/data/bulk", {"ids": ["x"]}),
+            ("GET", "/tables/events UNION ALL SELECT s FROM secrets/aggregate", None),
+            ("GET", "/tables/events UNION ALL SELECT s FROM secrets/data/count", None),
+        ):
+            status, body = server.handle(method, path, CONTEXT, body)
+            assert status == 400 and "hunter2" not in str(body), path
+        assert server.handle("GET", "/tables/nope/aggregate", CONTEXT, None)[0] == 404
+
+        bad = "kind = (SELECT s FROM secrets), n"
+        for method, path, body in (
+            ("PUT", f"/tables/events/data/{record['id']}", {"data": {bad: 5}}),
+            ("POST", "/tables/events/data", {"data": {bad: 5}}),
+            ("POST", "/tables/events/data/bulk", {"records": [{"kind": "b"}, {bad: 5}]}),
+            ("PUT", "/tables/events/data/bulk", {"updates": [{"id": record["id"], bad: 5}]}),
+            ("POST", "/tables/events/data/upsert", {"records": [{bad: 5}]}),
+            ("POST", "/tables/events/data/upsert", {"records": [{"kind": "b"}], "conflict": [bad]}),
+            ("POST", "/tables/events/data/upsert", {"records": [{"kind": "b"}], "update_columns": [bad]}),
+        ):
+            status, body = server.handle(method, path, CONTEXT, body)
+            assert status == 400 and "Invalid column" in body["detail"], (method, path)
+        assert db.query("SELECT kind, n FROM events") == [{"kind": "a", "n": 1}]
+
+    def test_unknown_names_are_not_found(self, server, project):
+        """Test that unknown databases, branches and tenants return 404 without creating files."""
+        files = set(project.rglob("*"))
+        for params, detail in (
+            ({**CONTEXT, "tenant": "ghost"}, "Tenant 'ghost' not found"),
+            ({**CONTEXT, "database": "nodb"}, "Database 'nodb' not found"),
+            ({**CONTEXT, "branch": "nobranch"}, "Branch 'nobranch' not found"),
+        ):
+            assert server.handle("GET", "/tables/events/data", params, None) == (404, {"detail": detail})
+            assert server.handle("POST", "/query", params, {"sql": "SELECT 1"})[0] == 404
+        assert set(project.rglob("*")) == files
+
+    def test_tenants_and_branches(self, server):
+        """Test tenant and branch management."""
+        params = {"database": "main", "branch": "main"}
+        assert server.handle("POST", "/tenants", params, {"name": "acme"})[0] == 200
+        assert server.handle("PUT", "/tenants/acme/rename", params, {"new_name": "globex"})[0] == 200
+        status, tenants = server.handle("GET", "/tenants", params, None)
+        assert {t["name"] for t in tenants} == {"main", "globex"}
+        assert server.handle("DELETE", "/tenants/globex", params, None)[0] == 200
+
+        assert server.handle("POST", "/branches", params, {"name": "feature", "source": "main"})[0] == 200
+        status, branches = server.handle("GET", "/branches", params, None)
+        assert {b["name"] for b in branches} == {"main", "feature"}
+        status, changes = server.handle("GET", "/branches/feature/changes", params, None)
+        assert [c["entity_name"] for c in changes["changes"]] == ["events"]
+
+    def test_routing_errors(self, server):
+        """Test unknown endpoints, wrong methods and missing fields."""
+        assert server.handle("GET", "/nope", CONTEXT, None)[0] == 404
+        assert server.handle("PATCH", "/query", CONTEXT, None)[0] == 405
+        assert server.handle("POST", "/query", CONTEXT, {}) == (400, {"detail": "Missing required field 'sql'"})
+        assert server.handle("POST", "/query", {}, {"sql": "SELECT 1"})[0] == 400
+
+    def test_batch_stops_at_first_failure(self, server):
+        """Test that batch results end at the failing operation."""
+        status, body = server.handle("POST", "/batch", CONTEXT, {"operations": [
+            {"method": "POST", "path": "/tables/events/data", "body": {"data": {"kind": "a"}}},
+            {"method": "POST", "path": "/tables/missing/data", "body": {"data": {"kind": "b"}}},
+            {"method": "POST", "path": "/tables/events/data", "body": {"data": {"kind": "c"}}},
+        ]})
+        assert status == 200
+        assert [result["status"] for result in body["results"]] == [200, 404]
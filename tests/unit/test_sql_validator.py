@@ -6,6 +6,7 @@ from cinchdb.utils.sql_validator import (
     validate_query_safe,
     SQLValidationError,
     SQLOperation,
+    _validate_cached,
 )
 
 
@@ -223,3 +224,50 @@ class TestSQLValidator:
             assert is_valid is False
             assert "Unrecognized" in error or "restricted" in error.lower()
             assert operation is None
+
+    def test_literals_identifiers_and_comments_are_ignored(self):
+        """Test that keywords and semicolons inside literals are not parsed."""
+        queries = [
+            "SELECT 'a;b' FROM t",
+            "SELECT * FROM logs WHERE message = 'DROP TABLE users; --'",
+            'SELECT "drop" FROM t',
+            "SELECT [create] FROM t",
+            "SELECT `alter` FROM t /* ; DROP TABLE t */",
+            "SELECT 'it''s; fine' FROM t",
+        ]
+
+        for query in queries:
+            is_valid, error, operation = validate_sql_query(query)
+            assert is_valid is True, f"{query!r}: {error}"
+            assert operation == SQLOperation.SELECT
+
+    def test_cte_classified_by_main_statement(self):
+        """Test that a WITH clause takes the operation of its main statement."""
+        is_valid, _, operation = validate_sql_query(
+            "WITH recent AS (SELECT * FROM orders WHERE day > ?) SELECT COUNT(*) FROM recent"
+        )
+        assert is_valid is True
+        assert operation == SQLOperation.SELECT
+
+        is_valid, _, operation = validate_sql_query(
+            "WITH old AS (SELECT id FROM orders) DELETE FROM orders WHERE id IN (SELECT id FROM old)"
+        )
+        assert is_valid is True
+        assert operation == SQLOperation.DELETE
+
+    def test_multiple_statements_each_validated(self):
+        """Test that every statement is checked when multiple are allowed."""
+        is_valid, error, _ = validate_sql_query(
+            "SELECT 1; DROP TABLE users", allow_multiple_statements=True
+        )
+        assert is_valid is False
+        assert "DROP" in error
+
+    def test_validation_results_are_cached(self):
+        """Test that repeated queries are served from the cache."""
+        query = "SELECT id FROM cached_validation_test WHERE id = ?"
+        validate_sql_query(query)
+        hits = _validate_cached.cache_info().hits
+
+        assert validate_sql_query(query) == (True, None, SQLOperation.SELECT)
+        assert _validate_cached.cache_info().hits == hits + 1
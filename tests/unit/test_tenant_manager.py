@@ -230,6 +230,20 @@ class TestTenantManager:
         with pytest.raises(ValueError, match="Tenant 'main' already exists"):
             tenant_manager.rename_tenant("customer1", "main")
 
+    def test_get_materialized_tenant_paths(self, tenant_manager):
+        """Test that only materialized tenants are mapped to their files."""
+        tenant_manager.create_tenant("eager", lazy=False)
+        tenant_manager.create_tenant("lazy")
+
+        paths = tenant_manager.get_materialized_tenant_paths()
+        assert set(paths) == {"main", "eager"}
+        assert paths["eager"] == tenant_manager.get_tenant_db_path_for_operation("eager")
+        assert paths["eager"].exists()
+
+        assert list(tenant_manager.get_materialized_tenant_paths(["eager", "lazy", "main"])) == ["eager", "main"]
+        with pytest.raises(ValueError, match="does not exist"):
+            tenant_manager.get_materialized_tenant_paths(["nope"])
+
     def test_get_tenant_connection(self, tenant_manager):
         """Test getting a database connection for a tenant."""
         with tenant_manager.get_tenant_connection("main") as conn:
@@ -0,0 +1,206 @@
+"""Tests for per-tenant writer threads and group commit."""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from cinchdb.core.connection import DatabaseConnection
+from cinchdb.core.writer import TenantWriter, WriterOptions, close_writer, submit_write
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Database with an empty items table."""
+    path = tmp_path / "writer.db"
+    with DatabaseConnection(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.commit()
+    return path
+
+
+def insert(item_id, name="item"):
+    return lambda conn: conn.execute("INSERT INTO items VALUES (?, ?)", [item_id, name]).lastrowid
+
+
+def count(path):
+    with DatabaseConnection(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestTenantWriter:
+    """Test queued writes and group commit."""
+
+    def test_submit_returns_result_after_commit(self, db_path):
+        """Test that futures resolve to the operation's result once committed."""
+        writer = TenantWriter(db_path)
+        try:
+            assert writer.submit(insert(7)).result(timeout=5) == 7
+            assert count(db_path) == 1
+        finally:
+            writer.close()
+
+    def test_queued_operations_share_a_commit(self, db_path):
+        """Test that operations queued behind a running batch commit together."""
+        writer = TenantWriter(db_path, options=WriterOptions(max_delay=0))
+        started = threading.Event()
+        release = threading.Event()
+        sizes = []
+        original = writer._commit
+
+        def recording_commit(conn, batch):
+            sizes.append(len(batch))
+            original(conn, batch)
+
+        def block(conn):
+            started.set()
+            release.wait(5)
+
+        writer._commit = recording_commit
+        try:
+            writer.submit(block)
+            started.wait(5)
+            # While the first batch runs, these queue up for the next one
+            futures = [writer.submit(insert(i)) for i in range(10)]
+            release.set()
+
+            assert [future.result(timeout=5) for future in futures] == list(range(10))
+            assert sizes == [1, 10]
+            assert count(db_path) == 10
+        finally:
+            writer.close()
+
+    def test_max_batch_splits_batches(self, db_path):
+        """Test that no batch holds more than max_batch operations."""
+        writer = TenantWriter(db_path, options=WriterOptions(max_batch=3))
+        sizes = []
+        original = writer._commit
+
+        def recording_commit(conn, batch):
+            sizes.append(len(batch))
+            original(conn, batch)
+
+        writer._commit = recording_commit
+        try:
+            futures = [writer.submit(insert(i)) for i in range(10)]
+            for future in futures:
+                future.result(timeout=5)
+        finally:
+            writer.close()
+        assert sum(sizes) == 10 and max(sizes) <= 3
+
+    def test_failing_operation_is_rolled_back_alone(self, db_path):
+        """Test that an error only undoes its own operation in the batch."""
+        writer = TenantWriter(db_path)
+        try:
+            first = writer.submit(insert(1))
+            duplicate = writer.submit(insert(1))
+            third = writer.submit(insert(3))
+
+            assert first.result(timeout=5) == 1
+            with pytest.raises(sqlite3.IntegrityError):
+                duplicate.result(timeout=5)
+            assert third.result(timeout=5) == 3
+            assert count(db_path) == 2
+        finally:
+            writer.close()
+
+    def test_commit_and_rollback_inside_operation(self, db_path):
+        """Test that commit() is deferred and rollback() undoes only the caller."""
+        writer = TenantWriter(db_path)
+
+        def undone(conn):
+            conn.execute("INSERT INTO items VALUES (1, 'undone')")
+            conn.rollback()
+            conn.execute("INSERT INTO items VALUES (2, 'kept')")
+            conn.commit()
+
+        try:
+            writer.submit(undone).result(timeout=5)
+        finally:
+            writer.close()
+        with DatabaseConnection(db_path) as conn:
+            assert [row[0] for row in conn.execute("SELECT name FROM items")] == ["kept"]
+
+    def test_close_commits_queued_operations(self, db_path):
+        """Test that closing drains the queue and later submits are refused."""
+        writer = TenantWriter(db_path)
+        futures = [writer.submit(insert(i)) for i in range(5)]
+        writer.close()
+
+        assert all(future.done() for future in futures)
+        assert count(db_path) == 5
+        assert writer.submit(insert(6)) is None
+
+    def test_idle_writer_stops(self, db_path):
+        """Test that a writer exits after idle_timeout without work."""
+        stopped = threading.Event()
+        writer = TenantWriter(db_path, options=WriterOptions(idle_timeout=0.05), on_exit=lambda w: stopped.set())
+        writer.submit(insert(1)).result(timeout=5)
+
+        assert stopped.wait(5)
+        assert writer.submit(insert(2)) is None
+
+    def test_reopens_replaced_file(self, db_path, tmp_path):
+        """Test that writes go to a file that replaced the one originally opened."""
+        writer = TenantWriter(db_path)
+        try:
+            writer.submit(insert(1)).result(timeout=5)
+
+            replacement = tmp_path / "replacement.db"
+            with DatabaseConnection(replacement) as conn:
+                conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+                conn.commit()
+            os.replace(replacement, db_path)
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(f"{db_path}{suffix}"):
+                    os.remove(f"{db_path}{suffix}")
+
+            writer.submit(insert(2)).result(timeout=5)
+        finally:
+            writer.close()
+        with DatabaseConnection(db_path) as conn:
+            assert [row[0] for row in conn.execute("SELECT id FROM items")] == [2]
+
+    def test_options_are_validated(self):
+        """Test that nonsensical options are rejected."""
+        with pytest.raises(ValueError):
+            WriterOptions(max_batch=0)
+        with pytest.raises(ValueError):
+            WriterOptions(idle_timeout=0)
+
+
+class TestSubmitWrite:
+    """Test the per-file writer registry."""
+
+    def test_concurrent_submitters_share_one_writer(self, db_path):
+        """Test that threads writing to one file never see SQLITE_BUSY."""
+        errors = []
+
+        def write(start):
+            try:
+                for i in range(start, start + 50):
+                    submit_write(db_path, insert(i)).result(timeout=10)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n * 50,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        close_writer(db_path)
+
+        assert errors == []
+        assert count(db_path) == 200
+
+    def test_restarts_after_idle_exit(self, db_path):
+        """Test that a stopped writer is replaced on the next submit."""
+        options = WriterOptions(idle_timeout=0.01)
+        submit_write(db_path, insert(1), options=options).result(timeout=5)
+        threading.Event().wait(0.1)
+
+        assert submit_write(db_path, insert(2), options=options).result(timeout=5) == 2
+        close_writer(db_path)
+        assert count(db_path) == 2